@@ -40,6 +40,13 @@ class Authorizer:
         """
         raise NotImplementedError
 
+    async def close(self) -> None:
+        """
+        Releases whatever this Authorizer keeps open between scoped sessions
+        on the current event loop. To be called before the loop goes away.
+        """
+        raise NotImplementedError
+
     async def authorize(self, actor: Dict[str, Any], action: str, resource: Dict[str, Any]) -> bool:
         """
         :param actor: The actor dictionary with the keys "type" and "id" identifying what
@@ -62,6 +69,34 @@ class Authorizer:
         """
         raise NotImplementedError
 
+    async def batch_authorize(self, actor: Dict[str, Any], action: str,
+                              resources: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Like authorize() above, but for many resources at once.
+
+        :param actor: The actor dictionary with the keys "type" and "id" identifying what
+                      is seeking permission.  Most often this is of the form:
+                        {
+                            "type": "User",
+                            "id": "<username>"
+                        }
+        :param action:  The action for which the user is asking permission for.
+                        Most often this is one of the Permission values of:
+                            "create", "read", "update" or "delete".
+        :param resources: A list of resource dictionaries with the keys "type" and "id"
+                      identifying just what is to be authorized for use.  For instance:
+                        [
+                            {
+                                "type": "AgentNetwork",
+                                "id": "hello_world"
+                            }
+                        ]
+        :return: A list of booleans in the same order as the resources.
+                 Each is True if the actor is allowed to take the requested action
+                 on the resource. False otherwise.
+        """
+        raise NotImplementedError
+
     async def grant(self, actor: Dict[str, Any], relation: str, resource: Dict[str, Any]) -> bool:
         """
         :param actor: The actor dictionary with the keys "type" and "id" identifying what
@@ -19,11 +19,14 @@ from typing import Dict
 from typing import List
 from types import ModuleType
 
+import asyncio
+
 from os import environ
 
 from neuro_san.internals.authorization.interfaces.abstract_authorizer import AbstractAuthorizer
 from neuro_san.internals.authorization.interfaces.authorizer import Authorizer
 from neuro_san.internals.authorization.openfga.open_fga_store_cache import OpenFgaStoreCache
+from neuro_san.internals.utils.env_util import EnvUtil
 
 
 class OpenFgaAuthorizer(AbstractAuthorizer):
@@ -48,27 +51,45 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
         self.debug: bool = debug_auth is not None and len(debug_auth) > 0 and debug_auth != "false"
         self.fail_on_unauthorized: bool = environ.get("AGENT_DEBUG_AUTH") == "hard"
 
-        # Note: we don't initialize the client because constructors cannot be async
-        # This is what we use aenter() and aexit() for.
+        # Checks to send in one batch_check() round trip, and how many of those to have going at once.
+        # OpenFGA servers by default accept at most 50 checks in a batch.
+        self.batch_size: int = max(1, EnvUtil.get_int("AGENT_AUTHORIZER_BATCH_SIZE", 50))
+        self.batch_concurrency: int = max(1, EnvUtil.get_int("AGENT_AUTHORIZER_BATCH_CONCURRENCY", 4))
+
+        # Note: we don't initialize the client because constructors cannot be async.
+        # When none is given, a client shared by the event loop is used. See get_fga_client().
         self.fga_client: self.openfga_sdk.client.client.OpenFgaClient = fga_client
 
     async def __aenter__(self) -> Authorizer:
         """
         Opens a scoped session with an Authorizer.
         """
-        if self.fga_client is not None:
-            await self.fga_client.close()
-
-        # Open a new client
-        self.fga_client = await OpenFgaStoreCache.get_client()
+        # Clients are persistent, so there is nothing to open.
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """
         Closes a scoped session with an Authorizer.
         """
-        await self.fga_client.close()
-        self.fga_client = None
+        # Clients are persistent and shared, so there is nothing to close.
+
+    async def close(self) -> None:
+        """
+        Closes the client shared on the current event loop.
+        A client given to the constructor belongs to whoever gave it, so it is left open.
+        """
+        if self.fga_client is None:
+            await OpenFgaStoreCache.close_shared_clients()
+
+    async def get_fga_client(self) -> Any:
+        """
+        :return: The OpenFgaClient given to the constructor, if any.
+                Otherwise, the one shared by everything running on the current event loop,
+                so that requests do not each pay for opening and closing a client.
+        """
+        if self.fga_client is not None:
+            return self.fga_client
+        return await OpenFgaStoreCache.get_shared_client()
 
     async def authorize(self, actor: Dict[str, Any], action: str, resource: Dict[str, Any]) -> bool:
         """
@@ -124,7 +145,8 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
                                            object=f"{use_resource.get('type')}:{use_resource.get('id')}")
 
         # No async with here, as that would close the client
-        check_response: CheckResponse = await self.fga_client.check(check_request)
+        fga_client = await self.get_fga_client()
+        check_response: CheckResponse = await fga_client.check(check_request)
         authorized = check_response.allowed
 
         if not authorized:
@@ -140,6 +162,81 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
 
         return authorized
 
+    # pylint: disable=too-many-locals
+    async def batch_authorize(self, actor: Dict[str, Any], action: str,
+                              resources: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Like authorize() above, but for many resources at once.
+        Checks are sent in batches of self.batch_size via OpenFGA's batch_check(),
+        with at most self.batch_concurrency batches in flight at a time.
+
+        :param actor: The actor dictionary with the keys "type" and "id" identifying what
+                      is seeking permission.
+        :param action: The action for which the user is asking permission for.
+                      Most often this is one of the strings "create", "read", "update" or "delete".
+        :param resources: A list of resource dictionaries with the keys "type" and "id"
+                      identifying just what is to be authorized for use.
+        :return: A list of booleans in the same order as the resources.
+                 Each is True if the actor is allowed to take the requested action
+                 on the resource. False otherwise.
+        """
+        # Fix case where values are Enum types, as in authorize() above
+        use_action: str = action
+        if not isinstance(action, str):
+            use_action = action.value
+        user: str = f"{actor.get('type')}:{actor.get('id')}"
+
+        # Use classes from the lazily imported module to avoid extra required dependencies
+        # pylint: disable=invalid-name
+        ClientBatchCheckItem = self.openfga_sdk.client.models.batch_check_item.ClientBatchCheckItem
+        ClientBatchCheckRequest = self.openfga_sdk.client.models.batch_check_request.ClientBatchCheckRequest
+
+        # Correlation ids are the index of the resource, to put answers back in order.
+        checks: List[Any] = []
+        for index, resource in enumerate(resources):
+            resource_type: Any = resource.get("type")
+            if not isinstance(resource_type, str):
+                resource_type = resource_type.value
+            checks.append(ClientBatchCheckItem(user=user,
+                                               relation=use_action,
+                                               object=f"{resource_type}:{resource.get('id')}",
+                                               correlation_id=str(index)))
+
+        if self.debug:
+            self.logger.info("batch_authorize(%s, %s, %d resources)", actor, use_action, len(resources))
+
+        fga_client = await self.get_fga_client()
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+        options: Dict[str, Any] = {
+            # We do our own chunking, so each call is one round trip
+            "max_batch_size": self.batch_size,
+            "max_parallel_requests": 1
+        }
+
+        async def check_batch(batch: List[Any]) -> List[Any]:
+            async with semaphore:
+                # No async with here, as that would close the client
+                response = await fga_client.batch_check(ClientBatchCheckRequest(checks=batch), options)
+                return response.result
+
+        batches: List[List[Any]] = [checks[start:start + self.batch_size]
+                                    for start in range(0, len(checks), self.batch_size)]
+        batch_results: List[List[Any]] = await asyncio.gather(*[check_batch(batch) for batch in batches])
+
+        # Guilty until proven innocent, including for checks that came back with an error
+        authorized: List[bool] = [False] * len(resources)
+        for results in batch_results:
+            for result in results:
+                if result.error is None and result.allowed:
+                    authorized[int(result.correlation_id)] = True
+
+        if self.fail_on_unauthorized and not all(authorized):
+            unauthorized: List[Dict[str, Any]] = [resource for resource, allowed in zip(resources, authorized)
+                                                  if not allowed]
+            raise ValueError(f"Actor: {actor}   action: {action}   resources: {unauthorized}")
+
+        return authorized
+
     # pylint: disable=too-many-locals
     async def list(self, actor: Dict[str, Any], relation: str, resource: Dict[str, Any]) -> List[str]:
         """
@@ -172,7 +269,7 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
             # We are looking for a specific id. Faster through authorize()
             if self.debug:
                 self.logger.info("using authorize() for list()")
-            authorized: bool = self.authorize(actor, relation, resource)
+            authorized: bool = await self.authorize(actor, relation, resource)
             if authorized:
                 ids.append(str(resource.get("id")))
             return ids
@@ -202,7 +299,8 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
                                         type=resource_type)
 
         # No async with here, as that would close the client
-        response: ListObjectsResponse = await self.fga_client.list_objects(body, options)
+        fga_client = await self.get_fga_client()
+        response: ListObjectsResponse = await fga_client.list_objects(body, options)
 
         for one_object in response.objects:
             # Results come in the format of a single string "<type>:<identifier>"
@@ -270,7 +368,8 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
                                    object=request_object)
 
         # No async with here, as that would close the client
-        response: ReadResponse = await self.fga_client.read(body, options)
+        fga_client = await self.get_fga_client()
+        response: ReadResponse = await fga_client.read(body, options)
 
         # Process the response
         retval: List[str] = []
@@ -349,7 +448,8 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
         retval: bool = True
         try:
             # No async with here, as that would close the client
-            _ = await self.fga_client.write(body)
+            fga_client = await self.get_fga_client()
+            _ = await fga_client.write(body)
 
         except self.openfga_sdk.exceptions.ValidationException as err:
             if (str(err).find("tuple to be written already existed") > 0) and self.debug:
@@ -412,7 +512,8 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
         retval: bool = True
         try:
             # No async with here, as that would close the client
-            _ = await self.fga_client.write(body)
+            fga_client = await self.get_fga_client()
+            _ = await fga_client.write(body)
 
         except self.openfga_sdk.exceptions.ValidationException as err:
             if (str(err).find("tuple to be deleted did not exist") > 0) and self.debug:
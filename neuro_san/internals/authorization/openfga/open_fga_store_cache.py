@@ -19,8 +19,11 @@ from typing import Any
 from typing import Dict
 from typing import Type
 
+from asyncio import AbstractEventLoop
+from asyncio import get_running_loop
 from os import environ
 from threading import Lock
+from weakref import WeakKeyDictionary
 
 from leaf_common.config.resolver_util import ResolverUtil
 
@@ -57,6 +60,11 @@ class OpenFgaStoreCache:
     # Threaded lock - on purpose even though async access is used
     lock = Lock()
 
+    # A mapping of event loop to a mapping of store id to the client shared on that loop.
+    # A client's http session belongs to the loop it was first used on,
+    # so each loop gets its own. See close_shared_clients() for closing them.
+    loop_clients: WeakKeyDictionary = WeakKeyDictionary()
+
     # Store name to use when none is specified by the caller.
     DEFAULT_STORE_NAME: str = environ.get("FGA_STORE_NAME", "default")
 
@@ -92,6 +100,51 @@ class OpenFgaStoreCache:
 
         return fga_client
 
+    @classmethod
+    async def get_shared_client(cls, store_name: str = None) -> OpenFgaClient:
+        """
+        :param store_name: The store name to use for fact storage.
+                See get_client() above.
+        :return: a connection to the OpenFGA authorization server for the given store name
+                that is shared by everything running on the current event loop.
+                Callers must not close it.
+        """
+        if store_name is None:
+            store_name = OpenFgaStoreCache.DEFAULT_STORE_NAME
+
+        loop: AbstractEventLoop = get_running_loop()
+        store_id: str = OpenFgaStoreCache.store_name_to_id.get(store_name)
+        if store_id is not None:
+            with OpenFgaStoreCache.lock:
+                fga_client: OpenFgaClient = OpenFgaStoreCache.loop_clients.get(loop, {}).get(store_id)
+            if fga_client is not None:
+                return fga_client
+
+        # Initializes the store if need be.
+        fga_client = await cls.get_client(store_name)
+        store_id = OpenFgaStoreCache.store_name_to_id.get(store_name)
+        with OpenFgaStoreCache.lock:
+            clients: Dict[str, OpenFgaClient] = OpenFgaStoreCache.loop_clients.setdefault(loop, {})
+            shared_client: OpenFgaClient = clients.setdefault(store_id, fga_client)
+
+        if shared_client is not fga_client:
+            # Someone else on this loop got there first while we were waiting on the store.
+            await fga_client.close()
+        return shared_client
+
+    @classmethod
+    async def close_shared_clients(cls):
+        """
+        Closes the clients shared on the current event loop, if any.
+        To be called on the loop before it goes away, like when the server shuts down.
+        A later get_shared_client() on the same loop gets a new client.
+        """
+        loop: AbstractEventLoop = get_running_loop()
+        with OpenFgaStoreCache.lock:
+            clients: Dict[str, OpenFgaClient] = OpenFgaStoreCache.loop_clients.pop(loop, {})
+        for fga_client in clients.values():
+            await fga_client.close()
+
     @classmethod
     def _remove_key_for_testing(cls, store_name: str):
         """
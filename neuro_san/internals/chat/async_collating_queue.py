@@ -17,10 +17,19 @@
 
 from typing import Any
 from typing import AsyncIterator
+from typing import Deque
 from typing import Dict
+from typing import List
+
+import asyncio
+import threading
+
+from asyncio import AbstractEventLoop
+from collections import deque
 
 from janus import Queue
 
+from neuro_san.internals.chat.micro_batch import MicroBatch
 from neuro_san.internals.interfaces.async_hopper import AsyncHopper
 
 
@@ -28,6 +37,12 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
     """
     AsyncIterator instance to asynchronously iterate over/consume the contents of
     a Queue as they come in.
+
+    Optionally, items put() on the queue can be micro-batched so that several
+    of them move through the Queue in a single operation.  Batches are sent
+    when they are full, when the final item is put on the queue, or at the
+    latest once the event loop of the putter gets around to it.
+    Consumers iterating over this instance only ever see single items.
     """
     # Constant for the end key
     END_KEY: str = "end"
@@ -35,17 +50,33 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
     # Constant for the end message to be put in a Queue when all the messages are done
     END_MESSAGE: Dict[str, Any] = {END_KEY: True}
 
-    def __init__(self, queue: Queue = None):
+    def __init__(self, queue: Queue = None, batch_size: int = 1):
         """
         Constructor
 
         :param queue: The queue we will be iterating over.
                       Default value is None, indicating a standard Queue will be used.
+        :param batch_size: The maximum number of items that move through the queue
+                      in a single operation.  The default of 1 turns micro-batching off.
+                      Only turn this on when the consumer iterates over this instance,
+                      and not over the underlying Queue itself.
         """
         self.queue: Queue = queue
         if self.queue is None:
             self.queue = Queue()
 
+        self.batch_size: int = max(1, batch_size or 1)
+        self.batch: List[Any] = []
+        self.batch_lock = threading.Lock()
+        self.flush_task: asyncio.Task = None
+
+        # Items from a batch the consumer has not gotten to yet
+        self.pending: Deque[Any] = deque()
+
+        # The event loop the consumer iterates in. Puts from the same loop
+        # can use the asynchronous side of the queue.
+        self.consumer_loop: AbstractEventLoop = None
+
     def get_queue(self) -> Queue:
         """
         :return: The Queue associated with this instance
@@ -65,7 +96,16 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
                 Will throw StopAsyncIteration when the final item is detected
                 via the is_final_item() method..
         """
-        message = await self.queue.async_q.get()
+        if self.pending:
+            message = self.pending.popleft()
+        else:
+            if self.consumer_loop is None:
+                self.consumer_loop = asyncio.get_running_loop()
+            message = await self.queue.async_q.get()
+            if self.is_batch(message):
+                self.pending.extend(message)
+                message = self.pending.popleft()
+
         if self.is_final_item(message):
             raise StopAsyncIteration
 
@@ -81,13 +121,87 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
                 would be expected inside an async call, which is why it is the default.
                 When True, we use the synchronous side of the queue for put().
                 This ends up being necessary when each end of the queue is serviced
-                in a different asyncio event loop.
+                in a different asyncio event loop.  When the consumer is known to
+                be iterating in the same event loop as the caller, the asynchronous
+                side is used anyway, as it does not need to wake up the consumer's
+                event loop from another thread.
         """
-        if synchronous:
+        if self.batch_size > 1:
+            await self.add_to_batch(item, synchronous)
+        else:
+            await self.put_on_queue(item, synchronous)
+
+    async def put_on_queue(self, item: Any, synchronous: bool):
+        """
+        Puts a single item on the underlying queue
+        :param item: The item to put on the queue
+        :param synchronous: See put()
+        """
+        if synchronous and not self.is_consumer_loop():
             self.queue.sync_q.put(item)
         else:
             await self.queue.async_q.put(item)
 
+    def is_consumer_loop(self) -> bool:
+        """
+        :return: True if the caller runs in the event loop the consumer iterates in
+        """
+        if self.consumer_loop is None:
+            # Consumer has not started yet. Don't tie the queue to our loop.
+            return False
+        try:
+            return asyncio.get_running_loop() is self.consumer_loop
+        except RuntimeError:
+            return False
+
+    async def add_to_batch(self, item: Any, synchronous: bool):
+        """
+        Adds an item to the current micro-batch, sending the batch on when it is full.
+        :param item: The item to put on the queue
+        :param synchronous: See put()
+        """
+        items: List[Any] = None
+        with self.batch_lock:
+            self.batch.append(item)
+            if len(self.batch) >= self.batch_size:
+                items = self.take_batch()
+            elif len(self.batch) == 1:
+                # Make sure a batch that does not fill up still gets sent
+                # once this event loop gets around to it.
+                self.flush_task = asyncio.get_running_loop().create_task(self.flush(synchronous))
+
+        if items:
+            await self.put_batch(items, synchronous)
+
+    def take_batch(self) -> List[Any]:
+        """
+        Must be called with the batch_lock held.
+        :return: The items of the current micro-batch, leaving a new empty one in its place.
+        """
+        items: List[Any] = self.batch
+        self.batch = []
+        return items
+
+    async def flush(self, synchronous: bool = False):
+        """
+        Sends on any items waiting in the current micro-batch
+        :param synchronous: See put()
+        """
+        with self.batch_lock:
+            items: List[Any] = self.take_batch()
+        if items:
+            await self.put_batch(items, synchronous)
+
+    async def put_batch(self, items: List[Any], synchronous: bool):
+        """
+        :param items: The non-empty list of items to put on the queue as a single item
+        :param synchronous: See put()
+        """
+        item: Any = items[0]
+        if len(items) > 1:
+            item = MicroBatch(items)
+        await self.put_on_queue(item, synchronous)
+
     async def put_final_item(self, synchronous: bool = False):
         """
         Puts the final item on the queue indicating that no more data will
@@ -100,7 +214,9 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
                 This ends up being necessary when each end of the queue is serviced
                 in a different asyncio event loop.
         """
-        await self.put(self.END_MESSAGE, synchronous)
+        # Anything still waiting in a micro-batch goes before the end
+        await self.flush(synchronous)
+        await self.put_on_queue(self.END_MESSAGE, synchronous)
 
     def is_final_item(self, item: Any) -> bool:
         """
@@ -110,6 +226,13 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
         """
         return isinstance(item, Dict) and item.get(self.END_KEY) is not None
 
+    def is_batch(self, item: Any) -> bool:
+        """
+        :param item: An item that has just been pulled off the queue
+        :return: True if this item is a micro-batch of items. False otherwise.
+        """
+        return isinstance(item, MicroBatch)
+
     def close(self):
         """
         Close this queue
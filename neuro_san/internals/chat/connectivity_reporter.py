@@ -97,6 +97,26 @@ class ConnectivityReporter:
         connectivity: List[Dict[str, Any]] = self.report_node_connectivity(front_man, reported_agents)
         return connectivity
 
+    def report_connectivity_response(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary version of the ConnectivityResponse
+                    protobufs structure. Has the following keys:
+                "connectivity_info" - the list of connectivity descriptions for
+                                    each node in the agent network the service
+                                    wants the client ot know about.
+                "metadata" - the metadata of the agent network, if any
+        """
+        config: Dict[str, Any] = self.inspector.get_config()
+        metadata: Dict[str, Any] = config.get("metadata")
+        connectivity_info: List[Dict[str, Any]] = self.report_network_connectivity()
+        response_dict: Dict[str, Any] = {
+            "connectivity_info": connectivity_info,
+        }
+        if metadata is not None:
+            response_dict["metadata"] = metadata
+
+        return response_dict
+
     def report_node_connectivity(self, agent_name: str, reported_agents: Set[str]) -> List[Dict[str, Any]]:
         """
         Share the connectivity information of a single node in the network.
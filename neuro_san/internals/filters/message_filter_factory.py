@@ -18,9 +18,11 @@ from typing import Any
 from typing import Dict
 from typing import Type
 
+from neuro_san.internals.filters.compound_message_filter import CompoundMessageFilter
 from neuro_san.internals.filters.maximal_message_filter import MaximalMessageFilter
 from neuro_san.internals.filters.message_filter import MessageFilter
 from neuro_san.internals.filters.minimal_message_filter import MinimalMessageFilter
+from neuro_san.internals.filters.token_delta_message_filter import TokenDeltaMessageFilter
 
 TYPE_TO_MESSAGE_FILTER_CLASS: Dict[Any, Type[MessageFilter]] = {
     0:  MinimalMessageFilter,
@@ -64,4 +66,24 @@ class MessageFilterFactory:
 
         # Instantiate the class and return
         message_filter: MessageFilter = chat_filter_class()
+
+        if MessageFilterFactory.is_stream_tokens(chat_filter):
+            # Token deltas are asked for independently of the type of filter
+            message_filter = CompoundMessageFilter([message_filter, TokenDeltaMessageFilter()])
+
         return message_filter
+
+    @staticmethod
+    def is_stream_tokens(chat_filter: Dict[str, Any]) -> bool:
+        """
+        :param chat_filter: The ChatFilter dictionary to process.
+        :return: True if the ChatFilter asks for the front man's LLM output
+                to be streamed as it is generated.
+        """
+        if chat_filter is None:
+            return False
+
+        stream_tokens: Any = chat_filter.get("stream_tokens", False)
+        if isinstance(stream_tokens, str):
+            stream_tokens = stream_tokens.lower() == "true"
+        return bool(stream_tokens)
@@ -22,6 +22,9 @@ from langchain_core.messages.base import BaseMessage
 
 from neuro_san.internals.graph.interfaces.agent_tool_factory import AgentToolFactory
 from neuro_san.internals.graph.interfaces.callable_activation import CallableActivation
+from neuro_san.internals.interfaces.invocation_context import InvocationContext
+from neuro_san.internals.metrics.agent_span import AgentSpan
+from neuro_san.internals.metrics.agent_span_recorder import AgentSpanRecorder
 from neuro_san.internals.run_context.interfaces.agent_network_inspector import AgentNetworkInspector
 from neuro_san.internals.run_context.interfaces.run_context import RunContext
 
@@ -58,6 +61,9 @@ class AbstractCallableActivation(CallableActivation):
         # because not everyone needs an llm_config
         self.run_context: RunContext = None
 
+        # Timing information for this activation. Started by whoever calls us.
+        self.span: AgentSpan = None
+
     def get_agent_tool_spec(self) -> Dict[str, Any]:
         """
         :return: the dictionary describing the data-driven agent
@@ -97,6 +103,35 @@ class AbstractCallableActivation(CallableActivation):
         """
         return self.run_context.get_origin()
 
+    def get_span_kind(self) -> str:
+        """
+        :return: A short string describing what kind of activation this is
+                for the purposes of timing spans.
+        """
+        return "agent"
+
+    def start_span(self) -> AgentSpan:
+        """
+        Starts the timing span for this activation.
+        Needs to be called while the RunContext is still around.
+        :return: The started AgentSpan, or None if timing is not available
+        """
+        if self.run_context is None:
+            return None
+        invocation_context: InvocationContext = self.run_context.get_invocation_context()
+        if invocation_context is None:
+            return None
+        recorder: AgentSpanRecorder = invocation_context.get_span_recorder()
+        self.span = recorder.start_span(self.get_origin(), self.get_span_kind())
+        return self.span
+
+    def end_span(self):
+        """
+        Ends the timing span for this activation, if any.
+        """
+        if self.span is not None:
+            self.span.end()
+
     async def delete_resources(self, parent_run_context: RunContext):
         """
         Cleans up after any allocated resources on their server side.
@@ -22,7 +22,6 @@ from typing import Union
 
 from asyncio import AbstractEventLoop
 
-from copy import deepcopy
 from logging import getLogger
 from logging import Logger
 import traceback
@@ -108,8 +107,9 @@ class AbstractClassActivation(AbstractCallableActivation):
 
         # Set some standard args so CodedTool can know about origin, but only if they are
         # not already set by other infrastructure.
+        # The origin is handed over read-only, so there is no need to copy it.
         if self.arguments.get("origin") is None:
-            self.arguments["origin"] = deepcopy(self.run_context.get_origin())
+            self.arguments["origin"] = Origination.freeze_origin(self.run_context.get_origin())
         if self.arguments.get("origin_str") is None:
             self.arguments["origin_str"] = self.full_name
 
@@ -127,6 +127,13 @@ class AbstractClassActivation(AbstractCallableActivation):
             # do not have any access to service internals.
             self.arguments["reservationist"] = self.reservationist
 
+    def get_span_kind(self) -> str:
+        """
+        :return: A short string describing what kind of activation this is
+                for the purposes of timing spans.
+        """
+        return "coded_tool"
+
     def get_full_class_ref(self) -> str:
         """
         Returns the full class reference path of the target tool to be invoked.
@@ -20,6 +20,8 @@ from typing import List
 
 import uuid
 
+from time import time
+
 from aiohttp.client_exceptions import ClientConnectionError
 
 from langchain_core.messages.base import BaseMessage
@@ -100,6 +102,13 @@ class BranchActivation(CallingActivation, CallableActivation):
         # and the list of available tools.
         return agent_spec.get("command")
 
+    def get_span_kind(self) -> str:
+        """
+        :return: A short string describing what kind of activation this is
+                for the purposes of timing spans.
+        """
+        return "branch"
+
     async def integrate_callable_response(self, run: Run, messages: List[BaseMessage]) -> List[BaseMessage]:
         """
         :param run: The Run for the prescriptor (if any)
@@ -118,7 +127,7 @@ class BranchActivation(CallingActivation, CallableActivation):
         while run.requires_action():
             # The tool we just called requires more information
             new_run: Run = await self.make_tool_function_calls(run)
-            new_run = await self.run_context.wait_on_run(new_run, self.journal)
+            new_run = await self.timed_wait_on_run(new_run)
             new_messages = await self.run_context.get_response()
 
         return new_messages
@@ -144,7 +153,7 @@ class BranchActivation(CallingActivation, CallableActivation):
             assignments = assignments + "\n" + command
 
         run: Run = await self.run_context.submit_message(assignments)
-        run = await self.run_context.wait_on_run(run, self.journal)
+        run = await self.timed_wait_on_run(run)
 
         messages: List[BaseMessage] = await self.run_context.get_response()
 
@@ -184,6 +193,8 @@ class BranchActivation(CallingActivation, CallableActivation):
                                                                                        sly_data,
                                                                                        tool_args)
         message: BaseMessage = None
+        start_time: float = time()
+        callable_activation.start_span()
         try:
             # DEF - need to integrate sly_data
             message = await callable_activation.build()
@@ -203,6 +214,11 @@ flag to your invocation.
             # Nope. Just a regular http connection failure given the tool_name. Can't help ya.
             raise exception
 
+        finally:
+            callable_activation.end_span()
+            if self.span is not None:
+                self.span.add_tool_wait(time() - start_time)
+
         # We got a message back, take the content as the return string
         return message.content
 
@@ -18,6 +18,8 @@ from typing import Any
 from typing import Dict
 from typing import List
 
+from time import time
+
 from langchain_core.messages.base import BaseMessage
 
 from leaf_common.config.dictionary_overlay import DictionaryOverlay
@@ -26,6 +28,7 @@ from neuro_san.internals.graph.activations.abstract_callable_activation import A
 from neuro_san.internals.graph.interfaces.agent_tool_factory import AgentToolFactory
 from neuro_san.internals.graph.interfaces.callable_activation import CallableActivation
 from neuro_san.internals.journals.journal import Journal
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
 from neuro_san.internals.run_context.factory.run_context_factory import RunContextFactory
 from neuro_san.internals.run_context.interfaces.run import Run
 from neuro_san.internals.run_context.interfaces.run_context import RunContext
@@ -182,14 +185,19 @@ context with which it will proces input, essentially telling it what to do.
         component_tool_calls: List[ToolCall] = component_run.get_tool_calls()
         tool_outputs: List[Dict[str, Any]] = []  # Initialize an empty list to store tool outputs
 
-        # Call each of the the listed tools and collect the results
-        # of their function(s).
-        for component_tool_call in component_tool_calls:
+        start_time: float = time()
+        try:
+            # Call each of the the listed tools and collect the results
+            # of their function(s).
+            for component_tool_call in component_tool_calls:
 
-            tool_output: Dict[str, Any] = await self.make_one_tool_function_call(component_tool_call)
+                tool_output: Dict[str, Any] = await self.make_one_tool_function_call(component_tool_call)
 
-            # Add the tool output for the current component_tool_call to the list
-            tool_outputs.append(tool_output)
+                # Add the tool output for the current component_tool_call to the list
+                tool_outputs.append(tool_output)
+        finally:
+            if self.span is not None:
+                self.span.add_tool_wait(time() - start_time)
 
         # Submit all tool outputs at once after the loop has gathered all
         # outputs of all CallableActivation' functions.
@@ -226,7 +234,15 @@ context with which it will proces input, essentially telling it what to do.
             self.factory.create_agent_activation(self.run_context, our_agent_spec, use_tool_name,
                                                  self.sly_data, tool_arguments)
 
-        message: BaseMessage = await callable_component.build()
+        start_time: float = time()
+        callable_component.start_span()
+        try:
+            message: BaseMessage = await callable_component.build()
+        finally:
+            callable_component.end_span()
+        MetricsRegistry.get_instance().observe(MetricsRegistry.TOOL_CALL_DURATION,
+                                               {"agent": use_tool_name},
+                                               time() - start_time)
 
         # Prepare the tool output
         tool_output: Dict[str, Any] = {
@@ -248,6 +264,28 @@ context with which it will proces input, essentially telling it what to do.
 
         return tool_output
 
+    async def timed_wait_on_run(self, run: Run) -> Run:
+        """
+        Waits on the given run with the RunContext, attributing the time
+        not spent in tool calls made along the way to waiting on the LLM.
+
+        :param run: The run to wait on
+        :return: A potentially updated run
+        """
+        if self.span is None:
+            return await self.run_context.wait_on_run(run, self.journal)
+
+        # Tools are called from within the wait, so keep track of how much
+        # of the wait they account for.
+        tool_wait_before: float = self.span.tool_wait_seconds
+        start_time: float = time()
+        try:
+            run = await self.run_context.wait_on_run(run, self.journal)
+        finally:
+            elapsed: float = time() - start_time
+            self.span.add_llm_wait(elapsed - (self.span.tool_wait_seconds - tool_wait_before))
+        return run
+
     async def build(self) -> BaseMessage:
         """
         Main entry point to the class.
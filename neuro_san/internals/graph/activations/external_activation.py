@@ -135,6 +135,13 @@ class ExternalActivation(AbstractCallableActivation):
         """
         return self.agent_url
 
+    def get_span_kind(self) -> str:
+        """
+        :return: A short string describing what kind of activation this is
+                for the purposes of timing spans.
+        """
+        return "external"
+
     # pylint: disable=too-many-locals
     async def build(self) -> BaseMessage:
         """
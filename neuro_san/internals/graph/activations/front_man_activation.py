@@ -14,13 +14,19 @@
 # limitations under the License.
 #
 # END COPYRIGHT
+from typing import Any
+from typing import Dict
 from typing import List
 
+import os
+
 from langchain_core.messages.base import BaseMessage
 
 from neuro_san.internals.graph.activations.calling_activation import CallingActivation
 from neuro_san.internals.interfaces.front_man import FrontMan
 from neuro_san.internals.interfaces.invocation_context import InvocationContext
+from neuro_san.internals.metrics.agent_span_recorder import AgentSpanRecorder
+from neuro_san.internals.metrics.otlp_json_span_exporter import OtlpJsonSpanExporter
 from neuro_san.internals.run_context.interfaces.run import Run
 
 
@@ -45,31 +51,64 @@ class FrontManActivation(CallingActivation, FrontMan):
         # Initialize our return value
         messages: List[BaseMessage] = []
 
-        current_run: Run = await self.run_context.submit_message(user_input)
-
-        terminate = False
-        while not terminate:
-            if self.run_context is None:
-                # Breaking from inside a container during cleanup can yield a None
-                # run_context
-                break
+        # Each exchange with the front man gets its own tree of timing spans
+        invocation_context: InvocationContext = self.run_context.get_invocation_context()
+        recorder: AgentSpanRecorder = invocation_context.get_span_recorder()
+        recorder.reset()
+        self.start_span()
 
-            current_run = await self.run_context.wait_on_run(current_run, self.journal)
+        try:
+            current_run: Run = await self.run_context.submit_message(user_input)
 
-            if current_run.requires_action():
-                current_run = await self.make_tool_function_calls(current_run)
-            else:
-                # Needs to get more information from the user on the basic task
-                # of collecting information from the user about the current run.
+            terminate = False
+            while not terminate:
                 if self.run_context is None:
                     # Breaking from inside a container during cleanup can yield a None
                     # run_context
                     break
-                messages = await self.run_context.get_response()
-                terminate = True
+
+                current_run = await self.timed_wait_on_run(current_run)
+
+                if current_run.requires_action():
+                    current_run = await self.make_tool_function_calls(current_run)
+                else:
+                    # Needs to get more information from the user on the basic task
+                    # of collecting information from the user about the current run.
+                    if self.run_context is None:
+                        # Breaking from inside a container during cleanup can yield a None
+                        # run_context
+                        break
+                    messages = await self.run_context.get_response()
+                    terminate = True
+        finally:
+            self.end_span()
+            self.report_spans(invocation_context)
 
         return messages
 
+    @staticmethod
+    def report_spans(invocation_context: InvocationContext):
+        """
+        Puts the tree of timing spans for the request into the request reporting
+        and optionally appends them as OTLP JSON to the file named by the
+        AGENT_SPAN_EXPORT_FILE environment variable.
+        :param invocation_context: The context policy container that pertains to the invocation
+        """
+        recorder: AgentSpanRecorder = invocation_context.get_span_recorder()
+        request_reporting: Dict[str, Any] = invocation_context.get_request_reporting()
+        request_reporting["spans"] = recorder.get_span_tree()
+
+        export_file: str = os.environ.get("AGENT_SPAN_EXPORT_FILE")
+        if export_file:
+            OtlpJsonSpanExporter(export_file).export(recorder)
+
+    def get_span_kind(self) -> str:
+        """
+        :return: A short string describing what kind of activation this is
+                for the purposes of timing spans.
+        """
+        return "front_man"
+
     def update_invocation_context(self, invocation_context: InvocationContext):
         """
         Update internal state based on the InvocationContext instance passed in.
@@ -27,6 +27,13 @@ class ToolboxActivation(AbstractClassActivation):
     Note that this class does not apply to Langchain's base tools.
     """
 
+    def get_span_kind(self) -> str:
+        """
+        :return: A short string describing what kind of activation this is
+                for the purposes of timing spans.
+        """
+        return "toolbox"
+
     def get_full_class_ref(self) -> str:
         """
         Returns the full class reference path from a predefined toolbox.
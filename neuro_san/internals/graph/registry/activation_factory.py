@@ -219,6 +219,12 @@ Check to be sure your value for PYTHONPATH includes where you expect where your
         """
         return self.agent_network.get_config()
 
+    def get_network_name(self) -> str:
+        """
+        :return: The name of the agent network
+        """
+        return self.agent_network.get_network_name()
+
     def get_name_from_spec(self, agent_spec: Dict[str, Any]) -> str:
         """
         :param agent_spec: A single agent to register
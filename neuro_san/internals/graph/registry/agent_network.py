@@ -20,6 +20,8 @@ from typing import List
 
 from leaf_common.parsers.dictionary_extractor import DictionaryExtractor
 
+from neuro_san.internals.utils.etag_util import EtagUtil
+
 from neuro_san.internals.run_context.interfaces.agent_network_inspector import \
     AgentNetworkInspector
 
@@ -47,6 +49,11 @@ class AgentNetwork(AgentNetworkInspector):
 
         self.first_agent: str = None
 
+        # Precomputed ConnectivityResponse dictionary and its ETag.
+        # None until set_connectivity() is called.
+        self.connectivity: Dict[str, Any] = None
+        self.connectivity_etag: str = None
+
         agent_specs = self.config.get("tools")
         if agent_specs is not None:
             for agent_spec in agent_specs:
@@ -71,6 +78,29 @@ class AgentNetwork(AgentNetworkInspector):
         """
         return self.is_mcp_network
 
+    def set_connectivity(self, connectivity: Dict[str, Any]):
+        """
+        :param connectivity: The ConnectivityResponse dictionary for this network,
+                computed once so that it does not have to be for every request.
+        """
+        self.connectivity_etag = EtagUtil.compute_etag(connectivity)
+        self.connectivity = connectivity
+
+    def get_connectivity(self) -> Dict[str, Any]:
+        """
+        :return: The precomputed ConnectivityResponse dictionary for this network,
+                or None if it has not been computed.  This dictionary is shared
+                between requests and must not be modified.
+        """
+        return self.connectivity
+
+    def get_connectivity_etag(self) -> str:
+        """
+        :return: The strong ETag of the precomputed ConnectivityResponse dictionary,
+                or None if it has not been computed.
+        """
+        return self.connectivity_etag
+
     def register(self, agent_spec: Dict[str, Any]):
         """
         :param agent_spec: A single agent to register
@@ -86,6 +86,12 @@ class AgentToolRegistry(AgentNetworkInspector, AgentToolFactory):
         """
         return self.agent_network.get_config()
 
+    def get_network_name(self) -> str:
+        """
+        :return: The name of the agent network
+        """
+        return self.agent_network.get_network_name()
+
     def get_agent_tool_spec(self, name: str) -> Dict[str, Any]:
         """
         :param name: The name of the agent tool to get out of the registry
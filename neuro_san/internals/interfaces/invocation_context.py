@@ -27,6 +27,7 @@ from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextT
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.metrics.agent_span_recorder import AgentSpanRecorder
 
 
 class InvocationContext:
@@ -94,6 +95,19 @@ class InvocationContext:
         """
         raise NotImplementedError
 
+    def get_span_recorder(self) -> AgentSpanRecorder:
+        """
+        :return: The AgentSpanRecorder collecting per-agent timing for the request
+        """
+        raise NotImplementedError
+
+    def is_stream_tokens(self) -> bool:
+        """
+        :return: True if the text generated by the front man's LLM is to be
+                streamed to the client as it is produced.
+        """
+        raise NotImplementedError
+
     def get_llm_factory(self) -> ContextTypeLlmFactory:
         """
         :return: The ContextTypeLlmFactory instance for the session
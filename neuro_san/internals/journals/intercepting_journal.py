@@ -16,11 +16,13 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 
 from langchain_core.messages.base import BaseMessage
 
 from neuro_san.internals.journals.journal import Journal
+from neuro_san.internals.journals.message_retention import MessageRetention
 from neuro_san.internals.messages.traced_message import TracedMessage
 
 
@@ -30,16 +32,22 @@ class InterceptingJournal(Journal):
     to another wrapped Journal.
     """
 
-    def __init__(self, wrapped_journal: Journal, origin: List[Dict[str, Any]]):
+    def __init__(self, wrapped_journal: Journal, origin: List[Dict[str, Any]],
+                 retention: MessageRetention = None):
         """
         Constructor
 
         :param wrapped_journal: The journal to forward messages to
         :param origin: The origin dictionary to match for intercepts
+        :param retention: The MessageRetention policy deciding which intercepted
+                    messages are kept. Default is None, which uses a policy
+                    configured from environment variables.
         """
         self.wrapped_journal: Journal = wrapped_journal
         self.origin: List[Dict[str, Any]] = origin
-        self.messages: List[BaseMessage] = []
+        self.messages: MessageRetention = retention
+        if self.messages is None:
+            self.messages = MessageRetention.create_from_environment()
 
     async def write_message(self, message: BaseMessage, origin: List[Dict[str, Any]]):
         """
@@ -81,10 +89,23 @@ class InterceptingJournal(Journal):
             if isinstance(message, TracedMessage):
                 new_message = message.__class__(trace_source=message)
 
-            self.messages.append(new_message)
+            self.messages.add(new_message)
+
+    def iterate_messages(self) -> Iterator[BaseMessage]:
+        """
+        :return: An iterator over the intercepted messages that were kept, oldest first
+        """
+        return iter(self.messages)
 
     def get_messages(self) -> List[BaseMessage]:
         """
-        :return: the intercepted messages
+        Prefer iterate_messages(), which does not need all messages in memory at once.
+        :return: A list of the intercepted messages that were kept
+        """
+        return list(self.messages)
+
+    def close(self):
+        """
+        Forgets all intercepted messages, removing any temporary file they were spilled to
         """
-        return self.messages
+        self.messages.close()
@@ -40,6 +40,9 @@ class MessageJournal(Journal):
         """
         self.hopper: AsyncHopper = hopper
 
+        # The origin is given per message, so one converter does for all of them
+        self.converter = BaseMessageDictionaryConverter()
+
     async def write_message(self, message: BaseMessage, origin: List[Dict[str, Any]]):
         """
         Writes a BaseMessage entry into the journal
@@ -51,13 +54,14 @@ class MessageJournal(Journal):
                     "instantiation_index"   An integer indicating which incarnation
                                             of the tool is being dealt with.
         """
-        converter = BaseMessageDictionaryConverter(origin=origin)
-        message_dict: Dict[str, Any] = converter.to_dict(message)
+        message_dict: Dict[str, Any] = self.converter.to_dict_with_origin(message, origin)
 
         # Queue Producer from this:
         #   https://stackoverflow.com/questions/74130544/asyncio-yielding-results-from-multiple-futures-as-they-arrive
         # The synchronous=True is necessary when an async HTTP request is at the get()-ing end of the queue,
         # as the journal messages come from inside a separate event loop from that request. The lock
         # taken here ends up being harmless in the synchronous request case (like for gRPC) because
-        # we would only be blocking our own event loop.
+        # we would only be blocking our own event loop.  When the consumer turns out to be in our own
+        # event loop (like for direct sessions to other agent networks), the hopper can use the
+        # asynchronous side of its queue instead.
         await self.hopper.put(message_dict, synchronous=True)
@@ -0,0 +1,169 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Deque
+from typing import IO
+from typing import Iterator
+from typing import List
+from typing import Set
+
+import os
+import pickle
+import tempfile
+
+from collections import deque
+
+from langchain_core.messages.base import BaseMessage
+
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+
+
+class MessageRetention:
+    """
+    Keeps the messages an InterceptingJournal has intercepted according to a
+    retention policy, so that long-running agents with chatty sub-agents do not
+    grow memory with every message they see.
+
+    Policies are:
+        * keep everything (the default)
+        * keep only the last N messages
+        * keep only answer messages (AI and AGENT_FRAMEWORK types)
+        * keep everything, but spill messages to a temporary file once
+          the kept messages exceed a number of bytes
+
+    Answer-only retention can be combined with either of the others.
+    Keeping only the last N messages takes precedence over spilling.
+    """
+
+    ANSWER_TYPES: Set[ChatMessageType] = {ChatMessageType.AI, ChatMessageType.AGENT_FRAMEWORK}
+
+    def __init__(self, max_messages: int = 0, answers_only: bool = False, spill_bytes: int = 0):
+        """
+        Constructor
+
+        :param max_messages: The maximum number of messages to keep. Older messages
+                    are dropped first. 0 (the default) means there is no maximum.
+        :param answers_only: When True, only keep AI and AGENT_FRAMEWORK messages.
+                    Default is False, which keeps messages of every type.
+        :param spill_bytes: When there is no max_messages, the number of bytes of
+                    pickled messages to keep in memory before all messages are
+                    spilled to a temporary file. 0 (the default) means never spill.
+        """
+        self.max_messages: int = max(0, max_messages or 0)
+        self.answers_only: bool = answers_only
+        self.spill_bytes: int = 0
+        if self.max_messages == 0:
+            self.spill_bytes = max(0, spill_bytes or 0)
+
+        self.messages: Deque[BaseMessage] = deque(maxlen=self.max_messages or None)
+
+        # State for spilling
+        self.num_bytes: int = 0
+        self.spill_file: IO[bytes] = None
+
+    @classmethod
+    def create_from_environment(cls) -> "MessageRetention":
+        """
+        :return: A new MessageRetention configured from environment variables
+        """
+        max_messages: int = int(os.environ.get("AGENT_INTERCEPT_MAX_MESSAGES", "0"))
+        answers_only: bool = os.environ.get("AGENT_INTERCEPT_ANSWERS_ONLY", "false").lower() in ("true", "1")
+        # Note that spilling pickles the full content of agent messages into an
+        # unencrypted file in the system temporary directory (usually /tmp, see TMPDIR)
+        # for as long as the agent is active.
+        spill_bytes: int = int(os.environ.get("AGENT_INTERCEPT_SPILL_BYTES", "0"))
+        return MessageRetention(max_messages, answers_only, spill_bytes)
+
+    def add(self, message: BaseMessage):
+        """
+        :param message: The message to keep, if the policy allows
+        """
+        if self.answers_only and ChatMessageType.from_message(message) not in self.ANSWER_TYPES:
+            return
+
+        if self.spill_bytes == 0:
+            self.messages.append(message)
+            return
+
+        data: bytes = pickle.dumps(message)
+        if self.spill_file is not None:
+            self.spill_file.write(data)
+            return
+
+        self.messages.append(message)
+        self.num_bytes += len(data)
+        if self.num_bytes > self.spill_bytes:
+            self.spill()
+
+    def spill(self):
+        """
+        Moves all messages kept in memory to the temporary file.
+        Every message after this goes straight to the file.
+        """
+        # Deleted as soon as it is closed or garbage collected.
+        # Unbuffered, so readers always see whole messages.
+        # This stays open for writing past this method, so it cannot be opened in a with block.
+        # close() is called by the owner of this instance when it is done with it.
+        # pylint: disable=consider-using-with
+        self.spill_file = tempfile.NamedTemporaryFile(prefix="neuro_san_messages_", buffering=0)
+        for message in self.messages:
+            pickle.dump(message, self.spill_file)
+        self.messages.clear()
+        self.num_bytes = 0
+
+    def __iter__(self) -> Iterator[BaseMessage]:
+        """
+        :return: An iterator over the kept messages, oldest first.
+                Spilled messages are read back one at a time.
+        """
+        if self.spill_file is not None:
+            # Read with a file position of our own, so messages can still be
+            # written while the consumer iterates.
+            with open(self.spill_file.name, "rb") as reader:
+                while True:
+                    try:
+                        yield pickle.load(reader)
+                    except EOFError:
+                        break
+
+        # Iterate over a copy, as messages can be added while the consumer iterates
+        messages: List[BaseMessage] = list(self.messages)
+        yield from messages
+
+    def get_size(self) -> int:
+        """
+        :return: The number of messages kept in memory
+        """
+        return len(self.messages)
+
+    def is_spilled(self) -> bool:
+        """
+        :return: True if messages have been spilled to a temporary file
+        """
+        return self.spill_file is not None
+
+    def close(self):
+        """
+        Forgets all kept messages, removing any temporary file
+        """
+        self.messages.clear()
+        self.num_bytes = 0
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
@@ -0,0 +1,49 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from __future__ import annotations
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Literal
+from typing import Union
+
+from neuro_san.internals.messages.traced_message import TracedMessage
+
+
+class AgentTokenDeltaMessage(TracedMessage):
+    """
+    TracedMessage implementation of an incremental piece of text
+    generated by the front man's LLM while it is still producing its answer.
+
+    These are only ever streamed to clients that ask for them and
+    never become part of any chat history.
+    """
+
+    type: Literal["agent-token-delta"] = "agent-token-delta"
+
+    def __init__(self, content: Union[str, List[Union[str, Dict]]] = "",
+                 trace_source: AgentTokenDeltaMessage = None,
+                 **kwargs: Any) -> None:
+        """
+        Constructor
+
+        :param content: The string contents of the delta.
+        :param trace_source: A message of the same type to prepare for tracing display
+        :param kwargs: Additional fields to pass to initialize
+        """
+        super().__init__(content=content, trace_source=trace_source, **kwargs)
@@ -30,6 +30,7 @@ from leaf_common.serialization.interface.dictionary_converter import DictionaryC
 from neuro_san.internals.messages.agent_message import AgentMessage
 from neuro_san.internals.messages.agent_framework_message import AgentFrameworkMessage
 from neuro_san.internals.messages.agent_progress_message import AgentProgressMessage
+from neuro_san.internals.messages.agent_token_delta_message import AgentTokenDeltaMessage
 from neuro_san.internals.messages.agent_tool_result_message import AgentToolResultMessage
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
 
@@ -40,6 +41,17 @@ class BaseMessageDictionaryConverter(DictionaryConverter):
     back and forth to our own ChatMessage dictionary format (as defined in chat.proto).
     """
 
+    # Dictionary of BaseMessage field sources to ChatMessage destinations
+    # Anything in this dictionary is considered optional and we only populate
+    # the field on ChatMessage if it has a value.
+    OPTIONALS: Dict[str, str] = {
+        "content": "text",
+        "chat_context": "chat_context",
+        "tool_result_origin": "tool_result_origin",
+        "structure": "structure",
+        "sly_data": "sly_data",
+    }
+
     def __init__(self, origin: List[Dict[str, Any]] = None,
                  langchain_only: bool = True):
         """
@@ -66,6 +78,18 @@ class BaseMessageDictionaryConverter(DictionaryConverter):
         :param obj: The BaseMessage to convert
         :return: The ChatMessage in dictionary form
         """
+        return self.to_dict_with_origin(obj, self.origin)
+
+    def to_dict_with_origin(self, obj: BaseMessage, origin: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert the BaseMessage to a chat.ChatMessage dictionary.
+        This allows a single instance to convert messages of many origins.
+
+        :param obj: The BaseMessage to convert
+        :param origin: A List of origin dictionaries indicating the origin of the message.
+                Can be None.
+        :return: The ChatMessage in dictionary form
+        """
 
         message: BaseMessage = obj
         message_type: ChatMessageType = ChatMessageType.from_message(message)
@@ -75,20 +99,10 @@ class BaseMessageDictionaryConverter(DictionaryConverter):
         }
 
         # Handle the origin information if we have it
-        if self.origin is not None:
-            chat_message["origin"] = self.origin
-
-        # Dictionary of BaseMessage field sources to ChatMessage destinations
-        # Anything in this dictionary is considered optional and we only populate
-        # the field on ChatMessage if it has a value.
-        optionals: Dict[str, str] = {
-            "content": "text",
-            "chat_context": "chat_context",
-            "tool_result_origin": "tool_result_origin",
-            "structure": "structure",
-            "sly_data": "sly_data",
-        }
-        for src, dest in optionals.items():
+        if origin is not None:
+            chat_message["origin"] = origin
+
+        for src, dest in self.OPTIONALS.items():
             value: Any = None
             try:
                 value = getattr(message, src)
@@ -159,6 +173,8 @@ class BaseMessageDictionaryConverter(DictionaryConverter):
             elif chat_message_type == ChatMessageType.AGENT_PROGRESS:
                 base_message = AgentProgressMessage(content=chat_message.get("text", ""),
                                                     structure=chat_message.get("structure"))
+            elif chat_message_type == ChatMessageType.AGENT_TOKEN_DELTA:
+                base_message = AgentTokenDeltaMessage(content=chat_message.get("text", ""))
 
         # Any other message type we do not want to send to any agent as chat history.
 
@@ -171,7 +187,8 @@ class BaseMessageDictionaryConverter(DictionaryConverter):
         :return: True if the BaseMessage type is relevant to chat history (include).
                  False otherwise (do not include).
         """
-        if isinstance(base_message, (AgentMessage, AgentFrameworkMessage, ToolMessage, AgentProgressMessage)):
+        if isinstance(base_message, (AgentMessage, AgentFrameworkMessage, ToolMessage, AgentProgressMessage,
+                                     AgentTokenDeltaMessage)):
             # These guys cannot be in chat history as langchain will not recognize them.
             return False
         return True
@@ -29,6 +29,7 @@ from langchain_core.messages.system import SystemMessage
 from neuro_san.internals.messages.agent_framework_message import AgentFrameworkMessage
 from neuro_san.internals.messages.agent_message import AgentMessage
 from neuro_san.internals.messages.agent_progress_message import AgentProgressMessage
+from neuro_san.internals.messages.agent_token_delta_message import AgentTokenDeltaMessage
 from neuro_san.internals.messages.agent_tool_result_message import AgentToolResultMessage
 
 
@@ -46,6 +47,7 @@ class ChatMessageType(IntEnum):
     AGENT_FRAMEWORK = 101
     AGENT_TOOL_RESULT = 103
     AGENT_PROGRESS = 104
+    AGENT_TOKEN_DELTA = 105
 
     # Adding something? Don't forget to update the maps below.
 
@@ -109,6 +111,7 @@ _MESSAGE_TYPE_TO_CHAT_MESSAGE_TYPE: Dict[Type[BaseMessage], ChatMessageType] = {
     AgentFrameworkMessage: ChatMessageType.AGENT_FRAMEWORK,
     AgentToolResultMessage: ChatMessageType.AGENT_TOOL_RESULT,
     AgentProgressMessage: ChatMessageType.AGENT_PROGRESS,
+    AgentTokenDeltaMessage: ChatMessageType.AGENT_TOKEN_DELTA,
 }
 
 _CHAT_MESSAGE_TYPE_TO_STRING: Dict[ChatMessageType, str] = {
@@ -123,4 +126,5 @@ _CHAT_MESSAGE_TYPE_TO_STRING: Dict[ChatMessageType, str] = {
     ChatMessageType.AGENT_FRAMEWORK: "AGENT_FRAMEWORK",
     ChatMessageType.AGENT_TOOL_RESULT: "AGENT_TOOL_RESULT",
     ChatMessageType.AGENT_PROGRESS: "AGENT_PROGRESS",
+    ChatMessageType.AGENT_TOKEN_DELTA: "AGENT_TOKEN_DELTA",
 }
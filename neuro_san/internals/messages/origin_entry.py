@@ -0,0 +1,112 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NoReturn
+from typing import Tuple
+
+import sys
+
+
+class OriginEntry(dict):
+    """
+    A single component dictionary of an origin list that cannot be modified.
+
+    Origin lists are built by shallow copying the origin of the parent and
+    appending one new entry, so entries are shared by every deeper origin.
+    Keeping entries immutable allows whole origins to be handed to CodedTools
+    without copying them first.
+
+    As this is still a dictionary, it serializes and compares just like
+    the plain dictionaries that describe origins elsewhere.
+
+    An entry can also remember the full name of the origin it was created
+    at the end of, so the name need not be rebuilt for every message.
+    That full name is not one of the dictionary's items.
+    """
+
+    __slots__ = ("full_name", "origin_length", "parent")
+
+    def __init__(self, *args, **kwargs):
+        """
+        Constructor. Takes the same arguments as dict.
+        """
+        super().__init__(*args, **kwargs)
+        self.full_name: str = None
+        self.origin_length: int = 0
+        self.parent: Dict[str, Any] = None
+
+    def set_full_name(self, origin: List[Dict[str, Any]], full_name: str):
+        """
+        :param origin: The origin list this entry is the last element of
+        :param full_name: The full name of that origin. This gets interned,
+                as every message from the same agent carries the same name.
+        """
+        self.origin_length = len(origin)
+        self.parent = origin[-2] if self.origin_length > 1 else None
+        self.full_name = sys.intern(full_name)
+
+    def get_full_name(self, origin: List[Dict[str, Any]]) -> str:
+        """
+        :param origin: An origin list this entry is the last element of
+        :return: The remembered full name if the origin is the one this entry
+                was created at the end of. None otherwise, for instance
+                when the entry ended up in an origin received from a sub-network.
+        """
+        if self.full_name is None or len(origin) != self.origin_length:
+            return None
+        if self.origin_length > 1 and origin[-2] is not self.parent:
+            return None
+        return self.full_name
+
+    def _read_only(self, *args, **kwargs) -> NoReturn:
+        """
+        Refuses any modification
+        """
+        raise TypeError(f"{self.__class__.__name__} cannot be modified")
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> "OriginEntry":
+        """
+        :return: This instance, as there is nothing to copy for an immutable entry
+        """
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "OriginEntry":
+        """
+        :param memo: The memo dictionary of the ongoing deepcopy
+        :return: This instance, as there is nothing to copy for an immutable entry
+        """
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        :return: A way to pickle that does not need to set items one at a time
+        """
+        return (self.__class__, (dict(self),))
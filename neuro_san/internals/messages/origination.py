@@ -17,9 +17,11 @@
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Tuple
 
 from copy import copy
 
+from neuro_san.internals.messages.origin_entry import OriginEntry
 from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
 
 
@@ -73,15 +75,39 @@ class Origination:
         instantiation_index: int = self.tool_to_index_map.get(agent_name, Origination.INSTANTIATION_START)
         self.tool_to_index_map[agent_name] = instantiation_index + 1
 
-        # Prepare the origin dictionary to append
-        origin_dict: Dict[str, Any] = {
+        # Prepare the origin dictionary to append.
+        # This is shared by all deeper origins, so it cannot be modified.
+        origin_dict: OriginEntry = OriginEntry({
             "tool": agent_name,
             "instantiation_index": instantiation_index
-        }
+        })
         new_origin.append(origin_dict)
 
+        # Work out the full name once, as it is asked for with every message
+        origin_dict.set_full_name(new_origin, Origination.build_full_name(new_origin))
+
         return new_origin
 
+    @staticmethod
+    def freeze_origin(origin: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], ...]:
+        """
+        :param origin: A List of origin dictionaries indicating the origin of the run.
+        :return: A read-only version of the origin that can be handed out without
+                copying it first: a tuple of OriginEntry dictionaries.
+                Entries that are already OriginEntries are shared, not copied.
+                None if the origin is None.
+        """
+        if origin is None:
+            return None
+
+        frozen: List[Dict[str, Any]] = []
+        for origin_dict in origin:
+            if isinstance(origin_dict, dict) and not isinstance(origin_dict, OriginEntry):
+                origin_dict = OriginEntry(origin_dict)
+            frozen.append(origin_dict)
+
+        return tuple(frozen)
+
     @staticmethod
     def get_full_name_from_origin(origin: List[Dict[str, Any]]) -> str:
         """
@@ -96,6 +122,20 @@ class Origination:
         if origin is None:
             return None
 
+        # Most origins were made by add_spec_name_to_origin() and already know their name
+        if len(origin) > 0 and isinstance(origin[-1], OriginEntry):
+            full_name: str = origin[-1].get_full_name(origin)
+            if full_name is not None:
+                return full_name
+
+        return Origination.build_full_name(origin)
+
+    @staticmethod
+    def build_full_name(origin: List[Dict[str, Any]]) -> str:
+        """
+        :param origin: A List of origin dictionaries indicating the origin of the run.
+        :return: A single string name built from every element of the origin path/list
+        """
         # Connect all the elements of the origin by the delimiter "."
         origin_list: List[str] = []
         for origin_dict in origin:
@@ -0,0 +1,92 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+import os
+import threading
+
+from time import time
+
+
+# pylint: disable=too-many-instance-attributes
+class AgentSpan:
+    """
+    Timing information for a single activation of an agent within a request.
+
+    Spans are identified by the full origin name of the agent activation
+    (e.g. "front_man.sub_agent-02") and know the full origin name of their parent,
+    which is what allows an AgentSpanRecorder to assemble them into a tree.
+
+    Besides the wall-clock start and end, a span accumulates the time the agent
+    spent waiting on its LLM and the time it spent waiting on the tools it called.
+    Tool calls made in parallel each contribute their own wait, so tool wait
+    can exceed the wall-clock duration of the span.
+    """
+
+    def __init__(self, name: str, kind: str, parent_name: str = None):
+        """
+        Constructor
+
+        :param name: The full origin name of the agent activation
+        :param kind: A short string describing what kind of activation this is
+                    (e.g. "front_man", "branch", "coded_tool", "external")
+        :param parent_name: The full origin name of the calling agent activation.
+                    None if this is the root of the tree.
+        """
+        self.name: str = name
+        self.kind: str = kind
+        self.parent_name: str = parent_name
+        self.span_id: str = os.urandom(8).hex()
+
+        self.start_time: float = time()
+        self.end_time: float = None
+        self.llm_wait_seconds: float = 0.0
+        self.tool_wait_seconds: float = 0.0
+
+        # Multiple tool calls can report back concurrently
+        self.lock = threading.Lock()
+
+    def end(self):
+        """
+        Marks the end of the span.  Only the first call has any effect.
+        """
+        if self.end_time is None:
+            self.end_time = time()
+
+    def add_llm_wait(self, seconds: float):
+        """
+        :param seconds: The number of seconds to add to the time spent waiting on the LLM
+        """
+        with self.lock:
+            self.llm_wait_seconds += max(0.0, seconds)
+
+    def add_tool_wait(self, seconds: float):
+        """
+        :param seconds: The number of seconds to add to the time spent waiting on tools
+        """
+        with self.lock:
+            self.tool_wait_seconds += max(0.0, seconds)
+
+    def get_duration(self) -> float:
+        """
+        :return: The number of seconds the span lasted, or has lasted so far
+                if it has not ended yet.
+        """
+        end_time: float = self.end_time
+        if end_time is None:
+            end_time = time()
+        return end_time - self.start_time
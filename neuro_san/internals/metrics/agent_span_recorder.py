@@ -0,0 +1,130 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+import os
+import threading
+
+from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.metrics.agent_span import AgentSpan
+
+# Number of decimal places kept for seconds in the span tree
+PRECISION: int = 6
+
+
+class AgentSpanRecorder:
+    """
+    Collects the AgentSpans of a single request (one exchange with the front man)
+    and assembles them into a compact tree suitable for request reporting.
+
+    One instance lives on each InvocationContext.  Spans are started from whichever
+    thread is running the agent network, so bookkeeping is done under a lock.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        self.spans: List[AgentSpan] = []
+        self.trace_id: str = os.urandom(16).hex()
+
+    def reset(self):
+        """
+        Forgets all spans so that the next request gets a tree of its own.
+        """
+        with self.lock:
+            self.spans = []
+            self.trace_id = os.urandom(16).hex()
+
+    def start_span(self, origin: List[Dict[str, Any]], kind: str) -> AgentSpan:
+        """
+        :param origin: A List of origin dictionaries indicating the origin of the run.
+                The origin can be considered a path to the original call to the front-man.
+                The last entry is the agent the span is for.
+        :param kind: A short string describing what kind of activation this is
+        :return: A new AgentSpan that has been started
+        """
+        name: str = Origination.get_full_name_from_origin(origin)
+        parent_name: str = None
+        if origin is not None and len(origin) > 1:
+            parent_name = Origination.get_full_name_from_origin(origin[:-1])
+
+        span = AgentSpan(name, kind, parent_name)
+        with self.lock:
+            self.spans.append(span)
+        return span
+
+    def get_spans(self) -> List[AgentSpan]:
+        """
+        :return: A copy of the list of spans recorded so far, in order of start
+        """
+        with self.lock:
+            return list(self.spans)
+
+    def get_trace_id(self) -> str:
+        """
+        :return: The hex string identifying the request the spans belong to
+        """
+        return self.trace_id
+
+    def get_span_tree(self) -> List[Dict[str, Any]]:
+        """
+        :return: A list of root span dictionaries.  Normally there is only one
+                root: the front man.  Each dictionary has the keys:
+                    "name"      The full origin name of the agent activation
+                    "kind"      What kind of activation this is
+                    "start"     Seconds since the start of the earliest span
+                    "duration"  Wall-clock seconds of the span
+                    "llm_wait"  Seconds spent waiting on the LLM
+                    "tool_wait" Seconds spent waiting on called tools
+                    "children"  Optional list of span dictionaries for called agents
+        """
+        spans: List[AgentSpan] = self.get_spans()
+        if len(spans) == 0:
+            return []
+
+        origin_time: float = min(span.start_time for span in spans)
+
+        nodes: List[Dict[str, Any]] = []
+        for span in spans:
+            nodes.append({
+                "name": span.name,
+                "kind": span.kind,
+                "start": round(span.start_time - origin_time, PRECISION),
+                "duration": round(span.get_duration(), PRECISION),
+                "llm_wait": round(span.llm_wait_seconds, PRECISION),
+                "tool_wait": round(span.tool_wait_seconds, PRECISION),
+            })
+
+        # Should an agent name show up more than once, children attach
+        # to the most recent activation of their parent.
+        roots: List[Dict[str, Any]] = []
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for span, node in zip(spans, nodes):
+            parent: Dict[str, Any] = by_name.get(span.parent_name)
+            if parent is None:
+                roots.append(node)
+            else:
+                parent.setdefault("children", []).append(node)
+            by_name[span.name] = node
+
+        return roots
@@ -0,0 +1,305 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import bisect
+import threading
+
+# Upper bounds (in seconds) of latency histogram buckets.
+# The implicit "+Inf" bucket is always appended when rendering.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                                              1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+COUNTER: str = "counter"
+GAUGE: str = "gauge"
+HISTOGRAM: str = "histogram"
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry of counters, gauges and histograms describing
+    what the server is doing: request latencies per network, time to first
+    streamed message, LLM call latencies per model, tool call latencies per agent,
+    token and cost totals and in-flight requests.
+
+    Metric values are kept as plain python numbers behind a single lock so
+    that both the server event loop and the AsyncioExecutor threads that run
+    agent networks can record observations cheaply.  The registry itself knows
+    nothing about the exposition format; get_snapshot() yields a JSON-friendly
+    dictionary that the service layer renders (and, when the server forks
+    multiple instances, aggregates across processes).
+
+    Labels are passed as dictionaries and are normalized to a sorted tuple of
+    (name, value) pairs to key the samples of a metric family.
+    """
+
+    # Well-known metric family names
+    REQUESTS_IN_FLIGHT: str = "neuro_san_requests_in_flight"
+    REQUEST_DURATION: str = "neuro_san_request_duration_seconds"
+    TIME_TO_FIRST_MESSAGE: str = "neuro_san_time_to_first_message_seconds"
+    LLM_CALL_DURATION: str = "neuro_san_llm_call_duration_seconds"
+    LLM_TOKENS: str = "neuro_san_llm_tokens_total"
+    LLM_COST: str = "neuro_san_llm_cost_usd_total"
+    TOOL_CALL_DURATION: str = "neuro_san_tool_call_duration_seconds"
+    EXECUTOR_POOL_EXECUTORS: str = "neuro_san_executor_pool_executors"
+    EXECUTOR_POOL_THREADS: str = "neuro_san_executor_pool_threads"
+    EXECUTOR_POOL_THREADS_RUNNING: str = "neuro_san_executor_pool_threads_running"
+
+    _instance: "MetricsRegistry" = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        self.enabled: bool = True
+
+        # Metric name -> dictionary with "type", "help" and (for histograms) "buckets" keys
+        self.families: Dict[str, Dict[str, Any]] = {}
+
+        # Metric name -> label tuple -> value.
+        # For counters and gauges the value is a float.
+        # For histograms the value is a dictionary with
+        # per-bucket (non-cumulative) "counts", "sum" and "count" keys.
+        self.samples: Dict[str, Dict[Tuple[Tuple[str, str], ...], Any]] = {}
+
+        # Callables invoked just before a snapshot is taken so that
+        # point-in-time gauges (like executor pool utilization) can be refreshed.
+        self.collectors: List[Callable[["MetricsRegistry"], None]] = []
+
+        self.declare_standard_metrics()
+
+    @classmethod
+    def get_instance(cls) -> "MetricsRegistry":
+        """
+        :return: The process-wide MetricsRegistry
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = MetricsRegistry()
+        return cls._instance
+
+    def declare_standard_metrics(self):
+        """
+        Declares the metric families neuro-san itself reports on.
+        """
+        self.declare(self.REQUESTS_IN_FLIGHT, GAUGE,
+                     "Number of requests currently being processed")
+        self.declare(self.REQUEST_DURATION, HISTOGRAM,
+                     "Latency of agent network requests")
+        self.declare(self.TIME_TO_FIRST_MESSAGE, HISTOGRAM,
+                     "Latency until the first streaming_chat message is sent to the client")
+        self.declare(self.LLM_CALL_DURATION, HISTOGRAM,
+                     "Latency of individual LLM calls")
+        self.declare(self.LLM_TOKENS, COUNTER,
+                     "Number of tokens used by LLM calls")
+        self.declare(self.LLM_COST, COUNTER,
+                     "Estimated cost in US dollars of LLM calls")
+        self.declare(self.TOOL_CALL_DURATION, HISTOGRAM,
+                     "Latency of tool calls made by agents")
+        self.declare(self.EXECUTOR_POOL_EXECUTORS, GAUGE,
+                     "Number of AsyncioExecutors in the executor pool")
+        self.declare(self.EXECUTOR_POOL_THREADS, GAUGE,
+                     "Number of work threads across executors in the executor pool")
+        self.declare(self.EXECUTOR_POOL_THREADS_RUNNING, GAUGE,
+                     "Number of running work threads across executors in the executor pool")
+
+    def declare(self, name: str, metric_type: str, help_text: str,
+                buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Declare a metric family.  Re-declaring an existing family is a no-op.
+
+        :param name: The name of the metric family
+        :param metric_type: One of "counter", "gauge" or "histogram"
+        :param help_text: Human-readable description of the metric
+        :param buckets: Sorted upper bounds for histogram buckets.
+                        Ignored for other metric types.
+        """
+        if metric_type not in (COUNTER, GAUGE, HISTOGRAM):
+            raise ValueError(f"Unknown metric type {metric_type} for {name}")
+
+        with self.lock:
+            if name in self.families:
+                return
+            family: Dict[str, Any] = {
+                "type": metric_type,
+                "help": help_text,
+            }
+            if metric_type == HISTOGRAM:
+                family["buckets"] = list(buckets)
+            self.families[name] = family
+            self.samples[name] = {}
+
+    def set_enabled(self, enabled: bool):
+        """
+        :param enabled: False if observations should be ignored altogether.
+        """
+        self.enabled = enabled
+
+    def add_collector(self, collector: Callable[["MetricsRegistry"], None]):
+        """
+        :param collector: A callable taking this registry which is called
+                just before each snapshot to refresh point-in-time values.
+        """
+        with self.lock:
+            if collector not in self.collectors:
+                self.collectors.append(collector)
+
+    def inc(self, name: str, labels: Dict[str, str] = None, amount: float = 1.0):
+        """
+        Increment a counter or a gauge.
+
+        :param name: The name of the metric family
+        :param labels: Dictionary of label name -> value for the sample
+        :param amount: The amount to add.  Negative amounts are only
+                    allowed for gauges.
+        """
+        if not self.enabled:
+            return
+        key: Tuple[Tuple[str, str], ...] = self.make_label_key(labels)
+        with self.lock:
+            family_samples: Dict[Tuple[Tuple[str, str], ...], Any] = self._get_samples(name, (COUNTER, GAUGE))
+            family_samples[key] = family_samples.get(key, 0.0) + amount
+
+    def dec(self, name: str, labels: Dict[str, str] = None, amount: float = 1.0):
+        """
+        Decrement a gauge.
+
+        :param name: The name of the metric family
+        :param labels: Dictionary of label name -> value for the sample
+        :param amount: The amount to subtract.
+        """
+        if not self.enabled:
+            return
+        key: Tuple[Tuple[str, str], ...] = self.make_label_key(labels)
+        with self.lock:
+            family_samples: Dict[Tuple[Tuple[str, str], ...], Any] = self._get_samples(name, (GAUGE,))
+            family_samples[key] = family_samples.get(key, 0.0) - amount
+
+    def set(self, name: str, labels: Dict[str, str] = None, value: float = 0.0):
+        """
+        Set the value of a gauge.
+
+        :param name: The name of the metric family
+        :param labels: Dictionary of label name -> value for the sample
+        :param value: The value to set
+        """
+        if not self.enabled:
+            return
+        key: Tuple[Tuple[str, str], ...] = self.make_label_key(labels)
+        with self.lock:
+            family_samples: Dict[Tuple[Tuple[str, str], ...], Any] = self._get_samples(name, (GAUGE,))
+            family_samples[key] = float(value)
+
+    def observe(self, name: str, labels: Dict[str, str] = None, value: float = 0.0):
+        """
+        Record an observation in a histogram.
+
+        :param name: The name of the metric family
+        :param labels: Dictionary of label name -> value for the sample
+        :param value: The observed value.  For latencies this is in seconds.
+        """
+        if not self.enabled:
+            return
+        key: Tuple[Tuple[str, str], ...] = self.make_label_key(labels)
+        with self.lock:
+            family_samples: Dict[Tuple[Tuple[str, str], ...], Any] = self._get_samples(name, (HISTOGRAM,))
+            buckets: List[float] = self.families[name]["buckets"]
+            sample: Dict[str, Any] = family_samples.get(key)
+            if sample is None:
+                # One more count slot than there are buckets for the +Inf bucket
+                sample = {
+                    "counts": [0] * (len(buckets) + 1),
+                    "sum": 0.0,
+                    "count": 0
+                }
+                family_samples[key] = sample
+            index: int = bisect.bisect_left(buckets, value)
+            sample["counts"][index] += 1
+            sample["sum"] += value
+            sample["count"] += 1
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        :return: A JSON-serializable dictionary of all metric families and their samples.
+                Keys are metric names, values are dictionaries with "type", "help",
+                optional "buckets" and a "samples" list.  Each sample has a "labels"
+                dictionary and either a "value" or the histogram "counts", "sum" and "count".
+        """
+        with self.lock:
+            collectors: List[Callable[["MetricsRegistry"], None]] = list(self.collectors)
+        for collector in collectors:
+            collector(self)
+
+        snapshot: Dict[str, Any] = {}
+        with self.lock:
+            for name, family in self.families.items():
+                family_snapshot: Dict[str, Any] = dict(family)
+                samples: List[Dict[str, Any]] = []
+                for key, value in self.samples[name].items():
+                    sample: Dict[str, Any] = {"labels": dict(key)}
+                    if family["type"] == HISTOGRAM:
+                        sample["counts"] = list(value["counts"])
+                        sample["sum"] = value["sum"]
+                        sample["count"] = value["count"]
+                    else:
+                        sample["value"] = value
+                    samples.append(sample)
+                family_snapshot["samples"] = samples
+                snapshot[name] = family_snapshot
+        return snapshot
+
+    def reset(self):
+        """
+        Clears all recorded samples.  Declared families and collectors remain.
+        Mostly useful for tests.
+        """
+        with self.lock:
+            for name in self.samples:
+                self.samples[name] = {}
+
+    @staticmethod
+    def make_label_key(labels: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+        """
+        :param labels: Dictionary of label name -> value.  Can be None.
+        :return: A hashable, order-independent key for the labels
+        """
+        if not labels:
+            return ()
+        return tuple(sorted((str(key), str(value)) for key, value in labels.items()))
+
+    def _get_samples(self, name: str, allowed_types: Tuple[str, ...]) -> Dict[Tuple[Tuple[str, str], ...], Any]:
+        """
+        Must be called with the lock held.
+        :param name: The name of the metric family
+        :param allowed_types: The metric types the caller's operation applies to
+        :return: The samples dictionary for the metric family
+        """
+        family: Dict[str, Any] = self.families.get(name)
+        if family is None:
+            raise ValueError(f"Metric {name} has not been declared")
+        if family["type"] not in allowed_types:
+            raise ValueError(f"Metric {name} is a {family['type']}, not one of {allowed_types}")
+        return self.samples[name]
@@ -0,0 +1,140 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+import threading
+
+from neuro_san.internals.metrics.agent_span import AgentSpan
+from neuro_san.internals.metrics.agent_span_recorder import AgentSpanRecorder
+
+NANOS_PER_SECOND: int = 1_000_000_000
+
+# OTLP SpanKind value for SPAN_KIND_INTERNAL
+SPAN_KIND_INTERNAL: int = 1
+
+
+class OtlpJsonSpanExporter:
+    """
+    Appends the spans of an AgentSpanRecorder to a local file in the
+    OTLP/JSON encoding, one ExportTraceServiceRequest per line, as the
+    OpenTelemetry Collector's file exporter and otlpjsonfile receiver expect.
+
+    This does not require any OpenTelemetry packages to be installed.
+    """
+
+    SCOPE_NAME: str = "neuro_san"
+
+    # Serialize writes from concurrent requests in the same process
+    _file_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, file_name: str, service_name: str = "neuro-san"):
+        """
+        Constructor
+
+        :param file_name: The file to append OTLP JSON lines to
+        :param service_name: The value for the "service.name" resource attribute
+        """
+        self.file_name: str = file_name
+        self.service_name: str = service_name
+
+    def export(self, recorder: AgentSpanRecorder):
+        """
+        :param recorder: The AgentSpanRecorder whose spans are to be exported
+        """
+        request: Dict[str, Any] = self.to_otlp(recorder)
+        if request is None:
+            return
+
+        line: str = json.dumps(request, separators=(",", ":"))
+        with self._file_lock:
+            with open(self.file_name, "a", encoding="utf-8") as export_file:
+                export_file.write(line + "\n")
+
+    def to_otlp(self, recorder: AgentSpanRecorder) -> Dict[str, Any]:
+        """
+        :param recorder: The AgentSpanRecorder whose spans are to be converted
+        :return: A dictionary in the shape of an OTLP ExportTraceServiceRequest,
+                or None if there are no spans.
+        """
+        spans: List[AgentSpan] = recorder.get_spans()
+        if len(spans) == 0:
+            return None
+
+        trace_id: str = recorder.get_trace_id()
+        span_ids: Dict[str, str] = {}
+        otlp_spans: List[Dict[str, Any]] = []
+        for span in spans:
+            otlp_span: Dict[str, Any] = {
+                "traceId": trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": SPAN_KIND_INTERNAL,
+                # 64-bit integers are strings in OTLP/JSON
+                "startTimeUnixNano": str(int(span.start_time * NANOS_PER_SECOND)),
+                "endTimeUnixNano": str(int((span.start_time + span.get_duration()) * NANOS_PER_SECOND)),
+                "attributes": [
+                    self.make_attribute("neuro_san.agent.kind", "stringValue", span.kind),
+                    self.make_attribute("neuro_san.llm_wait_seconds", "doubleValue", span.llm_wait_seconds),
+                    self.make_attribute("neuro_san.tool_wait_seconds", "doubleValue", span.tool_wait_seconds),
+                ]
+            }
+            parent_span_id: str = span_ids.get(span.parent_name)
+            if parent_span_id is not None:
+                otlp_span["parentSpanId"] = parent_span_id
+            span_ids[span.name] = span.span_id
+            otlp_spans.append(otlp_span)
+
+        request: Dict[str, Any] = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            self.make_attribute("service.name", "stringValue", self.service_name)
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {
+                                "name": self.SCOPE_NAME
+                            },
+                            "spans": otlp_spans
+                        }
+                    ]
+                }
+            ]
+        }
+        return request
+
+    @staticmethod
+    def make_attribute(key: str, value_type: str, value: Any) -> Dict[str, Any]:
+        """
+        :param key: The attribute key
+        :param value_type: The OTLP AnyValue field name, e.g. "stringValue"
+        :param value: The attribute value
+        :return: An OTLP KeyValue dictionary
+        """
+        return {
+            "key": key,
+            "value": {
+                value_type: value
+            }
+        }
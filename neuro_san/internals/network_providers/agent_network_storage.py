@@ -21,6 +21,7 @@ from typing import List
 import logging
 import threading
 
+from neuro_san.internals.chat.connectivity_reporter import ConnectivityReporter
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkProvider
 from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
@@ -42,6 +43,10 @@ class AgentNetworkStorage(AgentStorageSource):
         self.lock = threading.Lock()
         self.listeners: List[AgentStateListener] = []
 
+        # Bumped on every change to the agents_table so that things derived
+        # from the contents of this storage can tell when they are stale.
+        self.generation: int = 0
+
     def add_listener(self, listener: AgentStateListener):
         """
         Add a state listener to be notified when status of service agents changes.
@@ -61,10 +66,15 @@ class AgentNetworkStorage(AgentStorageSource):
         where we register a new agent name -> AgentNetwork pair in the service scope
         or notify the service that for existing agent its AgentNetwork has been modified.
         """
+        # Connectivity only depends on the network, so do it once here
+        # instead of on every request.  Do it outside of internal lock.
+        self.precompute_connectivity(agent_network)
+
         is_new: bool = False
         with self.lock:
             is_new = self.agents_table.get(agent_name) is None
             self.agents_table[agent_name] = agent_network
+            self.generation += 1
 
         # Notify listeners about this state change:
         # do it outside of internal lock
@@ -76,6 +86,24 @@ class AgentNetworkStorage(AgentStorageSource):
                 listener.agent_modified(agent_name, self)
                 self.logger.info("REPLACED network for agent %s : %d", agent_name, id(agent_network))
 
+    def precompute_connectivity(self, agent_network: AgentNetwork):
+        """
+        Computes the connectivity of the given network and stores it with the network.
+        Should that fail, connectivity will be reported the slow way per request,
+        which is where any errors will surface to a client.
+
+        :param agent_network: The AgentNetwork to compute connectivity for
+        """
+        if agent_network is None:
+            return
+
+        try:
+            reporter = ConnectivityReporter(agent_network)
+            agent_network.set_connectivity(reporter.report_connectivity_response())
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            self.logger.warning("Could not precompute connectivity for %s: %s",
+                                agent_network.get_network_name(), str(exception))
+
     def setup_agent_networks(self, agent_networks: Dict[str, AgentNetwork]):
         """
         Replace agents networks with a new collection.
@@ -99,6 +127,7 @@ class AgentNetworkStorage(AgentStorageSource):
         with self.lock:
             agent_network: AgentNetwork = self.agents_table.get(agent_name, None)
             self.agents_table.pop(agent_name, None)
+            self.generation += 1
 
         # Notify listeners about this state change:
         # do it outside of internal lock
@@ -121,3 +150,11 @@ class AgentNetworkStorage(AgentStorageSource):
         with self.lock:
             # Create static snapshot of agents names collection
             return list(self.agents_table.keys())
+
+    def get_generation(self) -> int:
+        """
+        :return: A number that changes whenever an agent network is added,
+                replaced or removed from this storage
+        """
+        with self.lock:
+            return self.generation
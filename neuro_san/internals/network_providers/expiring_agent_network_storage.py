@@ -62,13 +62,20 @@ class ExpiringAgentNetworkStorage(AgentNetworkStorage, ReservationsStorage):
         # Need to do this while holding the lock
         added: List[str] = []
         replaced: List[str] = []
+
+        # Create the networks and their connectivity outside of internal lock
+        agent_networks: Dict[Reservation, AgentNetwork] = {}
+        for reservation, agent_spec in reservations_dict.items():
+            agent_network = AgentNetwork(agent_spec, reservation.get_reservation_id())
+            self.precompute_connectivity(agent_network)
+            agent_networks[reservation] = agent_network
+
         with self.lock:
-            for reservation, agent_spec in reservations_dict.items():
+            for reservation, agent_network in agent_networks.items():
 
                 agent_name: str = reservation.get_reservation_id()
                 is_new = self.agents_table.get(agent_name) is None
 
-                agent_network = AgentNetwork(agent_spec, agent_name)
                 self.agents_table[agent_name] = agent_network
                 self.reservations_table[agent_name] = reservation
 
@@ -78,6 +85,7 @@ class ExpiringAgentNetworkStorage(AgentNetworkStorage, ReservationsStorage):
                     replaced.append(agent_name)
 
             self.last_modified = time.time()
+            self.generation += 1
 
         # Notify listeners about this state change:
         # do it outside of internal lock
@@ -119,6 +127,7 @@ class ExpiringAgentNetworkStorage(AgentNetworkStorage, ReservationsStorage):
                 self.agents_table.pop(agent_name, None)
 
             self.last_modified = time.time()
+            self.generation += 1
 
         # Notify listeners about this state change:
         # do it outside of internal lock
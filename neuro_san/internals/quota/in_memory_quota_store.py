@@ -0,0 +1,82 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import threading
+
+from neuro_san.internals.quota.quota_store import QuotaStore
+
+
+class InMemoryQuotaStore(QuotaStore):
+    """
+    QuotaStore implementation that keeps usage in a dictionary.
+    Counts are only shared by the threads of a single process.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        # (quota_key, window) -> window_index -> amount
+        self.amounts: Dict[Tuple[str, str], Dict[int, float]] = {}
+
+    def increment(self, quota_key: str, window: str, window_index: int, amount: float):
+        """
+        Adds to the amount stored for a single window.
+
+        :param quota_key: The key identifying whose usage this is
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param window_index: The number of the window of that kind
+        :param amount: The amount to add
+        """
+        with self.lock:
+            windows: Dict[int, float] = self.amounts.setdefault((quota_key, window), {})
+            windows[window_index] = windows.get(window_index, 0.0) + amount
+
+    def get_amounts(self, quota_key: str, window: str, window_indexes: List[int]) -> Dict[int, float]:
+        """
+        :param quota_key: The key identifying whose usage this is
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param window_indexes: The numbers of the windows of that kind to look up
+        :return: A dictionary of window index to the amount stored for it.
+                Windows without any usage have no entry.
+        """
+        with self.lock:
+            windows: Dict[int, float] = self.amounts.get((quota_key, window), {})
+            return {index: windows[index] for index in window_indexes if index in windows}
+
+    def prune(self, window: str, before_index: int):
+        """
+        Forgets the amounts of all windows of the given kind that are older than before_index.
+
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param before_index: Windows with an index less than this are removed
+        """
+        with self.lock:
+            for key in list(self.amounts.keys()):
+                if key[1] != window:
+                    continue
+                windows: Dict[int, float] = self.amounts[key]
+                for index in [index for index in windows if index < before_index]:
+                    del windows[index]
+                if len(windows) == 0:
+                    del self.amounts[key]
@@ -0,0 +1,241 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+import logging
+import os
+import threading
+
+from time import time
+
+from neuro_san.internals.quota.in_memory_quota_store import InMemoryQuotaStore
+from neuro_san.internals.quota.quota_exceeded_error import QuotaExceededError
+from neuro_san.internals.quota.quota_store import QuotaStore
+from neuro_san.internals.quota.sqlite_quota_store import SqliteQuotaStore
+
+SECONDS_PER_MINUTE: float = 60.0
+SECONDS_PER_DAY: float = 24 * 60 * 60.0
+
+
+# pylint: disable=too-many-instance-attributes
+class QuotaManager:
+    """
+    Enforces per-key token and cost budgets on LLM usage.
+
+    The quota key of a request is the value of a configurable request metadata field
+    (typically a header listed in AGENT_FORWARDED_REQUEST_METADATA identifying a tenant or user).
+    Two limits are supported, either or both of which can be set:
+        * tokens per minute, measured over a sliding one-minute window
+        * cost (in USD) per UTC calendar day
+
+    Usage is recorded after each LLM call completes and checked before the next one starts,
+    so a single call in progress can take a key somewhat over its budget.
+
+    The process-wide instance is configured from these environment variables:
+        AGENT_QUOTA_METADATA_KEY        The request metadata field holding the quota key.
+                                        Quotas are not enforced when this is not set.
+        AGENT_QUOTA_TOKENS_PER_MINUTE   The token limit per quota key per minute
+        AGENT_QUOTA_COST_PER_DAY        The cost limit in USD per quota key per day
+        AGENT_QUOTA_SQLITE_FILE         A SQLite file in which to keep counts so that all
+                                        server processes on the host share them.
+                                        When not set, counts are kept in memory per process.
+    """
+
+    TOKENS_WINDOW: str = "tokens_minute"
+    COST_WINDOW: str = "cost_day"
+
+    # The quota key used for requests that do not have the metadata field
+    ANONYMOUS: str = "anonymous"
+
+    # How many records between removals of windows that can no longer matter
+    PRUNE_INTERVAL: int = 100
+
+    _instance: "QuotaManager" = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, metadata_key: str,
+                 tokens_per_minute: float = None,
+                 cost_per_day: float = None,
+                 store: QuotaStore = None,
+                 clock: Callable[[], float] = time):
+        """
+        Constructor
+
+        :param metadata_key: The request metadata field holding the quota key.
+                    None means quotas are not enforced.
+        :param tokens_per_minute: The token limit per quota key per minute. None means no limit.
+        :param cost_per_day: The cost limit in USD per quota key per day. None means no limit.
+        :param store: The QuotaStore to keep counts in. Default None means an InMemoryQuotaStore.
+        :param clock: A function returning the current time in seconds since the epoch
+        """
+        self.metadata_key: str = metadata_key
+        self.tokens_per_minute: float = tokens_per_minute
+        self.cost_per_day: float = cost_per_day
+        self.store: QuotaStore = store
+        if self.store is None:
+            self.store = InMemoryQuotaStore()
+        self.clock: Callable[[], float] = clock
+        self.lock = threading.Lock()
+        self.records_since_prune: int = 0
+
+    @classmethod
+    def get_instance(cls) -> "QuotaManager":
+        """
+        :return: The process-wide QuotaManager configured from the environment
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls.create_from_environment()
+        return cls._instance
+
+    @classmethod
+    def create_from_environment(cls) -> "QuotaManager":
+        """
+        :return: A new QuotaManager configured from environment variables
+        """
+        metadata_key: str = os.environ.get("AGENT_QUOTA_METADATA_KEY") or None
+        tokens_per_minute: float = cls.parse_limit("AGENT_QUOTA_TOKENS_PER_MINUTE")
+        cost_per_day: float = cls.parse_limit("AGENT_QUOTA_COST_PER_DAY")
+
+        store: QuotaStore = None
+        file_name: str = os.environ.get("AGENT_QUOTA_SQLITE_FILE")
+        if metadata_key is not None and file_name:
+            store = SqliteQuotaStore(file_name)
+
+        return QuotaManager(metadata_key, tokens_per_minute, cost_per_day, store)
+
+    @staticmethod
+    def parse_limit(env_var: str) -> float:
+        """
+        :param env_var: The name of the environment variable holding a limit
+        :return: The limit as a float, or None if there is no (valid, positive) limit
+        """
+        value: str = os.environ.get(env_var)
+        if not value:
+            return None
+        try:
+            limit = float(value)
+        except ValueError:
+            logging.getLogger(__name__).warning("Ignoring non-numeric %s value %s", env_var, value)
+            return None
+        if limit <= 0.0:
+            return None
+        return limit
+
+    def is_enabled(self) -> bool:
+        """
+        :return: True if there are limits to enforce
+        """
+        return self.metadata_key is not None and \
+            (self.tokens_per_minute is not None or self.cost_per_day is not None)
+
+    def get_quota_key(self, metadata: Dict[str, Any]) -> str:
+        """
+        :param metadata: The request metadata
+        :return: The quota key for a request with the given metadata,
+                or None if quotas are not enforced.
+        """
+        if not self.is_enabled():
+            return None
+        quota_key: Any = None
+        if metadata is not None:
+            quota_key = metadata.get(self.metadata_key)
+        if not quota_key:
+            return self.ANONYMOUS
+        return str(quota_key)
+
+    def get_usage(self, quota_key: str) -> Dict[str, float]:
+        """
+        :param quota_key: The key identifying whose usage this is
+        :return: A dictionary with keys:
+                    "tokens_per_minute" The (estimated) number of tokens used in the last minute
+                    "cost_per_day"      The cost in USD so far in the current UTC day
+        """
+        now: float = self.clock()
+
+        # Sliding window estimate: all of this minute plus the part of
+        # the previous minute that still falls within the last 60 seconds.
+        minutes: float = now / SECONDS_PER_MINUTE
+        minute: int = int(minutes)
+        previous_weight: float = 1.0 - (minutes - minute)
+        tokens: Dict[int, float] = self.store.get_amounts(quota_key, self.TOKENS_WINDOW, [minute - 1, minute])
+        tokens_per_minute: float = tokens.get(minute, 0.0) + previous_weight * tokens.get(minute - 1, 0.0)
+
+        day: int = int(now / SECONDS_PER_DAY)
+        cost: Dict[int, float] = self.store.get_amounts(quota_key, self.COST_WINDOW, [day])
+
+        return {
+            "tokens_per_minute": tokens_per_minute,
+            "cost_per_day": cost.get(day, 0.0),
+        }
+
+    def check(self, quota_key: str):
+        """
+        Raises QuotaExceededError if the given quota key is out of budget.
+
+        :param quota_key: The key identifying whose usage this is.
+                    None means there is nothing to enforce.
+        """
+        if quota_key is None or not self.is_enabled():
+            return
+
+        usage: Dict[str, float] = self.get_usage(quota_key)
+        if self.tokens_per_minute is not None and usage["tokens_per_minute"] >= self.tokens_per_minute:
+            raise QuotaExceededError(f"Quota exceeded for {self.metadata_key} '{quota_key}': "
+                                     f"about {int(usage['tokens_per_minute'])} tokens used in the last minute "
+                                     f"against a limit of {int(self.tokens_per_minute)} tokens per minute. "
+                                     "Please try again later.")
+        if self.cost_per_day is not None and usage["cost_per_day"] >= self.cost_per_day:
+            raise QuotaExceededError(f"Quota exceeded for {self.metadata_key} '{quota_key}': "
+                                     f"${usage['cost_per_day']:.4f} spent today "
+                                     f"against a limit of ${self.cost_per_day:.4f} per day. "
+                                     "Please try again tomorrow.")
+
+    def record(self, quota_key: str, tokens: int, cost: float):
+        """
+        Records the usage of a completed LLM call.
+
+        :param quota_key: The key identifying whose usage this is.
+                    None means there is nothing to record.
+        :param tokens: The total number of tokens used by the call
+        :param cost: The cost of the call in USD
+        """
+        if quota_key is None or not self.is_enabled():
+            return
+
+        now: float = self.clock()
+        minute: int = int(now / SECONDS_PER_MINUTE)
+        day: int = int(now / SECONDS_PER_DAY)
+        if tokens:
+            self.store.increment(quota_key, self.TOKENS_WINDOW, minute, tokens)
+        if cost:
+            self.store.increment(quota_key, self.COST_WINDOW, day, cost)
+
+        with self.lock:
+            self.records_since_prune += 1
+            prune: bool = self.records_since_prune >= self.PRUNE_INTERVAL
+            if prune:
+                self.records_since_prune = 0
+        if prune:
+            self.store.prune(self.TOKENS_WINDOW, minute - 1)
+            self.store.prune(self.COST_WINDOW, day)
@@ -0,0 +1,60 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Dict
+from typing import List
+
+
+class QuotaStore:
+    """
+    Interface for storage of quota usage counts.
+
+    Usage is kept as amounts accumulated in numbered time windows
+    (e.g. tokens in minute number N since the epoch, cost in day number M)
+    for each quota key.  What the windows mean is up to the QuotaManager.
+    """
+
+    def increment(self, quota_key: str, window: str, window_index: int, amount: float):
+        """
+        Adds to the amount stored for a single window.
+
+        :param quota_key: The key identifying whose usage this is
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param window_index: The number of the window of that kind
+        :param amount: The amount to add
+        """
+        raise NotImplementedError
+
+    def get_amounts(self, quota_key: str, window: str, window_indexes: List[int]) -> Dict[int, float]:
+        """
+        :param quota_key: The key identifying whose usage this is
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param window_indexes: The numbers of the windows of that kind to look up
+        :return: A dictionary of window index to the amount stored for it.
+                Windows without any usage have no entry.
+        """
+        raise NotImplementedError
+
+    def prune(self, window: str, before_index: int):
+        """
+        Forgets the amounts of all windows of the given kind that are older than before_index.
+
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param before_index: Windows with an index less than this are removed
+        """
+        raise NotImplementedError
@@ -0,0 +1,121 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Dict
+from typing import List
+
+import os
+import sqlite3
+import threading
+
+from neuro_san.internals.quota.quota_store import QuotaStore
+
+
+class SqliteQuotaStore(QuotaStore):
+    """
+    QuotaStore implementation that keeps usage in a SQLite database file
+    so that all the server processes forked on the same host share the same counts.
+
+    Each thread of each process gets its own connection, as sqlite3 connections
+    can neither be shared across threads by default nor survive a fork.
+    Increments are single atomic upserts, so concurrent writers do not lose counts.
+    """
+
+    CREATE_TABLE: str = """
+        CREATE TABLE IF NOT EXISTS quota_usage (
+            quota_key TEXT NOT NULL,
+            window TEXT NOT NULL,
+            window_index INTEGER NOT NULL,
+            amount REAL NOT NULL,
+            PRIMARY KEY (quota_key, window, window_index)
+        )
+    """
+
+    INCREMENT: str = """
+        INSERT INTO quota_usage (quota_key, window, window_index, amount) VALUES (?, ?, ?, ?)
+        ON CONFLICT (quota_key, window, window_index) DO UPDATE SET amount = amount + excluded.amount
+    """
+
+    def __init__(self, file_name: str, timeout_seconds: float = 5.0):
+        """
+        Constructor
+
+        :param file_name: The path to the SQLite database file.
+                    It is created if it does not exist.
+        :param timeout_seconds: How long to wait on a lock held by another process
+        """
+        self.file_name: str = file_name
+        self.timeout_seconds: float = timeout_seconds
+        self.local = threading.local()
+
+        with self.get_connection() as connection:
+            connection.execute(self.CREATE_TABLE)
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        :return: The sqlite3 Connection for the current process and thread
+        """
+        connection: sqlite3.Connection = getattr(self.local, "connection", None)
+        if connection is not None and getattr(self.local, "pid", None) == os.getpid():
+            return connection
+
+        # isolation_level=None is autocommit. Each statement we issue is atomic on its own.
+        connection = sqlite3.connect(self.file_name, timeout=self.timeout_seconds, isolation_level=None)
+        # Write-ahead logging lets readers proceed while another process writes.
+        connection.execute("PRAGMA journal_mode=WAL")
+        self.local.connection = connection
+        self.local.pid = os.getpid()
+        return connection
+
+    def increment(self, quota_key: str, window: str, window_index: int, amount: float):
+        """
+        Adds to the amount stored for a single window.
+
+        :param quota_key: The key identifying whose usage this is
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param window_index: The number of the window of that kind
+        :param amount: The amount to add
+        """
+        self.get_connection().execute(self.INCREMENT, (quota_key, window, window_index, float(amount)))
+
+    def get_amounts(self, quota_key: str, window: str, window_indexes: List[int]) -> Dict[int, float]:
+        """
+        :param quota_key: The key identifying whose usage this is
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param window_indexes: The numbers of the windows of that kind to look up
+        :return: A dictionary of window index to the amount stored for it.
+                Windows without any usage have no entry.
+        """
+        if len(window_indexes) == 0:
+            return {}
+
+        placeholders: str = ", ".join("?" * len(window_indexes))
+        query: str = "SELECT window_index, amount FROM quota_usage " + \
+                     f"WHERE quota_key = ? AND window = ? AND window_index IN ({placeholders})"
+        cursor: sqlite3.Cursor = self.get_connection().execute(query, (quota_key, window, *window_indexes))
+        return {int(index): amount for index, amount in cursor.fetchall()}
+
+    def prune(self, window: str, before_index: int):
+        """
+        Forgets the amounts of all windows of the given kind that are older than before_index.
+
+        :param window: The name of the kind of window (e.g. "tokens_minute")
+        :param before_index: Windows with an index less than this are removed
+        """
+        self.get_connection().execute("DELETE FROM quota_usage WHERE window = ? AND window_index < ?",
+                                      (window, before_index))
@@ -0,0 +1,111 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+import logging
+import threading
+
+from neuro_san.internals.rate_limits.model_rate_limiter import ModelRateLimiter
+
+DEFAULT_BURST_SECONDS: float = 1.0
+
+
+class LlmCallScheduler:
+    """
+    Process-wide registry of ModelRateLimiters, one per (provider, model),
+    so that LLM calls from all concurrent agents and requests in the process
+    are coordinated against the limits the provider enforces.
+
+    Limits come from a "rate_limits" dictionary in an llm_info model entry,
+    optionally overridden by the same key in an agent's llm_config:
+        "requests_per_minute"   The limit on calls to the model per minute
+        "tokens_per_minute"     The limit on prompt tokens sent to the model per minute
+        "burst_seconds"         How many seconds worth of either rate can go out at once.
+                                Default is 1.0, which paces calls evenly over the minute.
+
+    Models without a "rate_limits" entry are not scheduled at all.
+    """
+
+    _instance: "LlmCallScheduler" = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        self.limiters: Dict[Tuple[str, str], ModelRateLimiter] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def get_instance(cls) -> "LlmCallScheduler":
+        """
+        :return: The process-wide LlmCallScheduler
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = LlmCallScheduler()
+        return cls._instance
+
+    def get_limiter(self, provider: str, model_name: str, rate_limits: Dict[str, Any]) -> ModelRateLimiter:
+        """
+        :param provider: The llm class (provider) of the model
+        :param model_name: The name of the model
+        :param rate_limits: The "rate_limits" dictionary for the model
+        :return: The ModelRateLimiter shared by all calls to the model,
+                or None if there are no limits to enforce.
+        """
+        if not rate_limits:
+            return None
+
+        requests_per_minute: float = self.parse_limit(rate_limits, "requests_per_minute")
+        tokens_per_minute: float = self.parse_limit(rate_limits, "tokens_per_minute")
+        if requests_per_minute is None and tokens_per_minute is None:
+            return None
+        burst_seconds: float = self.parse_limit(rate_limits, "burst_seconds") or DEFAULT_BURST_SECONDS
+
+        key: Tuple[str, str] = (provider, model_name)
+        with self.lock:
+            limiter: ModelRateLimiter = self.limiters.get(key)
+            if limiter is None or not limiter.has_limits(requests_per_minute, tokens_per_minute, burst_seconds):
+                # New, or the limits were changed by a configuration reload.
+                limiter = ModelRateLimiter(requests_per_minute, tokens_per_minute, burst_seconds)
+                self.limiters[key] = limiter
+        return limiter
+
+    def parse_limit(self, rate_limits: Dict[str, Any], name: str) -> float:
+        """
+        :param rate_limits: The "rate_limits" dictionary for a model
+        :param name: The name of the limit
+        :return: The limit as a float, or None if there is no (valid, positive) limit
+        """
+        value: Any = rate_limits.get(name)
+        if value is None:
+            return None
+        try:
+            limit = float(value)
+        except (TypeError, ValueError):
+            self.logger.warning("Ignoring non-numeric rate_limits.%s value %s", name, value)
+            return None
+        if limit <= 0.0:
+            return None
+        return limit
@@ -0,0 +1,160 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+import asyncio
+import heapq
+import itertools
+import threading
+
+from time import monotonic
+
+from neuro_san.internals.rate_limits.token_bucket import TokenBucket
+
+# How often callers who are not next in line look again.
+# The caller who is next in line sleeps exactly as long as the buckets need.
+POLL_SECONDS: float = 0.02
+
+
+# pylint: disable=too-many-instance-attributes
+class ModelRateLimiter:
+    """
+    Keeps the LLM calls to a single (provider, model) within its
+    requests-per-minute and tokens-per-minute limits.
+
+    Callers wait in line by priority (lower goes first), then by arrival.
+    Callers can be on different threads and event loops, as each
+    request gets its own, so waiting is done by sleeping on the caller's
+    own event loop rather than by being woken up by someone else.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, requests_per_minute: float = None,
+                 tokens_per_minute: float = None,
+                 burst_seconds: float = 1.0,
+                 clock: Callable[[], float] = monotonic):
+        """
+        Constructor
+
+        :param requests_per_minute: The limit on calls per minute. None means no limit.
+        :param tokens_per_minute: The limit on prompt tokens per minute. None means no limit.
+        :param burst_seconds: How many seconds worth of either rate can go out at once
+        :param clock: A function returning the current time in seconds
+        """
+        self.requests_per_minute: float = requests_per_minute
+        self.tokens_per_minute: float = tokens_per_minute
+        self.burst_seconds: float = burst_seconds
+        self.clock: Callable[[], float] = clock
+
+        now: float = self.clock()
+        self.request_bucket: TokenBucket = None
+        if requests_per_minute is not None:
+            self.request_bucket = TokenBucket(requests_per_minute, burst_seconds, now)
+        self.token_bucket: TokenBucket = None
+        if tokens_per_minute is not None:
+            self.token_bucket = TokenBucket(tokens_per_minute, burst_seconds, now)
+
+        self.lock = threading.Lock()
+        self.waiting: List[Tuple[int, int]] = []
+        self.sequence = itertools.count()
+
+    def has_limits(self, requests_per_minute: float, tokens_per_minute: float, burst_seconds: float) -> bool:
+        """
+        :return: True if this instance was created with the given limits
+        """
+        return self.requests_per_minute == requests_per_minute \
+            and self.tokens_per_minute == tokens_per_minute \
+            and self.burst_seconds == burst_seconds
+
+    async def acquire(self, tokens: int, priority: int = 0):
+        """
+        Waits until a call with the given number of prompt tokens can go out.
+
+        :param tokens: The (estimated) number of prompt tokens of the call
+        :param priority: The priority of the call. Lower goes first.
+        """
+        with self.lock:
+            ticket: Tuple[int, int] = (priority, next(self.sequence))
+            heapq.heappush(self.waiting, ticket)
+
+        granted: bool = False
+        try:
+            while True:
+                wait_seconds: float = self.try_acquire(ticket, tokens)
+                if wait_seconds <= 0.0:
+                    granted = True
+                    return
+                await asyncio.sleep(wait_seconds)
+        finally:
+            if not granted:
+                # Cancelled while waiting. Get out of line.
+                with self.lock:
+                    self.waiting.remove(ticket)
+                    heapq.heapify(self.waiting)
+
+    def try_acquire(self, ticket: Tuple[int, int], tokens: int) -> float:
+        """
+        :param ticket: The (priority, sequence) place in line of the caller
+        :param tokens: The (estimated) number of prompt tokens of the call
+        :return: 0.0 if the call was let through. Otherwise how long to wait before trying again.
+        """
+        with self.lock:
+            if self.waiting[0] != ticket:
+                return POLL_SECONDS
+
+            now: float = self.clock()
+            wait_seconds: float = 0.0
+            if self.request_bucket is not None:
+                self.request_bucket.refill(now)
+                wait_seconds = max(wait_seconds, self.request_bucket.get_wait_seconds(1))
+            if self.token_bucket is not None:
+                self.token_bucket.refill(now)
+                wait_seconds = max(wait_seconds, self.token_bucket.get_wait_seconds(tokens))
+            if wait_seconds > 0.0:
+                return wait_seconds
+
+            if self.request_bucket is not None:
+                self.request_bucket.consume(1)
+            if self.token_bucket is not None:
+                self.token_bucket.consume(tokens)
+            heapq.heappop(self.waiting)
+            return 0.0
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Corrects the token accounting of a completed call
+        once the provider has said how many prompt tokens it actually used.
+
+        :param estimated_tokens: The number of tokens the call was let through with
+        :param actual_tokens: The number of prompt tokens the provider reported
+        """
+        if self.token_bucket is None:
+            return
+        with self.lock:
+            self.token_bucket.refill(self.clock())
+            self.token_bucket.consume(actual_tokens - estimated_tokens)
+
+    def get_waiting_count(self) -> int:
+        """
+        :return: The number of calls waiting in line
+        """
+        with self.lock:
+            return len(self.waiting)
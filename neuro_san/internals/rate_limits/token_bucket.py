@@ -0,0 +1,73 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+
+SECONDS_PER_MINUTE: float = 60.0
+
+
+class TokenBucket:
+    """
+    Token-bucket accounting for a per-minute limit.
+
+    The bucket refills continuously at the per-minute rate and holds at most
+    burst_seconds worth of it, so calls are spread out over the minute
+    rather than all allowed at its start.
+
+    An amount bigger than the bucket can hold is allowed once the bucket is full,
+    leaving the bucket in debt that later callers wait out.
+
+    This class is not thread-safe. Callers hold their own lock.
+    """
+
+    def __init__(self, per_minute: float, burst_seconds: float, now: float):
+        """
+        Constructor
+
+        :param per_minute: The limit per minute
+        :param burst_seconds: How many seconds worth of the rate the bucket can hold
+        :param now: The current time in seconds
+        """
+        self.rate: float = per_minute / SECONDS_PER_MINUTE
+        self.capacity: float = max(1.0, self.rate * burst_seconds)
+        self.level: float = self.capacity
+        self.updated: float = now
+
+    def refill(self, now: float):
+        """
+        :param now: The current time in seconds
+        """
+        elapsed: float = max(0.0, now - self.updated)
+        self.level = min(self.capacity, self.level + elapsed * self.rate)
+        self.updated = now
+
+    def get_wait_seconds(self, amount: float) -> float:
+        """
+        :param amount: The amount to take from the bucket
+        :return: How many seconds until the amount can be taken. 0.0 if it can be taken now.
+        """
+        needed: float = min(amount, self.capacity)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) / self.rate
+
+    def consume(self, amount: float):
+        """
+        :param amount: The amount to take from the bucket. Can leave the bucket in debt.
+                    A negative amount gives back what was taken in excess.
+        """
+        self.level = min(self.capacity, self.level - amount)
@@ -52,3 +52,9 @@ class AgentNetworkInspector:
                  an exception will be raised.
         """
         raise NotImplementedError
+
+    def get_network_name(self) -> str:
+        """
+        :return: The name of the agent network
+        """
+        raise NotImplementedError
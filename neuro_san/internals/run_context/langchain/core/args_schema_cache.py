@@ -0,0 +1,137 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import Type
+
+import hashlib
+import json
+import threading
+
+from collections import OrderedDict
+from os import environ
+
+from pydantic import BaseModel
+
+from neuro_san.internals.run_context.langchain.core.base_model_dictionary_converter \
+    import BaseModelDictionaryConverter
+
+
+class ArgsSchemaCache:
+    """
+    Bounded, process-wide LRU of the pydantic BaseModel classes that
+    BaseModelDictionaryConverter generates for OpenAI function parameters.
+
+    Generating one of these classes is relatively expensive and every
+    generated class lives on for the life of the process, yet the same
+    handful of function specs get turned into tools on every agent turn of
+    every request.  Classes are keyed by a hash of the canonical JSON of the
+    parameters dictionary, so identical specs share a single class no matter
+    which network or request they come from.
+
+    The size of the cache is taken from the AGENT_ARGS_SCHEMA_CACHE_SIZE
+    environment variable.  A size of 0 turns caching off.
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 1000
+
+    _instance: "ArgsSchemaCache" = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Constructor
+
+        :param max_entries: The maximum number of classes to keep
+        """
+        self.max_entries: int = max_entries
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, Type[BaseModel]] = OrderedDict()
+
+    @staticmethod
+    def get_instance() -> "ArgsSchemaCache":
+        """
+        :return: The process-wide ArgsSchemaCache
+        """
+        if ArgsSchemaCache._instance is None:
+            with ArgsSchemaCache._instance_lock:
+                if ArgsSchemaCache._instance is None:
+                    max_entries: int = int(environ.get("AGENT_ARGS_SCHEMA_CACHE_SIZE",
+                                                       str(ArgsSchemaCache.DEFAULT_MAX_ENTRIES)))
+                    ArgsSchemaCache._instance = ArgsSchemaCache(max_entries)
+        return ArgsSchemaCache._instance
+
+    @staticmethod
+    def get_cache_key(top_level_field_name: str, parameters: Dict[str, Any]) -> str:
+        """
+        :param top_level_field_name: The field name for the top-level object
+        :param parameters: The OpenAI function parameters dictionary
+        :return: A hash of the canonical JSON for the parameters
+        """
+        canonical: str = json.dumps([top_level_field_name, parameters], sort_keys=True,
+                                    separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get_args_schema(self, top_level_field_name: str, parameters: Dict[str, Any]) -> Type[BaseModel]:
+        """
+        :param top_level_field_name: The field name for the top-level object
+        :param parameters: The OpenAI function parameters dictionary
+        :return: The pydantic BaseModel class describing the parameters,
+                generated only if an identical spec has not been seen recently.
+        """
+        if self.max_entries <= 0:
+            converter = BaseModelDictionaryConverter(top_level_field_name)
+            return converter.from_dict(parameters)
+
+        cache_key: str = self.get_cache_key(top_level_field_name, parameters)
+        with self.lock:
+            args_schema: Type[BaseModel] = self.entries.get(cache_key)
+            if args_schema is not None:
+                self.entries.move_to_end(cache_key)
+                return args_schema
+
+        # Generate outside the lock. Should two threads race on the same
+        # spec, the first one in wins and the other class is simply dropped.
+        converter = BaseModelDictionaryConverter(top_level_field_name)
+        args_schema = converter.from_dict(parameters)
+
+        with self.lock:
+            existing: Type[BaseModel] = self.entries.get(cache_key)
+            if existing is not None:
+                self.entries.move_to_end(cache_key)
+                return existing
+            self.entries[cache_key] = args_schema
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return args_schema
+
+    def get_size(self) -> int:
+        """
+        :return: The number of classes currently cached
+        """
+        with self.lock:
+            return len(self.entries)
+
+    def clear(self):
+        """
+        Forgets all cached classes
+        """
+        with self.lock:
+            self.entries.clear()
@@ -100,9 +100,8 @@ class BaseToolFactory:
         # from the service call to the external agent.
         # We should be able to use the same BaseTool for langchain integration
         # purposes as we do for any other tool, though.
-        # Optimization:
-        #   It's possible we might want to cache these results somehow to minimize
-        #   network calls.
+        # The adapter consults the process-wide ExternalFunctionCache, so repeated
+        # activations do not each make a network call for the same spec.
         session_factory: AsyncAgentSessionFactory = self.invocation_context.get_async_session_factory()
         adapter = ExternalToolAdapter(session_factory, name)
         try:
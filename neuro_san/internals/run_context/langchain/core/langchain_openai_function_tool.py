@@ -29,9 +29,8 @@ from langchain_core.messages.base import BaseMessage
 from langchain_core.tools import BaseTool
 
 from neuro_san.internals.run_context.interfaces.tool_caller import ToolCaller
+from neuro_san.internals.run_context.langchain.core.args_schema_cache import ArgsSchemaCache
 from neuro_san.internals.run_context.langchain.core.langchain_run import LangChainRun
-from neuro_san.internals.run_context.langchain.core.base_model_dictionary_converter \
-    import BaseModelDictionaryConverter
 from neuro_san.internals.run_context.langchain.core.pydantic_argument_dictionary_converter \
     import PydanticArgumentDictionaryConverter
 from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
@@ -161,9 +160,11 @@ It's function_json is described thusly:
         # to satisfy that langchain need.  It's kind of a shame because this is just
         # going to get converted back to an OpenAI function again later on in langchain
         #  agent-land.
+        #
+        # The same specs come through here on every agent turn of every request,
+        # so the generated classes are shared via a process-wide cache.
         if use_function_json != function_json:
-            converter = BaseModelDictionaryConverter("parameters")
-            tool.args_schema = converter.from_dict(use_function_json)
+            tool.args_schema = ArgsSchemaCache.get_instance().get_args_schema("parameters", use_function_json)
 
         tool.tool_caller = tool_caller
 
@@ -21,6 +21,7 @@ from typing import Tuple
 from typing import Type
 from typing import Union
 
+import hashlib
 import json
 import uuid
 
@@ -31,12 +32,15 @@ from logging import getLogger
 from pydantic_core import ValidationError
 
 from langchain.agents.factory import create_agent
+from langchain_core.callbacks.base import BaseCallbackManager
 from langchain_core.language_models.base import BaseLanguageModel
 from langchain_core.messages.base import BaseMessage
 from langchain_core.messages.human import HumanMessage
 from langchain_core.messages.system import SystemMessage
+from langchain_core.prompt_values import ChatPromptValue
 from langchain_core.prompts.chat import ChatPromptTemplate
 from langchain_core.runnables.base import Runnable
+from langchain_core.runnables.base import RunnableLambda
 from langchain_core.runnables.passthrough import RunnablePassthrough
 from langchain_core.tools.base import BaseTool
 
@@ -51,13 +55,21 @@ from neuro_san.internals.journals.originating_journal import OriginatingJournal
 from neuro_san.internals.messages.origination import Origination
 from neuro_san.internals.messages.agent_tool_result_message import AgentToolResultMessage
 from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
+from neuro_san.internals.rate_limits.llm_call_scheduler import LlmCallScheduler
+from neuro_san.internals.rate_limits.model_rate_limiter import ModelRateLimiter
 from neuro_san.internals.run_context.interfaces.run import Run
 from neuro_san.internals.run_context.interfaces.run_context import RunContext
 from neuro_san.internals.run_context.interfaces.tool_caller import ToolCaller
 from neuro_san.internals.run_context.langchain.core.base_tool_factory import BaseToolFactory
 from neuro_san.internals.run_context.langchain.core.langchain_run import LangChainRun
+from neuro_san.internals.run_context.langchain.core.prompt_template_cache import PromptTemplateCache
 from neuro_san.internals.run_context.langchain.core.run_context_runnable import RunContextRunnable
+from neuro_san.internals.run_context.langchain.hedging.hedge_delay_tracker import HedgeDelayTracker
+from neuro_san.internals.run_context.langchain.hedging.hedged_runnable import HedgedRunnable
 from neuro_san.internals.run_context.langchain.llms.langchain_llm_resources import LangChainLlmResources
+from neuro_san.internals.run_context.langchain.llms.llm_policy import LlmPolicy
+from neuro_san.internals.run_context.langchain.token_counting.rate_limit_callback_handler \
+    import RateLimitCallbackHandler
 
 
 MINUTES: float = 60.0
@@ -102,6 +114,7 @@ class LangChainRunContext(RunContext):
         self.interceptor: InterceptingJournal = None
         self.llm_resources: LangChainLlmResources = None
         self.agent_chain: Runnable = None
+        self.prompt_cache_key: str = None
 
         # This might get modified in create_resources() (for now)
         self.llm_config: Dict[str, Any] = llm_config
@@ -186,12 +199,19 @@ class LangChainRunContext(RunContext):
                 tool: Union[BaseTool | List[BaseTool]] = await factory.create_base_tool(tool_name)
                 if tool is not None:
                     if isinstance(tool, List):
-                        self.tools.extend(tool)
+                        # Servers and toolkits do not promise any order for the tools they list.
+                        # Sort them so tool definitions render the same way every time,
+                        # which is what lets providers cache the prompt prefix.
+                        self.tools.extend(sorted(tool, key=lambda one_tool: one_tool.name))
                     else:
                         self.tools.append(tool)
 
         prompt_template: ChatPromptTemplate = await self.create_prompt_template(instructions)
 
+        # The static prefix of every prompt is the tool definitions and the system instructions.
+        prefix_parts: List[str] = [one_tool.name for one_tool in self.tools] + [instructions]
+        self.prompt_cache_key = hashlib.sha256("\n".join(prefix_parts).encode("utf-8")).hexdigest()[:32]
+
         self.agent_chain = self.create_agent_with_fallbacks(prompt_template)
         self.resources_created = True
 
@@ -217,9 +237,15 @@ class LangChainRunContext(RunContext):
         # Go through the list of fallbacks in the config.
         for index, fallback in enumerate(fallbacks):
 
+            if self.llm_config.get("prompt_caching"):
+                # Providers that take a cache key with every request get it when the model is created.
+                fallback = {**fallback, "prompt_cache_key": self.prompt_cache_key}
+
             # Create a model we might use.
             one_llm_resources: LangChainLlmResources = llm_factory.create_llm(fallback)
-            one_agent: Runnable = self.create_agent(prompt_template, one_llm_resources.get_model())
+            self.schedule_model_calls(one_llm_resources)
+            one_prompt: Runnable = self.mark_prompt_cache(prompt_template, one_llm_resources)
+            one_agent: Runnable = self.create_agent(one_prompt, one_llm_resources.get_model())
 
             if index == 0:
                 # The first agent is the one we want to be our main guy.
@@ -230,13 +256,81 @@ class LangChainRunContext(RunContext):
                 # Anything later than the first guy is considered a fallback. Add it to the list.
                 chain_fallbacks.append(one_agent)
 
-        if len(chain_fallbacks) > 0:
+        hedging: Union[bool, Dict[str, Any]] = self.llm_config.get("hedging")
+        if len(chain_fallbacks) > 0 and hedging:
+            # Set up fallbacks that also kick in when the primary is too slow.
+            agent_name: str = None
+            if self.tool_caller is not None:
+                agent_name = self.tool_caller.get_name()
+            key: Tuple[str, str, str] = (agent_name,
+                                         self.llm_resources.get_provider(),
+                                         self.llm_resources.get_model_name())
+            tracker: HedgeDelayTracker = HedgeDelayTracker.get_tracker(key, hedging)
+            agent = HedgedRunnable([agent] + chain_fallbacks, tracker)
+        elif len(chain_fallbacks) > 0:
             # Set up fallbacks.
             # See https://python.langchain.com/docs/how_to/tools_error/#tryexcept-tool-call
             agent = agent.with_fallbacks(chain_fallbacks)
 
         return agent
 
+    def schedule_model_calls(self, llm_resources: LangChainLlmResources):
+        """
+        Has every call to the model wait its turn with the process-wide LlmCallScheduler
+        if the model has rate limits configured.
+
+        The handler is attached to the model itself rather than to the run,
+        so that each of the fallbacks is held to its own limits.
+        :param llm_resources: The LangChainLlmResources with the model to schedule
+        """
+        rate_limits: Dict[str, Any] = None
+        if isinstance(llm_resources, LangChainLlmResources):
+            rate_limits = llm_resources.get_rate_limits()
+        if not rate_limits:
+            return
+
+        scheduler: LlmCallScheduler = LlmCallScheduler.get_instance()
+        limiter: ModelRateLimiter = scheduler.get_limiter(llm_resources.get_provider(),
+                                                          llm_resources.get_model_name(),
+                                                          rate_limits)
+        if limiter is None:
+            return
+
+        # The front man has the shortest origin. Deeper sub-agents wait behind it.
+        handler = RateLimitCallbackHandler(limiter, priority=len(self.origin))
+        llm: BaseLanguageModel = llm_resources.get_model()
+        if isinstance(llm.callbacks, BaseCallbackManager):
+            llm.callbacks.add_handler(handler, inherit=False)
+        else:
+            llm.callbacks = list(llm.callbacks or []) + [handler]
+
+    def mark_prompt_cache(self, prompt_template: ChatPromptTemplate,
+                          llm_resources: LangChainLlmResources) -> Runnable:
+        """
+        Has the LlmPolicy of the model attach its provider-specific prompt caching hints
+        to every rendered prompt if the agent has "prompt_caching" turned on in its llm_config.
+
+        :param prompt_template: The ChatPromptTemplate to use for the agent
+        :param llm_resources: The LangChainLlmResources with the model the prompt goes to
+        :return: A Runnable that renders the prompt, possibly with cache hints
+        """
+        if not self.llm_config.get("prompt_caching") or not isinstance(llm_resources, LangChainLlmResources):
+            return prompt_template
+
+        llm_policy: LlmPolicy = llm_resources.get_llm_policy()
+        if llm_policy is None:
+            return prompt_template
+
+        llm: BaseLanguageModel = llm_resources.get_model()
+        cache_key: str = self.prompt_cache_key
+
+        def mark(prompt_value: ChatPromptValue) -> ChatPromptValue:
+            messages: List[BaseMessage] = llm_policy.mark_cacheable_prefix(llm, prompt_value.to_messages(),
+                                                                           cache_key)
+            return ChatPromptValue(messages=messages)
+
+        return prompt_template | RunnableLambda(mark)
+
     def create_agent(self, prompt_template: ChatPromptTemplate, llm: BaseLanguageModel) -> Runnable:
         """
         Creates an agent.
@@ -270,14 +364,41 @@ class LangChainRunContext(RunContext):
     async def create_prompt_template(self, instructions: str) -> ChatPromptTemplate:
         """
         Creates a ChatPromptTemplate given the generic instructions
-        """
-        # Assemble the prompt message list
-        message_list: List[Tuple[str, str]] = []
 
+        The compiled template is the same for every request to the same agent,
+        so it comes from the process-wide PromptTemplateCache where possible.
+        """
         system_message = SystemMessage(instructions)
         if not self.chat_history:
             await self.journal.write_message(system_message)
-        message_list.append(("system", instructions))
+
+        network_name: str = None
+        agent_name: str = None
+        if self.tool_caller is not None:
+            network_name = self.tool_caller.get_inspector().get_network_name()
+            agent_name = self.tool_caller.get_name()
+
+        cache: PromptTemplateCache = PromptTemplateCache.get_instance()
+        prompt: ChatPromptTemplate = cache.get_prompt_template(network_name, agent_name, instructions,
+                                                               self.compile_prompt_template)
+        return prompt
+
+    @staticmethod
+    def compile_prompt_template(instructions: str) -> ChatPromptTemplate:
+        """
+        Compiles a ChatPromptTemplate given the generic instructions.
+        Only the chat history and the input are left as variables.
+
+        The order of the messages matters for provider-side prompt caching:
+        the static system instructions always come first so that they (together with
+        the tool definitions) form a prefix that renders byte-identically on every turn.
+        Only the chat history and the new input after that vary from turn to turn.
+
+        :param instructions: The instructions for the agent
+        :return: The ChatPromptTemplate
+        """
+        # Assemble the prompt message list
+        message_list: List[Tuple[str, str]] = [("system", instructions)]
 
         # Fill out the rest of the prompt per the docs for create_tooling_agent()
         # Note we are not write_message()-ing the chat history because that is redundant
@@ -498,6 +619,8 @@ class LangChainRunContext(RunContext):
         self.recent_human_message = None
         self.llm_resources = None
         self.journal = None
+        if self.interceptor is not None:
+            self.interceptor.close()
         self.interceptor = None
 
     def get_agent_tool_spec(self) -> Dict[str, Any]:
@@ -550,8 +673,9 @@ class LangChainRunContext(RunContext):
         # The SystemMessage has already been written to the journal
         # need to transfer it over when this shift happens.
         if old_interceptor is not None:
-            for message in old_interceptor.get_messages():
+            for message in old_interceptor.iterate_messages():
                 self.interceptor.write_unwrapped_message(message, self.origin)
+            old_interceptor.close()
         self.journal = OriginatingJournal(self.interceptor, self.origin, self.chat_history)
 
     def update_from_chat_context(self, chat_context: Dict[str, Any]):
@@ -0,0 +1,170 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+import threading
+
+from collections import OrderedDict
+
+from langchain_core.prompts.chat import ChatPromptTemplate
+
+from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
+from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+from neuro_san.internals.utils.env_util import EnvUtil
+
+
+class PromptTemplateCache(AgentStateListener):
+    """
+    Bounded, process-wide LRU of the ChatPromptTemplates that agents are
+    created with, keyed by (agent network name, agent name).
+
+    Every request gets its own copy of an agent network and every activation
+    of an agent compiles its instructions into a ChatPromptTemplate, even though
+    the result is the same for every request to that agent.  Cached templates
+    only leave the chat history and the input as variables and are shared between
+    requests.
+
+    An entry is only used when the instructions it was compiled from are the same
+    as the ones asked for.  On top of that, registered as an AgentStateListener,
+    the entries for a network are dropped whenever an AgentNetworkStorage reports
+    that network as modified or removed, which starts a new generation for it.
+
+    The size of the cache is taken from the AGENT_PROMPT_TEMPLATE_CACHE_SIZE
+    environment variable.  A size of 0 turns caching off.
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 1000
+
+    _instance: "PromptTemplateCache" = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Constructor
+
+        :param max_entries: The maximum number of templates to keep
+        """
+        self.max_entries: int = max_entries
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[Tuple[str, str], Tuple[str, ChatPromptTemplate]] = OrderedDict()
+
+        # Network name -> generation. Bumped whenever a network is invalidated
+        # so that templates compiled from the previous generation are not put back.
+        self.generations: Dict[str, int] = {}
+
+    @staticmethod
+    def get_instance() -> "PromptTemplateCache":
+        """
+        :return: The process-wide PromptTemplateCache
+        """
+        if PromptTemplateCache._instance is None:
+            with PromptTemplateCache._instance_lock:
+                if PromptTemplateCache._instance is None:
+                    max_entries: int = EnvUtil.get_int("AGENT_PROMPT_TEMPLATE_CACHE_SIZE",
+                                                       PromptTemplateCache.DEFAULT_MAX_ENTRIES)
+                    PromptTemplateCache._instance = PromptTemplateCache(max_entries)
+        return PromptTemplateCache._instance
+
+    def get_prompt_template(self, network_name: str, agent_name: str, instructions: str,
+                            compile_template: Callable[[str], ChatPromptTemplate]) -> ChatPromptTemplate:
+        """
+        :param network_name: The name of the agent network. If None, nothing is cached.
+        :param agent_name: The name of the agent within the network
+        :param instructions: The instructions to compile into the template
+        :param compile_template: The function that compiles instructions into a ChatPromptTemplate
+        :return: The ChatPromptTemplate for the instructions, compiled only if
+                the agent has not been seen recently with the same instructions.
+                The template is shared between requests and must not be modified.
+        """
+        if self.max_entries <= 0 or network_name is None:
+            return compile_template(instructions)
+
+        cache_key: Tuple[str, str] = (network_name, agent_name)
+        with self.lock:
+            generation: int = self.generations.get(network_name, 0)
+            entry: Tuple[str, ChatPromptTemplate] = self.entries.get(cache_key)
+            if entry is not None and entry[0] == instructions:
+                self.entries.move_to_end(cache_key)
+                return entry[1]
+
+        # Compile outside the lock. Should two threads race on the same
+        # agent, the last one in wins, and both templates are equivalent.
+        prompt_template: ChatPromptTemplate = compile_template(instructions)
+
+        with self.lock:
+            if self.generations.get(network_name, 0) == generation:
+                self.entries[cache_key] = (instructions, prompt_template)
+                self.entries.move_to_end(cache_key)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+
+        return prompt_template
+
+    def get_size(self) -> int:
+        """
+        :return: The number of templates currently cached
+        """
+        with self.lock:
+            return len(self.entries)
+
+    def invalidate(self, network_name: str):
+        """
+        Forgets the cached templates for a network
+
+        :param network_name: The name of the agent network
+        """
+        with self.lock:
+            self.generations[network_name] = self.generations.get(network_name, 0) + 1
+            for cache_key in [key for key in self.entries if key[0] == network_name]:
+                del self.entries[cache_key]
+
+    def clear(self):
+        """
+        Forgets all cached templates
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def agent_added(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being added to the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        # A network that was removed could have templates put back by requests
+        # that were still running. Those are for the old generation.
+        self.invalidate(agent_name)
+
+    def agent_modified(self, agent_name: str, source: AgentStorageSource):
+        """
+        Existing agent has been modified in service scope.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate(agent_name)
+
+    def agent_removed(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being removed from the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate(agent_name)
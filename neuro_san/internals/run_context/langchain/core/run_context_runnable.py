@@ -41,9 +41,14 @@ from leaf_common.config.resolver_util import ResolverUtil
 from neuro_san.internals.errors.error_detector import ErrorDetector
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.quota.quota_exceeded_error import QuotaExceededError
+from neuro_san.internals.quota.quota_manager import QuotaManager
 from neuro_san.internals.run_context.interfaces.tool_caller import ToolCaller
 from neuro_san.internals.run_context.langchain.journaling.journaling_callback_handler import JournalingCallbackHandler
+from neuro_san.internals.run_context.langchain.journaling.token_streaming_callback_handler \
+    import TokenStreamingCallbackHandler
 from neuro_san.internals.run_context.langchain.token_counting.langchain_token_counter import LangChainTokenCounter
+from neuro_san.internals.run_context.langchain.token_counting.quota_callback_handler import QuotaCallbackHandler
 from neuro_san.internals.run_context.langchain.tracing.neuro_san_runnable import NeuroSanRunnable
 from neuro_san.internals.run_context.langchain.util.api_key_error_check import ApiKeyErrorCheck
 
@@ -81,7 +86,7 @@ class RunContextRunnable(NeuroSanRunnable):
     # a non-pydantic Journal as a member, we need to do this.
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    # pylint: disable=redefined-builtin
+    # pylint: disable=redefined-builtin,too-many-locals
     async def run_it(self, inputs: Input) -> Output:
         """
         Transform a single input into an output.
@@ -123,6 +128,17 @@ class RunContextRunnable(NeuroSanRunnable):
             # to the logs.  Add this because some people are interested in it.
             callbacks.append(LoggingCallbackHandler(self.logger))
 
+        if self.invocation_context.is_stream_tokens() and len(parent_origin) == 1:
+            # The client asked for the front man's text as it is generated.
+            # Only the front man has an origin of length 1.
+            callbacks.append(TokenStreamingCallbackHandler(base_journal, parent_origin))
+
+        quota_manager: QuotaManager = QuotaManager.get_instance()
+        if quota_manager.is_enabled():
+            # Check the budget of whoever made the request before each LLM call.
+            quota_key: str = quota_manager.get_quota_key(self.invocation_context.get_metadata())
+            callbacks.append(QuotaCallbackHandler(quota_manager, quota_key))
+
         runnable_config: Dict[str, Any] = self.prepare_runnable_config(callbacks=callbacks,
                                                                        recursion_limit=recursion_limit)
 
@@ -136,6 +152,7 @@ class RunContextRunnable(NeuroSanRunnable):
 
         return inputs
 
+    # pylint: disable=too-many-locals
     async def invoke_agent_chain(self, inputs: Dict[str, Any], runnable_config: Dict[str, Any]):
         """
         Set the agent in motion
@@ -150,6 +167,11 @@ class RunContextRunnable(NeuroSanRunnable):
         while chain_result is None and retries > 0:
             try:
                 chain_result: Dict[str, Any] = await self.agent_chain.ainvoke(input=inputs, config=runnable_config)
+            except QuotaExceededError as quota_error:
+                # Retrying will not help. End the run with the reason as the answer.
+                self.logger.warning(str(quota_error))
+                exception = quota_error
+                break
             except API_ERROR_TYPES as api_error:
                 backtrace = traceback.format_exc()
                 message: str = None
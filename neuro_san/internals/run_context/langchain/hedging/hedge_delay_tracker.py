@@ -0,0 +1,118 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import Hashable
+from typing import Tuple
+from typing import Union
+
+import math
+import threading
+
+from collections import deque
+
+
+class HedgeDelayTracker:
+    """
+    Keeps track of how long a primary LLM takes to produce its first token or result
+    and decides how long to wait for it before starting a hedged call to a fallback.
+
+    The delay is the configured percentile of the recent samples, so that only the
+    slowest calls get hedged. Until there are enough samples, a fixed delay is used.
+
+    Hedging is configured with a "hedging" key in an agent's llm_config,
+    next to its "fallbacks". The value is either true for the defaults, or a dictionary with keys:
+        "percentile"            The percentile of observed delays after which to hedge. Default is 95.
+        "delay_seconds"         The delay to use until there are enough samples. Default is 5.0.
+        "min_samples"           How many samples are enough. Default is 20.
+    """
+
+    DEFAULT_PERCENTILE: float = 95.0
+    DEFAULT_DELAY_SECONDS: float = 5.0
+    DEFAULT_MIN_SAMPLES: int = 20
+
+    # How many of the most recent samples to keep
+    MAX_SAMPLES: int = 200
+
+    _trackers: Dict[Hashable, "HedgeDelayTracker"] = {}
+    _trackers_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, percentile: float = DEFAULT_PERCENTILE,
+                 delay_seconds: float = DEFAULT_DELAY_SECONDS,
+                 min_samples: int = DEFAULT_MIN_SAMPLES):
+        """
+        Constructor
+
+        :param percentile: The percentile of observed delays after which to hedge
+        :param delay_seconds: The delay to use until there are enough samples
+        :param min_samples: How many samples are enough
+        """
+        self.percentile: float = min(100.0, max(0.0, percentile))
+        self.delay_seconds: float = delay_seconds
+        self.min_samples: int = max(1, min_samples)
+        self.lock = threading.Lock()
+        self.samples: Deque[float] = deque(maxlen=self.MAX_SAMPLES)
+
+    @classmethod
+    def get_tracker(cls, key: Hashable, hedging: Union[bool, Dict[str, Any]]) -> "HedgeDelayTracker":
+        """
+        :param key: Identifies the agent and primary model whose delays are tracked
+        :param hedging: The "hedging" value from the llm_config
+        :return: The process-wide HedgeDelayTracker for the key
+        """
+        config: Dict[str, Any] = hedging if isinstance(hedging, Dict) else {}
+        settings: Tuple[float, float, int] = (
+            float(config.get("percentile", cls.DEFAULT_PERCENTILE)),
+            float(config.get("delay_seconds", cls.DEFAULT_DELAY_SECONDS)),
+            int(config.get("min_samples", cls.DEFAULT_MIN_SAMPLES)),
+        )
+        with cls._trackers_lock:
+            tracker: HedgeDelayTracker = cls._trackers.get(key)
+            if tracker is None or tracker.get_settings() != settings:
+                # New, or the settings were changed by a configuration reload.
+                tracker = HedgeDelayTracker(*settings)
+                cls._trackers[key] = tracker
+        return tracker
+
+    def get_settings(self) -> Tuple[float, float, int]:
+        """
+        :return: The settings this instance was created with
+        """
+        return (self.percentile, self.delay_seconds, self.min_samples)
+
+    def add_sample(self, seconds: float):
+        """
+        :param seconds: How long the primary took to produce its first token or result.
+                    When it was abandoned before doing so, how long it had been going.
+        """
+        with self.lock:
+            self.samples.append(seconds)
+
+    def get_delay_seconds(self) -> float:
+        """
+        :return: How long to wait for the primary before hedging
+        """
+        with self.lock:
+            if len(self.samples) < self.min_samples:
+                return self.delay_seconds
+            ordered = sorted(self.samples)
+
+        index: int = max(0, math.ceil(self.percentile / 100.0 * len(ordered)) - 1)
+        return ordered[index]
@@ -0,0 +1,67 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+
+import asyncio
+import threading
+
+
+class HedgeRace:
+    """
+    Decides which of the two calls of a hedged HedgedRunnable gets to go on
+    once they are both running. The first to hear back from its LLM wins.
+    The other is held where it is until it is cancelled, so that it never
+    gets to call any tools.
+
+    Instances must be created on the event loop of whoever waits for the decision.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.event = asyncio.Event()
+        self.lock = threading.Lock()
+        self.winner: Any = None
+
+    def claim(self, contender: Any) -> bool:
+        """
+        :param contender: The contender that has just heard back from its LLM
+        :return: True if the contender has won the race, either now or earlier.
+                False if some other contender won it first.
+        """
+        with self.lock:
+            if self.winner is None:
+                self.winner = contender
+                self.loop.call_soon_threadsafe(self.event.set)
+            return self.winner is contender
+
+    async def wait(self):
+        """
+        Waits for the race to be decided
+        """
+        await self.event.wait()
+
+    def get_winner(self) -> Any:
+        """
+        :return: The contender that won the race, or None if it has not been decided yet
+        """
+        with self.lock:
+            return self.winner
@@ -0,0 +1,241 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from uuid import UUID
+
+import asyncio
+
+from time import time
+
+from langchain_core.callbacks.base import BaseCallbackManager
+from langchain_core.runnables.base import Runnable
+from langchain_core.runnables.config import RunnableConfig
+from langchain_core.runnables.config import ensure_config
+from langchain_core.runnables.utils import Input
+from langchain_core.runnables.utils import Output
+
+from neuro_san.internals.run_context.langchain.hedging.hedge_delay_tracker import HedgeDelayTracker
+from neuro_san.internals.run_context.langchain.hedging.hedge_race import HedgeRace
+from neuro_san.internals.run_context.langchain.hedging.progress_callback_handler import ProgressCallbackHandler
+from neuro_san.internals.run_context.langchain.token_counting.get_llm_token_callback import llm_token_callback_var
+from neuro_san.internals.run_context.langchain.token_counting.llm_token_callback_handler \
+    import LlmTokenCallbackHandler
+
+
+# pylint: disable=redefined-builtin
+class HedgedRunnable(Runnable):
+    """
+    Like the Runnable.with_fallbacks() it stands in for, tries a list of agent
+    chains built on different LLMs in order until one succeeds.
+
+    The difference is that a primary that is slow but not failing does not
+    hold things up for too long. If the primary has produced neither its first token
+    nor a result after the delay given by the HedgeDelayTracker, the first fallback
+    is started alongside it. Whichever hears back from its LLM first goes on
+    and the other is cancelled.
+
+    Since the fallback is only started while the primary has not yet heard back
+    from its LLM, neither has called any tools when the race is decided.
+    The one that lost is held in its ProgressCallbackHandler until it is cancelled,
+    so tools and any other side effects only ever happen once.
+
+    Both calls are counted by the token accounting. LLM calls of the abandoned one
+    that were still in flight are counted with their estimated prompt tokens.
+    """
+
+    def __init__(self, runnables: List[Runnable], tracker: HedgeDelayTracker):
+        """
+        Constructor
+
+        :param runnables: The primary agent chain followed by its fallbacks
+        :param tracker: The HedgeDelayTracker for the primary
+        """
+        self.runnables: List[Runnable] = runnables
+        self.tracker: HedgeDelayTracker = tracker
+
+    def invoke(self, input: Input, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Output:
+        """
+        Hedging needs an event loop to wait on two calls at once.
+        Synchronous callers just get plain fallbacks.
+        """
+        fallbacks: Runnable = self.runnables[0].with_fallbacks(self.runnables[1:])
+        return fallbacks.invoke(input, config, **kwargs)
+
+    # pylint: disable=too-many-locals
+    async def ainvoke(self, input: Input, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Output:
+        """
+        :param input: The input to the agent chains
+        :param config: The RunnableConfig to invoke with
+        :return: The output of whichever agent chain succeeded first
+        """
+        config = ensure_config(config)
+        start_time: float = time()
+        tasks: List[asyncio.Task] = []
+        try:
+            primary_handler = ProgressCallbackHandler()
+            primary: asyncio.Task = self.start(0, input, config, primary_handler, **kwargs)
+            tasks.append(primary)
+
+            # Give the primary its chance
+            progress: asyncio.Task = asyncio.ensure_future(primary_handler.wait())
+            done, _ = await asyncio.wait([primary, progress], timeout=self.tracker.get_delay_seconds(),
+                                         return_when=asyncio.FIRST_COMPLETED)
+            progress.cancel()
+            if done:
+                if primary_handler.get_progress_time() is not None:
+                    self.tracker.add_sample(primary_handler.get_progress_time() - start_time)
+                try:
+                    return await primary
+                except Exception as exception:      # pylint: disable=broad-exception-caught
+                    return await self.fall_back(1, input, config, exception, **kwargs)
+
+            # The primary is taking too long. Hedge with the first fallback.
+            race = HedgeRace()
+            primary_handler.set_race(race)
+            hedge_handler = ProgressCallbackHandler()
+            hedge_handler.set_race(race)
+            hedge: asyncio.Task = self.start(1, input, config, hedge_handler, **kwargs)
+            tasks.append(hedge)
+            handlers: Dict[asyncio.Task, ProgressCallbackHandler] = {
+                primary: primary_handler,
+                hedge: hedge_handler,
+            }
+
+            winner, first_exception = await self.run_race(handlers, race)
+            self.add_primary_sample(primary_handler, start_time)
+            if winner is None:
+                # Both failed. Carry on with the rest of the fallbacks, if any.
+                return await self.fall_back(2, input, config, first_exception, **kwargs)
+
+            await self.abandon({task for task in handlers if task is not winner}, handlers)
+            try:
+                return await winner
+            except Exception as exception:      # pylint: disable=broad-exception-caught
+                return await self.fall_back(2, input, config, first_exception or exception, **kwargs)
+
+        finally:
+            # In case we ourselves were cancelled
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def start(self, index: int, input: Input, config: RunnableConfig,
+              handler: ProgressCallbackHandler, **kwargs: Any) -> asyncio.Task:
+        """
+        :param index: The index of the agent chain to start
+        :param input: The input to the agent chain
+        :param config: The RunnableConfig to invoke with
+        :param handler: The ProgressCallbackHandler to watch the agent chain with
+        :return: The task running the agent chain
+        """
+        callbacks: Any = config.get("callbacks")
+        if isinstance(callbacks, BaseCallbackManager):
+            callbacks = callbacks.copy()
+            callbacks.add_handler(handler, inherit=True)
+        else:
+            callbacks = list(callbacks or []) + [handler]
+        use_config: RunnableConfig = {**config, "callbacks": callbacks}
+        return asyncio.ensure_future(self.runnables[index].ainvoke(input, use_config, **kwargs))
+
+    @staticmethod
+    async def run_race(handlers: Dict[asyncio.Task, ProgressCallbackHandler], race: HedgeRace) \
+            -> Tuple[asyncio.Task, Exception]:
+        """
+        Waits until one of the racing agent chains has heard back from its LLM or has finished.
+
+        :param handlers: The ProgressCallbackHandler for each task running an agent chain
+        :param race: The HedgeRace the handlers are in
+        :return: A tuple of the task that gets to go on, and the exception of the first
+                agent chain that failed, if any. The task is None if both failed.
+        """
+        decided: asyncio.Task = asyncio.ensure_future(race.wait())
+        first_exception: Exception = None
+        pending: Set[asyncio.Task] = set(handlers.keys())
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending | {decided}, return_when=asyncio.FIRST_COMPLETED)
+                if decided in done:
+                    winner: ProgressCallbackHandler = race.get_winner()
+                    return next(task for task, handler in handlers.items() if handler is winner), first_exception
+                for task in done:
+                    pending.discard(task)
+                    if task.exception() is None:
+                        return task, first_exception
+                    if first_exception is None:
+                        first_exception = task.exception()
+        finally:
+            decided.cancel()
+        return None, first_exception
+
+    async def fall_back(self, index: int, input: Input, config: RunnableConfig,
+                        first_exception: Exception, **kwargs: Any) -> Output:
+        """
+        Tries the remaining agent chains one at a time, as with_fallbacks() would.
+
+        :param index: The index of the first agent chain to try
+        :param input: The input to the agent chains
+        :param config: The RunnableConfig to invoke with
+        :param first_exception: The exception of the first agent chain that failed
+        :return: The output of the first agent chain to succeed.
+                If none do, the first exception is raised.
+        """
+        for runnable in self.runnables[index:]:
+            try:
+                return await runnable.ainvoke(input, config, **kwargs)
+            except Exception:       # pylint: disable=broad-exception-caught
+                continue
+        raise first_exception
+
+    async def abandon(self, tasks: Set[asyncio.Task], handlers: Dict[asyncio.Task, ProgressCallbackHandler]):
+        """
+        Cancels the agent chains that lost the race,
+        counting their LLM calls still in flight with the token accounting.
+
+        :param tasks: The tasks running the agent chains that lost
+        :param handlers: The ProgressCallbackHandler for each task
+        """
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        token_callback: LlmTokenCallbackHandler = llm_token_callback_var.get()
+        if token_callback is None:
+            return
+        for task in tasks:
+            in_flight: Dict[UUID, Tuple[str, int]] = handlers[task].get_in_flight()
+            for run_id, (model_name, prompt_tokens) in in_flight.items():
+                await token_callback.record_abandoned_call(run_id, model_name, prompt_tokens)
+
+    def add_primary_sample(self, primary_handler: ProgressCallbackHandler, start_time: float):
+        """
+        Tells the tracker how long the primary took to make progress,
+        or how long it went without any if it never did.
+
+        :param primary_handler: The ProgressCallbackHandler of the primary
+        :param start_time: When the primary was started
+        """
+        progress_time: float = primary_handler.get_progress_time()
+        if progress_time is None:
+            progress_time = time()
+        self.tracker.add_sample(progress_time - start_time)
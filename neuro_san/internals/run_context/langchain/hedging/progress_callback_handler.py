@@ -0,0 +1,157 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from uuid import UUID
+
+import asyncio
+import threading
+
+from time import time
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from neuro_san.internals.run_context.langchain.hedging.hedge_race import HedgeRace
+from neuro_san.internals.run_context.langchain.token_counting.token_estimator import TokenEstimator
+
+
+# pylint: disable=too-many-ancestors
+class ProgressCallbackHandler(AsyncCallbackHandler):
+    """
+    Callback handler for one of the calls of a HedgedRunnable that notes when
+    its LLM first produces a token or a result, and which of its LLM calls
+    are still in flight should the call have to be abandoned.
+
+    Once the call is racing another, it also has each LLM result claim the HedgeRace.
+    A call that loses the race is held in on_llm_end() until it is cancelled.
+
+    Streaming models can report tokens from another thread, so this is thread-safe.
+    Instances must be created on the event loop of whoever waits for progress.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        super().__init__()
+        self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.event = asyncio.Event()
+        self.lock = threading.Lock()
+        self.progress_time: float = None
+        # Model name and estimated prompt tokens per LLM call in flight
+        self.in_flight: Dict[UUID, Tuple[str, int]] = {}
+        self.race: HedgeRace = None
+
+    async def on_chat_model_start(self, serialized: Dict[str, Any],
+                                  messages: List[List[BaseMessage]],
+                                  *, run_id: UUID,
+                                  **kwargs: Any) -> None:
+        """
+        Notes a chat model call going out.
+        :param serialized: Dictionary of metadata of the invoked model
+        :param messages: The messages about to be sent to the model
+        :param run_id: The id of the model call
+        """
+        tokens: int = TokenEstimator.estimate_chat_call(messages, kwargs.get("invocation_params"))
+        model_name: str = self.get_model_name(kwargs.get("invocation_params"))
+        with self.lock:
+            self.in_flight[run_id] = (model_name, tokens)
+
+    async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        """
+        :param token: A newly generated token
+        """
+        self.signal()
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """
+        :param response: The result of the call
+        :param run_id: The id of the model call
+        """
+        with self.lock:
+            self.in_flight.pop(run_id, None)
+        self.signal()
+
+        if self.race is not None and not self.race.claim(self):
+            # The other call heard back from its LLM first. Hold this one here
+            # until it is cancelled, so that it never acts on what its LLM said.
+            await asyncio.Event().wait()
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """
+        :param error: The error from the call
+        :param run_id: The id of the model call
+        """
+        if isinstance(error, asyncio.CancelledError):
+            # Still costs what was sent. Leave it for the accounting of abandoned calls.
+            return
+        with self.lock:
+            self.in_flight.pop(run_id, None)
+
+    def set_race(self, race: HedgeRace):
+        """
+        :param race: The HedgeRace this call is now in
+        """
+        self.race = race
+
+    def signal(self):
+        """
+        Notes the first progress, waking up anyone waiting for it.
+        """
+        with self.lock:
+            if self.progress_time is not None:
+                return
+            self.progress_time = time()
+        self.loop.call_soon_threadsafe(self.event.set)
+
+    async def wait(self):
+        """
+        Waits for the first progress
+        """
+        await self.event.wait()
+
+    def get_progress_time(self) -> float:
+        """
+        :return: The time of the first progress, or None if there has been none
+        """
+        with self.lock:
+            return self.progress_time
+
+    def get_in_flight(self) -> Dict[UUID, Tuple[str, int]]:
+        """
+        :return: A dictionary of model name and estimated prompt tokens
+                for each LLM call still in flight, keyed by run id
+        """
+        with self.lock:
+            return dict(self.in_flight)
+
+    @staticmethod
+    def get_model_name(invocation_params: Dict[str, Any]) -> str:
+        """
+        :param invocation_params: The invocation parameters of a model call
+        :return: The model name, whichever key the provider puts it under
+        """
+        if not invocation_params:
+            return None
+        return invocation_params.get("model_name") or invocation_params.get("model") \
+            or invocation_params.get("model_id")
@@ -0,0 +1,93 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import TypeVar
+from uuid import UUID
+
+from pydantic import ConfigDict
+
+from langchain_core.callbacks.base import AsyncCallbackHandler
+
+from neuro_san.internals.journals.journal import Journal
+from neuro_san.internals.messages.agent_token_delta_message import AgentTokenDeltaMessage
+
+T = TypeVar("T")
+
+
+# pylint: disable=too-many-ancestors
+class TokenStreamingCallbackHandler(AsyncCallbackHandler):
+    """
+    AsyncCallbackHandler implementation that forwards each new token
+    an LLM generates to the Journal as an AgentTokenDeltaMessage.
+
+    LangChain chat models only hit their streaming API (and so only call
+    on_llm_new_token()) when asked to stream.  Having the tap_output_aiter()
+    and tap_output_iter() methods below makes LangChain regard this handler
+    as a streaming handler, which is what asks for streaming without having
+    to reconfigure the LLM itself.
+    """
+
+    # This guy needs to be a pydantic class and in order to have
+    # a non-pydantic Journal as a member, we need to do this.
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def __init__(self, journal: Journal, origin: List[Dict[str, Any]]):
+        """
+        Constructor
+
+        :param journal: The Journal to write delta messages to.
+                This is expected to be the base journal of the InvocationContext
+                so that deltas bypass any chat history.
+        :param origin: A List of origin dictionaries indicating the origin of the run
+        """
+        self.journal: Journal = journal
+        self.origin: List[Dict[str, Any]] = origin
+
+    async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        """
+        :param token: The new token
+        :param kwargs: Other arguments LangChain passes, including the chunk
+        """
+        if not isinstance(token, str) or len(token) == 0:
+            # Tool call chunks and end-of-stream markers have no text for the client
+            return
+        await self.journal.write_message(AgentTokenDeltaMessage(content=token), self.origin)
+
+    def tap_output_aiter(self, run_id: UUID, output: AsyncIterator[T]) -> AsyncIterator[T]:
+        """
+        Pass-through that marks this handler as a streaming handler.
+        :param run_id: The id of the run
+        :param output: The output of the run
+        :return: The output untouched
+        """
+        _ = run_id
+        return output
+
+    def tap_output_iter(self, run_id: UUID, output: Iterator[T]) -> Iterator[T]:
+        """
+        Pass-through that marks this handler as a streaming handler.
+        :param run_id: The id of the run
+        :param output: The output of the run
+        :return: The output untouched
+        """
+        _ = run_id
+        return output
@@ -17,10 +17,12 @@
 
 from typing import Any
 from typing import Dict
+from typing import List
 
 from contextlib import suppress
 
 from langchain_core.language_models.base import BaseLanguageModel
+from langchain_core.messages.base import BaseMessage
 
 from neuro_san.internals.run_context.langchain.llms.llm_policy import LlmPolicy
 
@@ -88,6 +90,21 @@ class AnthropicLlmPolicy(LlmPolicy):
         )
         return llm
 
+    def mark_cacheable_prefix(self, llm: BaseLanguageModel, messages: List[BaseMessage],
+                              cache_key: str) -> List[BaseMessage]:
+        """
+        Puts a cache_control breakpoint at the end of the system prompt.
+        Anthropic renders tool definitions before the system prompt,
+        so this caches both of them.
+
+        :param llm: The BaseLanguageModel the messages are about to be sent to
+        :param messages: The messages of a rendered prompt, static system prefix first
+        :param cache_key: A key that is stable for as long as the static prefix is
+        :return: The messages to send
+        """
+        _ = llm, cache_key
+        return self.mark_system_prefix(messages, {"cache_control": {"type": "ephemeral"}})
+
     async def delete_resources(self):
         """
         Release the run-time resources used by the model
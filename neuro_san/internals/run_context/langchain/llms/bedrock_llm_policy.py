@@ -17,8 +17,10 @@
 
 from typing import Any
 from typing import Dict
+from typing import List
 
 from langchain_core.language_models.base import BaseLanguageModel
+from langchain_core.messages.base import BaseMessage
 
 from neuro_san.internals.run_context.langchain.llms.llm_policy import LlmPolicy
 
@@ -89,6 +91,23 @@ class BedrockLlmPolicy(LlmPolicy):
         )
         return llm
 
+    def mark_cacheable_prefix(self, llm: BaseLanguageModel, messages: List[BaseMessage],
+                              cache_key: str) -> List[BaseMessage]:
+        """
+        Anthropic models on Bedrock take the same cache_control breakpoints as they do directly.
+        Other Bedrock models are left alone.
+
+        :param llm: The BaseLanguageModel the messages are about to be sent to
+        :param messages: The messages of a rendered prompt, static system prefix first
+        :param cache_key: A key that is stable for as long as the static prefix is
+        :return: The messages to send
+        """
+        _ = cache_key
+        model_id: str = getattr(llm, "model_id", None) or ""
+        if "anthropic" not in model_id:
+            return messages
+        return self.mark_system_prefix(messages, {"cache_control": {"type": "ephemeral"}})
+
     async def delete_resources(self):
         """
         Release the run-time resources used by the model
@@ -38,7 +38,9 @@ from neuro_san.internals.run_context.langchain.llms.standard_langchain_llm_facto
 from neuro_san.internals.run_context.langchain.util.api_key_error_check import ApiKeyErrorCheck
 from neuro_san.internals.run_context.langchain.util.argument_validator import ArgumentValidator
 
-KEYS_TO_REMOVE_FOR_USER_CLASS: Set[str] = {"class", "verbose"}
+KEYS_TO_REMOVE_FOR_USER_CLASS: Set[str] = {
+    "class", "verbose", "rate_limits", "hedging", "prompt_caching", "prompt_cache_key"
+}
 
 # Lazily import specific errors from llm providers
 API_KEY_ERRORS: Tuple[Type[Any], ...] = ResolverUtil.create_type_tuple([
@@ -73,6 +75,10 @@ class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
         "max_tokens"                The maximum number of tokens to use in
                                     get_max_prompt_tokens(). By default this comes from
                                     the model description in this class.
+
+        "rate_limits"               An optional dictionary of per-model limits the
+                                    provider enforces, overlaid on top of the "rate_limits"
+                                    of the model's llm_info entry. See LlmCallScheduler.
     """
 
     def __init__(self, config: Dict[str, Any] = None):
@@ -175,6 +181,10 @@ class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
         """
         full_config: Dict[str, Any] = self.create_full_llm_config(config)
         llm_resources: LangChainLlmResources = self.create_llm_resources(full_config)
+
+        # Let the caller know what provider limits to schedule calls against, if any.
+        model_name: str = full_config.get("model_name") or full_config.get("model") or full_config.get("model_id")
+        llm_resources.set_rate_limits(full_config.get("class"), model_name, full_config.get("rate_limits"))
         return llm_resources
 
     def create_full_llm_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -241,6 +251,12 @@ class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
         # Attempt to get a max_tokens through calculation
         full_config["max_tokens"] = self.get_max_prompt_tokens(full_config)
 
+        # Any rate_limits in the llm_config override those of the model entry key by key.
+        entry_rate_limits: Dict[str, Any] = llm_entry.get("rate_limits")
+        if entry_rate_limits:
+            full_config["rate_limits"] = self.overlayer.overlay(entry_rate_limits,
+                                                                full_config.get("rate_limits") or {})
+
         return full_config
 
     def get_chat_class_args(self, chat_class_name: str, use_model_name: str = None) -> Dict[str, Any]:
@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 # END COPYRIGHT
+from typing import Any
+from typing import Dict
 
 from langchain_core.language_models.base import BaseLanguageModel
 
@@ -34,6 +36,9 @@ class LangChainLlmResources:
         """
         self.model: BaseLanguageModel = model
         self.llm_policy: LlmPolicy = llm_policy
+        self.provider: str = None
+        self.model_name: str = None
+        self.rate_limits: Dict[str, Any] = None
 
     def get_model(self) -> BaseLanguageModel:
         """
@@ -47,6 +52,35 @@ class LangChainLlmResources:
         """
         return self.llm_policy
 
+    def set_rate_limits(self, provider: str, model_name: str, rate_limits: Dict[str, Any]):
+        """
+        :param provider: The llm class (provider) of the model
+        :param model_name: The name of the model
+        :param rate_limits: The "rate_limits" dictionary for the model from its llm_info entry
+                    and llm_config. Can be None.
+        """
+        self.provider = provider
+        self.model_name = model_name
+        self.rate_limits = rate_limits
+
+    def get_rate_limits(self) -> Dict[str, Any]:
+        """
+        :return: The "rate_limits" dictionary for the model. Can be None.
+        """
+        return self.rate_limits
+
+    def get_provider(self) -> str:
+        """
+        :return: The llm class (provider) of the model. Can be None.
+        """
+        return self.provider
+
+    def get_model_name(self) -> str:
+        """
+        :return: The name of the model. Can be None.
+        """
+        return self.model_name
+
     async def delete_resources(self):
         """
         Release the run-time resources used by the model
@@ -18,9 +18,12 @@ from __future__ import annotations
 
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Tuple
 
 from langchain_core.language_models.base import BaseLanguageModel
+from langchain_core.messages.base import BaseMessage
+from langchain_core.messages.system import SystemMessage
 
 from leaf_common.config.resolver import Resolver
 
@@ -63,6 +66,10 @@ class LlmPolicy(EnvironmentConfiguration):
              to your LLM.  This is only required if your BaseLanguageModel implementation
              can take some kind of externally instantiated web client as an argument to
              its constructor and you care about delete_resources() cleanup.
+        * mark_cacheable_prefix() attaches provider-specific prompt caching hints
+             to the static system prefix of a prompt when an agent opts in to
+             "prompt_caching".  By default nothing is marked, which suits providers
+             that cache repeated prefixes automatically.
     """
 
     def __init__(self, llm: BaseLanguageModel = None):
@@ -148,3 +155,53 @@ class LlmPolicy(EnvironmentConfiguration):
             self.llm = llm
 
         return llm, self
+
+    def mark_cacheable_prefix(self, llm: BaseLanguageModel, messages: List[BaseMessage],
+                              cache_key: str) -> List[BaseMessage]:
+        """
+        Attaches provider-specific prompt caching hints to the messages of a prompt.
+        This is only called for agents that have "prompt_caching" turned on in their llm_config.
+
+        :param llm: The BaseLanguageModel the messages are about to be sent to
+        :param messages: The messages of a rendered prompt, static system prefix first
+        :param cache_key: A key that is stable for as long as the static prefix is
+        :return: The messages to send. By default these are the messages passed in.
+        """
+        _ = llm, cache_key
+        return messages
+
+    @staticmethod
+    def mark_system_prefix(messages: List[BaseMessage], marker: Dict[str, Any]) -> List[BaseMessage]:
+        """
+        Helper for implementations whose providers take cache markers on content blocks.
+
+        :param messages: The messages of a rendered prompt
+        :param marker: The extra keys to add to the last content block of the system prefix
+        :return: A new list of messages where the last leading SystemMessage has its
+                content as text blocks with the marker on the last one.
+                The messages passed in are not modified.
+        """
+        last_system: int = -1
+        for index, message in enumerate(messages):
+            if not isinstance(message, SystemMessage):
+                break
+            last_system = index
+
+        if last_system < 0:
+            return messages
+
+        system_message: SystemMessage = messages[last_system]
+        content: Any = system_message.content
+        blocks: List[Any] = []
+        if isinstance(content, str):
+            blocks.append({"type": "text", "text": content})
+        else:
+            blocks.extend(content)
+
+        if not blocks or not isinstance(blocks[-1], Dict):
+            return messages
+
+        blocks[-1] = {**blocks[-1], **marker}
+        marked: List[BaseMessage] = list(messages)
+        marked[last_system] = system_message.model_copy(update={"content": blocks})
+        return marked
@@ -148,6 +148,9 @@ class OpenAILlmPolicy(LlmPolicy):
             tiktoken_model_name=config.get("tiktoken_model_name"),
             stop=config.get("stop"),
 
+            # Only set when the agent has "prompt_caching" turned on.
+            model_kwargs=self.create_model_kwargs(config),
+
             # The following three parameters are for reasoning models only.
             reasoning=config.get("reasoning"),
             reasoning_effort=config.get("reasoning_effort"),
@@ -174,6 +177,23 @@ class OpenAILlmPolicy(LlmPolicy):
 
         return llm
 
+    def create_model_kwargs(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        OpenAI caches repeated prompt prefixes automatically, so prompts need no markers.
+        A prompt_cache_key does help route requests with the same prefix to the same cache.
+        Only OpenAI itself is sent one, as OpenAI-compatible servers at another
+        openai_api_base can reject parameters they do not know.
+
+        :param config: The fully specified llm config
+        :return: The extra parameters to send with every request
+        """
+        model_kwargs: Dict[str, Any] = {}
+        cache_key: str = config.get("prompt_cache_key")
+        base_url: str = self.get_value_or_env(config, "openai_api_base", "OPENAI_API_BASE")
+        if cache_key and (not base_url or "api.openai.com" in base_url):
+            model_kwargs["prompt_cache_key"] = cache_key
+        return model_kwargs
+
     async def delete_resources(self):
         """
         Release the run-time resources used by the instance.
@@ -35,7 +35,8 @@ register_configure_hook(llm_token_callback_var, inheritable=True)
 
 
 @contextmanager
-def get_llm_token_callback(llm_infos: Dict[str, Any]) -> Generator[LlmTokenCallbackHandler, None, None]:
+def get_llm_token_callback(llm_infos: Dict[str, Any],
+                           quota_key: str = None) -> Generator[LlmTokenCallbackHandler, None, None]:
     """Get llm token callback.
 
     Get context manager for tracking usage metadata across chat model calls using
@@ -47,11 +48,13 @@ def get_llm_token_callback(llm_infos: Dict[str, Any]) -> Generator[LlmTokenCallb
 
     :param llm_infos: Dictionary containing configuration or metadata about the LLM
                       (e.g., model name, class (provider), token cost).
+    :param quota_key: The key against which usage is recorded with the QuotaManager.
+                      Default None means usage is not recorded for quotas.
     :return: A generator-based context manager that yields an `LlmTokenCallbackHandler`
              for tracking token usage within the context.
     """
     # Create a new callback handler instance for tracking token usage
-    cb = LlmTokenCallbackHandler(llm_infos)
+    cb = LlmTokenCallbackHandler(llm_infos, quota_key)
 
     # Set the context variable to the newly created callback handler
     llm_token_callback_var.set(cb)
@@ -39,6 +39,7 @@ from neuro_san.internals.interfaces.invocation_context import InvocationContext
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.agent_message import AgentMessage
 from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.quota.quota_manager import QuotaManager
 from neuro_san.internals.run_context.langchain.token_counting.get_llm_token_callback import get_llm_token_callback
 from neuro_san.internals.run_context.langchain.token_counting.get_llm_token_callback import llm_token_callback_var
 
@@ -98,6 +99,7 @@ class LangChainTokenCounter:
         retval: Any = None
         llm_factory: ContextTypeLlmFactory = self.invocation_context.get_llm_factory()
         llm_infos: Dict[str, Any] = llm_factory.llm_infos
+        quota_key: str = QuotaManager.get_instance().get_quota_key(self.invocation_context.get_metadata())
         # Take a time stamp so we measure another thing people care about - latency.
         start_time: float = time()
 
@@ -124,7 +126,7 @@ class LangChainTokenCounter:
         #   are now limited to the calling agent only, and no longer include those
         #   from downstream (chained) agents. However, `models_token_dict` is added
         #   to the `LlmTokenCallbackHandler` to collect token stats of each model call.
-        with get_llm_token_callback(llm_infos) as callback:
+        with get_llm_token_callback(llm_infos, quota_key) as callback:
             # Create a new context for different ContextVar values
             # and use the create_task() to run within that context.
             new_context: Context = copy_context()
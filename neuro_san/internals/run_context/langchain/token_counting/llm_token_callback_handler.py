@@ -23,6 +23,9 @@ from typing import Dict
 from typing import List
 from typing import Literal
 from typing import Optional
+from typing import Tuple
+from uuid import UUID
+
 from typing_extensions import override
 
 from langchain_community.callbacks.bedrock_anthropic_callback import MODEL_COST_PER_1K_INPUT_TOKENS
@@ -35,6 +38,9 @@ from langchain_core.messages import BaseMessage
 from langchain_core.messages.ai import UsageMetadata
 from langchain_core.outputs import ChatGeneration, LLMResult
 
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
+from neuro_san.internals.quota.quota_manager import QuotaManager
+
 EMPTY = ""
 CLASS_TABLE = {
     # Chat model class : Provider class
@@ -85,13 +91,21 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
     successful_requests: int = 0
     total_cost: float = 0.0
 
-    def __init__(self, llm_infos: Dict[str, Any]):
-        """Initialize the CallbackHandler."""
+    def __init__(self, llm_infos: Dict[str, Any], quota_key: str = None):
+        """
+        Initialize the CallbackHandler.
+        :param llm_infos: Dictionary containing metadata about the LLMs, including token prices
+        :param quota_key: The key against which usage is recorded with the QuotaManager.
+                    Default None means usage is not recorded for quotas.
+        """
         super().__init__()
         self._lock = asyncio.Lock()
         self.llm_infos: Dict[str, Any] = llm_infos
+        self.quota_key: str = quota_key
         self.provider_class: str = None
         self.start_time: float = None
+        # Provider class and start time per model call, as calls can overlap
+        self.run_starts: Dict[UUID, Tuple[str, float]] = {}
 
         # Dictionary for accumulating token stats of models. For example
         # {"openai": {"gpt-4o": {"total_tokens": 100, "prompt_tokens": 80, ...}, "gpt_4.1": {...}}, }
@@ -132,6 +146,9 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
 
         # Start timer
         self.start_time = time()
+        run_id: UUID = kwargs.get("run_id")
+        if run_id is not None:
+            self.run_starts[run_id] = (self.provider_class, self.start_time)
 
     @override
     async def on_llm_end(self, response: LLMResult, **kwargs: Any):
@@ -139,9 +156,15 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
         Collect token usage when llm ends.
         :param response: Output from chat model
         """
+        provider_class: str = self.provider_class
+        start_time: float = self.start_time
+        run_start: Tuple[str, float] = self.run_starts.pop(kwargs.get("run_id"), None)
+        if run_start is not None:
+            provider_class, start_time = run_start
+
         # Calculate time latency for each llm
         # Note that this will be slightly lower time taken by the agent
-        time_taken_in_seconds: float = time() - self.start_time
+        time_taken_in_seconds: float = time() - start_time
 
         # Check for usage_metadata (Only work for langchain-core >= 0.2.2)
         try:
@@ -170,45 +193,115 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
             except AttributeError:
                 pass
 
+        # Report to process-wide metrics
+        metrics: MetricsRegistry = MetricsRegistry.get_instance()
+        metric_labels: Dict[str, str] = {"provider": provider_class, "model": model_name}
+        metrics.observe(MetricsRegistry.LLM_CALL_DURATION, metric_labels, time_taken_in_seconds)
+
         if usage_metadata:
-            total_tokens: int = usage_metadata.get("total_tokens", 0)
-            completion_tokens: int = usage_metadata.get("output_tokens", 0)
-            prompt_tokens: int = usage_metadata.get("input_tokens", 0)
-
-            # Calculate the total cost
-            total_cost: float = self.calculate_token_costs(model_name, completion_tokens, prompt_tokens)
-
-            # Update shared state behind lock
-            async with self._lock:
-                # Initialize model entry if this is the first time we see this model
-                if model_name not in self.models_token_dict[self.provider_class]:
-                    self._init_model_entry(model_name)
-
-                # Update per-model stats.
-                self.models_token_dict[self.provider_class][model_name]["total_tokens"] += total_tokens
-                self.models_token_dict[self.provider_class][model_name]["prompt_tokens"] += prompt_tokens
-                self.models_token_dict[self.provider_class][model_name]["completion_tokens"] += \
-                    completion_tokens
-                self.models_token_dict[self.provider_class][model_name]["successful_requests"] += 1
-                self.models_token_dict[self.provider_class][model_name]["total_cost"] += total_cost
-                self.models_token_dict[self.provider_class][model_name]["time_taken_in_seconds"] += \
-                    time_taken_in_seconds
-
-                # Update per-agent stats
-                self.total_tokens += total_tokens
-                self.prompt_tokens += prompt_tokens
-                self.completion_tokens += completion_tokens
+            await self.add_usage(provider_class, model_name,
+                                 usage_metadata.get("input_tokens", 0),
+                                 usage_metadata.get("output_tokens", 0),
+                                 usage_metadata.get("total_tokens", 0),
+                                 time_taken_in_seconds)
+
+    @override
+    async def on_llm_error(self, error: BaseException, **kwargs: Any):
+        """
+        Forgets about a failed call. Cancelled calls are left for record_abandoned_call().
+        :param error: The error from the call
+        """
+        if not isinstance(error, asyncio.CancelledError):
+            self.run_starts.pop(kwargs.get("run_id"), None)
+
+    async def record_abandoned_call(self, run_id: UUID, model_name: str, prompt_tokens: int):
+        """
+        Counts a model call that was cancelled before it could report its usage,
+        like the slower of two hedged calls. Providers still charge for the prompt.
+
+        :param run_id: The id of the model call
+        :param model_name: The name of the model called
+        :param prompt_tokens: The estimated number of prompt tokens sent
+        """
+        provider_class: str = self.provider_class
+        start_time: float = self.start_time
+        run_start: Tuple[str, float] = self.run_starts.pop(run_id, None)
+        if run_start is not None:
+            provider_class, start_time = run_start
+        if provider_class is None:
+            return
+
+        time_taken_in_seconds: float = time() - start_time
+        await self.add_usage(provider_class, model_name or EMPTY, prompt_tokens, 0, prompt_tokens,
+                             time_taken_in_seconds, successful=False)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    async def add_usage(self, provider_class: str, model_name: str,
+                        prompt_tokens: int, completion_tokens: int, total_tokens: int,
+                        time_taken_in_seconds: float, successful: bool = True):
+        """
+        Adds the usage of one model call to the stats, metrics and quotas.
+        :param provider_class: The provider class of the model called
+        :param model_name: The name of the model called
+        :param prompt_tokens: Number of input tokens
+        :param completion_tokens: Number of output tokens
+        :param total_tokens: Number of total tokens
+        :param time_taken_in_seconds: How long the call took
+        :param successful: Whether the call completed
+        """
+        # Calculate the total cost
+        total_cost: float = self.calculate_token_costs(model_name, completion_tokens, prompt_tokens, provider_class)
+
+        metrics: MetricsRegistry = MetricsRegistry.get_instance()
+        metric_labels: Dict[str, str] = {"provider": provider_class, "model": model_name}
+        metrics.inc(MetricsRegistry.LLM_TOKENS, {**metric_labels, "type": "prompt"}, prompt_tokens)
+        metrics.inc(MetricsRegistry.LLM_TOKENS, {**metric_labels, "type": "completion"}, completion_tokens)
+        metrics.inc(MetricsRegistry.LLM_COST, metric_labels, total_cost)
+
+        # Count against the budget of whoever made the request
+        QuotaManager.get_instance().record(self.quota_key, total_tokens, total_cost)
+
+        # Update shared state behind lock
+        async with self._lock:
+            # Initialize model entry if this is the first time we see this model
+            if provider_class not in self.models_token_dict:
+                self.models_token_dict[provider_class] = {}
+            if model_name not in self.models_token_dict[provider_class]:
+                self._init_model_entry(model_name, provider_class)
+
+            # Update per-model stats.
+            model_dict: Dict[str, Any] = self.models_token_dict[provider_class][model_name]
+            model_dict["total_tokens"] += total_tokens
+            model_dict["prompt_tokens"] += prompt_tokens
+            model_dict["completion_tokens"] += completion_tokens
+            model_dict["total_cost"] += total_cost
+            model_dict["time_taken_in_seconds"] += time_taken_in_seconds
+            if successful:
+                model_dict["successful_requests"] += 1
+            else:
+                model_dict["abandoned_requests"] = model_dict.get("abandoned_requests", 0) + 1
+
+            # Update per-agent stats
+            self.total_tokens += total_tokens
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            if successful:
                 self.successful_requests += 1
-                self.total_cost += total_cost
+            self.total_cost += total_cost
 
-    def calculate_token_costs(self, model_name: str, completion_tokens: int, prompt_tokens: int) -> float:
+    def calculate_token_costs(self, model_name: str, completion_tokens: int, prompt_tokens: int,
+                              provider_class: str = None) -> float:
         """
         Calculate token costs with fallback methods for different providers.
         :param model_name: Model to calculate the cost
         :param completion_tokens: Number of output tokens
         :param prompt_tokens: Number of input tokens
+        :param provider_class: The provider class of the model.
+                    Default None means the provider of the most recently started call.
         :return: Total cost
         """
+        if provider_class is None:
+            provider_class = self.provider_class
 
         # Try to get costs from llm_infos first
         completion_token_cost: float = \
@@ -217,13 +310,13 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
 
         # Fallback to provider-specific methods for anthropic and openai based models
         # Since there are lookup tables for these models in langchain-community
-        if self.provider_class in ["azure-openai", "openai"]:
+        if provider_class in ["azure-openai", "openai"]:
             completion_token_cost = completion_token_cost or \
                 self._get_openai_cost(model_name, completion_tokens, token_type=TokenType.COMPLETION)
             prompt_token_cost = prompt_token_cost or \
                 self._get_openai_cost(model_name, prompt_tokens, token_type=TokenType.PROMPT)
 
-        elif self.provider_class in ["anthropic", "bedrock"]:
+        elif provider_class in ["anthropic", "bedrock"]:
             completion_token_cost = completion_token_cost or \
                 self._get_anthropic_cost(model_name, completion_tokens, "completion")
             prompt_token_cost = prompt_token_cost or self._get_anthropic_cost(model_name, prompt_tokens, "prompt")
@@ -271,12 +364,16 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
         except ValueError:
             return None
 
-    def _init_model_entry(self, model_name: str):
+    def _init_model_entry(self, model_name: str, provider_class: str = None):
         """
         Initialize a new model entry in the tracking dictionary.
         :param model_name: LLM model name to put in the dictionary
+        :param provider_class: The provider class of the model.
+                    Default None means the provider of the most recently started call.
         """
-        self.models_token_dict[self.provider_class][model_name] = {
+        if provider_class is None:
+            provider_class = self.provider_class
+        self.models_token_dict[provider_class][model_name] = {
             "total_tokens": 0,
             "prompt_tokens": 0,
             "completion_tokens": 0,
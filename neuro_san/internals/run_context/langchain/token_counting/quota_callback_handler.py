@@ -0,0 +1,71 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import BaseMessage
+
+from neuro_san.internals.quota.quota_manager import QuotaManager
+
+
+# pylint: disable=too-many-ancestors
+class QuotaCallbackHandler(AsyncCallbackHandler):
+    """
+    Callback handler that checks the budget of the request's quota key
+    with the QuotaManager just before every LLM call is made.
+
+    When the budget is exhausted, the QuotaExceededError raised stops the LLM call
+    from going out. Usage itself is recorded by the LlmTokenCallbackHandler.
+    """
+
+    # Without this LangChain would log and swallow the QuotaExceededError
+    raise_error: bool = True
+
+    def __init__(self, quota_manager: QuotaManager, quota_key: str):
+        """
+        Constructor
+
+        :param quota_manager: The QuotaManager doing the bookkeeping
+        :param quota_key: The key whose budget is to be checked
+        """
+        super().__init__()
+        self.quota_manager: QuotaManager = quota_manager
+        self.quota_key: str = quota_key
+
+    async def on_chat_model_start(self, serialized: Dict[str, Any],
+                                  messages: List[List[BaseMessage]],
+                                  **kwargs: Any) -> None:
+        """
+        Checks the budget before a chat model is called.
+        :param serialized: Dictionary of metadata of the invoked model
+        :param messages: The messages about to be sent to the model
+        """
+        self.quota_manager.check(self.quota_key)
+
+    async def on_llm_start(self, serialized: Dict[str, Any],
+                           prompts: List[str],
+                           **kwargs: Any) -> None:
+        """
+        Checks the budget before a (non-chat) LLM is called.
+        :param serialized: Dictionary of metadata of the invoked model
+        :param prompts: The prompts about to be sent to the model
+        """
+        self.quota_manager.check(self.quota_key)
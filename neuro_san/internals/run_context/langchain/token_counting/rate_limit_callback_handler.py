@@ -0,0 +1,128 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import AIMessage
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from neuro_san.internals.rate_limits.model_rate_limiter import ModelRateLimiter
+from neuro_san.internals.run_context.langchain.token_counting.token_estimator import TokenEstimator
+
+
+# pylint: disable=too-many-ancestors
+class RateLimitCallbackHandler(AsyncCallbackHandler):
+    """
+    Callback handler attached to a single model that waits for its turn
+    with the model's ModelRateLimiter just before every call to the model is made.
+
+    Prompt tokens are estimated with tiktoken going in, and the estimate
+    is corrected with what the provider reports, if anything, coming out.
+    """
+
+    def __init__(self, limiter: ModelRateLimiter, priority: int):
+        """
+        Constructor
+
+        :param limiter: The ModelRateLimiter for the model this handler is attached to
+        :param priority: The priority of the calls of the agent using the model.
+                    Lower goes first. This is the depth of the agent in its network,
+                    so that the front man is not kept waiting by its own sub-agents.
+        """
+        super().__init__()
+        self.limiter: ModelRateLimiter = limiter
+        self.priority: int = priority
+        self.estimates: Dict[UUID, int] = {}
+
+    async def on_chat_model_start(self, serialized: Dict[str, Any],
+                                  messages: List[List[BaseMessage]],
+                                  *, run_id: UUID,
+                                  **kwargs: Any) -> None:
+        """
+        Waits for a turn before a chat model is called.
+        :param serialized: Dictionary of metadata of the invoked model
+        :param messages: The messages about to be sent to the model
+        :param run_id: The id of the model call
+        """
+        tokens: int = TokenEstimator.estimate_chat_call(messages, kwargs.get("invocation_params"))
+        await self.wait_for_turn(run_id, tokens)
+
+    async def on_llm_start(self, serialized: Dict[str, Any],
+                           prompts: List[str],
+                           *, run_id: UUID,
+                           **kwargs: Any) -> None:
+        """
+        Waits for a turn before a (non-chat) LLM is called.
+        :param serialized: Dictionary of metadata of the invoked model
+        :param prompts: The prompts about to be sent to the model
+        :param run_id: The id of the model call
+        """
+        tokens: int = sum(TokenEstimator.estimate_text(prompt) for prompt in prompts)
+        await self.wait_for_turn(run_id, tokens)
+
+    async def wait_for_turn(self, run_id: UUID, tokens: int):
+        """
+        :param run_id: The id of the model call
+        :param tokens: The estimated number of prompt tokens of the call
+        """
+        await self.limiter.acquire(tokens, self.priority)
+        self.estimates[run_id] = tokens
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """
+        Corrects the token accounting with the prompt tokens reported by the provider.
+        :param response: The result of the call
+        :param run_id: The id of the model call
+        """
+        estimate: int = self.estimates.pop(run_id, None)
+        if estimate is None:
+            return
+        actual: int = self.get_prompt_tokens(response)
+        if actual is not None:
+            self.limiter.reconcile(estimate, actual)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """
+        Forgets about a failed call. Whatever it cost at the provider stays counted.
+        :param error: The error from the call
+        :param run_id: The id of the model call
+        """
+        self.estimates.pop(run_id, None)
+
+    @staticmethod
+    def get_prompt_tokens(response: LLMResult) -> int:
+        """
+        :param response: The result of a call
+        :return: The number of prompt tokens the provider reported, or None if it did not say
+        """
+        token_usage: Dict[str, Any] = (response.llm_output or {}).get("token_usage") or {}
+        if token_usage.get("prompt_tokens") is not None:
+            return token_usage.get("prompt_tokens")
+
+        prompt_tokens: int = None
+        for generations in response.generations:
+            for generation in generations:
+                message: BaseMessage = getattr(generation, "message", None)
+                if isinstance(message, AIMessage) and message.usage_metadata:
+                    prompt_tokens = (prompt_tokens or 0) + message.usage_metadata.get("input_tokens", 0)
+        return prompt_tokens
@@ -0,0 +1,230 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import hashlib
+import json
+import threading
+
+from collections import OrderedDict
+from functools import lru_cache
+
+from langchain_core.messages import BaseMessage
+from tiktoken import Encoding
+from tiktoken import get_encoding
+from tiktoken.model import encoding_name_for_model
+
+from neuro_san.internals.utils.env_util import EnvUtil
+
+# The same encoding as gpt-4o. Close enough for estimates with other providers.
+DEFAULT_ENCODING: str = "o200k_base"
+
+# Rough per-message overhead for role and separators
+TOKENS_PER_MESSAGE: int = 4
+
+# Model name prefixes tiktoken might not know about yet -> encoding name.
+# Longest prefixes are checked first. Anything not listed here or known
+# to tiktoken gets the DEFAULT_ENCODING.
+MODEL_ENCODINGS: Dict[str, str] = {
+    "gpt-5": "o200k_base",
+    "gpt-4.1": "o200k_base",
+    "gpt-4o": "o200k_base",
+    "o1": "o200k_base",
+    "o3": "o200k_base",
+    "o4": "o200k_base",
+    "gpt-4": "cl100k_base",
+    "gpt-3.5": "cl100k_base",
+}
+
+# Strings at least this long are worth remembering the token counts of.
+# Shorter ones are quicker to encode than to look up.
+MIN_CACHED_LENGTH: int = 512
+
+
+class TokenEstimator:
+    """
+    Estimates token counts with tiktoken before an LLM call is made,
+    when there is no usage reported by a provider to go by.
+
+    tiktoken encoders are expensive to create, so they are looked up once per process,
+    as is the encoding for each model name.
+
+    Large static strings such as agent instructions and tool schemas are sent again
+    on every turn, so their counts are kept in a bounded, process-wide LRU keyed by
+    a hash of their content.  The size of that cache is taken from the
+    AGENT_TOKEN_COUNT_CACHE_SIZE environment variable.  A size of 0 turns it off.
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 1000
+
+    # Read from the environment the first time it is needed. See get_max_entries().
+    max_entries: int = None
+    counts: OrderedDict[Tuple[str, bytes], int] = OrderedDict()
+    counts_lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_encoder(encoding_name: str = DEFAULT_ENCODING) -> Encoding:
+        """
+        :param encoding_name: The name of the tiktoken encoding
+        :return: The shared encoder for the encoding
+        """
+        return get_encoding(encoding_name)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_encoding_name(model_name: str = None) -> str:
+        """
+        :param model_name: The name of a model. Can be None.
+        :return: The name of the tiktoken encoding to estimate tokens for the model with
+        """
+        if not model_name:
+            return DEFAULT_ENCODING
+
+        for prefix in sorted(MODEL_ENCODINGS, key=len, reverse=True):
+            if model_name.startswith(prefix):
+                return MODEL_ENCODINGS.get(prefix)
+
+        try:
+            return encoding_name_for_model(model_name)
+        except KeyError:
+            return DEFAULT_ENCODING
+
+    @classmethod
+    def get_max_entries(cls) -> int:
+        """
+        :return: The maximum number of token counts kept in the cache
+        """
+        if cls.max_entries is None:
+            cls.max_entries = EnvUtil.get_int("AGENT_TOKEN_COUNT_CACHE_SIZE", cls.DEFAULT_MAX_ENTRIES)
+        return cls.max_entries
+
+    @classmethod
+    def get_encoder_for_model(cls, model_name: str = None) -> Encoding:
+        """
+        :param model_name: The name of a model. Can be None.
+        :return: The shared encoder to estimate tokens for the model with
+        """
+        return cls.get_encoder(cls.get_encoding_name(model_name))
+
+    @classmethod
+    def estimate_text(cls, text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+        """
+        :param text: The text to estimate
+        :param encoding_name: The name of the tiktoken encoding
+        :return: The number of tokens in the text
+        """
+        if not text:
+            return 0
+
+        max_entries: int = cls.get_max_entries()
+        if len(text) < MIN_CACHED_LENGTH or max_entries <= 0:
+            return cls.encode_length(text, encoding_name)
+
+        cache_key: Tuple[str, bytes] = (encoding_name,
+                                        hashlib.blake2b(text.encode("utf-8", "surrogatepass"),
+                                                        digest_size=16).digest())
+        with cls.counts_lock:
+            tokens: int = cls.counts.get(cache_key)
+            if tokens is not None:
+                cls.counts.move_to_end(cache_key)
+                return tokens
+
+        # Encode outside the lock. Racing threads come up with the same count.
+        tokens = cls.encode_length(text, encoding_name)
+
+        with cls.counts_lock:
+            cls.counts[cache_key] = tokens
+            while len(cls.counts) > max_entries:
+                cls.counts.popitem(last=False)
+
+        return tokens
+
+    @classmethod
+    def encode_length(cls, text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+        """
+        :param text: The text to encode
+        :param encoding_name: The name of the tiktoken encoding
+        :return: The number of tokens in the text, without looking in the cache
+        """
+        # Special tokens in user content should be counted as text, not rejected.
+        return len(cls.get_encoder(encoding_name).encode(text, disallowed_special=()))
+
+    @classmethod
+    def get_cache_size(cls) -> int:
+        """
+        :return: The number of token counts currently cached
+        """
+        with cls.counts_lock:
+            return len(cls.counts)
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forgets all cached token counts
+        """
+        with cls.counts_lock:
+            cls.counts.clear()
+
+    @classmethod
+    def estimate_messages(cls, messages: List[BaseMessage], encoding_name: str = DEFAULT_ENCODING) -> int:
+        """
+        :param messages: The messages of a prompt
+        :param encoding_name: The name of the tiktoken encoding
+        :return: The estimated number of prompt tokens for the messages
+        """
+        tokens: int = 0
+        for message in messages:
+            tokens += TOKENS_PER_MESSAGE
+            content: Any = message.content
+            if isinstance(content, str):
+                tokens += cls.estimate_text(content, encoding_name)
+            elif isinstance(content, list):
+                # Content blocks. Only text blocks are estimated.
+                for block in content:
+                    if isinstance(block, str):
+                        tokens += cls.estimate_text(block, encoding_name)
+                    elif isinstance(block, Dict):
+                        tokens += cls.estimate_text(block.get("text"), encoding_name)
+        return tokens
+
+    @classmethod
+    def estimate_chat_call(cls, messages: List[List[BaseMessage]], invocation_params: Dict[str, Any] = None) -> int:
+        """
+        :param messages: The lists of messages of a chat model call, as given to on_chat_model_start()
+        :param invocation_params: The invocation parameters of the call. Can be None.
+                The model name in here picks the encoding and any tool definitions are counted too.
+        :return: The estimated number of prompt tokens for the call
+        """
+        params: Dict[str, Any] = invocation_params or {}
+        model_name: Any = params.get("model_name") or params.get("model")
+        encoding_name: str = DEFAULT_ENCODING
+        if isinstance(model_name, str):
+            encoding_name = cls.get_encoding_name(model_name)
+
+        tokens: int = sum(cls.estimate_messages(one_list, encoding_name) for one_list in messages)
+
+        tools: List[Any] = params.get("tools")
+        if tools:
+            # Tool definitions are the same from turn to turn, so this is usually a cache hit.
+            tokens += cls.estimate_text(json.dumps(tools, sort_keys=True, default=str), encoding_name)
+        return tokens
@@ -16,6 +16,7 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
@@ -201,7 +202,7 @@ class NeuroSanRunnable(RunnablePassthrough, RunTarget):
         """
         :return: the intercepted outputs
         """
-        intercepted_messages: List[BaseMessage] = self.interceptor.get_messages()
+        intercepted_messages: Iterator[BaseMessage] = self.interceptor.iterate_messages()
 
         messages: List[Dict[str, Any]] = messages_to_dict(intercepted_messages)
         outputs: Dict[str, Any] = {
@@ -0,0 +1,247 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+import os
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from time import time
+
+# A function that takes the ETag of the last known function json (or None)
+# and returns a tuple of (FunctionResponse dictionary, ETag).
+# The FunctionResponse dictionary is None when the remote side says the ETag is still good.
+FunctionFetcher = Callable[[str], Awaitable[Tuple[Dict[str, Any], str]]]
+
+
+# pylint: disable=too-many-instance-attributes
+class ExternalFunctionCache:
+    """
+    Process-wide cache of the function json of external agents.
+
+    Without it, every activation of an agent that lists an external agent as a tool
+    makes a full function() round trip to the external agent's server.
+
+    Entries are keyed by the resolved location of the external agent and the values
+    of those request metadata keys that can affect what the caller is allowed to see.
+    * Entries are good for a time-to-live, after which they are revalidated by sending
+      the ETag of the cached function json. The server can answer that it has not changed
+      without sending it again.
+    * Failures to reach an external agent are remembered for a shorter time so that a
+      down server does not get hammered by every activation.
+    * Concurrent lookups of the same key, even from different event loops, share a single
+      round trip.
+
+    The process-wide instance is configured from these environment variables:
+        AGENT_EXTERNAL_FUNCTION_CACHE_TTL_SECONDS           Default 60. 0 disables caching.
+        AGENT_EXTERNAL_FUNCTION_CACHE_NEGATIVE_TTL_SECONDS  Default 5
+        AGENT_EXTERNAL_FUNCTION_CACHE_METADATA_KEYS         Space-delimited request metadata keys
+                                                            that are part of the cache key.
+                                                            Default "authorization user_id"
+
+    Only the listed metadata keys separate one caller's entries from another's.
+    Callers that differ only in other metadata share entries, so when an external agent
+    answers function() differently depending on some other request header
+    (a tenant id or an API key with a different name, for instance), that key needs
+    to be added to AGENT_EXTERNAL_FUNCTION_CACHE_METADATA_KEYS.
+    """
+
+    DEFAULT_TTL_SECONDS: float = 60.0
+    DEFAULT_NEGATIVE_TTL_SECONDS: float = 5.0
+    DEFAULT_METADATA_KEYS: str = "authorization user_id"
+    DEFAULT_MAX_ENTRIES: int = 1000
+
+    _instance: "ExternalFunctionCache" = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+                 metadata_keys: List[str] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 clock: Callable[[], float] = time):
+        """
+        Constructor
+
+        :param ttl_seconds: How long function json is used before it is revalidated
+        :param negative_ttl_seconds: How long a failure to reach an external agent is remembered
+        :param metadata_keys: The request metadata keys that are part of the cache key.
+                    Default of None means the DEFAULT_METADATA_KEYS.
+        :param max_entries: The maximum number of entries kept. The least recently used go first.
+        :param clock: A function returning the current time in seconds
+        """
+        self.ttl_seconds: float = ttl_seconds
+        self.negative_ttl_seconds: float = negative_ttl_seconds
+        self.metadata_keys: List[str] = metadata_keys
+        if self.metadata_keys is None:
+            self.metadata_keys = self.DEFAULT_METADATA_KEYS.split()
+        self.max_entries: int = max_entries
+        self.clock: Callable[[], float] = clock
+
+        self.lock = threading.Lock()
+        # Cache key -> entry dictionary with keys:
+        #   "function_json" The FunctionResponse "function" dictionary, None if the agent was unreachable
+        #   "etag"          The ETag that came with the function json, if any
+        #   "error"         The message to raise when the agent was unreachable
+        #   "expires"       The clock time at which the entry needs revalidation
+        self.entries: OrderedDict[Tuple[Any, ...], Dict[str, Any]] = OrderedDict()
+        # Cache key -> concurrent Future resolved with the entry when the round trip in flight is done
+        self.in_flight: Dict[Tuple[Any, ...], Future] = {}
+
+    @classmethod
+    def get_instance(cls) -> "ExternalFunctionCache":
+        """
+        :return: The process-wide ExternalFunctionCache configured from the environment
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = ExternalFunctionCache(
+                        ttl_seconds=float(os.environ.get("AGENT_EXTERNAL_FUNCTION_CACHE_TTL_SECONDS",
+                                                         cls.DEFAULT_TTL_SECONDS)),
+                        negative_ttl_seconds=float(os.environ.get(
+                            "AGENT_EXTERNAL_FUNCTION_CACHE_NEGATIVE_TTL_SECONDS",
+                            cls.DEFAULT_NEGATIVE_TTL_SECONDS)),
+                        metadata_keys=os.environ.get("AGENT_EXTERNAL_FUNCTION_CACHE_METADATA_KEYS",
+                                                     cls.DEFAULT_METADATA_KEYS).split())
+        return cls._instance
+
+    def get_cache_key(self, agent_location: Dict[str, Any], metadata: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        :param agent_location: An agent location dictionary returned by
+                    ExternalAgentParsing.parse_external_agent()
+        :param metadata: The request metadata that will be forwarded to the external agent
+        :return: A hashable key for the cache
+        """
+        if metadata is None:
+            metadata = {}
+        auth_values: Tuple[Any, ...] = tuple(str(metadata.get(key)) for key in self.metadata_keys)
+        return (agent_location.get("host"), agent_location.get("port"), agent_location.get("agent_name"),
+                *auth_values)
+
+    async def get_function_json(self, cache_key: Tuple[Any, ...], fetcher: FunctionFetcher) -> Dict[str, Any]:
+        """
+        :param cache_key: The key from get_cache_key()
+        :param fetcher: The FunctionFetcher that does the actual round trip
+        :return: The function json of the external agent.
+                Raises ValueError if the external agent is unreachable.
+        """
+        if self.ttl_seconds <= 0:
+            function_response, _ = await fetcher(None)
+            return function_response.get("function")
+
+        leader: bool = False
+        with self.lock:
+            entry: Dict[str, Any] = self.entries.get(cache_key)
+            if entry is not None and entry.get("expires") > self.clock():
+                self.entries.move_to_end(cache_key)
+                return self.use_entry(entry)
+
+            future: Future = self.in_flight.get(cache_key)
+            if future is None:
+                leader = True
+                future = Future()
+                self.in_flight[cache_key] = future
+
+        if not leader:
+            # Someone else is already making the round trip. Wait for it on our own event loop,
+            # without letting our own cancellation cancel the future for the others.
+            return self.use_entry(await asyncio.shield(asyncio.wrap_future(future)))
+
+        new_entry: Dict[str, Any] = None
+        try:
+            new_entry = await self.fetch(fetcher, entry)
+            with self.lock:
+                self.entries[cache_key] = new_entry
+                self.entries.move_to_end(cache_key)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        except asyncio.CancelledError:
+            # Do not leave followers waiting forever.
+            future.set_exception(ValueError("Function lookup was cancelled"))
+            raise
+        except Exception as exception:
+            # Followers get the same error as we do
+            future.set_exception(exception)
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[cache_key]
+
+        future.set_result(new_entry)
+        return self.use_entry(new_entry)
+
+    async def fetch(self, fetcher: FunctionFetcher, stale_entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param fetcher: The FunctionFetcher that does the actual round trip
+        :param stale_entry: The expired entry for the key, if any
+        :return: A new entry for the key
+        """
+        etag: str = None
+        if stale_entry is not None and stale_entry.get("function_json") is not None:
+            etag = stale_entry.get("etag")
+
+        entry: Dict[str, Any] = None
+        try:
+            function_response, new_etag = await fetcher(etag)
+            if function_response is None:
+                # Not modified
+                entry = {
+                    "function_json": stale_entry.get("function_json"),
+                    "etag": etag,
+                    "expires": self.clock() + self.ttl_seconds,
+                }
+            else:
+                entry = {
+                    "function_json": function_response.get("function"),
+                    "etag": new_etag,
+                    "expires": self.clock() + self.ttl_seconds,
+                }
+        except ValueError as exception:
+            entry = {
+                "function_json": None,
+                "error": str(exception),
+                "expires": self.clock() + self.negative_ttl_seconds,
+            }
+        return entry
+
+    @staticmethod
+    def use_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param entry: A cache entry
+        :return: The function json of the entry. Raises ValueError if the entry records a failure.
+        """
+        error: str = entry.get("error")
+        if error is not None:
+            raise ValueError(error)
+        return entry.get("function_json")
+
+    def clear(self):
+        """
+        Forgets everything
+        """
+        with self.lock:
+            self.entries.clear()
@@ -16,6 +16,7 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import Tuple
 
 from grpc import StatusCode
 from grpc.aio import AioRpcError
@@ -23,6 +24,8 @@ from grpc.aio import AioRpcError
 from neuro_san.interfaces.agent_session import AgentSession
 from neuro_san.internals.interfaces.async_agent_session_factory import AsyncAgentSessionFactory
 from neuro_san.internals.interfaces.invocation_context import InvocationContext
+from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
+from neuro_san.internals.run_context.utils.external_function_cache import ExternalFunctionCache
 
 
 class ExternalToolAdapter:
@@ -49,21 +52,53 @@ class ExternalToolAdapter:
         """
         if self.function_json is None:
 
-            # Lazily get the information about the service
-            session: AgentSession = self.session_factory.create_session(self.agent_url,
-                                                                        invocation_context=invocation_context)
-
-            # Set up the request. Turns out we don't need much.
-            request_dict: Dict[str, Any] = {}
-
-            # Get the function spec so we can call it as a tool later.
-            try:
-                function_response: Dict[str, Any] = await session.function(request_dict)
-                self.function_json = function_response.get("function")
-            except (AioRpcError, ValueError) as exception:
-                message: str = f"Problem accessing external agent {self.agent_url}.\n"
-                if not isinstance(exception, AioRpcError) or exception.code() == StatusCode.UNIMPLEMENTED:
-                    message += """
+            # Lazily get the information about the service, going through
+            # the process-wide cache so not every activation makes a round trip.
+            server_port: int = invocation_context.get_port()
+            agent_location: Dict[str, str] = ExternalAgentParsing.parse_external_agent(self.agent_url,
+                                                                                       server_port=server_port)
+            if agent_location is None:
+                agent_location = {"agent_name": self.agent_url}
+
+            cache: ExternalFunctionCache = ExternalFunctionCache.get_instance()
+            cache_key: Tuple[Any, ...] = cache.get_cache_key(agent_location, invocation_context.get_metadata())
+
+            async def fetcher(etag: str) -> Tuple[Dict[str, Any], str]:
+                return await self.fetch_function_response(invocation_context, etag)
+
+            self.function_json = await cache.get_function_json(cache_key, fetcher)
+
+        return self.function_json
+
+    async def fetch_function_response(self, invocation_context: InvocationContext,
+                                      etag: str) -> Tuple[Dict[str, Any], str]:
+        """
+        Makes the actual function() round trip to the external agent.
+
+        :param invocation_context: The context policy container that pertains to the invocation
+        :param etag: The ETag of the function json already known, if any
+        :return: A tuple of (FunctionResponse dictionary, ETag of its function json).
+                The FunctionResponse dictionary is None if the ETag passed in is still good.
+                Raises ValueError if the external agent could not be reached.
+        """
+        session: AgentSession = self.session_factory.create_session(self.agent_url,
+                                                                    invocation_context=invocation_context)
+
+        # Set up the request. Turns out we don't need much.
+        request_dict: Dict[str, Any] = {}
+
+        # Get the function spec so we can call it as a tool later.
+        try:
+            function_with_etag = getattr(session, "function_with_etag", None)
+            if function_with_etag is not None:
+                # Http sessions can revalidate what we already have
+                return await function_with_etag(request_dict, etag)
+            function_response: Dict[str, Any] = await session.function(request_dict)
+            return function_response, None
+        except (AioRpcError, ValueError) as exception:
+            message: str = f"Problem accessing external agent {self.agent_url}.\n"
+            if not isinstance(exception, AioRpcError) or exception.code() == StatusCode.UNIMPLEMENTED:
+                message += """
 The server (which could be your own localhost) is currently not serving up
 an agent network by that name. Try these hints:
 1. Check to see that you do not have a typo in your reference to the external agent
@@ -83,6 +118,4 @@ an agent network by that name. Try these hints:
        "function" definition, which includes a description, and at least one parameter
        defined.  These are how calling agents know how to interact with the agent network.
 """
-                raise ValueError(message) from exception
-
-        return self.function_json
+            raise ValueError(message) from exception
@@ -0,0 +1,42 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import logging
+import os
+
+
+class EnvUtil:
+    """
+    Utilities to read settings from environment variables.
+    """
+
+    @staticmethod
+    def get_int(name: str, default: int) -> int:
+        """
+        :param name: The name of the environment variable
+        :param default: The value to use when the variable is not set, empty, or not an integer
+        :return: The integer value of the environment variable.
+                A bad value is logged as a warning instead of failing whatever reads it.
+        """
+        value: str = os.environ.get(name)
+        if value is None or len(value.strip()) == 0:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            logging.getLogger(EnvUtil.__name__).warning("Ignoring bad %s value %r. Using %s.",
+                                                        name, value, default)
+            return default
@@ -0,0 +1,46 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+
+import hashlib
+import json
+
+
+class EtagUtil:
+    """
+    Utilities to deal with HTTP entity tags for JSON responses.
+    """
+
+    @staticmethod
+    def compute_etag(response_dict: Dict[str, Any]) -> str:
+        """
+        :param response_dict: The JSON-able dictionary to be sent as a response
+        :return: A strong ETag for the dictionary, quoted as HTTP wants it.
+                Dictionaries with the same content get the same ETag
+                regardless of key order.
+        """
+        canonical: str = json.dumps(response_dict, sort_keys=True, separators=(",", ":"))
+        return EtagUtil.compute_etag_from_string(canonical)
+
+    @staticmethod
+    def compute_etag_from_string(content: str) -> str:
+        """
+        :param content: A string that uniquely describes a response
+        :return: A strong ETag for the content, quoted as HTTP wants it.
+        """
+        return f'"{hashlib.sha256(content.encode("utf-8")).hexdigest()}"'
@@ -0,0 +1,97 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+
+import asyncio
+import threading
+
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical asynchronous calls so that only one of them
+    does the actual work and the rest share its result (or its exception).
+
+    The first caller for a key starts the work as a separate task, so that
+    its own cancellation (say, a client going away) does not take the work
+    away from everyone else waiting on it.  Callers can be on different
+    threads and event loops.
+
+    Nothing is remembered once the work is done. This is not a cache.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        self.in_flight: Dict[Hashable, Future] = {}
+
+    async def do(self, key: Hashable, work: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        :param key: A hashable identifying calls that are interchangeable
+        :param work: A function returning the awaitable that does the actual work.
+                Only called if there is no call for the same key already in flight.
+        :return: The result of the work
+        """
+        task: asyncio.Task = None
+        with self.lock:
+            future: Future = self.in_flight.get(key)
+            if future is None:
+                future = Future()
+                self.in_flight[key] = future
+                task = asyncio.ensure_future(work())
+
+        if task is None:
+            # Someone else is doing the work. Wait for it on our own event loop,
+            # without letting our own cancellation cancel it for the others.
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        task.add_done_callback(lambda done: self.finish(key, future, done))
+        return await asyncio.shield(task)
+
+    def finish(self, key: Hashable, future: Future, task: asyncio.Task):
+        """
+        Hands the outcome of the work to the callers waiting on it.
+
+        :param key: The key the work was done for
+        :param future: The Future the other callers are waiting on
+        :param task: The finished task that did the work
+        """
+        with self.lock:
+            self.in_flight.pop(key, None)
+
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    def get_in_flight_count(self) -> int:
+        """
+        :return: The number of keys with work currently in flight
+        """
+        with self.lock:
+            return len(self.in_flight)
@@ -18,6 +18,7 @@
 from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import Tuple
 
 import json
 import contextlib
@@ -37,12 +38,15 @@ from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextT
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
 from neuro_san.internals.run_context.factory.master_toolbox_factory import MasterToolboxFactory
 from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
+from neuro_san.internals.utils.etag_util import EtagUtil
+from neuro_san.internals.utils.single_flight import SingleFlight
 from neuro_san.service.generic.service_agent_reservationist import ServiceAgentReservationist
 from neuro_san.service.generic.agent_server_logging import AgentServerLogging
 from neuro_san.service.generic.chat_message_converter import ChatMessageConverter
 from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
 from neuro_san.service.usage.usage_logger_factory import UsageLoggerFactory
 from neuro_san.service.usage.wrapped_usage_logger import WrappedUsageLogger
+from neuro_san.service.utils.fair_request_queue import FairRequestQueue
 from neuro_san.service.utils.server_context import ServerContext
 from neuro_san.session.async_direct_agent_session import AsyncDirectAgentSession
 from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
@@ -96,6 +100,8 @@ class AsyncAgentService:
         self.port: int = server_context.get_server_port()
 
         self.async_executor_pool: AsyncioExecutorPool = server_context.get_executor_pool()
+        self.fair_request_queue: FairRequestQueue = server_context.get_fair_request_queue()
+        self.single_flight = SingleFlight()
         self.reload_factories()
 
     def reload_factories(self):
@@ -155,7 +161,9 @@ class AsyncAgentService:
                 "Received a %s request for %s",
                 f"{self.agent_name}.Function", log_marker)
 
-        # Delegate to Direct*Session
+        # Delegate to Direct*Session.
+        # The answer depends only on the agent network and the request,
+        # so concurrent identical calls share a single computation.
         agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
         session: AsyncDirectAgentSession =\
             AsyncDirectAgentSession(
@@ -163,7 +171,8 @@ class AsyncAgentService:
                 invocation_context=None,
                 metadata=metadata,
                 security_cfg=self.security_cfg)
-        response_dict = await session.function(request_dict)
+        key: Tuple[Any, ...] = ("function", agent_network, json.dumps(request_dict, sort_keys=True))
+        response_dict = await self.single_flight.do(key, lambda: session.function(request_dict))
 
         if do_log:
             self.request_logger.info(
@@ -199,7 +208,9 @@ class AsyncAgentService:
                 "Received a %s request for %s",
                 f"{self.agent_name}.Connectivity", log_marker)
 
-        # Delegate to Direct*Session
+        # Delegate to Direct*Session.
+        # The answer depends only on the agent network and the request,
+        # so concurrent identical calls share a single computation.
         agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
         session: AsyncDirectAgentSession =\
             AsyncDirectAgentSession(
@@ -207,7 +218,8 @@ class AsyncAgentService:
                 invocation_context=None,
                 metadata=metadata,
                 security_cfg=self.security_cfg)
-        response_dict = await session.connectivity(request_dict)
+        key: Tuple[Any, ...] = ("connectivity", agent_network, json.dumps(request_dict, sort_keys=True))
+        response_dict = await self.single_flight.do(key, lambda: session.connectivity(request_dict))
 
         if do_log:
             self.request_logger.info(
@@ -218,7 +230,18 @@ class AsyncAgentService:
         self.request_counter.decrement()
         return response_dict
 
-    # pylint: disable=too-many-locals
+    def get_connectivity_etag(self, response_dict: Dict[str, Any]) -> str:
+        """
+        :param response_dict: A ConnectivityResponse dictionary returned by connectivity()
+        :return: A strong ETag for the response.  Precomputed connectivity
+                comes with its ETag already computed.
+        """
+        agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
+        if agent_network is not None and agent_network.get_connectivity() is response_dict:
+            return agent_network.get_connectivity_etag()
+        return EtagUtil.compute_etag(response_dict)
+
+    # pylint: disable=too-many-locals,too-many-statements
     async def streaming_chat(self, request_dict: Dict[str, Any],
                              request_metadata: Dict[str, Any]) \
             -> Generator[Dict[str, Any], None, None]:
@@ -252,41 +275,56 @@ class AsyncAgentService:
             reservationist = ServiceAgentReservationist()
             self.queues.sync_q.put(reservationist.get_queue())
 
-        # Prepare
-        factory = ExternalAgentSessionFactory(use_direct=False)
-        invocation_context = SessionInvocationContext(
-            self.agent_name,
-            factory,
-            self.async_executor_pool,
-            self.llm_factory,
-            self.toolbox_factory,
-            metadata,
-            reservationist,
-            self.port)
-        invocation_context.start()
-
-        # Set up logging inside async thread
-        # Prefer any request_id from the client over what we generated on the server.
-        executor: AsyncioExecutor = invocation_context.get_asyncio_executor()
-        _ = executor.submit(None, self.server_logging.setup_logging, metadata, metadata.get("request_id"))
-
-        # Delegate to Direct*Session
-        agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
-        session: AsyncDirectAgentSession =\
-            AsyncDirectAgentSession(
-                agent_network=agent_network,
-                invocation_context=invocation_context,
-                metadata=metadata,
-                security_cfg=self.security_cfg)
-        # Get our args in order to pass to transport-agnostic session level
-        response_dict_generator: Generator[Dict[str, Any], None, None] = session.streaming_chat(request_dict)
-
-        # See if we want to put the request dict in the response
-        chat_filter_dict: Dict[str, Any] = {}
-        chat_filter_dict = request_dict.get("chat_filter", chat_filter_dict)
-        chat_filter_type: str = chat_filter_dict.get("chat_filter_type", "MINIMAL")
-
+        # Wait our turn among the requests of other tenants
+        # before taking an executor from the pool.
+        # Calls to external agents on this same server made by a request
+        # that already has its turn carry the token of its slot and do not wait.
+        # Only the server sets that token, so it goes into the metadata
+        # forwarded to such calls after whatever the client sent is taken out.
+        tenant: str = self.fair_request_queue.get_tenant(metadata)
+        slot: str = metadata.pop(FairRequestQueue.SLOT_METADATA_KEY, None)
+        slot = await self.fair_request_queue.acquire(tenant, slot)
+        if slot is not None:
+            metadata[FairRequestQueue.SLOT_METADATA_KEY] = slot
+
+        invocation_context: SessionInvocationContext = None
+        response_dict_generator: Generator[Dict[str, Any], None, None] = None
+        request_reporting: Dict[str, Any] = None
         try:
+            # Prepare
+            factory = ExternalAgentSessionFactory(use_direct=False)
+            invocation_context = SessionInvocationContext(
+                self.agent_name,
+                factory,
+                self.async_executor_pool,
+                self.llm_factory,
+                self.toolbox_factory,
+                metadata,
+                reservationist,
+                self.port)
+            invocation_context.start()
+
+            # Set up logging inside async thread
+            # Prefer any request_id from the client over what we generated on the server.
+            executor: AsyncioExecutor = invocation_context.get_asyncio_executor()
+            _ = executor.submit(None, self.server_logging.setup_logging, metadata, metadata.get("request_id"))
+
+            # Delegate to Direct*Session
+            agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
+            session: AsyncDirectAgentSession =\
+                AsyncDirectAgentSession(
+                    agent_network=agent_network,
+                    invocation_context=invocation_context,
+                    metadata=metadata,
+                    security_cfg=self.security_cfg)
+            # Get our args in order to pass to transport-agnostic session level
+            response_dict_generator = session.streaming_chat(request_dict)
+
+            # See if we want to put the request dict in the response
+            chat_filter_dict: Dict[str, Any] = {}
+            chat_filter_dict = request_dict.get("chat_filter", chat_filter_dict)
+            chat_filter_type: str = chat_filter_dict.get("chat_filter_type", "MINIMAL")
+
             async for response_dict in response_dict_generator:
                 # Prepare chat message for output:
                 response_dict = ChatMessageConverter().to_dict(response_dict)
@@ -300,15 +338,18 @@ class AsyncAgentService:
             # whether we finish consuming its data stream normally
             # OR we are interrupted downstream
             # and have special "GeneratorExit" exception delivered to us.
-            request_reporting: Dict[str, Any] = invocation_context.get_request_reporting()
+            if invocation_context is not None:
+                request_reporting = invocation_context.get_request_reporting()
             # Properly close our async generator:
             if response_dict_generator is not None:
                 with contextlib.suppress(Exception):
                     await response_dict_generator.aclose()
             # Ensure that our SessionInvocationContext is always closed,
             # even if generator is interrupted.
-            invocation_context.close()
-            invocation_context = None
+            if invocation_context is not None:
+                invocation_context.close()
+                invocation_context = None
+            self.fair_request_queue.release(slot)
 
         # Maybe report token accounting to a UsageLogger
         token_dict: Dict[str, Any] = request_reporting.get("token_accounting")
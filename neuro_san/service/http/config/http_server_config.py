@@ -22,12 +22,14 @@ DEFAULT_HTTP_CONNECTIONS_BACKLOG: int = 128
 DEFAULT_HTTP_IDLE_CONNECTIONS_TIMEOUT_SECONDS: int = 3600
 DEFAULT_HTTP_SERVER_INSTANCES: int = 1
 DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS: int = 0
+DEFAULT_METRICS_SNAPSHOT_INTERVAL_SECONDS: int = 5
 
 
 class HttpServerConfig:
     """
     Class aggregating Tornado http server run-time configuration parameters.
     """
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(self):
         self.http_connections_backlog: int = DEFAULT_HTTP_CONNECTIONS_BACKLOG
@@ -35,3 +37,9 @@ class HttpServerConfig:
         self.http_server_instances: int = DEFAULT_HTTP_SERVER_INSTANCES
         self.http_port: int = 80
         self.http_server_monitor_interval_seconds: int = DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS
+        # Metrics are only served on /metrics when asked for.
+        self.metrics_enabled: bool = False
+        # Directory shared by forked server instances for metrics aggregation.
+        # None means a temporary directory is created if more than one instance is run.
+        self.metrics_multiprocess_dir: str = None
+        self.metrics_snapshot_interval_seconds: int = DEFAULT_METRICS_SNAPSHOT_INTERVAL_SECONDS
@@ -34,6 +34,7 @@ from leaf_common.utils.async_atomic_counter import AsyncAtomicCounter
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
 from neuro_san.service.interfaces.agent_authorizer import AgentAuthorizer
+from neuro_san.service.utils.fair_request_queue import FairRequestQueue
 from neuro_san.service.utils.server_context import ServerContext
 from neuro_san.service.http.logging.http_logger import HttpLogger
 
@@ -93,6 +94,11 @@ class BaseRequestHandler(RequestHandler):
         user_request_id: str = metadata_dict.get("request_id", "None")
         if user_request_id == "None":
             metadata_dict["request_id"] = f"request-{self.request_id}"
+        # Calls to external agents on this server carry the fair queue slot
+        # of the request making them.  The fair queue ignores any slot it is not holding.
+        slot: str = self.request.headers.get(FairRequestQueue.SLOT_METADATA_KEY)
+        if slot:
+            metadata_dict[FairRequestQueue.SLOT_METADATA_KEY] = slot
         return metadata_dict
 
     @classmethod
@@ -21,10 +21,9 @@ from typing import Any
 from typing import Dict
 from typing import List
 
-from neuro_san.interfaces.concierge_session import ConciergeSession
-from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.internals.utils.etag_util import EtagUtil
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
-from neuro_san.session.direct_concierge_session import DirectConciergeSession
+from neuro_san.service.utils.concierge_list_cache import ConciergeListCache
 
 
 class ConciergeHandler(BaseRequestHandler):
@@ -38,20 +37,25 @@ class ConciergeHandler(BaseRequestHandler):
         """
         metadata: Dict[str, Any] = self.get_metadata()
         self.application.start_client_request(metadata, "/api/v1/list")
-        network_storage_dict: Dict[str, AgentNetworkStorage] = self.server_context.get_network_storage_dict()
-        public_storage: AgentNetworkStorage = network_storage_dict.get("public")
-
-        # See what the authorizer says
-        allowed_agents: List[str] = await self.agent_policy.list_agents(metadata)
 
         try:
-            data: Dict[str, Any] = {}
-            session: ConciergeSession = DirectConciergeSession(public_storage, metadata=metadata)
-            result_dict: Dict[str, Any] = session.list(data)
+            # The unfiltered listing only changes when the public agent networks do.
+            list_cache: ConciergeListCache = self.server_context.get_concierge_list_cache()
+            result_dict, etag, name_index = list_cache.get_listing()
+
+            # See what the authorizer says about the listed agents, all in one go.
+            allowed_agents: List[str] = await self.agent_policy.allow_agents(list(name_index.keys()), metadata)
 
-            # Maybe remove agents if the agent_policy has something to say.
-            if allowed_agents is not None:
-                result_dict = self.pare_allowed_agents(allowed_agents, result_dict)
+            # Remove agents if the agent_policy does not allow them all.
+            if len(allowed_agents) < len(name_index):
+                result_dict = self.pare_allowed_agents(allowed_agents, result_dict, name_index)
+                etag = self.compute_pared_etag(etag, result_dict)
+
+            # Let clients that already have this listing know they can keep it
+            self.set_header("Etag", etag)
+            if self.check_etag_header():
+                self.set_status(304)
+                return
 
             # Return response to the HTTP client
             self.set_header("Content-Type", "application/json")
@@ -63,7 +67,8 @@ class ConciergeHandler(BaseRequestHandler):
             self.do_finish()
             self.application.finish_client_request(metadata, "/api/v1/list")
 
-    def pare_allowed_agents(self, allowed_agents: List[str], result_dict: Dict[str, Any]) -> Dict[str, Any]:
+    def pare_allowed_agents(self, allowed_agents: List[str], result_dict: Dict[str, Any],
+                            name_index: Dict[str, int] = None) -> Dict[str, Any]:
         """
         Remove agents which are not allowed.
 
@@ -71,6 +76,9 @@ class ConciergeHandler(BaseRequestHandler):
         :param result_dict: A dictionary version of the ConciergeResponse
                 protobuf structure. Has the following keys:
             "agents" - the sequence of dictionaries describing available agents
+            This dictionary is not modified.
+        :param name_index: A dictionary of agent name to position in the "agents" list
+                of the result_dict.  If None, one is built.
         :return: A dictionary version of the ConciergeResponse
                 protobuf structure. Has the following keys:
             "agents" - the sequence of dictionaries describing available agents
@@ -79,13 +87,32 @@ class ConciergeHandler(BaseRequestHandler):
         empty: List[Dict[str, Any]] = []
         agent_infos: List[Dict[str, Any]] = result_dict.get("agents", empty)
 
-        # Create a dictionary of agent names for quick lookup
-        agent_info_dict: Dict[str, Dict[str, Any]] = {}
-        for agent_info in agent_infos:
-            agent_name: str = agent_info.get("agent_name")
-            if agent_name in allowed_agents:
-                agent_info_dict[agent_name] = agent_info
+        if name_index is None:
+            name_index = {}
+            for index, agent_info in enumerate(agent_infos):
+                name_index[agent_info.get("agent_name")] = index
+
+        # Look up the allowed agents instead of scanning the listing,
+        # keeping the order of the listing.
+        positions: List[int] = []
+        for agent_name in set(allowed_agents):
+            position: int = name_index.get(agent_name)
+            if position is not None:
+                positions.append(position)
+        positions.sort()
 
-        # Recreate the list of agents in the results by taking the values from the dictionary
-        result_dict["agents"] = list(agent_info_dict.values())
-        return result_dict
+        pared_dict: Dict[str, Any] = dict(result_dict)
+        pared_dict["agents"] = [agent_infos[position] for position in positions]
+        return pared_dict
+
+    @staticmethod
+    def compute_pared_etag(etag: str, pared_dict: Dict[str, Any]) -> str:
+        """
+        :param etag: The strong ETag of the unfiltered listing
+        :param pared_dict: The listing after paring down to allowed agents
+        :return: A strong ETag for the pared listing, quoted as HTTP wants it
+        """
+        empty: List[Dict[str, Any]] = []
+        names: List[str] = [agent_info.get("agent_name") for agent_info in pared_dict.get("agents", empty)]
+        content: str = etag + "\n" + "\n".join(names)
+        return EtagUtil.compute_etag_from_string(content)
@@ -43,6 +43,12 @@ class ConnectivityHandler(BaseRequestHandler):
             data: Dict[str, Any] = {}
             result_dict: Dict[str, Any] = await service.connectivity(data, metadata)
 
+            # Connectivity only changes when the network does, so let clients revalidate
+            self.set_header("Etag", service.get_connectivity_etag(result_dict))
+            if self.check_etag_header():
+                self.set_status(304)
+                return
+
             # Return response to the HTTP client
             self.set_header("Content-Type", "application/json")
             self.write(result_dict)
@@ -51,4 +57,5 @@ class ConnectivityHandler(BaseRequestHandler):
             self.process_exception(exc)
         finally:
             self.do_finish()
-            self.application.finish_client_request(metadata, f"{agent_name}/connectivity")
+            self.application.finish_client_request(metadata, f"{agent_name}/connectivity",
+                                                   duration_seconds=self.request.request_time())
@@ -20,6 +20,7 @@ See class comment for details
 from typing import Any
 from typing import Dict
 
+from neuro_san.internals.utils.etag_util import EtagUtil
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
 
@@ -43,6 +44,12 @@ class FunctionHandler(BaseRequestHandler):
             data: Dict[str, Any] = {}
             result_dict: Dict[str, Any] = await service.function(data, metadata)
 
+            # Clients that cache function descriptions can revalidate with If-None-Match
+            self.set_header("Etag", EtagUtil.compute_etag(result_dict))
+            if self.check_etag_header():
+                self.set_status(304)
+                return
+
             # Return service response to the HTTP client
             self.set_header("Content-Type", "application/json")
             self.write(result_dict)
@@ -51,4 +58,5 @@ class FunctionHandler(BaseRequestHandler):
             self.process_exception(exc)
         finally:
             self.do_finish()
-            self.application.finish_client_request(metadata, f"{agent_name}/function")
+            self.application.finish_client_request(metadata, f"{agent_name}/function",
+                                                   duration_seconds=self.request.request_time())
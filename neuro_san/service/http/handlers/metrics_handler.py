@@ -0,0 +1,81 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+from tornado.web import RequestHandler
+
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.metrics.multiprocess_metrics_store import MultiprocessMetricsStore
+from neuro_san.service.http.metrics.prometheus_formatter import CONTENT_TYPE
+from neuro_san.service.http.metrics.prometheus_formatter import PrometheusFormatter
+
+
+class MetricsHandler(RequestHandler):
+    """
+    Handler class for the Prometheus "/metrics" scrape endpoint.
+    """
+
+    # pylint: disable=attribute-defined-outside-init
+    def initialize(self,
+                   forwarded_request_metadata: List[str],
+                   metrics_store: MultiprocessMetricsStore = None):
+        """
+        This method is called by Tornado framework to allow
+        injecting service-specific data into local handler context.
+        :param forwarded_request_metadata: list of client metadata keys;
+        :param metrics_store: MultiprocessMetricsStore to aggregate metrics
+                   across forked server instances. None if this process is
+                   the only server instance.
+        """
+        self.logger = HttpLogger(forwarded_request_metadata)
+        self.metrics_store: MultiprocessMetricsStore = metrics_store
+
+    async def get(self):
+        """
+        Implementation of GET request handler for the metrics scrape.
+        """
+        try:
+            snapshot: Dict[str, Any] = MetricsRegistry.get_instance().get_snapshot()
+            if self.metrics_store is not None:
+                snapshot = self.metrics_store.aggregate(snapshot)
+            self.set_header("Content-Type", CONTENT_TYPE)
+            self.write(PrometheusFormatter().format(snapshot))
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            # Handle unexpected errors
+            self.logger.error({}, "Failed to collect metrics: %s", str(exception))
+            self.set_status(500)
+            self.write({"error": "Internal server error"})
+        finally:
+            self.finish()
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """
+        Get request metadata
+        """
+        return {}
+
+    def data_received(self, chunk):
+        """
+        Method overrides abstract method of RequestHandler
+        with no-op implementation.
+        """
+        return
@@ -27,6 +27,7 @@ import contextlib
 import json
 import tornado
 
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
 
@@ -68,9 +69,15 @@ class StreamingChatHandler(BaseRequestHandler):
                 # Raise accordingly - we will handle this exception:
                 raise tornado.iostream.StreamClosedError()
 
+            first_message: bool = True
             async with asyncio.timeout(request_timeout):
                 result_generator = service.streaming_chat(data, metadata)
                 async for result_dict in result_generator:
+                    if first_message:
+                        first_message = False
+                        MetricsRegistry.get_instance().observe(MetricsRegistry.TIME_TO_FIRST_MESSAGE,
+                                                               {"network": agent_name},
+                                                               self.request.request_time())
                     result_str: str = json.dumps(result_dict) + "\n"
                     self.write(result_str)
                     flush_ok = await self.do_flush()
@@ -104,4 +111,5 @@ class StreamingChatHandler(BaseRequestHandler):
                     # on our result_generator - it is allowed and has no effect.
                     await result_generator.aclose()
             self.do_finish()
-            self.application.finish_client_request(metadata, f"{agent_name}/streaming_chat", get_stats=True)
+            self.application.finish_client_request(metadata, f"{agent_name}/streaming_chat", get_stats=True,
+                                                   duration_seconds=self.request.request_time())
@@ -21,7 +21,6 @@ from typing import Any
 from typing import Dict
 from typing import Sequence
 
-import copy
 import logging
 import pathlib
 
@@ -62,8 +61,9 @@ class HttpLogger(EventLoopLogger):
         Prepare logger filter with request-specific metadata
         and delegate logging to underlying standard Logger.
         """
-        self.prepare_filter(metadata)
-        self.logger.info(msg, *args)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.prepare_filter(metadata)
+            self.logger.info(msg, *args)
 
     def warning(self, metadata: Dict[str, Any], msg: str, *args):
         """
@@ -71,8 +71,9 @@ class HttpLogger(EventLoopLogger):
         Prepare logger filter with request-specific metadata
         and delegate logging to underlying standard Logger.
         """
-        self.prepare_filter(metadata)
-        self.logger.warning(msg, *args)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.prepare_filter(metadata)
+            self.logger.warning(msg, *args)
 
     def debug(self, metadata: Dict[str, Any], msg: str, *args):
         """
@@ -80,8 +81,9 @@ class HttpLogger(EventLoopLogger):
         Prepare logger filter with request-specific metadata
         and delegate logging to underlying standard Logger.
         """
-        self.prepare_filter(metadata)
-        self.logger.debug(msg, *args)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.prepare_filter(metadata)
+            self.logger.debug(msg, *args)
 
     def error(self, metadata: Dict[str, Any], msg: str, *args):
         """
@@ -89,8 +91,9 @@ class HttpLogger(EventLoopLogger):
         Prepare logger filter with request-specific metadata
         and delegate logging to underlying standard Logger.
         """
-        self.prepare_filter(metadata)
-        self.logger.error(msg, *args)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.prepare_filter(metadata)
+            self.logger.error(msg, *args)
 
     def setup_logging(self):
         """
@@ -109,8 +112,8 @@ class HttpLogger(EventLoopLogger):
 
     def prepare_filter(self, metadata: Dict[str, Any]):
         """
-        Prepare logging filter using request metadata,
+        Prepare logging filter using request metadata.
+        No merged copy is made here. The base and request metadata are
+        only merged by the LogContextFilter when a record is emitted.
         """
-        use_metadata: Dict[str, Any] = copy.copy(self.base_metadata)
-        use_metadata.update(metadata)
-        LogContextFilter.log_context.set(use_metadata)
+        LogContextFilter.log_context.set((self.base_metadata, metadata))
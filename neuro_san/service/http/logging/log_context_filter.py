@@ -31,10 +31,15 @@ class LogContextFilter(logging.Filter):
         """
         Logging filter: add key-value pairs from log_context
         to logging record to be used.
+
+        The log_context holds a sequence of metadata dictionaries which are
+        only merged here, once a record is actually emitted.
+        Later dictionaries take precedence over earlier ones.
         """
-        ctx = LogContextFilter.log_context.get()
-        for key, value in ctx.items():
-            setattr(record, key, value)
+        layers = LogContextFilter.log_context.get()
+        for ctx in layers:
+            for key, value in ctx.items():
+                setattr(record, key, value)
         return True
 
     @classmethod
@@ -42,4 +47,4 @@ class LogContextFilter(logging.Filter):
         """
         Create log context class instance.
         """
-        cls.log_context = contextvars.ContextVar("http_server_context", default={})
+        cls.log_context = contextvars.ContextVar("http_server_context", default=())
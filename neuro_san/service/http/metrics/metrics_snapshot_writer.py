@@ -0,0 +1,73 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+import tornado
+
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.metrics.multiprocess_metrics_store import MultiprocessMetricsStore
+from neuro_san.service.interfaces.startable import Startable
+
+
+class MetricsSnapshotWriter(Startable):
+    """
+    Periodically writes the snapshot of this process's MetricsRegistry
+    to the MultiprocessMetricsStore so that whichever server instance
+    serves a /metrics scrape sees the metrics of all instances.
+
+    This is started after the http server has forked so that each
+    instance gets its own periodic callback and its own per-process file.
+    """
+
+    def __init__(self, store: MultiprocessMetricsStore, interval_seconds: float, logger: HttpLogger):
+        """
+        Constructor
+
+        :param store: The MultiprocessMetricsStore shared between server instances
+        :param interval_seconds: interval in seconds between snapshot writes
+        :param logger: HttpLogger instance for logging
+        """
+        self.store: MultiprocessMetricsStore = store
+        self.logger: HttpLogger = logger
+        self.periodic_callback = tornado.ioloop.PeriodicCallback(
+            self.write_snapshot,
+            interval_seconds * 1000
+        )
+
+    def write_snapshot(self):
+        """
+        Write the current snapshot of this process's metrics
+        """
+        try:
+            self.store.write(MetricsRegistry.get_instance().get_snapshot())
+        except OSError as exception:
+            self.logger.warning({}, "Failed to write metrics snapshot: %s", str(exception))
+
+    def start(self):
+        """
+        Start periodic writing of metrics snapshots.
+        """
+        # Write once right away so this instance shows up on the next scrape.
+        self.write_snapshot()
+        self.periodic_callback.start()
+
+    def stop(self):
+        """
+        Stop periodic writing of metrics snapshots.
+        """
+        self.periodic_callback.stop()
@@ -0,0 +1,187 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import glob
+import json
+import logging
+import os
+
+from neuro_san.internals.metrics.metrics_registry import GAUGE
+from neuro_san.internals.metrics.metrics_registry import HISTOGRAM
+
+FILE_PREFIX: str = "metrics_"
+FILE_SUFFIX: str = ".json"
+
+
+class MultiprocessMetricsStore:
+    """
+    Shares MetricsRegistry snapshots between the forked instances of the http server.
+
+    When the server is started with more than one instance, each forked process
+    keeps its own MetricsRegistry, so a scrape served by any one of them would only
+    see a fraction of the picture.  To get around this, each process periodically
+    writes its snapshot to a per-process file in a shared directory and the process
+    serving a scrape aggregates all of the files it finds there:
+        * counters and histograms are summed across all processes, including ones
+          that have exited, so totals never go backwards
+        * gauges are summed across live processes only, as the point-in-time values
+          of an exited process no longer mean anything
+    """
+
+    def __init__(self, directory: str):
+        """
+        Constructor
+
+        :param directory: The directory shared by all server processes
+        """
+        self.directory: str = directory
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def clear(self):
+        """
+        Remove any per-process files left over from a previous run.
+        To be called by the parent process before forking.
+        """
+        for file_name in glob.glob(os.path.join(self.directory, f"{FILE_PREFIX}*{FILE_SUFFIX}")):
+            try:
+                os.remove(file_name)
+            except OSError as exception:
+                self.logger.warning("Could not remove stale metrics file %s: %s", file_name, str(exception))
+
+    def write(self, snapshot: Dict[str, Any], pid: int = None):
+        """
+        Atomically write the snapshot of the given process
+
+        :param snapshot: The snapshot dictionary from MetricsRegistry.get_snapshot()
+        :param pid: The process id to write for. Defaults to the current process.
+        """
+        if pid is None:
+            pid = os.getpid()
+        file_name: str = os.path.join(self.directory, f"{FILE_PREFIX}{pid}{FILE_SUFFIX}")
+        temp_file_name: str = f"{file_name}.tmp"
+        with open(temp_file_name, "w", encoding="utf-8") as out_file:
+            json.dump(snapshot, out_file)
+        # Rename is atomic, so readers never see a partially written file.
+        os.replace(temp_file_name, file_name)
+
+    def read_all(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        :return: A list of (pid, snapshot) tuples for all processes that have written.
+        """
+        results: List[Tuple[int, Dict[str, Any]]] = []
+        for file_name in glob.glob(os.path.join(self.directory, f"{FILE_PREFIX}*{FILE_SUFFIX}")):
+            base_name: str = os.path.basename(file_name)
+            pid_str: str = base_name[len(FILE_PREFIX):-len(FILE_SUFFIX)]
+            if not pid_str.isdigit():
+                continue
+            try:
+                with open(file_name, "r", encoding="utf-8") as in_file:
+                    snapshot: Dict[str, Any] = json.load(in_file)
+            except (OSError, ValueError) as exception:
+                # Could be removed out from under us.
+                self.logger.warning("Could not read metrics file %s: %s", file_name, str(exception))
+                continue
+            results.append((int(pid_str), snapshot))
+        return results
+
+    def aggregate(self, local_snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write the local snapshot and aggregate it with those of all other processes.
+
+        :param local_snapshot: The up-to-date snapshot of the current process
+        :return: A single snapshot dictionary aggregated across processes
+        """
+        my_pid: int = os.getpid()
+        self.write(local_snapshot, my_pid)
+
+        snapshots: List[Dict[str, Any]] = [local_snapshot]
+        alive: List[bool] = [True]
+        for pid, snapshot in self.read_all():
+            if pid == my_pid:
+                # Already have the in-memory version we just wrote
+                continue
+            snapshots.append(snapshot)
+            alive.append(self.is_alive(pid))
+
+        return self.merge(snapshots, alive)
+
+    @staticmethod
+    def merge(snapshots: List[Dict[str, Any]], alive: List[bool]) -> Dict[str, Any]:
+        """
+        :param snapshots: A list of snapshot dictionaries
+        :param alive: A parallel list telling whether the process that wrote each
+                    snapshot is still alive
+        :return: A single snapshot dictionary aggregated across the snapshots
+        """
+        merged: Dict[str, Any] = {}
+        # Metric name -> label tuple -> merged sample
+        merged_samples: Dict[str, Dict[Tuple[Tuple[str, str], ...], Dict[str, Any]]] = {}
+
+        for snapshot, is_alive in zip(snapshots, alive):
+            for name, family in snapshot.items():
+                metric_type: str = family.get("type")
+                if name not in merged:
+                    merged[name] = {key: value for key, value in family.items() if key != "samples"}
+                    merged_samples[name] = {}
+
+                if metric_type == GAUGE and not is_alive:
+                    continue
+
+                for sample in family.get("samples", []):
+                    key: Tuple[Tuple[str, str], ...] = tuple(sorted(sample.get("labels", {}).items()))
+                    existing: Dict[str, Any] = merged_samples[name].get(key)
+                    if existing is None:
+                        existing = {"labels": dict(key)}
+                        if metric_type == HISTOGRAM:
+                            existing["counts"] = [0] * len(sample.get("counts", []))
+                            existing["sum"] = 0.0
+                            existing["count"] = 0
+                        else:
+                            existing["value"] = 0.0
+                        merged_samples[name][key] = existing
+
+                    if metric_type == HISTOGRAM:
+                        existing["counts"] = [a + b for a, b in zip(existing["counts"], sample.get("counts", []))]
+                        existing["sum"] += sample.get("sum", 0.0)
+                        existing["count"] += sample.get("count", 0)
+                    else:
+                        existing["value"] += sample.get("value", 0.0)
+
+        for name, family in merged.items():
+            family["samples"] = list(merged_samples[name].values())
+        return merged
+
+    @staticmethod
+    def is_alive(pid: int) -> bool:
+        """
+        :param pid: A process id
+        :return: True if a process with the pid is still running
+        """
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # Exists, but is not ours to signal.
+            return True
+        return True
@@ -0,0 +1,119 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+from neuro_san.internals.metrics.metrics_registry import HISTOGRAM
+
+# Content type for version 0.0.4 of the Prometheus text exposition format
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class PrometheusFormatter:
+    """
+    Renders a MetricsRegistry snapshot dictionary in the Prometheus text exposition format.
+    See https://prometheus.io/docs/instrumenting/exposition_formats/
+    """
+
+    def format(self, snapshot: Dict[str, Any]) -> str:
+        """
+        :param snapshot: A snapshot dictionary as returned by MetricsRegistry.get_snapshot()
+                    or as aggregated by MultiprocessMetricsStore
+        :return: The text of the exposition
+        """
+        lines: List[str] = []
+        for name in sorted(snapshot.keys()):
+            family: Dict[str, Any] = snapshot[name]
+            metric_type: str = family.get("type")
+            lines.append(f"# HELP {name} {self.escape_help(family.get('help', ''))}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+            for sample in family.get("samples", []):
+                labels: Dict[str, str] = sample.get("labels", {})
+                if metric_type == HISTOGRAM:
+                    lines.extend(self.format_histogram(name, labels, family.get("buckets"), sample))
+                else:
+                    lines.append(f"{name}{self.format_labels(labels)} {self.format_value(sample.get('value'))}")
+
+        return "\n".join(lines) + "\n"
+
+    def format_histogram(self, name: str, labels: Dict[str, str],
+                         buckets: List[float], sample: Dict[str, Any]) -> List[str]:
+        """
+        :param name: The name of the histogram metric family
+        :param labels: The labels of the sample
+        :param buckets: The upper bounds of the buckets, without +Inf
+        :param sample: The histogram sample dictionary with non-cumulative "counts", "sum" and "count"
+        :return: A list of exposition lines for the histogram sample
+        """
+        lines: List[str] = []
+        cumulative: int = 0
+        counts: List[int] = sample.get("counts", [])
+        bounds: List[str] = [self.format_value(bound) for bound in buckets] + ["+Inf"]
+        for bound, count in zip(bounds, counts):
+            cumulative += count
+            bucket_labels: Dict[str, str] = dict(labels)
+            bucket_labels["le"] = bound
+            lines.append(f"{name}_bucket{self.format_labels(bucket_labels)} {cumulative}")
+        label_str: str = self.format_labels(labels)
+        lines.append(f"{name}_sum{label_str} {self.format_value(sample.get('sum'))}")
+        lines.append(f"{name}_count{label_str} {sample.get('count', 0)}")
+        return lines
+
+    def format_labels(self, labels: Dict[str, str]) -> str:
+        """
+        :param labels: Dictionary of label name -> value
+        :return: The braced label string, or an empty string if there are no labels
+        """
+        if not labels:
+            return ""
+        pairs: List[str] = [f'{key}="{self.escape_label_value(value)}"' for key, value in labels.items()]
+        return "{" + ",".join(pairs) + "}"
+
+    @staticmethod
+    def format_value(value: Any) -> str:
+        """
+        :param value: A number
+        :return: The string representation of the number for the exposition
+        """
+        if value is None:
+            return "0"
+        if isinstance(value, int):
+            return str(value)
+        value = float(value)
+        if value.is_integer():
+            return str(int(value)) if abs(value) < 1e15 else repr(value)
+        return repr(value)
+
+    @staticmethod
+    def escape_label_value(value: str) -> str:
+        """
+        :param value: A label value
+        :return: The value escaped per the exposition format
+        """
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    @staticmethod
+    def escape_help(value: str) -> str:
+        """
+        :param value: Help text
+        :return: The help text escaped per the exposition format
+        """
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n")
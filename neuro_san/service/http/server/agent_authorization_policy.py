@@ -80,6 +80,36 @@ class AgentAuthorizationPolicy(AgentAuthorizer):
         service_provider: AsyncAgentServiceProvider = self.allowed_agents.get(agent_name)
         return is_authorized, service_provider
 
+    async def allow_agents(self, agent_names: List[str], metadata: Dict[str, Any]) -> List[str]:
+        """
+        :param agent_names: names of agents
+        :param metadata: metadata from the request
+        :return: the names of the agents the request is allowed for
+                 and which exist, in the order given
+        """
+        # The networks still need to exist. No need to ask about those that do not.
+        existing_agents: List[str] = [agent_name for agent_name in agent_names
+                                      if agent_name in self.allowed_agents]
+        if len(existing_agents) == 0:
+            return existing_agents
+
+        # Prepare the input for the Authorizer
+        actor_id: str = metadata.get(self.actor_id_metadata_key)
+        actor: Dict[str, Any] = {
+            "type": self.actor_key,
+            "id": actor_id
+        }
+
+        resources: List[Dict[str, Any]] = [{"type": self.resource_key, "id": agent_name}
+                                           for agent_name in existing_agents]
+
+        # Consult the authorizer once for all of them
+        authorized: List[bool] = []
+        async with self.authorizer as auth:
+            authorized = await auth.batch_authorize(actor, self.allow_relation, resources)
+
+        return [agent_name for agent_name, is_authorized in zip(existing_agents, authorized) if is_authorized]
+
     async def list_agents(self, metadata: Dict[str, Any]) -> List[str]:
         """
         What is the list of allowed agents for this request?
@@ -116,3 +146,9 @@ class AgentAuthorizationPolicy(AgentAuthorizer):
             listed_agents = list(listed_set)
 
         return listed_agents
+
+    async def close(self):
+        """
+        Releases whatever the authorizer keeps open on the current event loop.
+        """
+        await self.authorizer.close()
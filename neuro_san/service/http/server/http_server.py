@@ -22,8 +22,12 @@ from typing import Any
 from typing import Dict
 from typing import List
 
+import atexit
 import json
+import os
 import random
+import shutil
+import tempfile
 import threading
 
 import tornado
@@ -31,6 +35,7 @@ import tornado
 from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkProvider
 from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
 from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.service.generic.agent_server_logging import AgentServerLogging
 from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
@@ -39,9 +44,12 @@ from neuro_san.service.http.handlers.concierge_handler import ConciergeHandler
 from neuro_san.service.http.handlers.connectivity_handler import ConnectivityHandler
 from neuro_san.service.http.handlers.function_handler import FunctionHandler
 from neuro_san.service.http.handlers.health_check_handler import HealthCheckHandler
+from neuro_san.service.http.handlers.metrics_handler import MetricsHandler
 from neuro_san.service.http.handlers.openapi_publish_handler import OpenApiPublishHandler
 from neuro_san.service.http.handlers.streaming_chat_handler import StreamingChatHandler
 from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.metrics.metrics_snapshot_writer import MetricsSnapshotWriter
+from neuro_san.service.http.metrics.multiprocess_metrics_store import MultiprocessMetricsStore
 from neuro_san.service.http.server.agent_authorization_policy import AgentAuthorizationPolicy
 from neuro_san.service.http.server.http_server_app import HttpServerApp
 from neuro_san.service.http.server.resources_usage_logger import ResourcesUsageLogger
@@ -50,6 +58,7 @@ from neuro_san.service.interfaces.agent_server import AgentServer
 from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
 from neuro_san.service.interfaces.startable import Startable
 from neuro_san.service.mcp.handlers.mcp_root_handler import McpRootHandler
+from neuro_san.service.utils.mcp_server_context import McpServerContext
 from neuro_san.service.utils.server_context import ServerContext
 from neuro_san.service.utils.server_status import ServerStatus
 
@@ -111,6 +120,8 @@ class HttpServer(AgentStateListener):
         self.allowed_agents: Dict[str, AsyncAgentServiceProvider] = {}
         self.authorization_policy: AgentAuthorizer = AgentAuthorizationPolicy(self.allowed_agents)
         self.lock = threading.Lock()
+        self.metrics_store: MultiprocessMetricsStore = None
+        MetricsRegistry.get_instance().set_enabled(self.server_config.metrics_enabled)
 
         # Add listener to handle adding per-agent http service
         # (services map is defined by self.allowed_agents dictionary)
@@ -125,6 +136,7 @@ class HttpServer(AgentStateListener):
         :param startables: List of Startable instances to start once server
             has forked its multiple running instances.
         """
+        self.setup_metrics_store()
         app = self.make_app(self.requests_limit, self.logger)
 
         self.logger.debug({}, "Serving agents: %s", repr(self.allowed_agents.keys()))
@@ -143,6 +155,14 @@ class HttpServer(AgentStateListener):
                     self.server_config.http_server_monitor_interval_seconds, self.http_port, self.logger)
             startables.append(resources_logger)
 
+        if self.metrics_store is not None:
+            # Each forked instance shares its metrics snapshot with the others.
+            snapshot_writer: Startable = \
+                MetricsSnapshotWriter(self.metrics_store,
+                                      self.server_config.metrics_snapshot_interval_seconds,
+                                      self.logger)
+            startables.append(snapshot_writer)
+
         # Bind the socket with a custom backlog
         server.bind(self.http_port, backlog=self.server_config.http_connections_backlog)
 
@@ -176,6 +196,9 @@ class HttpServer(AgentStateListener):
                             startable.__class__.__name__, str(exception))
 
         tornado.ioloop.IOLoop.current().start()
+
+        # Close what authorization kept open on the server's loop, like OpenFGA clients.
+        tornado.ioloop.IOLoop.current().run_sync(self.authorization_policy.close)
         self.logger.info({}, "Http server stopped.")
 
     def make_app(self, requests_limit: int, logger: EventLoopLogger):
@@ -203,6 +226,14 @@ class HttpServer(AgentStateListener):
         handlers.append(("/readyz", HealthCheckHandler, ready_request_initialize_data))
         handlers.append(("/livez", HealthCheckHandler, live_request_initialize_data))
 
+        if self.server_config.metrics_enabled:
+            metrics_request_initialize_data: Dict[str, Any] = {
+                "forwarded_request_metadata": self.forwarded_request_metadata,
+                "metrics_store": self.metrics_store
+            }
+            handlers.append(("/metrics", MetricsHandler, metrics_request_initialize_data))
+            MetricsRegistry.get_instance().add_collector(self.collect_executor_pool_metrics)
+
         if enable_http_handlers:
             handlers.append(("/api/v1/list", ConciergeHandler, request_initialize_data))
             handlers.append(("/api/v1/docs", OpenApiPublishHandler, request_initialize_data))
@@ -215,11 +246,57 @@ class HttpServer(AgentStateListener):
 
         # Register MCP "root" handler for all MCP requests
         # if MCP server is enabled:
-        if self.server_context.get_mcp_server_context().is_enabled():
+        mcp_context: McpServerContext = self.server_context.get_mcp_server_context()
+        if mcp_context.is_enabled():
+            # Build the tool call validator before forking, rather than on the first request.
+            mcp_context.get_tool_request_validator(request_initialize_data.get("openapi_service_spec"))
             handlers.append((r"/mcp", McpRootHandler, request_initialize_data))
 
         return HttpServerApp(handlers, requests_limit, logger, self.forwarded_request_metadata)
 
+    def setup_metrics_store(self):
+        """
+        Set up sharing of metrics between server instances
+        if we are going to fork more than one of them.
+        To be called before the server forks.
+        """
+        if not self.server_config.metrics_enabled or self.server_config.http_server_instances == 1:
+            # Single process has all the metrics it needs in its own MetricsRegistry
+            return
+
+        metrics_dir: str = self.server_config.metrics_multiprocess_dir
+        if not metrics_dir:
+            metrics_dir = tempfile.mkdtemp(prefix="neuro-san-metrics-")
+            # Forked server instances exit through here too, but only this process removes anything.
+            atexit.register(self.remove_temp_dir, metrics_dir, os.getpid())
+        self.metrics_store = MultiprocessMetricsStore(metrics_dir)
+        # Do not aggregate anything left over from a previous run.
+        self.metrics_store.clear()
+        self.logger.info({}, "Sharing metrics between server instances in %s", metrics_dir)
+
+    @staticmethod
+    def remove_temp_dir(temp_dir: str, owner_pid: int):
+        """
+        Remove a temporary directory created before the server forked.
+        :param temp_dir: The temporary directory
+        :param owner_pid: The process which created the directory and is the only one to remove it
+        """
+        if os.getpid() == owner_pid:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def collect_executor_pool_metrics(self, metrics: MetricsRegistry):
+        """
+        Refresh executor pool utilization gauges just before metrics are reported.
+        :param metrics: The MetricsRegistry to update
+        """
+        pool_metrics: Dict[str, Any] = self.server_context.get_executor_pool().get_threads_metrics()
+        for state, state_metrics in pool_metrics.items():
+            labels: Dict[str, str] = {"state": state}
+            metrics.set(MetricsRegistry.EXECUTOR_POOL_EXECUTORS, labels, state_metrics.get("executors", 0))
+            metrics.set(MetricsRegistry.EXECUTOR_POOL_THREADS, labels, state_metrics.get("work_threads", 0))
+            metrics.set(MetricsRegistry.EXECUTOR_POOL_THREADS_RUNNING, labels,
+                        state_metrics.get("threads_running", 0))
+
     def agent_added(self, agent_name: str, source: AgentStorageSource):
         """
         Add agent to the map of known agents
@@ -30,6 +30,7 @@ from tornado.web import Application
 from tornado.web import ErrorHandler
 from tornado.ioloop import IOLoop
 
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
 from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
 
@@ -65,6 +66,7 @@ class HttpServerApp(Application):
         self.shutdown_initiated: bool = False
         self.lock: Lock = Lock()
         self.shutdown_thread = None
+        self.metrics: MetricsRegistry = MetricsRegistry.get_instance()
 
     def is_serving(self) -> bool:
         """
@@ -83,21 +85,29 @@ class HttpServerApp(Application):
         with self.lock:
             self.num_processing += 1
             self.requests_stats[caller] = self.requests_stats.get(caller, 0) + 1
+        self.metrics.inc(MetricsRegistry.REQUESTS_IN_FLIGHT, self.get_metric_labels(caller))
 
     def finish_client_request(self, metadata: Dict[str, Any],
-                              caller: str, get_stats: bool = False):
+                              caller: str, get_stats: bool = False,
+                              duration_seconds: float = None):
         """
         Register finishing of client request.
         :param metadata: request metadata
         :param caller: name of request client to be used for stats
         :param get_stats: True if we need to log requests statistics,
                           False otherwise.
+        :param duration_seconds: Optional duration of the request to record
+                          in the request latency metrics.
         """
         limit_reached: bool = False
         with self.lock:
             self.num_processing -= 1
             self.total += 1
             limit_reached = 0 <= self.requests_limit < self.total
+        labels: Dict[str, str] = self.get_metric_labels(caller)
+        self.metrics.dec(MetricsRegistry.REQUESTS_IN_FLIGHT, labels)
+        if duration_seconds is not None:
+            self.metrics.observe(MetricsRegistry.REQUEST_DURATION, labels, duration_seconds)
         self.logger.info(metadata, "Finish %s", caller)
         if get_stats:
             self.logger.info(metadata, "Stats: %s", self.get_stats())
@@ -106,6 +116,19 @@ class HttpServerApp(Application):
             self.serving = False
             self.initiate_shutdown()
 
+    @staticmethod
+    def get_metric_labels(caller: str) -> Dict[str, str]:
+        """
+        :param caller: name of request client as passed to start/finish_client_request(),
+                       either "<network>/<method>" or a fixed API path like "/api/v1/list"
+        :return: A dictionary of metric labels describing the caller
+        """
+        network: str = ""
+        method: str = caller
+        if not caller.startswith("/") and "/" in caller:
+            network, method = caller.rsplit("/", 1)
+        return {"network": network, "method": method}
+
     def do_shutdown(self, loop):
         """
         Poll for state with no executing requests
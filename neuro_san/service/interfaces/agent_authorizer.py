@@ -42,6 +42,18 @@ class AgentAuthorizer:
         """
         raise NotImplementedError
 
+    async def allow_agents(self, agent_names: List[str], metadata: Dict[str, Any]) -> List[str]:
+        """
+        Which of the given agents is the request allowed for?
+        Like allow_agent() above, but for many agents at once.
+
+        :param agent_names: names of agents
+        :param metadata: metadata from the request
+        :return: the names of the agents the request is allowed for
+                 and which exist, in the order given
+        """
+        raise NotImplementedError
+
     async def list_agents(self, metadata: Dict[str, Any]) -> List[str]:
         """
         What is the list of allowed agents for this request?
@@ -49,3 +61,9 @@ class AgentAuthorizer:
         :return: a list of agent names allowed for this request
         """
         raise NotImplementedError
+
+    async def close(self):
+        """
+        Releases whatever is kept open for authorizing requests on the current event loop.
+        To be called before the loop goes away, like when the server shuts down.
+        """
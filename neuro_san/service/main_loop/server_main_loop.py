@@ -39,6 +39,7 @@ from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_CONNEC
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_IDLE_CONNECTIONS_TIMEOUT_SECONDS
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_SERVER_INSTANCES
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS
+from neuro_san.service.http.config.http_server_config import DEFAULT_METRICS_SNAPSHOT_INTERVAL_SECONDS
 from neuro_san.service.http.config.http_server_config import HttpServerConfig
 from neuro_san.service.interfaces.agent_server import AgentServer
 from neuro_san.service.http.server.http_server import HttpServer
@@ -145,6 +146,28 @@ class ServerMainLoop:
         arg_parser.add_argument("--mcp_only", type=str,
                                 default=os.environ.get("AGENT_MCP_ONLY", "false"),
                                 help="'true' if only MCP protocol service will be run (no HTTP service)")
+        arg_parser.add_argument("--mcp_session_store", type=str,
+                                default=os.environ.get("AGENT_MCP_SESSION_STORE", "none"),
+                                choices=["none", "memory", "sqlite"],
+                                help="Where MCP client sessions are kept: 'none' for no sessions, "
+                                     "'memory' for each http server instance on its own, "
+                                     "'sqlite' for a database shared by all http server instances")
+        arg_parser.add_argument("--mcp_session_db", type=str,
+                                default=os.environ.get("AGENT_MCP_SESSION_DB", ""),
+                                help="SQLite database file for the 'sqlite' MCP session store. "
+                                     "If empty, a temporary file is used")
+        arg_parser.add_argument("--metrics_enable", type=str,
+                                default=os.environ.get("AGENT_METRICS_ENABLE", "false"),
+                                help="'true' if Prometheus metrics should be served on /metrics")
+        arg_parser.add_argument("--metrics_multiprocess_dir", type=str,
+                                default=os.environ.get("AGENT_METRICS_MULTIPROCESS_DIR", ""),
+                                help="Directory shared by http server instances for aggregating metrics. "
+                                     "If empty, a temporary directory is used when running more than one instance")
+        arg_parser.add_argument("--metrics_snapshot_interval_seconds", type=int,
+                                default=int(os.environ.get("AGENT_METRICS_SNAPSHOT_INTERVAL",
+                                                           DEFAULT_METRICS_SNAPSHOT_INTERVAL_SECONDS)),
+                                help="Interval in seconds at which each http server instance shares "
+                                     "its metrics with the other instances")
         return arg_parser
 
     def parse_args(self):
@@ -170,6 +193,7 @@ class ServerMainLoop:
 
         self.server_name_for_logs = args.server_name_for_logs
         self.max_concurrent_requests = args.max_concurrent_requests
+        self.server_context.get_fair_request_queue().set_max_concurrent(self.max_concurrent_requests)
         self.request_limit = args.request_limit
         self.forwarded_request_metadata = args.forwarded_request_metadata
         if not self.forwarded_request_metadata:
@@ -194,12 +218,18 @@ class ServerMainLoop:
             server_status.mcp_service.set_requested(True)
             # Disable HTTP service if MCP only is requested
             server_status.http_service.set_requested(False)
+        self.server_context.get_mcp_server_context().set_session_store(args.mcp_session_store,
+                                                                       args.mcp_session_db)
 
         self.http_server_config.http_connections_backlog = args.http_connections_backlog
         self.http_server_config.http_idle_connection_timeout_seconds = args.http_idle_connections_timeout
         self.http_server_config.http_server_instances = args.http_server_instances
         self.http_server_config.http_server_monitor_interval_seconds = args.http_resources_monitor_interval_seconds
         self.http_server_config.http_port = args.http_port
+        self.http_server_config.metrics_enabled = args.metrics_enable.lower() == "true"
+        if args.metrics_multiprocess_dir:
+            self.http_server_config.metrics_multiprocess_dir = args.metrics_multiprocess_dir
+        self.http_server_config.metrics_snapshot_interval_seconds = args.metrics_snapshot_interval_seconds
 
         manifest_restorer = RegistryManifestRestorer()
         manifest_agent_networks: Dict[str, Dict[str, AgentNetwork]] = manifest_restorer.restore()
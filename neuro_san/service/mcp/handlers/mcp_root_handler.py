@@ -18,6 +18,7 @@
 See class comment for details
 """
 
+import contextlib
 import json
 from typing import Any
 from typing import Dict
@@ -25,6 +26,8 @@ from typing import Tuple
 
 from http import HTTPStatus
 
+import tornado
+
 from neuro_san.internals.interfaces.dictionary_validator import DictionaryValidator
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
@@ -65,8 +68,10 @@ class McpRootHandler(BaseRequestHandler):
         #     of a particular grouping.
         self.network_storage_dict: Dict[str, AgentNetworkStorage] = self.server_context.get_network_storage_dict()
 
-        # For tool requests, we need to validate tool call arguments:
-        self.tool_request_validator: ToolRequestValidator = ToolRequestValidator(self.openapi_service_spec)
+        # For tool requests, we need to validate tool call arguments.
+        # The validator is built once per server and shared by all requests.
+        self.tool_request_validator: ToolRequestValidator = \
+            self.mcp_context.get_tool_request_validator(self.openapi_service_spec)
 
         self.set_header("Access-Control-Allow-Origin", "*")
         self.set_header("Access-Control-Allow-Methods", "GET, POST, DELETE, OPTIONS")
@@ -165,7 +170,9 @@ class McpRootHandler(BaseRequestHandler):
                         self.logger,
                         self.network_storage_dict,
                         self.agent_policy,
-                        self.tool_request_validator)
+                        self.tool_request_validator,
+                        self.mcp_context.get_tools_cache(),
+                        self.mcp_context.get_tools_list_concurrency())
                 result_dict: Dict[str, Any] = await tools_processor.list_tools(request_id, metadata)
                 self.set_status(HTTPStatus.OK)
                 self.write(result_dict)
@@ -175,35 +182,9 @@ class McpRootHandler(BaseRequestHandler):
                         self.logger,
                         self.network_storage_dict,
                         self.agent_policy,
-                        self.tool_request_validator)
-                call_params: Dict[str, Any] = data.get("params", {})
-                tool_name: str = call_params.get("name")
-                call_args: Dict[str, Any] = call_params.get("arguments", {})
-                # Validate tool arguments:
-                validation_errors = self.tool_request_validator.validate(call_args)
-                if validation_errors:
-                    extra_error: str = "; ".join(validation_errors)
-                    error_msg: Dict[str, Any] = \
-                        McpErrorsUtil.get_protocol_error(request_id, McpError.InvalidRequest, extra_error)
-                    self.set_status(HTTPStatus.BAD_REQUEST)
-                    self.write(error_msg)
-                    self.logger.error(self.get_metadata(), f"Error: Invalid tool call request: {extra_error}")
-                    return
-
-                prompt: Dict[str, Any] = call_args.get("user_message", {})
-                chat_context: Dict[str, Any] = call_args.get("chat_context", None)
-                chat_filter: Dict[str, Any] = call_args.get("chat_filter", None)
-                sly_data: Dict[str, Any] = call_args.get("sly_data", None)
-                result_dict: Dict[str, Any] =\
-                    await tools_processor.call_tool(
-                        request_id, metadata,
-                        tool_name,
-                        prompt,
-                        chat_context,
-                        chat_filter,
-                        sly_data)
-                self.set_status(HTTPStatus.OK)
-                self.write(result_dict)
+                        self.tool_request_validator,
+                        self.mcp_context.get_tools_cache())
+                await self.handle_tool_call(tools_processor, data, request_id, metadata)
             elif method == "resources/list":
                 resources_processor: McpResourcesProcessor = McpResourcesProcessor(self.logger)
                 result_dict: Dict[str, Any] = await resources_processor.list_resources(request_id, metadata)
@@ -235,6 +216,118 @@ class McpRootHandler(BaseRequestHandler):
             # We are done with response stream:
             self.do_finish()
 
+    async def handle_tool_call(
+            self,
+            tools_processor: McpToolsProcessor,
+            request_data: Dict[str, Any],
+            request_id,
+            metadata: Dict[str, Any]):
+        """
+        Respond to a tools/call request, with a single json response
+        or with a stream of server-sent events if the client asked for progress.
+        :param tools_processor: the McpToolsProcessor for the request;
+        :param request_data: MCP request data dictionary;
+        :param request_id: MCP request id;
+        :param metadata: http-level request metadata;
+        """
+        # pylint: disable=too-many-locals
+        call_params: Dict[str, Any] = request_data.get("params", {})
+        tool_name: str = call_params.get("name")
+        call_args: Dict[str, Any] = call_params.get("arguments", {})
+        # Validate tool arguments:
+        validation_errors = self.tool_request_validator.validate(call_args)
+        if validation_errors:
+            extra_error: str = "; ".join(validation_errors)
+            error_msg: Dict[str, Any] = \
+                McpErrorsUtil.get_protocol_error(request_id, McpError.InvalidRequest, extra_error)
+            self.set_status(HTTPStatus.BAD_REQUEST)
+            self.write(error_msg)
+            self.logger.error(self.get_metadata(), f"Error: Invalid tool call request: {extra_error}")
+            return
+
+        prompt: Dict[str, Any] = call_args.get("user_message", {})
+        chat_context: Dict[str, Any] = call_args.get("chat_context", None)
+        chat_filter: Dict[str, Any] = call_args.get("chat_filter", None)
+        sly_data: Dict[str, Any] = call_args.get("sly_data", None)
+        progress_token = call_params.get("_meta", {}).get("progressToken")
+        if progress_token is not None and self.accepts_event_stream():
+            await self.stream_tool_call(
+                tools_processor,
+                request_id, metadata,
+                tool_name,
+                prompt,
+                chat_context,
+                chat_filter,
+                sly_data,
+                progress_token)
+            return
+        result_dict: Dict[str, Any] =\
+            await tools_processor.call_tool(
+                request_id, metadata,
+                tool_name,
+                prompt,
+                chat_context,
+                chat_filter,
+                sly_data)
+        self.set_status(HTTPStatus.OK)
+        self.write(result_dict)
+
+    def accepts_event_stream(self) -> bool:
+        """
+        :return: True if the client accepts a text/event-stream response
+                 per the streamable HTTP transport; False otherwise
+        """
+        accept: str = self.request.headers.get("Accept", "")
+        return "text/event-stream" in accept
+
+    async def stream_tool_call(
+            self,
+            tools_processor: McpToolsProcessor,
+            request_id,
+            metadata: Dict[str, Any],
+            tool_name: str,
+            prompt: Dict[str, Any],
+            chat_context: Dict[str, Any],
+            chat_filter: Dict[str, Any],
+            sly_data: Dict[str, Any],
+            progress_token: Any):
+        """
+        Respond to a tools/call request with a stream of server-sent events:
+        "notifications/progress" messages while the agent network runs,
+        followed by the tool call result.
+        :param tools_processor: the McpToolsProcessor for the request;
+        :param request_id: MCP request id;
+        :param metadata: http-level request metadata;
+        :param tool_name: tool name;
+        :param prompt: input prompt as a JSON structure;
+        :param chat_context: chat context JSON structure, could be None;
+        :param chat_filter: chat filter type JSON structure, could be None;
+        :param sly_data: arbitrary JSON dictionary containing sly_data, could be None;
+        :param progress_token: the "progressToken" the client sent with the request
+        """
+        self.set_status(HTTPStatus.OK)
+        self.set_header("Content-Type", "text/event-stream")
+        self.set_header("Cache-Control", "no-cache")
+        message_generator = tools_processor.stream_tool(
+            request_id, metadata,
+            tool_name,
+            prompt,
+            chat_context,
+            chat_filter,
+            sly_data,
+            progress_token)
+        try:
+            async for message in message_generator:
+                self.write(f"event: message\ndata: {json.dumps(message)}\n\n")
+                # Events are delimited, so unlike json-lines streams
+                # there is no need to wait for transport buffers to drain.
+                await self.flush()
+        except tornado.iostream.StreamClosedError:
+            self.logger.info(metadata, "Tool %s event stream closed by client.", tool_name)
+        finally:
+            with contextlib.suppress(Exception):
+                await message_generator.aclose()
+
     async def handle_handshake(
             self,
             method: str,
@@ -0,0 +1,73 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+
+
+class SessionStore:
+    """
+    Interface for where the MCP client sessions of a ClientSessionPolicy are kept.
+    Implementations are responsible for bounding the number of sessions they keep
+    and for expiring sessions that have been idle for too long.
+    """
+
+    def add_session(self, session_id: str):
+        """
+        Add a new, not yet active session.
+        :param session_id: The id of the new session
+        """
+        raise NotImplementedError
+
+    def activate_session(self, session_id: str) -> bool:
+        """
+        Mark an existing session as active.
+        :param session_id: The id of the session to activate
+        :return: True if successful;
+                 False if session with given id does not exist
+        """
+        raise NotImplementedError
+
+    def remove_session(self, session_id: str) -> bool:
+        """
+        Remove an existing session.
+        :param session_id: The id of the session to remove
+        :return: True if successful;
+                 False if session with given id does not exist
+        """
+        raise NotImplementedError
+
+    def is_session_active(self, session_id: str) -> bool:
+        """
+        Check if the session with the given id is active.
+        Checking a session counts as using it, which keeps it from expiring.
+        :param session_id: The id of the session to check
+        :return: True if session exists and is active;
+                 False otherwise
+        """
+        raise NotImplementedError
+
+    def get_size(self) -> int:
+        """
+        :return: The number of sessions currently kept
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Release any resources held by the store.
+        """
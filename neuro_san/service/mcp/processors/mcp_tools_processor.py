@@ -18,6 +18,7 @@
 See class comment for details
 """
 from typing import Any
+from typing import AsyncIterator
 from typing import Dict
 from typing import List
 from typing import Tuple
@@ -25,6 +26,7 @@ from typing import Tuple
 import asyncio
 import contextlib
 import json
+
 import tornado
 
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
@@ -35,7 +37,9 @@ from neuro_san.service.generic.async_agent_service_provider import AsyncAgentSer
 from neuro_san.service.interfaces.agent_authorizer import AgentAuthorizer
 from neuro_san.service.mcp.util.mcp_errors_util import McpErrorsUtil
 from neuro_san.service.mcp.util.mcp_request_util import McpRequestUtil
+from neuro_san.service.mcp.util.mcp_tools_cache import McpToolsCache
 from neuro_san.service.mcp.validation.tool_request_validator import ToolRequestValidator
+from neuro_san.service.utils.mcp_server_context import McpServerContext
 from neuro_san.service.http.logging.http_logger import HttpLogger
 
 
@@ -46,15 +50,32 @@ class McpToolsProcessor:
     https://modelcontextprotocol.io/specification/2025-06-18/server/tools
     """
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(self,
                  logger: HttpLogger,
                  network_storage_dict: AgentNetworkStorage,
                  agent_policy: AgentAuthorizer,
-                 tool_request_validator: ToolRequestValidator):
+                 tool_request_validator: ToolRequestValidator,
+                 tools_cache: McpToolsCache = None,
+                 max_concurrency: int = McpServerContext.DEFAULT_TOOLS_LIST_CONCURRENCY):
+        """
+        Constructor
+
+        :param logger: The HttpLogger to use
+        :param network_storage_dict: A dictionary of string (describing scope) to AgentNetworkStorage
+        :param agent_policy: The AgentAuthorizer to consult
+        :param tool_request_validator: The ToolRequestValidator for tool call arguments
+        :param tools_cache: The McpToolsCache shared between requests.
+                    Default None means tool descriptions are not cached.
+        :param max_concurrency: The maximum number of agent networks
+                    a tools/list request describes at once
+        """
         self.logger: HttpLogger = logger
         self.network_storage_dict: AgentNetworkStorage = network_storage_dict
         self.agent_policy: AgentAuthorizer = agent_policy
         self.tool_request_validator: ToolRequestValidator = tool_request_validator
+        self.tools_cache: McpToolsCache = tools_cache
+        self.max_concurrency: int = max_concurrency
 
     async def list_tools(self, request_id, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -63,23 +84,29 @@ class McpToolsProcessor:
         :param metadata: http-level request metadata;
         :return: json dictionary with tools list in MCP format
         """
-        # See which agents the user has access to per authorization policy
-        authorized_agents: List[str] = await self.agent_policy.list_agents(metadata)
-
         public_storage: AgentNetworkStorage = self.network_storage_dict.get("public")
-        tools_description: List[Dict[str, Any]] = []
+        mcp_networks: Dict[str, AgentNetwork] = {}
         for agent_name in public_storage.get_agent_names():
-
-            # Skip agents that are not authorized
-            if agent_name not in authorized_agents:
-                continue
-
             provider: AgentNetworkProvider = public_storage.get_agent_network_provider(agent_name)
             if provider is not None:
                 agent_network: AgentNetwork = provider.get_agent_network()
-                if agent_network.is_mcp_tool():
-                    tool_dict: Dict[str, Any] = await self._get_tool_description(agent_name, metadata)
-                    tools_description.append(tool_dict)
+                if agent_network is not None and agent_network.is_mcp_tool():
+                    mcp_networks[agent_name] = agent_network
+
+        # See which of them the user has access to per authorization policy.
+        # This is the one authorization check for the whole listing.
+        authorized_agents: List[str] = await self.agent_policy.allow_agents(list(mcp_networks.keys()), metadata)
+
+        # Describe the networks concurrently, but not all at once.
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def describe(agent_name: str, agent_network: AgentNetwork) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._get_tool_description(agent_name, agent_network, metadata)
+
+        tool_dicts: List[Dict[str, Any]] = await asyncio.gather(
+            *[describe(agent_name, mcp_networks.get(agent_name)) for agent_name in authorized_agents])
+        tools_description: List[Dict[str, Any]] = [tool_dict for tool_dict in tool_dicts if tool_dict is not None]
         return {
             "jsonrpc": "2.0",
             "id": McpRequestUtil.safe_request_id(request_id),
@@ -88,7 +115,6 @@ class McpToolsProcessor:
             }
         }
 
-    # pylint: disable=too-many-return-statements
     async def call_tool(self, request_id, metadata: Dict[str, Any],
                         tool_name: str,
                         prompt: Dict[str, Any],
@@ -107,71 +133,197 @@ class McpToolsProcessor:
         :return: json dictionary with tool response in MCP format;
                  or json dictionary with error message in MCP format.
         """
-        # pylint: disable=too-many-locals
         # pylint: disable=too-many-arguments
         # pylint: disable=too-many-positional-arguments
+        call_result: Dict[str, Any] = None
+        async for message in self.stream_tool(request_id, metadata, tool_name,
+                                              prompt, chat_context, chat_filter, sly_data):
+            call_result = message
+        return call_result
 
-        is_authorized: bool = False
-        service_provider: AsyncAgentServiceProvider = None
-        is_authorized, service_provider = await self.agent_policy.allow_agent(tool_name, metadata)
-
-        if service_provider is None:
-            # No such tool is found:
-            return McpErrorsUtil.get_tool_error(request_id, f"Tool not found: {tool_name}")
-
-        if not is_authorized:
-            return McpErrorsUtil.get_tool_error(request_id, f"Tool not authorized: {tool_name}")
+    async def stream_tool(self, request_id, metadata: Dict[str, Any],
+                          tool_name: str,
+                          prompt: Dict[str, Any],
+                          chat_context: Dict[str, Any],
+                          chat_filter: Dict[str, Any],
+                          sly_data: Dict[str, Any],
+                          progress_token: Any = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Call MCP tool, which executes neuro-san agent chat request,
+        yielding MCP messages as the agent network runs.
+        :param request_id: MCP request id;
+        :param metadata: http-level request metadata;
+        :param tool_name: tool name;
+        :param prompt: input prompt as a JSON structure;
+        :param chat_context: chat context JSON structure, could be None;
+        :param chat_filter: chat filter type JSON structure, could be None;
+        :param sly_data: arbitrary JSON dictionary containing sly_data, could be None;
+        :param progress_token: the "progressToken" the client sent with the request, could be None.
+                 When given, intermediate agent messages are yielded as "notifications/progress"
+                 messages and only the final answer of the network makes up the tool result.
+        :return: an async iterator over json dictionaries in MCP format.
+                 The last one is the tool response or the error message.
+        """
+        # pylint: disable=too-many-locals
+        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-positional-arguments
+        # pylint: disable=too-many-branches
 
-        service: AsyncAgentService = service_provider.get_service()
-        if not service.is_mcp_tool():
-            # Service is not allowed to be called as MCP tool:
-            return McpErrorsUtil.get_tool_error(request_id, f"Service not available as MCP tool: {tool_name}")
+        service, error_dict = await self._get_tool_service(request_id, tool_name, metadata)
+        if error_dict is not None:
+            yield error_dict
+            return
 
         tool_timeout_seconds: float = service.get_request_timeout_seconds()
-        if tool_timeout_seconds <= 0.0:
-            # For asyncio.timeout(), None means no timeout:
-            tool_timeout_seconds = None
+        deadline: float = None
+        if tool_timeout_seconds > 0.0:
+            # For asyncio.timeout_at(), None means no timeout:
+            deadline = asyncio.get_running_loop().time() + tool_timeout_seconds
+
+        if progress_token is not None and \
+                (chat_filter is None or chat_filter.get("chat_filter_type", "MINIMAL") == "MINIMAL"):
+            # Intermediate messages are what progress is reported from.
+            # Only the final answer goes into the tool result all the same.
+            chat_filter = {"chat_filter_type": "MAXIMAL"}
 
         input_request: Dict[str, Any] = self._get_chat_input_request(prompt, chat_context, chat_filter, sly_data)
         response_text: str = ""
         response_structure: Dict[str, Any] = None
+        progress: int = 0
+
+        # The agent network runs in a task of its own, feeding this queue.
+        # Only the reads from the queue are under the timeout, never a yield,
+        # so the timeout cannot go off while our caller is busy with a message.
+        result_queue: asyncio.Queue = asyncio.Queue()
+        chat_task: asyncio.Task = asyncio.create_task(
+            self._run_streaming_chat(service, input_request, metadata, result_queue))
         try:
-            async with asyncio.timeout(tool_timeout_seconds):
-                result_generator = service.streaming_chat(input_request, metadata)
-                async for result_dict in result_generator:
-                    partial_response, structure_data = await self._extract_tool_response_part(result_dict)
-                    if partial_response is not None:
-                        response_text = response_text + partial_response
-                    if structure_data is not None:
-                        response_structure = structure_data
+            while True:
+                async with asyncio.timeout_at(deadline):
+                    result_dict: Dict[str, Any] = await result_queue.get()
+                if result_dict is None:
+                    break
+                if isinstance(result_dict, BaseException):
+                    raise result_dict
+
+                if progress_token is not None and not self._is_final_response(result_dict):
+                    progress_message: str = self._get_progress_message(result_dict)
+                    if progress_message is not None:
+                        progress += 1
+                        yield self.build_progress_notification(progress_token, progress, progress_message)
+                    continue
+
+                partial_response, structure_data = await self._extract_tool_response_part(result_dict)
+                if partial_response is not None:
+                    response_text = response_text + partial_response
+                if structure_data is not None:
+                    response_structure = structure_data
 
         except (asyncio.CancelledError, tornado.iostream.StreamClosedError):
             self.logger.info(metadata, "Tool execution %s cancelled/stream closed.", tool_name)
-            return McpErrorsUtil.get_tool_error(request_id, f"Stream closed for tool {tool_name}")
+            yield McpErrorsUtil.get_tool_error(request_id, f"Stream closed for tool {tool_name}")
+            return
 
         except asyncio.TimeoutError:
             self.logger.info(metadata,
                              "Chat tool timeout for %s in %f seconds.",
                              tool_name, tool_timeout_seconds)
-            return McpErrorsUtil.get_tool_error(request_id, f"Timeout for tool {tool_name}")
+            yield McpErrorsUtil.get_tool_error(request_id, f"Timeout for tool {tool_name}")
+            return
 
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self.logger.error(metadata, "Tool %s execution failed: %s", tool_name, str(exc))
-            return McpErrorsUtil.get_tool_error(request_id, f"Failed to execute tool {tool_name}")
+            yield McpErrorsUtil.get_tool_error(request_id, f"Failed to execute tool {tool_name}")
+            return
 
         finally:
-            # We are done with the response stream,
-            # ensure generator is closed properly in any case:
-            if result_generator is not None:
-                with contextlib.suppress(Exception):
-                    # It is possible we will call .aclose() twice
-                    # on our result_generator - it is allowed and has no effect.
-                    await result_generator.aclose()
+            # Stop the agent network if it is still running.
+            # The task closes the response stream itself.
+            chat_task.cancel()
 
         # Return tool call result:
         call_result: Dict[str, Any] =\
             await self.build_tool_call_result(request_id, response_text, response_structure)
-        return call_result
+        yield call_result
+
+    async def _get_tool_service(self, request_id, tool_name: str,
+                                metadata: Dict[str, Any]) -> Tuple[AsyncAgentService, Dict[str, Any]]:
+        """
+        Find the service for a tool call.
+        :param request_id: MCP request id;
+        :param tool_name: tool name;
+        :param metadata: http-level request metadata;
+        :return: tuple of 2 values:
+            the AsyncAgentService for the tool or None,
+            json dictionary with error message in MCP format if the tool cannot be called or None
+        """
+        is_authorized: bool = False
+        service_provider: AsyncAgentServiceProvider = None
+        is_authorized, service_provider = await self.agent_policy.allow_agent(tool_name, metadata)
+
+        if service_provider is None:
+            # No such tool is found:
+            return None, McpErrorsUtil.get_tool_error(request_id, f"Tool not found: {tool_name}")
+
+        if not is_authorized:
+            return None, McpErrorsUtil.get_tool_error(request_id, f"Tool not authorized: {tool_name}")
+
+        service: AsyncAgentService = service_provider.get_service()
+        if not service.is_mcp_tool():
+            # Service is not allowed to be called as MCP tool:
+            return None, McpErrorsUtil.get_tool_error(request_id,
+                                                      f"Service not available as MCP tool: {tool_name}")
+        return service, None
+
+    @staticmethod
+    async def _run_streaming_chat(service: AsyncAgentService,
+                                  input_request: Dict[str, Any],
+                                  metadata: Dict[str, Any],
+                                  result_queue: asyncio.Queue):
+        """
+        Run a streaming chat request, putting its response dictionaries on the given queue.
+        These are followed by None when the chat is done,
+        or by the exception it failed with.
+        :param service: the AsyncAgentService to chat with;
+        :param input_request: the chat request dictionary;
+        :param metadata: http-level request metadata;
+        :param result_queue: the asyncio.Queue to put the results on
+        """
+        result_generator = service.streaming_chat(input_request, metadata)
+        try:
+            async for result_dict in result_generator:
+                result_queue.put_nowait(result_dict)
+            result_queue.put_nowait(None)
+        except asyncio.CancelledError as exc:
+            # Let whoever reads the queue know, in case it was not them who cancelled.
+            result_queue.put_nowait(exc)
+            raise
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result_queue.put_nowait(exc)
+        finally:
+            # We are done with the response stream,
+            # ensure generator is closed properly in any case:
+            with contextlib.suppress(Exception):
+                await result_generator.aclose()
+
+    @staticmethod
+    def build_progress_notification(progress_token: Any, progress: int, message: str) -> Dict[str, Any]:
+        """
+        Build MCP progress notification dictionary.
+        :param progress_token: the "progressToken" the client sent with the request;
+        :param progress: the number of the notification for this request, increasing from 1;
+        :param message: the description of the progress;
+        :return: json dictionary with progress notification in MCP format
+        """
+        return {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {
+                "progressToken": progress_token,
+                "progress": progress,
+                "message": McpRequestUtil.safe_message(message)
+            }
+        }
 
     async def build_tool_call_result(
             self,
@@ -211,24 +363,42 @@ class McpToolsProcessor:
         call_result["result"]["content"][0]["text"] = McpRequestUtil.safe_message(result_text)
         return call_result
 
-    async def _get_tool_description(self, agent_name: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_tool_description(self, agent_name: str, agent_network: AgentNetwork,
+                                    metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param agent_name: name of an agent that has already been authorized
+        :param agent_network: The AgentNetwork for the agent
+        :param metadata: http-level request metadata;
+        :return: The MCP tool description for the agent network,
+                 or None if the agent is no longer served
+        """
+        if self.tools_cache is not None:
+            cached: Dict[str, Any] = self.tools_cache.get_tool_description(agent_name, agent_network)
+            if cached is not None:
+                return cached
 
+        # Like other MCP requests, go through the service for the agent,
+        # which shares concurrent identical function requests.
+        # The listing has already authorized the agent, so this only happens on a cache miss.
         is_authorized: bool = False
         service_provider: AsyncAgentServiceProvider = None
         is_authorized, service_provider = await self.agent_policy.allow_agent(agent_name, metadata)
-
         if service_provider is None or not is_authorized:
             return None
 
         service: AsyncAgentService = service_provider.get_service()
         function_dict: Dict[str, Any] = await service.function({}, metadata)
         tool_description: str = function_dict.get("function", {}).get("description", "")
-        return {
+        tool_dict: Dict[str, Any] = {
             "name": agent_name,
             "description": tool_description,
             "inputSchema": self.tool_request_validator.get_request_schema()
         }
 
+        if self.tools_cache is not None:
+            self.tools_cache.put_tool_description(agent_name, agent_network, tool_dict)
+        return tool_dict
+
     async def _extract_tool_response_part(
             self, response_dict: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         """
@@ -247,6 +417,33 @@ class McpToolsProcessor:
             return text, structure_data
         return None, None
 
+    @staticmethod
+    def _is_final_response(response_dict: Dict[str, Any]) -> bool:
+        """
+        :param response_dict: streaming chat response dictionary;
+        :return: True if the response is the final answer of the agent network.
+                 These are the only messages with a chat_context.
+        """
+        response_part_dict: Dict[str, Any] = response_dict.get("response", {})
+        return response_part_dict.get("type", "") == "AGENT_FRAMEWORK" and \
+            response_part_dict.get("chat_context") is not None
+
+    @staticmethod
+    def _get_progress_message(response_dict: Dict[str, Any]) -> str:
+        """
+        :param response_dict: streaming chat response dictionary;
+        :return: the progress message for an intermediate agent message,
+                 or None if the message has nothing to report.
+        """
+        response_part_dict: Dict[str, Any] = response_dict.get("response", {})
+        text: str = response_part_dict.get("text")
+        if not text:
+            return None
+        origin: List[Dict[str, Any]] = response_part_dict.get("origin")
+        if not origin:
+            return text
+        return f"{origin[-1].get('tool')}: {text}"
+
     def construct_mcp_structed_content(self, response_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
         Construct MCP structured content dictionary from the given streaming chat response dictionary.
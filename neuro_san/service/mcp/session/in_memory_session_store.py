@@ -0,0 +1,144 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from collections import OrderedDict
+from os import environ
+
+import threading
+import time
+
+from neuro_san.service.mcp.interfaces.session_store import SessionStore
+from neuro_san.service.mcp.session.mcp_client_session import McpClientSession
+
+DEFAULT_MAX_SESSIONS: int = 10000
+DEFAULT_IDLE_TTL_SECONDS: float = 3600.0
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    SessionStore keeping sessions in the memory of this process.
+
+    Sessions are kept in an LRU ordered by last use, so that both
+    expiring idle sessions and evicting the least recently used one
+    when there are too many are O(1) per session:
+    idle sessions are always at the front of the order.
+
+    This store is not shared between forked server instances.
+    """
+
+    def __init__(self, max_sessions: int = None, idle_ttl_seconds: float = None):
+        """
+        Constructor
+
+        :param max_sessions: The maximum number of sessions to keep.
+                    If None, taken from the AGENT_MCP_MAX_SESSIONS environment variable.
+        :param idle_ttl_seconds: The number of seconds a session can go unused before it expires.
+                    If None, taken from the AGENT_MCP_SESSION_IDLE_TTL_SECONDS environment variable.
+        """
+        if max_sessions is None:
+            max_sessions = int(environ.get("AGENT_MCP_MAX_SESSIONS", str(DEFAULT_MAX_SESSIONS)))
+        if idle_ttl_seconds is None:
+            idle_ttl_seconds = float(environ.get("AGENT_MCP_SESSION_IDLE_TTL_SECONDS",
+                                                 str(DEFAULT_IDLE_TTL_SECONDS)))
+        self.max_sessions: int = max(1, max_sessions)
+        self.idle_ttl_seconds: float = idle_ttl_seconds
+        self.lock: threading.Lock = threading.Lock()
+        self.sessions: OrderedDict[str, McpClientSession] = OrderedDict()
+
+    def add_session(self, session_id: str):
+        """
+        Add a new, not yet active session.
+        :param session_id: The id of the new session
+        """
+        now: float = time.monotonic()
+        session = McpClientSession(session_id)
+        session.set_last_access_time(now)
+        with self.lock:
+            self._expire(now)
+            self.sessions[session_id] = session
+            self.sessions.move_to_end(session_id)
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+
+    def activate_session(self, session_id: str) -> bool:
+        """
+        Mark an existing session as active.
+        :param session_id: The id of the session to activate
+        :return: True if successful;
+                 False if session with given id does not exist
+        """
+        with self.lock:
+            session: McpClientSession = self._touch(session_id)
+            if session is None:
+                return False
+            session.set_active(True)
+            return True
+
+    def remove_session(self, session_id: str) -> bool:
+        """
+        Remove an existing session.
+        :param session_id: The id of the session to remove
+        :return: True if successful;
+                 False if session with given id does not exist
+        """
+        with self.lock:
+            return self.sessions.pop(session_id, None) is not None
+
+    def is_session_active(self, session_id: str) -> bool:
+        """
+        Check if the session with the given id is active.
+        :param session_id: The id of the session to check
+        :return: True if session exists and is active;
+                 False otherwise
+        """
+        with self.lock:
+            session: McpClientSession = self._touch(session_id)
+            return session is not None and session.is_active()
+
+    def get_size(self) -> int:
+        """
+        :return: The number of sessions currently kept
+        """
+        with self.lock:
+            return len(self.sessions)
+
+    def _touch(self, session_id: str) -> McpClientSession:
+        """
+        Mark a session as just used. Must be called with the lock held.
+        :param session_id: The id of the session
+        :return: The session, or None if it does not exist or has expired
+        """
+        now: float = time.monotonic()
+        self._expire(now)
+        session: McpClientSession = self.sessions.get(session_id)
+        if session is not None:
+            session.set_last_access_time(now)
+            self.sessions.move_to_end(session_id)
+        return session
+
+    def _expire(self, now: float):
+        """
+        Drop the sessions that have been idle for too long. Must be called with the lock held.
+        :param now: The current time.monotonic()
+        """
+        while self.sessions:
+            oldest: McpClientSession = next(iter(self.sessions.values()))
+            if now - oldest.get_last_access_time() <= self.idle_ttl_seconds:
+                break
+            self.sessions.popitem(last=False)
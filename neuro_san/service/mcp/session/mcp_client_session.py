@@ -33,6 +33,9 @@ class McpClientSession(ClientSession):
         # by handshake sequence and now active.
         self.session_is_active: bool = False
 
+        # When the session was last used, per time.monotonic()
+        self.last_access_time: float = 0.0
+
     def get_id(self) -> str:
         """
         Get the session id.
@@ -50,3 +53,15 @@ class McpClientSession(ClientSession):
         Set the session active flag.
         """
         self.session_is_active = is_active
+
+    def get_last_access_time(self) -> float:
+        """
+        Get the time the session was last used.
+        """
+        return self.last_access_time
+
+    def set_last_access_time(self, last_access_time: float) -> None:
+        """
+        Set the time the session was last used.
+        """
+        self.last_access_time = last_access_time
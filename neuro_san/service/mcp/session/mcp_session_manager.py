@@ -17,14 +17,12 @@
 """
 See class comment for details
 """
-import threading
-
-from typing import Dict
-
 import uuid
 import base64
 
 from neuro_san.service.mcp.interfaces.client_session_policy import ClientSessionPolicy
+from neuro_san.service.mcp.interfaces.session_store import SessionStore
+from neuro_san.service.mcp.session.in_memory_session_store import InMemorySessionStore
 from neuro_san.service.mcp.session.mcp_client_session import McpClientSession
 
 MCP_SESSION_ID: str = "Mcp-Session-Id"
@@ -34,12 +32,20 @@ MCP_PROTOCOL_VERSION: str = "MCP-Protocol-Version"
 class McpSessionManager(ClientSessionPolicy):
     """
     Class creating and managing client sessions with the MCP service.
+    Sessions themselves are kept by a SessionStore, which bounds their number
+    and expires idle ones, and which can be shared by forked server instances.
     """
 
-    def __init__(self):
-        # Lock to protect access to the sessions dictionary
-        self.lock: threading.Lock = threading.Lock()
-        self.sessions: Dict[str, McpClientSession] = {}
+    def __init__(self, session_store: SessionStore = None):
+        """
+        Constructor
+
+        :param session_store: The SessionStore to keep sessions in.
+                    Default None means sessions are kept in the memory of this process.
+        """
+        self.session_store: SessionStore = session_store
+        if self.session_store is None:
+            self.session_store = InMemorySessionStore()
 
     def create_session(self) -> McpClientSession:
         """
@@ -48,9 +54,8 @@ class McpSessionManager(ClientSessionPolicy):
         :return: The created MCPClientSession
         """
         session_id: str = self._generate_id()
-        client_session: McpClientSession = McpClientSession(session_id)
-        self.sessions[session_id] = client_session
-        return client_session
+        self.session_store.add_session(session_id)
+        return McpClientSession(session_id)
 
     def activate_session(self, session_id: str) -> bool:
         """
@@ -60,12 +65,9 @@ class McpSessionManager(ClientSessionPolicy):
         :return: True if successful;
                  False if session with given id does not exist
         """
-        with self.lock:
-            session: McpClientSession = self.sessions.get(session_id)
-            if session is not None:
-                session.set_active(True)
-                return True
+        if session_id is None:
             return False
+        return self.session_store.activate_session(session_id)
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -76,11 +78,7 @@ class McpSessionManager(ClientSessionPolicy):
         """
         if session_id is None:
             return False
-        with self.lock:
-            if session_id in self.sessions:
-                del self.sessions[session_id]
-                return True
-            return False
+        return self.session_store.remove_session(session_id)
 
     def is_session_active(self, session_id: str) -> bool:
         """
@@ -91,11 +89,7 @@ class McpSessionManager(ClientSessionPolicy):
         """
         if session_id is None:
             return False
-        with self.lock:
-            session: McpClientSession = self.sessions.get(session_id)
-            if session is not None:
-                return session.is_active()
-            return False
+        return self.session_store.is_session_active(session_id)
 
     def _generate_id(self) -> str:
         """
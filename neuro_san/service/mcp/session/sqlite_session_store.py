@@ -0,0 +1,222 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from os import environ
+
+import atexit
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+from neuro_san.service.mcp.interfaces.session_store import SessionStore
+from neuro_san.service.mcp.session.in_memory_session_store import DEFAULT_IDLE_TTL_SECONDS
+from neuro_san.service.mcp.session.in_memory_session_store import DEFAULT_MAX_SESSIONS
+
+# Sessions are not marked as used again more often than this,
+# so that checking a session does not always take a write lock on the database.
+TOUCH_RESOLUTION_SECONDS: float = 1.0
+
+
+# pylint: disable=too-many-instance-attributes
+class SqliteSessionStore(SessionStore):
+    """
+    SessionStore keeping sessions in a local SQLite database file,
+    so that all server instances forked on the same host see the same sessions.
+
+    Each process opens its own connection to the database the first time it
+    needs one, which makes it safe to create the store before the server forks.
+
+    Sessions idle for longer than the idle TTL are expired when they are looked up
+    and swept along with the least recently used sessions over the maximum count
+    every so many new sessions.  Between sweeps, the database can hold slightly
+    more than the maximum number of sessions.
+
+    Without a database path, the store keeps its database in a temporary directory
+    of its own, which the process that created the store removes on close() or at exit.
+    """
+
+    def __init__(self, db_path: str = None, max_sessions: int = None, idle_ttl_seconds: float = None):
+        """
+        Constructor
+
+        :param db_path: The path to the SQLite database file shared by the server instances.
+                    If None or empty, a database in a temporary directory owned by this store is used.
+        :param max_sessions: The maximum number of sessions to keep.
+                    If None, taken from the AGENT_MCP_MAX_SESSIONS environment variable.
+        :param idle_ttl_seconds: The number of seconds a session can go unused before it expires.
+                    If None, taken from the AGENT_MCP_SESSION_IDLE_TTL_SECONDS environment variable.
+        """
+        if max_sessions is None:
+            max_sessions = int(environ.get("AGENT_MCP_MAX_SESSIONS", str(DEFAULT_MAX_SESSIONS)))
+        if idle_ttl_seconds is None:
+            idle_ttl_seconds = float(environ.get("AGENT_MCP_SESSION_IDLE_TTL_SECONDS",
+                                                 str(DEFAULT_IDLE_TTL_SECONDS)))
+        # The temporary directory this store created for its database, if any,
+        # and the process which created it and is the only one to remove it.
+        self.temp_dir: str = None
+        self.owner_pid: int = os.getpid()
+        if not db_path:
+            self.temp_dir = tempfile.mkdtemp(prefix="neuro-san-mcp-sessions-")
+            db_path = os.path.join(self.temp_dir, "sessions.db")
+            # Forked server instances exit through here too, but only the owner removes anything.
+            atexit.register(self.close)
+        self.db_path: str = db_path
+        self.max_sessions: int = max(1, max_sessions)
+        self.idle_ttl_seconds: float = idle_ttl_seconds
+        self.sweep_interval: int = max(1, self.max_sessions // 10)
+        self.touch_resolution_seconds: float = min(TOUCH_RESOLUTION_SECONDS, self.idle_ttl_seconds / 10)
+        self.added_since_sweep: int = 0
+
+        self.lock: threading.Lock = threading.Lock()
+        self.connection: sqlite3.Connection = None
+        self.connection_pid: int = None
+
+    def add_session(self, session_id: str):
+        """
+        Add a new, not yet active session.
+        :param session_id: The id of the new session
+        """
+        with self.lock:
+            connection: sqlite3.Connection = self._get_connection()
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO mcp_sessions (session_id, active, last_access) "
+                                   "VALUES (?, 0, ?)", (session_id, time.time()))
+            self.added_since_sweep += 1
+            if self.added_since_sweep >= self.sweep_interval:
+                self.added_since_sweep = 0
+                self._sweep(connection)
+
+    def activate_session(self, session_id: str) -> bool:
+        """
+        Mark an existing session as active.
+        :param session_id: The id of the session to activate
+        :return: True if successful;
+                 False if session with given id does not exist
+        """
+        now: float = time.time()
+        with self.lock:
+            connection: sqlite3.Connection = self._get_connection()
+            with connection:
+                cursor: sqlite3.Cursor = connection.execute(
+                    "UPDATE mcp_sessions SET active = 1, last_access = ? "
+                    "WHERE session_id = ? AND last_access >= ?",
+                    (now, session_id, now - self.idle_ttl_seconds))
+                return cursor.rowcount > 0
+
+    def remove_session(self, session_id: str) -> bool:
+        """
+        Remove an existing session.
+        :param session_id: The id of the session to remove
+        :return: True if successful;
+                 False if session with given id does not exist
+        """
+        with self.lock:
+            connection: sqlite3.Connection = self._get_connection()
+            with connection:
+                cursor: sqlite3.Cursor = connection.execute(
+                    "DELETE FROM mcp_sessions WHERE session_id = ?", (session_id,))
+                return cursor.rowcount > 0
+
+    def is_session_active(self, session_id: str) -> bool:
+        """
+        Check if the session with the given id is active.
+        :param session_id: The id of the session to check
+        :return: True if session exists and is active;
+                 False otherwise
+        """
+        now: float = time.time()
+        with self.lock:
+            connection: sqlite3.Connection = self._get_connection()
+            row = connection.execute("SELECT active, last_access FROM mcp_sessions WHERE session_id = ?",
+                                     (session_id,)).fetchone()
+            if row is None:
+                return False
+            active, last_access = row
+            if now - last_access > self.idle_ttl_seconds:
+                with connection:
+                    connection.execute("DELETE FROM mcp_sessions WHERE session_id = ?", (session_id,))
+                return False
+            if now - last_access > self.touch_resolution_seconds:
+                with connection:
+                    connection.execute("UPDATE mcp_sessions SET last_access = ? WHERE session_id = ?",
+                                       (now, session_id))
+            return bool(active)
+
+    def get_size(self) -> int:
+        """
+        :return: The number of sessions currently kept
+        """
+        with self.lock:
+            connection: sqlite3.Connection = self._get_connection()
+            return connection.execute("SELECT COUNT(*) FROM mcp_sessions").fetchone()[0]
+
+    def close(self):
+        """
+        Close the connection of this process to the database.
+        If the database is in a temporary directory created by this store,
+        the process which created the store also removes that directory.
+        """
+        with self.lock:
+            if self.connection is not None and self.connection_pid == os.getpid():
+                self.connection.close()
+            self.connection = None
+            self.connection_pid = None
+            if self.temp_dir is not None and self.owner_pid == os.getpid():
+                # This takes the WAL and shared memory files with it.
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
+                self.temp_dir = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Must be called with the lock held.
+        :return: The connection to the database for this process
+        """
+        pid: int = os.getpid()
+        if self.connection is None or self.connection_pid != pid:
+            # A connection inherited from the parent process must not be used.
+            connection = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # Losing the last sessions on power failure is fine, waiting for the disk every time is not.
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS mcp_sessions ("
+                                   "session_id TEXT PRIMARY KEY, "
+                                   "active INTEGER NOT NULL, "
+                                   "last_access REAL NOT NULL)")
+                connection.execute("CREATE INDEX IF NOT EXISTS mcp_sessions_last_access "
+                                   "ON mcp_sessions (last_access)")
+            self.connection = connection
+            self.connection_pid = pid
+        return self.connection
+
+    def _sweep(self, connection: sqlite3.Connection):
+        """
+        Drop expired sessions and the least recently used sessions over the maximum count.
+        Must be called with the lock held.
+        :param connection: The connection to the database
+        """
+        with connection:
+            connection.execute("DELETE FROM mcp_sessions WHERE last_access < ?",
+                               (time.time() - self.idle_ttl_seconds,))
+            connection.execute("DELETE FROM mcp_sessions WHERE session_id IN ("
+                               "SELECT session_id FROM mcp_sessions ORDER BY last_access DESC "
+                               "LIMIT -1 OFFSET ?)", (self.max_sessions,))
@@ -0,0 +1,109 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+import threading
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
+from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+
+
+class McpToolsCache(AgentStateListener):
+    """
+    Keeps the MCP tool description of each agent network for as long as
+    that network does not change, so that tools/list does not have to
+    describe every network on every request.
+
+    An entry is only used for the very AgentNetwork instance it was made from.
+    Storage replaces the instance whenever a network is modified, so that
+    instance is the generation of the network.  Changes are also noticed via
+    the AgentStateListener callbacks, which drop entries right away.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Tuple[AgentNetwork, Dict[str, Any]]] = {}
+
+    def get_tool_description(self, agent_name: str, agent_network: AgentNetwork) -> Dict[str, Any]:
+        """
+        :param agent_name: name of an agent
+        :param agent_network: The current AgentNetwork for the agent
+        :return: The cached tool description for the agent network, or None if there is none.
+                The dictionary is shared between requests and must not be modified.
+        """
+        with self.lock:
+            entry: Tuple[AgentNetwork, Dict[str, Any]] = self.entries.get(agent_name)
+        if entry is None or entry[0] is not agent_network:
+            return None
+        return entry[1]
+
+    def put_tool_description(self, agent_name: str, agent_network: AgentNetwork,
+                             tool_description: Dict[str, Any]):
+        """
+        :param agent_name: name of an agent
+        :param agent_network: The AgentNetwork the tool description was made from
+        :param tool_description: The MCP tool description for the agent network
+        """
+        with self.lock:
+            self.entries[agent_name] = (agent_network, tool_description)
+
+    def get_size(self) -> int:
+        """
+        :return: The number of tool descriptions currently cached
+        """
+        with self.lock:
+            return len(self.entries)
+
+    def invalidate(self, agent_name: str):
+        """
+        Forgets the cached tool description for an agent
+        :param agent_name: name of an agent
+        """
+        with self.lock:
+            self.entries.pop(agent_name, None)
+
+    def agent_added(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being added to the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate(agent_name)
+
+    def agent_modified(self, agent_name: str, source: AgentStorageSource):
+        """
+        Existing agent has been modified in service scope.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate(agent_name)
+
+    def agent_removed(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being removed from the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate(agent_name)
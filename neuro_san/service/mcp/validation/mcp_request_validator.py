@@ -32,6 +32,10 @@ class McpRequestValidator(DictionaryValidator):
     """
     def __init__(self, validation_schema: Dict[str, Any]):
         self.validation_schema = validation_schema
+        # Compile the validator once. The schema is large and checking it is not cheap.
+        validator_class = jsonschema.validators.validator_for(self.validation_schema)
+        validator_class.check_schema(self.validation_schema)
+        self.validator: jsonschema.protocols.Validator = validator_class(self.validation_schema)
 
     def validate(self, candidate: Dict[str, Any]) -> List[str]:
         """
@@ -40,7 +44,7 @@ class McpRequestValidator(DictionaryValidator):
         :return: A list of error messages, if any
         """
         try:
-            jsonschema.validate(instance=candidate, schema=self.validation_schema)
+            self.validator.validate(candidate)
         except jsonschema.exceptions.ValidationError:
             # We don't return detailed validation errors to the client,
             # since they tend to be very long and complex.
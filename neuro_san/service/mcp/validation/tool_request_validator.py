@@ -28,10 +28,17 @@ import jsonschema
 
 from neuro_san.internals.interfaces.dictionary_validator import DictionaryValidator
 
+# Local refs of the form "#/components/schemas/Name"
+REF_DEFS_RE = re.compile(r"^#/components/schemas/([^/]+)$")
+
 
 class ToolRequestValidator(DictionaryValidator):
     """
     Class implementing MCP tool call request validation against tool call schema.
+
+    Extracting the sub-schema and compiling the validator for it is expensive,
+    so instances are meant to be created once per server and shared by all handlers
+    (see McpServerContext).  Validation itself keeps no state between calls.
     """
     def __init__(self, service_schema: Dict[str, Any]):
         """
@@ -46,6 +53,9 @@ class ToolRequestValidator(DictionaryValidator):
             service_schema,
             self.tool_request_method,
             self.required_property)
+        validator_class = jsonschema.validators.validator_for(self.request_schema)
+        validator_class.check_schema(self.request_schema)
+        self.validator: jsonschema.protocols.Validator = validator_class(self.request_schema)
 
     def validate(self, candidate: Dict[str, Any]) -> List[str]:
         """
@@ -54,7 +64,7 @@ class ToolRequestValidator(DictionaryValidator):
         :return: A list of error messages, if any
         """
         try:
-            jsonschema.validate(instance=candidate, schema=self.request_schema)
+            self.validator.validate(candidate)
         except jsonschema.exceptions.ValidationError:
             # We don't return detailed validation errors to a client,
             # since they tend to be very long and complex.
@@ -76,7 +86,6 @@ class ToolRequestValidator(DictionaryValidator):
         Recognizes local refs of the form:
           - "#/components/schemas/Name"
         """
-        _ref_defs_re = re.compile(r"^#/components/schemas/([^/]+)$")
         out: Set[str] = set()
 
         def visit(node: Any):
@@ -84,7 +93,7 @@ class ToolRequestValidator(DictionaryValidator):
                 # Collect $ref if present
                 ref = node.get("$ref")
                 if isinstance(ref, str):
-                    m_ref = _ref_defs_re.match(ref)
+                    m_ref = REF_DEFS_RE.match(ref)
                     if m_ref:
                         out.add(m_ref.group(1))
                 # Recurse through all values (including keys like allOf/anyOf/etc.)
@@ -98,42 +107,25 @@ class ToolRequestValidator(DictionaryValidator):
         visit(schema)
         return out
 
-    def _get_next(self, items: Dict[str, bool]) -> str:
-        """
-        Returns the next unprocessed item in the provided dictionary.
-        Iterates through the given dictionary to find the first key whose value
-        is `False`, indicating it has not yet been processed.
-        :param items: A dictionary where keys are items being processed
-                      and values are booleans indicating if the item has been processed.
-        :return: The key of the first unprocessed item, or `None` if all items are done.
-        """
-        for item, processed in items.items():
-            if not processed:
-                return item
-        return None
-
     def _get_all_defs(self, root_item: str, schemas: Dict[str, Any]) -> Set[str]:
         """
         :param root_item: The root item to start processing from
         :param schemas: The json schemas dictionary to process
         :return: A set of all item names which were recursively referenced by the given root item
         """
-        items: Dict[str, bool] = {root_item: False}
-        processing: bool = True
-        while processing:
-            next_item = self._get_next(items)
-            if next_item:
-                items[next_item] = True  # Mark as being processed
-                next_schema: Dict[str, Any] = schemas.get(next_item)
-                if not next_schema:
-                    raise ValueError(f"No schema found for {next_item}")
-                referenced_defs = self._get_schema_defs(next_schema)
-                for ref in referenced_defs:
-                    if ref not in items:
-                        items[ref] = False
-            else:
-                processing = False
-        return set(items)
+        # Worklist traversal: each schema is visited once.
+        items: Set[str] = {root_item}
+        worklist: List[str] = [root_item]
+        while worklist:
+            next_item: str = worklist.pop()
+            next_schema: Dict[str, Any] = schemas.get(next_item)
+            if not next_schema:
+                raise ValueError(f"No schema found for {next_item}")
+            for ref in self._get_schema_defs(next_schema):
+                if ref not in items:
+                    items.add(ref)
+                    worklist.append(ref)
+        return items
 
     def _extract_sub_schema(self, schema: Dict[str, Any], root_item: str, required_property: str) -> Dict[str, Any]:
         """
@@ -147,13 +139,13 @@ class ToolRequestValidator(DictionaryValidator):
         item_schema: Dict[str, Any] = schemas.get(root_item, {})
         if not item_schema:
             raise ValueError(f"No schema found for {root_item}")
-        result["components"] = {"schemas": copy.deepcopy(schemas)}
         referenced_defs = self._get_all_defs(root_item, schemas)
         # To reduce the overall size of the resulting schema,
-        # remove all schemas that are not referenced by the root item.
-        for one_schema in schemas:
-            if one_schema not in referenced_defs:
-                del result["components"]["schemas"][one_schema]
+        # only copy the schemas that are referenced by the root item.
+        result["components"] = {
+            "schemas": {name: copy.deepcopy(one_schema) for name, one_schema in schemas.items()
+                        if name in referenced_defs}
+        }
         # Add required properties to the root schema
         root_schema = result["components"]["schemas"][root_item]
         root_schema["required"] = [required_property]
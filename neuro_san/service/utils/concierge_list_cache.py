@@ -0,0 +1,129 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import threading
+
+from neuro_san.interfaces.concierge_session import ConciergeSession
+from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
+from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.internals.utils.etag_util import EtagUtil
+from neuro_san.session.direct_concierge_session import DirectConciergeSession
+
+
+class ConciergeListCache(AgentStateListener):
+    """
+    Keeps the unfiltered concierge listing of an AgentNetworkStorage
+    for as long as the contents of that storage do not change.
+
+    UIs tend to poll the list endpoint, but the set of agent networks
+    changes rarely.  The listing is computed at most once per storage
+    generation, along with a strong ETag for it and an index of agent name
+    to position in the listing that makes paring down the list for
+    authorization cheap.
+
+    Changes are noticed via the AgentStateListener callbacks,
+    with the storage generation as a backstop.
+    """
+
+    def __init__(self, network_storage: AgentNetworkStorage):
+        """
+        Constructor
+
+        :param network_storage: The AgentNetworkStorage whose listing is to be cached
+        """
+        self.network_storage: AgentNetworkStorage = network_storage
+        self.lock = threading.Lock()
+
+        self.generation: int = None
+        self.result_dict: Dict[str, Any] = None
+        self.etag: str = None
+        self.name_index: Dict[str, int] = None
+
+        self.network_storage.add_listener(self)
+
+    def get_listing(self) -> Tuple[Dict[str, Any], str, Dict[str, int]]:
+        """
+        :return: A tuple of:
+            * A dictionary version of the ConciergeResponse protobuf structure
+              for all agents in the storage. Has the following keys:
+                "agents" - the sequence of dictionaries describing available agents
+            * The strong ETag of that listing
+            * A dictionary of agent name to position in the "agents" list
+            The dictionaries are shared between requests and must not be modified.
+        """
+        generation: int = self.network_storage.get_generation()
+        with self.lock:
+            if self.result_dict is None or self.generation != generation:
+                self.refresh_locked(generation)
+            return self.result_dict, self.etag, self.name_index
+
+    def refresh_locked(self, generation: int):
+        """
+        Recomputes the listing. Assumes the lock is held.
+
+        :param generation: The storage generation as of just before the listing is computed
+        """
+        session: ConciergeSession = DirectConciergeSession(self.network_storage)
+        result_dict: Dict[str, Any] = session.list({})
+
+        empty: List[Dict[str, Any]] = []
+        name_index: Dict[str, int] = {}
+        for index, agent_info in enumerate(result_dict.get("agents", empty)):
+            name_index[agent_info.get("agent_name")] = index
+
+        self.result_dict = result_dict
+        self.etag = EtagUtil.compute_etag(result_dict)
+        self.name_index = name_index
+        self.generation = generation
+
+    def invalidate(self):
+        """
+        Forgets the cached listing
+        """
+        with self.lock:
+            self.result_dict = None
+
+    def agent_added(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being added to the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate()
+
+    def agent_modified(self, agent_name: str, source: AgentStorageSource):
+        """
+        Existing agent has been modified in service scope.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate()
+
+    def agent_removed(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being removed from the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate()
@@ -0,0 +1,353 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Deque
+from typing import Dict
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import uuid
+
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from collections import deque
+
+
+# pylint: disable=too-many-instance-attributes
+class FairRequestQueue:
+    """
+    Weighted fair queueing of streaming chat requests across tenants,
+    in front of the acquisition of an executor from the server's AsyncioExecutorPool.
+
+    Without this, requests are served first-come-first-served, so a single tenant
+    firing many concurrent requests can starve everyone else on the same server process.
+    With it, at most max_concurrent requests run at once. When a slot frees up,
+    it goes to the waiting request with the smallest virtual finish tag, where each
+    new request of a tenant gets a tag 1/weight past the tenant's previous one.
+    Tenants get slots in proportion to their weights, and a tenant that has not asked
+    for anything in a while does not have to wait behind another tenant's backlog.
+    Tenants can also be capped in how many of their requests run concurrently.
+
+    Each granted slot gets an unguessable token minted here. The server puts it in the
+    request metadata under SLOT_METADATA_KEY, so calls an agent network makes to external
+    agents on the same server carry it, and a request with the token of a slot that is
+    still held runs on that slot without waiting.  Otherwise nested requests could wait
+    forever for slots held by the very requests waiting on them.  The slot stays with
+    the tenant it was granted to, and is freed when the last request sharing it is done.
+    Tokens that do not belong to a held slot are ignored.
+
+    The tenant of a request is the value of a configurable request metadata field.
+    There is one instance per server process (see ServerContext) configured from
+    these environment variables:
+        AGENT_FAIR_QUEUE_METADATA_KEY       The request metadata field holding the tenant.
+                                            Requests are not queued when this is not set.
+        AGENT_FAIR_QUEUE_TENANT_MAX_CONCURRENT
+                                            The default cap on concurrent requests per tenant
+        AGENT_FAIR_QUEUE_TENANTS            A JSON dictionary of tenant name to a dictionary
+                                            with optional "weight" and "max_concurrent" keys
+                                            overriding the defaults for that tenant.
+    The overall number of concurrent requests comes from AGENT_MAX_CONCURRENT_REQUESTS.
+
+    Requests from any thread or event loop can share one instance.
+    """
+
+    # The tenant of requests that do not have the metadata field
+    ANONYMOUS: str = "anonymous"
+
+    DEFAULT_MAX_CONCURRENT: int = 50
+
+    # The request metadata field that carries the token of the slot a request runs on
+    # to nested requests.  Only the server sets it.
+    SLOT_METADATA_KEY: str = "fair_queue_slot"
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, metadata_key: str = None,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+                 tenant_max_concurrent: int = None,
+                 tenants: Dict[str, Dict[str, Any]] = None):
+        """
+        Constructor
+
+        :param metadata_key: The request metadata field holding the tenant.
+                    Default None means requests are not queued at all.
+        :param max_concurrent: The maximum number of requests running at once
+        :param tenant_max_concurrent: The default maximum number of requests running
+                    at once for any single tenant.  Default None means no per-tenant cap.
+        :param tenants: A dictionary of tenant name to a dictionary with optional
+                    "weight" and "max_concurrent" keys overriding the defaults.
+        """
+        self.metadata_key: str = metadata_key
+        self.max_concurrent: int = max(1, max_concurrent)
+        self.tenant_max_concurrent: int = tenant_max_concurrent
+        self.tenants: Dict[str, Dict[str, Any]] = tenants or {}
+
+        self.lock = threading.Lock()
+        self.total_running: int = 0
+        self.running: Dict[str, int] = {}
+        # Tenant -> FIFO of waiter dictionaries. Tags only ever increase within a tenant.
+        self.waiting: Dict[str, Deque[Dict[str, Any]]] = {}
+        # Tenant -> virtual finish tag of its most recent request,
+        # only kept while the tenant has requests waiting or running
+        self.last_tags: Dict[str, float] = {}
+        # Slot token -> dictionary with the "tenant" the slot was granted to
+        # and the "count" of running requests sharing it
+        self.slots: Dict[str, Dict[str, Any]] = {}
+        self.virtual_time: float = 0.0
+
+    @staticmethod
+    def create_from_environment() -> "FairRequestQueue":
+        """
+        :return: A FairRequestQueue configured from environment variables
+        """
+        logger = logging.getLogger(FairRequestQueue.__name__)
+
+        metadata_key: str = os.environ.get("AGENT_FAIR_QUEUE_METADATA_KEY") or None
+
+        max_concurrent: int = FairRequestQueue.DEFAULT_MAX_CONCURRENT
+        tenant_max_concurrent: int = None
+        try:
+            max_concurrent = int(os.environ.get("AGENT_MAX_CONCURRENT_REQUESTS", max_concurrent))
+            tenant_max_concurrent = int(os.environ.get("AGENT_FAIR_QUEUE_TENANT_MAX_CONCURRENT", "0")) or None
+        except ValueError as exception:
+            logger.warning("Ignoring bad fair queue concurrency setting: %s", str(exception))
+
+        tenants: Dict[str, Dict[str, Any]] = None
+        tenants_json: str = os.environ.get("AGENT_FAIR_QUEUE_TENANTS")
+        if tenants_json:
+            try:
+                tenants = json.loads(tenants_json)
+            except json.JSONDecodeError as exception:
+                logger.warning("Ignoring bad AGENT_FAIR_QUEUE_TENANTS: %s", str(exception))
+
+        return FairRequestQueue(metadata_key, max_concurrent, tenant_max_concurrent, tenants)
+
+    def set_max_concurrent(self, max_concurrent: int):
+        """
+        :param max_concurrent: The maximum number of requests running at once
+        """
+        with self.lock:
+            self.max_concurrent = max(1, max_concurrent)
+            self.dispatch()
+
+    def is_enabled(self) -> bool:
+        """
+        :return: True if requests are queued
+        """
+        return self.metadata_key is not None
+
+    def get_tenant(self, metadata: Dict[str, Any]) -> str:
+        """
+        :param metadata: The request metadata
+        :return: The tenant the request belongs to
+        """
+        tenant: Any = None
+        if metadata is not None and self.metadata_key is not None:
+            tenant = metadata.get(self.metadata_key)
+        if not tenant:
+            return self.ANONYMOUS
+        return str(tenant)
+
+    def get_weight(self, tenant: str) -> float:
+        """
+        :param tenant: The tenant
+        :return: The share of the slots the tenant gets relative to others. Default 1.0
+        """
+        weight: float = float(self.tenants.get(tenant, {}).get("weight", 1.0))
+        return max(weight, 0.001)
+
+    def get_tenant_max_concurrent(self, tenant: str) -> int:
+        """
+        :param tenant: The tenant
+        :return: The maximum number of requests of the tenant running at once,
+                or None if there is no cap.
+        """
+        return self.tenants.get(tenant, {}).get("max_concurrent", self.tenant_max_concurrent)
+
+    async def acquire(self, tenant: str, slot: str = None) -> str:
+        """
+        Waits until the tenant's request may run.
+        Every call must eventually be followed by a call to release() with the returned slot.
+
+        :param tenant: The tenant the request belongs to
+        :param slot: The slot token from the metadata of the request, if any.
+                    A request with the token of a slot that is still held
+                    is part of the request holding it, and runs on that slot without waiting.
+        :return: The token of the slot the request runs on,
+                or None if requests are not queued
+        """
+        if not self.is_enabled():
+            return None
+
+        loop: AbstractEventLoop = asyncio.get_running_loop()
+        waiter: Dict[str, Any] = {
+            "tenant": tenant,
+            "loop": loop,
+            "future": loop.create_future(),
+            "slot": None,
+        }
+        with self.lock:
+            if slot and slot in self.slots:
+                self.slots[slot]["count"] += 1
+                return slot
+
+            tag: float = max(self.virtual_time, self.last_tags.get(tenant, 0.0)) + 1.0 / self.get_weight(tenant)
+            self.last_tags[tenant] = tag
+            waiter["tag"] = tag
+            self.waiting.setdefault(tenant, deque()).append(waiter)
+            self.dispatch()
+
+        try:
+            await waiter.get("future")
+        except asyncio.CancelledError:
+            with self.lock:
+                if waiter.get("slot") is not None:
+                    # Got the slot just as we were cancelled. Give it back.
+                    self.release_locked(waiter.get("slot"))
+                else:
+                    self.remove_waiter(waiter)
+            raise
+
+        return waiter.get("slot")
+
+    def release(self, slot: str):
+        """
+        Lets the next waiting request run.
+
+        :param slot: The slot token returned by acquire()
+        """
+        if not self.is_enabled() or slot is None:
+            return
+
+        with self.lock:
+            self.release_locked(slot)
+
+    def release_locked(self, slot: str):
+        """
+        Lets the next waiting request run. Must be called with the lock held.
+
+        :param slot: The slot token returned by acquire()
+        """
+        slot_dict: Dict[str, Any] = self.slots.get(slot)
+        if slot_dict is None:
+            return
+        slot_dict["count"] -= 1
+        if slot_dict.get("count") > 0:
+            # Other requests are still running on the same slot
+            return
+        del self.slots[slot]
+
+        # Free the slot of the tenant it was granted to,
+        # which is not necessarily the tenant of the last request to use it.
+        tenant: str = slot_dict.get("tenant")
+        self.total_running -= 1
+        self.running[tenant] -= 1
+        if self.running[tenant] <= 0:
+            del self.running[tenant]
+            self.forget_if_idle(tenant)
+        self.dispatch()
+
+    def remove_waiter(self, waiter: Dict[str, Any]):
+        """
+        Forgets about a request that stopped waiting. Must be called with the lock held.
+
+        :param waiter: The waiter dictionary of the request
+        """
+        tenant: str = waiter.get("tenant")
+        tenant_queue: Deque[Dict[str, Any]] = self.waiting.get(tenant)
+        if tenant_queue is None:
+            return
+        try:
+            tenant_queue.remove(waiter)
+        except ValueError:
+            pass
+        if len(tenant_queue) == 0:
+            del self.waiting[tenant]
+            self.forget_if_idle(tenant)
+
+    def forget_if_idle(self, tenant: str):
+        """
+        Forgets the last tag of a tenant with nothing waiting or running,
+        so that tenants that come and go do not pile up.
+        Must be called with the lock held.
+
+        Nothing is lost: once all of a tenant's requests have been granted,
+        the virtual time is at least as far along as the tenant's last tag.
+
+        :param tenant: The tenant
+        """
+        if tenant not in self.waiting and tenant not in self.running:
+            self.last_tags.pop(tenant, None)
+
+    def dispatch(self):
+        """
+        Grants free slots to waiting requests in order of their tags.
+        Must be called with the lock held.
+        """
+        while self.total_running < self.max_concurrent:
+
+            # Find the eligible request with the smallest tag.
+            # Only the head of each tenant's queue need be considered.
+            best: Dict[str, Any] = None
+            for tenant, tenant_queue in self.waiting.items():
+                cap: int = self.get_tenant_max_concurrent(tenant)
+                if cap is not None and self.running.get(tenant, 0) >= cap:
+                    continue
+                head: Dict[str, Any] = tenant_queue[0]
+                if best is None or head.get("tag") < best.get("tag"):
+                    best = head
+
+            if best is None:
+                return
+
+            tenant: str = best.get("tenant")
+            self.remove_waiter(best)
+            self.virtual_time = max(self.virtual_time, best.get("tag"))
+            slot: str = str(uuid.uuid4())
+            self.slots[slot] = {"tenant": tenant, "count": 1}
+            best["slot"] = slot
+            self.total_running += 1
+            self.running[tenant] = self.running.get(tenant, 0) + 1
+
+            loop: AbstractEventLoop = best.get("loop")
+            loop.call_soon_threadsafe(self.wake, best.get("future"))
+
+    @staticmethod
+    def wake(future: Future):
+        """
+        Lets a waiting request proceed. Called on the request's own event loop.
+
+        :param future: The Future the request is waiting on
+        """
+        if not future.done():
+            future.set_result(True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary describing the current state of the queue with keys:
+                    "running"   Tenant -> number of its requests running
+                    "waiting"   Tenant -> number of its requests waiting
+        """
+        with self.lock:
+            return {
+                "running": dict(self.running),
+                "waiting": {tenant: len(tenant_queue) for tenant, tenant_queue in self.waiting.items()},
+            }
@@ -17,28 +17,62 @@
 """
 See class comment for details
 """
+from typing import Any
+from typing import Dict
+
 import json
+import threading
 
 from neuro_san import TOP_LEVEL_DIR
 from neuro_san.internals.interfaces.dictionary_validator import DictionaryValidator
+from neuro_san.internals.utils.env_util import EnvUtil
 from neuro_san.service.mcp.validation.mcp_request_validator import McpRequestValidator
+from neuro_san.service.mcp.validation.tool_request_validator import ToolRequestValidator
 from neuro_san.service.mcp.interfaces.client_session_policy import ClientSessionPolicy
+from neuro_san.service.mcp.session.in_memory_session_store import InMemorySessionStore
 from neuro_san.service.mcp.session.mcp_no_sessions_policy import McpNoSessionsPolicy
+from neuro_san.service.mcp.session.mcp_session_manager import McpSessionManager
+from neuro_san.service.mcp.session.sqlite_session_store import SqliteSessionStore
 from neuro_san.service.mcp.util.mcp_request_util import McpRequestUtil
+from neuro_san.service.mcp.util.mcp_tools_cache import McpToolsCache
 
 
+# pylint: disable=too-many-instance-attributes
 class McpServerContext:
     """
     Class representing the server run-time context,
     necessary for handling MCP clients requests.
     """
 
+    DEFAULT_TOOLS_LIST_CONCURRENCY: int = 16
+
     def __init__(self):
         self.protocol_schema_filepath = None
         self.protocol_schema = None
         self.session_policy = None
         self.request_validator = None
+        self.tool_request_validator: ToolRequestValidator = None
+        self.tools_cache: McpToolsCache = McpToolsCache()
+        # How many agent networks a tools/list request describes at once
+        self.tools_list_concurrency: int = max(1, EnvUtil.get_int("AGENT_MCP_TOOLS_LIST_CONCURRENCY",
+                                                                  self.DEFAULT_TOOLS_LIST_CONCURRENCY))
+        self.lock = threading.Lock()
         self.enabled: bool = False
+        # One of "none", "memory" or "sqlite"
+        self.session_store_type: str = "none"
+        self.session_db_path: str = None
+
+    def set_session_store(self, session_store_type: str, session_db_path: str = None) -> None:
+        """
+        Set where MCP client sessions are kept. To be called before the service is enabled.
+        :param session_store_type: "none" if client sessions are not supported;
+                 "memory" to keep sessions in the memory of each server instance;
+                 "sqlite" to keep sessions in an SQLite database shared by the server instances
+        :param session_db_path: The SQLite database file for the "sqlite" session store.
+                 If None or empty, a temporary file is used.
+        """
+        self.session_store_type = session_store_type.lower()
+        self.session_db_path = session_db_path
 
     def set_enabled(self, enabled: bool) -> None:
         """
@@ -58,9 +92,23 @@ class McpServerContext:
                 raise RuntimeError(f"Cannot load MCP protocol schema from "
                                    f"'{self.protocol_schema_filepath}': {str(exc)}") from exc
             # Create a new session manager:
-            self.session_policy = McpNoSessionsPolicy()
+            self.session_policy = self.create_session_policy()
         self.enabled = enabled
 
+    def create_session_policy(self) -> ClientSessionPolicy:
+        """
+        Create the session policy per the session store type.
+        This happens before the server forks, so that a "sqlite" store
+        is shared by all server instances.
+        :return: The ClientSessionPolicy
+        """
+        if self.session_store_type == "memory":
+            return McpSessionManager(InMemorySessionStore())
+        if self.session_store_type == "sqlite":
+            # Without a database path, the store makes and cleans up a temporary one.
+            return McpSessionManager(SqliteSessionStore(self.session_db_path))
+        return McpNoSessionsPolicy()
+
     def is_enabled(self) -> bool:
         """
         Check if the MCP service is enabled.
@@ -82,6 +130,35 @@ class McpServerContext:
         """
         return self.request_validator
 
+    def get_tool_request_validator(self, service_spec: Dict[str, Any]) -> ToolRequestValidator:
+        """
+        Get the validator for tool call arguments, shared by all MCP requests.
+        It is built from the service spec the first time it is asked for,
+        which http servers do once at startup.
+
+        :param service_spec: The OpenAPI schema dictionary for the neuro-san service API
+        :return: The ToolRequestValidator
+        """
+        if self.tool_request_validator is None:
+            with self.lock:
+                if self.tool_request_validator is None:
+                    self.tool_request_validator = ToolRequestValidator(service_spec)
+        return self.tool_request_validator
+
+    def get_tools_cache(self) -> McpToolsCache:
+        """
+        Get the cache of MCP tool descriptions, shared by all tools/list requests.
+        :return: The McpToolsCache
+        """
+        return self.tools_cache
+
+    def get_tools_list_concurrency(self) -> int:
+        """
+        Get how many agent networks a tools/list request describes at once.
+        :return: The maximum number of tool descriptions built concurrently
+        """
+        return self.tools_list_concurrency
+
     def get_session_policy(self) -> ClientSessionPolicy:
         """
         Get the MCP session policy for this context.
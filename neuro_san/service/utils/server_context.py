@@ -25,10 +25,14 @@ from neuro_san.interfaces.agent_session_constants import AgentSessionConstants
 from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.internals.network_providers.expiring_agent_network_storage import ExpiringAgentNetworkStorage
+from neuro_san.internals.run_context.langchain.core.prompt_template_cache import PromptTemplateCache
+from neuro_san.service.utils.concierge_list_cache import ConciergeListCache
+from neuro_san.service.utils.fair_request_queue import FairRequestQueue
 from neuro_san.service.utils.server_status import ServerStatus
 from neuro_san.service.utils.mcp_server_context import McpServerContext
 
 
+# pylint: disable=too-many-instance-attributes
 class ServerContext:
     """
     Class that contains global-ish state for each instance of a server.
@@ -40,6 +44,7 @@ class ServerContext:
         """
         self.server_status: ServerStatus = None
         self.executor_pool = AsyncioExecutorPool(reuse_mode=True)
+        self.fair_request_queue: FairRequestQueue = FairRequestQueue.create_from_environment()
         self.queues: Queue[AsyncCollatingQueue] = Queue()
         self.mcp_server_context: McpServerContext = McpServerContext()
         self.server_port: int = AgentSessionConstants.DEFAULT_HTTP_PORT
@@ -51,12 +56,30 @@ class ServerContext:
             "temp": ExpiringAgentNetworkStorage()
         }
 
+        # UIs poll the listing of public agents
+        self.concierge_list_cache = ConciergeListCache(self.network_storage_dict.get("public"))
+
+        # Compiled prompt templates go stale when their agent network changes
+        prompt_template_cache: PromptTemplateCache = PromptTemplateCache.get_instance()
+        for network_storage in self.network_storage_dict.values():
+            network_storage.add_listener(prompt_template_cache)
+
+        # MCP tools are only listed from public storage
+        self.network_storage_dict.get("public").add_listener(self.mcp_server_context.get_tools_cache())
+
     def get_executor_pool(self) -> AsyncioExecutorPool:
         """
         :return: The AsyncioExecutorPool
         """
         return self.executor_pool
 
+    def get_fair_request_queue(self) -> FairRequestQueue:
+        """
+        :return: The FairRequestQueue that streaming chat requests wait in
+                before they get an executor from the pool
+        """
+        return self.fair_request_queue
+
     def set_server_status(self, server_status: ServerStatus):
         """
         Sets the server status
@@ -75,6 +98,12 @@ class ServerContext:
         """
         return self.network_storage_dict
 
+    def get_concierge_list_cache(self) -> ConciergeListCache:
+        """
+        :return: The ConciergeListCache for the public agent networks
+        """
+        return self.concierge_list_cache
+
     def get_queues(self) -> Queue[AsyncCollatingQueue]:
         """
         :return: The janus Queue of queues for temporary agent deployment
@@ -18,7 +18,6 @@
 from typing import Any
 from typing import Dict
 from typing import Generator
-from typing import List
 
 from asyncio import Future
 from contextlib import suppress
@@ -125,18 +124,12 @@ class AsyncDirectAgentSession(AsyncAgentSession):
         """
         self._log_agent_network_usage("connectivity")
         _ = request_dict
-        response_dict: Dict[str, Any] = {
-        }
 
-        reporter = ConnectivityReporter(self.agent_network)
-        config: Dict[str, Any] = self.agent_network.get_config()
-        metadata: Dict[str, Any] = config.get("metadata")
-        connectivity_info: List[Dict[str, Any]] = reporter.report_network_connectivity()
-        response_dict = {
-            "connectivity_info": connectivity_info,
-        }
-        if metadata is not None:
-            response_dict["metadata"] = metadata
+        # Networks held in AgentNetworkStorage have this computed already
+        response_dict: Dict[str, Any] = self.agent_network.get_connectivity()
+        if response_dict is None:
+            reporter = ConnectivityReporter(self.agent_network)
+            response_dict = reporter.report_connectivity_response()
 
         return response_dict
 
@@ -177,6 +170,7 @@ class AsyncDirectAgentSession(AsyncAgentSession):
         # Create a message filter so as to minimize network traffic per what the user wants
         chat_filter: Dict[str, Any] = request_dict.get("chat_filter")
         message_filter: MessageFilter = MessageFilterFactory.create_message_filter(chat_filter)
+        self.invocation_context.set_stream_tokens(MessageFilterFactory.is_stream_tokens(chat_filter))
 
         chat_context: Dict[str, Any] = request_dict.get("chat_context")
         sly_data: Dict[str, Any] = request_dict.get("sly_data")
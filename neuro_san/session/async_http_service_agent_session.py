@@ -18,10 +18,13 @@
 from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import Tuple
 
 import asyncio
 import json
 
+from http import HTTPStatus
+
 from aiohttp import ClientPayloadError
 from aiohttp import ClientOSError
 from aiohttp import ClientSession
@@ -45,19 +48,41 @@ class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSe
                     protobufs structure. Has the following keys:
                 "function" - the dictionary description of the function
         """
+        function_response, _ = await self.function_with_etag(request_dict)
+        return function_response
+
+    async def function_with_etag(self, request_dict: Dict[str, Any],
+                                 etag: str = None) -> Tuple[Dict[str, Any], str]:
+        """
+        Conditional version of function() for callers that cache what they get.
+
+        :param request_dict: A dictionary version of the FunctionRequest
+                    protobufs structure. Has the following keys:
+                        <None>
+        :param etag: The ETag that came with a previous response, if any.
+                    It is sent as If-None-Match.
+        :return: A tuple of (FunctionResponse dictionary, ETag of the response).
+                The FunctionResponse dictionary is None when the server says
+                the ETag passed in is still good.  The ETag is None when the server
+                does not send one.
+        """
         path: str = self.get_request_path("function")
-        result_dict: Dict[str, Any] = None
+        headers: Dict[str, Any] = dict(self.get_headers())
+        if etag is not None:
+            headers["If-None-Match"] = etag
         try:
             timeout: ClientTimeout = None
             if self.timeout_in_seconds is not None:
                 timeout = ClientTimeout(self.timeout_in_seconds)
 
-            async with ClientSession(headers=self.get_headers(),
+            async with ClientSession(headers=headers,
                                      timeout=timeout
                                      ) as session:
                 async with session.get(path, json=request_dict) as response:
-                    result_dict = await response.json()
-                    return result_dict
+                    if response.status == HTTPStatus.NOT_MODIFIED:
+                        return None, etag
+                    result_dict: Dict[str, Any] = await response.json()
+                    return result_dict, response.headers.get("ETag")
         except Exception as exc:  # pylint: disable=broad-exception-caught
             raise ValueError(self.help_message(path)) from exc
 
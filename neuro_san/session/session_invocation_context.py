@@ -36,6 +36,8 @@ from neuro_san.internals.interfaces.invocation_context import InvocationContext
 from neuro_san.internals.journals.message_journal import MessageJournal
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.metrics.agent_span_recorder import AgentSpanRecorder
+from neuro_san.internals.utils.env_util import EnvUtil
 
 
 # pylint: disable=too-many-instance-attributes
@@ -46,6 +48,10 @@ class SessionInvocationContext(InvocationContext):
     service call or library call.
     """
 
+    # How many journal messages are handed to the collating queue at once.
+    # Read from AGENT_JOURNAL_BATCH_SIZE once, the first time it is needed.
+    _journal_batch_size: int = None
+
     # pylint: disable=too-many-arguments
     # pylint: disable=too-many-positional-arguments
     def __init__(self, agent_name: str,
@@ -88,12 +94,24 @@ class SessionInvocationContext(InvocationContext):
         self.asyncio_executor: AsyncioExecutor = self.async_executors_pool.get_executor()
         self.request_reporting: Dict[str, Any] = {}
         self.origination: Origination = Origination()
+        self.span_recorder: AgentSpanRecorder = AgentSpanRecorder()
+        self.stream_tokens: bool = False
 
         # Anything that has to do with the queue will need a new instance in
         # safe_shallow_copy() below to keep AsyncDirectAgentSessions happy.
-        self.queue: AsyncCollatingQueue = AsyncCollatingQueue()
+        self.journal_batch_size: int = SessionInvocationContext.get_journal_batch_size()
+        self.queue: AsyncCollatingQueue = AsyncCollatingQueue(batch_size=self.journal_batch_size)
         self.journal: Journal = MessageJournal(self.queue)
 
+    @staticmethod
+    def get_journal_batch_size() -> int:
+        """
+        :return: The number of journal messages handed to the collating queue at once
+        """
+        if SessionInvocationContext._journal_batch_size is None:
+            SessionInvocationContext._journal_batch_size = EnvUtil.get_int("AGENT_JOURNAL_BATCH_SIZE", 1)
+        return SessionInvocationContext._journal_batch_size
+
     def start(self):
         """
         Starts the active components of this invocation context.
@@ -164,6 +182,26 @@ class SessionInvocationContext(InvocationContext):
         """
         return self.request_reporting
 
+    def get_span_recorder(self) -> AgentSpanRecorder:
+        """
+        :return: The AgentSpanRecorder collecting per-agent timing for the request
+        """
+        return self.span_recorder
+
+    def is_stream_tokens(self) -> bool:
+        """
+        :return: True if the text generated by the front man's LLM is to be
+                streamed to the client as it is produced.
+        """
+        return self.stream_tokens
+
+    def set_stream_tokens(self, stream_tokens: bool):
+        """
+        :param stream_tokens: True if the text generated by the front man's LLM is to be
+                streamed to the client as it is produced.
+        """
+        self.stream_tokens = stream_tokens
+
     def get_llm_factory(self) -> ContextTypeLlmFactory:
         """
         :return: The ContextTypeLlmFactory instance for the session
@@ -213,10 +251,14 @@ class SessionInvocationContext(InvocationContext):
         invocation_context: SessionInvocationContext = copy(self)
 
         # We need a different queue in order to call external agents with direct sessions.
-        invocation_context.queue: AsyncCollatingQueue = AsyncCollatingQueue()
+        invocation_context.queue: AsyncCollatingQueue = AsyncCollatingQueue(batch_size=self.journal_batch_size)
 
         # Now that the queue has changed, we need a new Journal as well
         # to be sure that the messages are sent to the correct queue.
         invocation_context.journal: Journal = MessageJournal(invocation_context.queue)
 
+        # The called network times its own request. From the caller's side
+        # the whole call shows up as a single span.
+        invocation_context.span_recorder: AgentSpanRecorder = AgentSpanRecorder()
+
         return invocation_context
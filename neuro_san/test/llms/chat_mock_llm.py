@@ -21,6 +21,8 @@ from typing import Iterator
 from typing import List
 from typing import Optional
 
+from time import sleep
+
 from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage
@@ -31,7 +33,8 @@ from langchain_core.outputs import ChatGenerationChunk
 from langchain_core.outputs import ChatResult
 from pydantic import ConfigDict
 from pydantic import Field
-from tiktoken import get_encoding
+
+from neuro_san.internals.run_context.langchain.token_counting.token_estimator import TokenEstimator
 
 
 class ChatMockLlm(BaseChatModel):
@@ -45,6 +48,10 @@ class ChatMockLlm(BaseChatModel):
     model_name: str = Field(default=None, alias="model")
     # Maybe useful for testing
     max_retries: Optional[int] = None
+    # Seconds to wait before answering, to simulate LLM latency
+    delay_seconds: float = 0.0
+    # Seconds to wait before each streamed chunk, to simulate token generation
+    stream_delay_seconds: float = 0.0
 
     # Accept both argument name and alias
     model_config = ConfigDict(populate_by_name=True)
@@ -73,6 +80,8 @@ class ChatMockLlm(BaseChatModel):
         :return: chat result containing chat generation which includes ai message.
         """
 
+        self._simulate_latency()
+
         # The last message should be human message
         last_message = messages[-1]
         content = last_message.content
@@ -122,6 +131,8 @@ class ChatMockLlm(BaseChatModel):
         :yields: ChatGenerationChunk objects containing the streamed model output.
         """
 
+        self._simulate_latency()
+
         # The last message should be human message
         last_message = messages[-1]
         content = last_message.content
@@ -145,6 +156,9 @@ class ChatMockLlm(BaseChatModel):
             )
             input_tokens = 0
 
+            if self.stream_delay_seconds > 0:
+                sleep(self.stream_delay_seconds)
+
             if run_manager:
                 # This is optional in newer versions of LangChain
                 # The on_llm_new_token will be called automatically
@@ -166,6 +180,15 @@ class ChatMockLlm(BaseChatModel):
 
         yield chunk
 
+    def _simulate_latency(self):
+        """
+        Blocks for the configured delay_seconds, if any.
+        LangChain runs the sync methods in an executor thread when called asynchronously,
+        so this does not hold up the event loop.
+        """
+        if self.delay_seconds > 0:
+            sleep(self.delay_seconds)
+
     def _num_tokens_from_string(self, string: str, encoding_name: str = "o200k_base") -> int:
         """
         Returns the number of tokens in a text string using tiktoken.
@@ -176,8 +199,8 @@ class ChatMockLlm(BaseChatModel):
 
         :return: Number of token.
         """
-        encoding = get_encoding(encoding_name)
-        num_tokens = len(encoding.encode(string))
+        # The encoder is shared and counts for long strings are remembered.
+        num_tokens = TokenEstimator.estimate_text(string, encoding_name)
         return num_tokens
 
     @property
@@ -0,0 +1,147 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import json
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages import BaseMessage
+from langchain_core.messages import HumanMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_core.outputs import ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from neuro_san.test.llms.chat_mock_llm import ChatMockLlm
+
+
+class ToolCallingMockLlm(ChatMockLlm):
+    """
+    A mock chat model that, when it has been given tools, calls every one of them
+    once with the text of the human message as the value of each argument.
+    Once the tool results come back it echoes the last of them.
+
+    Without tools this behaves just like ChatMockLlm.
+    """
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable[LanguageModelInput, BaseMessage]:
+        """
+        :param tools: The tools the model is allowed to call
+        :return: A Runnable that passes the OpenAI-style tool definitions to _generate()
+        """
+        _ = kwargs
+        formatted_tools: List[Dict[str, Any]] = [convert_to_openai_tool(tool) for tool in tools]
+        return self.bind(tools=formatted_tools)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """
+        :param messages: the prompt composed of a list of messages.
+        :param stop: a list of strings on which the model should stop generating.
+        :param run_manager: A run manager with callbacks for the LLM.
+        :return: chat result containing either tool calls or the echo of the last message.
+        """
+        tools: List[Dict[str, Any]] = kwargs.get("tools")
+        last_message: BaseMessage = messages[-1]
+        if not tools or not isinstance(last_message, HumanMessage):
+            return super()._generate(messages, stop, run_manager)
+
+        self._simulate_latency()
+
+        content: str = last_message.content
+        tool_calls: List[Dict[str, Any]] = []
+        for index, tool in enumerate(tools):
+            function: Dict[str, Any] = tool.get("function", {})
+            properties: Dict[str, Any] = function.get("parameters", {}).get("properties", {})
+            tool_calls.append({
+                "name": function.get("name"),
+                "args": {key: content for key in properties},
+                "id": f"call_{index}",
+                "type": "tool_call",
+            })
+
+        input_tokens: int = self._num_tokens_from_string(content)
+        message = AIMessage(
+            content="",
+            tool_calls=tool_calls,
+            response_metadata={
+                "model_name": self.model_name,
+            },
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": 0,
+                "total_tokens": input_tokens,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        """
+        :param messages: the prompt composed of a list of messages.
+        :param stop: a list of strings on which the model should stop generating.
+        :param run_manager: A run manager with callbacks for the LLM.
+        :yields: ChatGenerationChunk objects. Tool calls come in a single chunk.
+        """
+        tools: List[Dict[str, Any]] = kwargs.get("tools")
+        if not tools or not isinstance(messages[-1], HumanMessage):
+            yield from super()._stream(messages, stop, run_manager)
+            return
+
+        result: ChatResult = self._generate(messages, stop, run_manager, **kwargs)
+        message: AIMessage = result.generations[0].message
+        tool_call_chunks: List[Dict[str, Any]] = []
+        for index, tool_call in enumerate(message.tool_calls):
+            tool_call_chunks.append({
+                "name": tool_call.get("name"),
+                "args": json.dumps(tool_call.get("args")),
+                "id": tool_call.get("id"),
+                "index": index,
+                "type": "tool_call_chunk",
+            })
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content="",
+                tool_call_chunks=tool_call_chunks,
+                response_metadata=message.response_metadata,
+                usage_metadata=message.usage_metadata,
+            )
+        )
+
+    @property
+    def _llm_type(self) -> str:
+        """Get the type of language model used by this chat model."""
+        return "tool-calling-chat-model-basic"
@@ -0,0 +1,214 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+
+import asyncio
+import time
+
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from neuro_san.internals.authorization.openfga.open_fga_authorizer import OpenFgaAuthorizer
+from neuro_san.internals.authorization.openfga.open_fga_init import OpenFgaInit
+from neuro_san.internals.authorization.openfga.open_fga_store_cache import OpenFgaStoreCache
+from neuro_san.service.http.server.agent_authorization_policy import AgentAuthorizationPolicy
+
+NUM_AGENTS: int = 120
+
+# Simulated latency of one round trip to the OpenFGA server
+ROUND_TRIP_SECONDS: float = 0.005
+
+ACTOR: Dict[str, Any] = {"type": "User", "id": "alice"}
+
+
+class LocalOpenFgaDouble:
+    """
+    Stands in for an OpenFgaClient talking to an OpenFGA server,
+    counting the round trips made to it.
+    """
+
+    def __init__(self, allowed_objects: Set[str]):
+        """
+        :param allowed_objects: The "<type>:<id>" objects that any user is allowed to read
+        """
+        self.allowed_objects: Set[str] = allowed_objects
+        self.round_trips: int = 0
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.max_batch: int = 0
+        self.closes: int = 0
+
+    async def round_trip(self):
+        """
+        Simulates the latency of one request
+        """
+        self.round_trips += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        self.in_flight -= 1
+
+    async def check(self, body: Any, options: Dict[str, Any] = None) -> Any:
+        """
+        :return: a CheckResponse look-alike
+        """
+        _ = options
+        await self.round_trip()
+        return SimpleNamespace(allowed=body.object in self.allowed_objects)
+
+    async def batch_check(self, body: Any, options: Dict[str, Any] = None) -> Any:
+        """
+        :return: a ClientBatchCheckResponse look-alike
+        """
+        _ = options
+        self.max_batch = max(self.max_batch, len(body.checks))
+        await self.round_trip()
+        return SimpleNamespace(result=[SimpleNamespace(allowed=check.object in self.allowed_objects,
+                                                       correlation_id=check.correlation_id,
+                                                       error=None)
+                                       for check in body.checks])
+
+    async def close(self):
+        """
+        Counts closes, which should only happen when the loop of a shared client is done with it
+        """
+        self.closes += 1
+
+
+class TestOpenFgaAuthorizer(TestCase):
+    """
+    Tests batched authorization checks and persistent clients of the OpenFgaAuthorizer.
+    """
+
+    def setUp(self):
+        self.agent_names: List[str] = [f"agent_{index}" for index in range(NUM_AGENTS)]
+        # Every third agent is allowed
+        allowed: Set[str] = {f"AgentNetwork:{name}" for name in self.agent_names[::3]}
+        self.double = LocalOpenFgaDouble(allowed)
+        self.authorizer = OpenFgaAuthorizer(fga_client=self.double)
+        self.authorizer.batch_size = 50
+        self.authorizer.batch_concurrency = 2
+        self.resources: List[Dict[str, Any]] = [{"type": "AgentNetwork", "id": name} for name in self.agent_names]
+
+    def test_batch_authorize(self):
+        """
+        Tests that answers come back in order in as few round trips as the batch size allows
+        """
+        authorized: List[bool] = asyncio.run(self.authorizer.batch_authorize(ACTOR, "read", self.resources))
+        self.assertEqual(authorized, [index % 3 == 0 for index in range(NUM_AGENTS)])
+
+        self.assertEqual(self.double.round_trips, 3)
+        self.assertLessEqual(self.double.max_batch, 50)
+        self.assertLessEqual(self.double.max_in_flight, 2)
+        self.assertEqual(asyncio.run(self.authorizer.batch_authorize(ACTOR, "read", [])), [])
+
+    def test_batch_settings(self):
+        """
+        Tests that bad batch settings fall back to the defaults instead of failing
+        """
+        with patch.dict("os.environ", {"AGENT_AUTHORIZER_BATCH_SIZE": "lots",
+                                       "AGENT_AUTHORIZER_BATCH_CONCURRENCY": "0"}):
+            authorizer = OpenFgaAuthorizer(fga_client=self.double)
+        self.assertEqual(authorizer.batch_size, 50)
+        self.assertEqual(authorizer.batch_concurrency, 1)
+
+    def test_persistent_client(self):
+        """
+        Tests that scoped sessions no longer open and close a client every time
+        """
+        async def scoped_checks():
+            for resource in self.resources[:5]:
+                async with self.authorizer as auth:
+                    await auth.authorize(ACTOR, "read", resource)
+
+        asyncio.run(scoped_checks())
+        self.assertEqual(self.double.closes, 0)
+
+        # The client given to the constructor belongs to the test
+        asyncio.run(self.authorizer.close())
+        self.assertEqual(self.double.closes, 0)
+
+    def test_shared_client_per_loop(self):
+        """
+        Tests that one client is shared by everything on an event loop, and only on that loop,
+        and that it is closed when the loop is done with it
+        """
+        created: List[LocalOpenFgaDouble] = []
+
+        def make_client(store_id: str = None, model_id: str = None) -> LocalOpenFgaDouble:
+            _ = store_id, model_id
+            created.append(LocalOpenFgaDouble(set()))
+            return created[-1]
+
+        async def get_twice() -> List[Any]:
+            clients: List[Any] = [await OpenFgaStoreCache.get_shared_client("test_store"),
+                                  await OpenFgaStoreCache.get_shared_client("test_store")]
+            self.assertEqual(clients[0].closes, 0)
+            await OpenFgaAuthorizer().close()
+            return clients
+
+        with patch.object(OpenFgaInit, "initialize_one_client", side_effect=make_client), \
+                patch.dict(OpenFgaStoreCache.store_name_to_id, {"test_store": "test_store_id"}):
+            first_loop: List[Any] = asyncio.run(get_twice())
+            second_loop: List[Any] = asyncio.run(get_twice())
+
+        self.assertIs(first_loop[0], first_loop[1])
+        self.assertIs(second_loop[0], second_loop[1])
+        self.assertIsNot(first_loop[0], second_loop[0])
+        self.assertEqual(len(created), 2)
+        self.assertEqual([client.closes for client in created], [1, 1])
+
+    def test_allow_agents(self):
+        """
+        Tests that the agent policy asks about all agents in one batch
+        """
+        policy = AgentAuthorizationPolicy({name: None for name in self.agent_names})
+        policy.authorizer = self.authorizer
+        self.authorizer.batch_size = NUM_AGENTS
+
+        allowed: List[str] = asyncio.run(policy.allow_agents(self.agent_names + ["no_such_agent"],
+                                                             {"user_id": "alice"}))
+        self.assertEqual(allowed, self.agent_names[::3])
+        self.assertEqual(self.double.round_trips, 1)
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Compares checking every agent on its own with checking them in batches,
+        checking that batches take fewer round trips and less time.
+        """
+        async def one_by_one() -> List[bool]:
+            return [await self.authorizer.authorize(ACTOR, "read", resource) for resource in self.resources]
+
+        start_time: float = time.perf_counter()
+        singles: List[bool] = asyncio.run(one_by_one())
+        single_seconds: float = time.perf_counter() - start_time
+        single_trips: int = self.double.round_trips
+
+        self.double.round_trips = 0
+        start_time = time.perf_counter()
+        batched: List[bool] = asyncio.run(self.authorizer.batch_authorize(ACTOR, "read", self.resources))
+        batch_seconds: float = time.perf_counter() - start_time
+
+        self.assertEqual(singles, batched)
+        self.assertLess(self.double.round_trips, single_trips)
+        self.assertLess(batch_seconds, single_seconds)
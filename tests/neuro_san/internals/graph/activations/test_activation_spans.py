@@ -0,0 +1,180 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+import os
+import tempfile
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
+from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextTypeToolboxFactory
+from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
+from neuro_san.internals.run_context.factory.master_toolbox_factory import MasterToolboxFactory
+from neuro_san.session.direct_agent_session import DirectAgentSession
+from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
+from neuro_san.session.session_invocation_context import SessionInvocationContext
+
+FRONT_MAN_DELAY: float = 0.2
+SUB_AGENT_DELAY: float = 0.3
+
+# Allowance for framework overhead around the mock LLM calls
+TOLERANCE: float = 0.1
+
+NETWORK_CONFIG: Dict[str, Any] = {
+    "llm_config": {
+        "class": "neuro_san.test.llms.chat_mock_llm.ChatMockLlm",
+        "model_name": "echo",
+        "delay_seconds": SUB_AGENT_DELAY,
+    },
+    "tools": [
+        {
+            "name": "front",
+            "function": {
+                "description": "Calls the sub agent"
+            },
+            "instructions": "Call the sub agent",
+            "llm_config": {
+                "class": "neuro_san.test.llms.tool_calling_mock_llm.ToolCallingMockLlm",
+                "model_name": "echo",
+                "delay_seconds": FRONT_MAN_DELAY,
+            },
+            "tools": ["sub"]
+        },
+        {
+            "name": "sub",
+            "function": {
+                "description": "Echoes the inquiry",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "inquiry": {
+                            "type": "string",
+                            "description": "What to echo"
+                        }
+                    },
+                    "required": ["inquiry"]
+                }
+            },
+            "instructions": "Echo the inquiry"
+        }
+    ]
+}
+
+
+class TestActivationSpans(TestCase):
+    """
+    Tests the per-agent timing spans that end up in request reporting
+    using mock LLMs with injected latencies.
+    """
+
+    def setUp(self):
+        """
+        Sets up a DirectAgentSession on a two-agent mock network
+        """
+        agent_network = AgentNetwork(NETWORK_CONFIG, "span_test")
+
+        llm_factory: ContextTypeLlmFactory = MasterLlmFactory.create_llm_factory(NETWORK_CONFIG)
+        toolbox_factory: ContextTypeToolboxFactory = MasterToolboxFactory.create_toolbox_factory(NETWORK_CONFIG)
+        llm_factory.load()
+        toolbox_factory.load()
+
+        self.executors_pool = AsyncioExecutorPool()
+        factory = ExternalAgentSessionFactory(use_direct=True, network_storage_dict={})
+        self.invocation_context = SessionInvocationContext("span_test", factory, self.executors_pool,
+                                                           llm_factory, toolbox_factory, {})
+        self.invocation_context.start()
+        self.session = DirectAgentSession(agent_network=agent_network,
+                                          invocation_context=self.invocation_context,
+                                          metadata={})
+
+    def tearDown(self):
+        self.session.close()
+        self.executors_pool.shutdown()
+
+    def chat(self) -> List[Dict[str, Any]]:
+        """
+        :return: The span tree reported after a single chat request
+        """
+        request: Dict[str, Any] = {
+            "user_message": {
+                "type": "HUMAN",
+                "text": "hello"
+            }
+        }
+        for _ in self.session.streaming_chat(request):
+            pass
+        return self.invocation_context.get_request_reporting().get("spans")
+
+    def test_span_durations(self):
+        """
+        Tests that the front man's time is accounted for by LLM and tool waits
+        and that its tool wait is the time of the agent it called.
+        """
+        spans: List[Dict[str, Any]] = self.chat()
+
+        self.assertEqual(len(spans), 1)
+        front: Dict[str, Any] = spans[0]
+        self.assertEqual(front["name"], "front")
+        self.assertEqual(front["kind"], "front_man")
+
+        self.assertEqual(len(front["children"]), 1)
+        sub: Dict[str, Any] = front["children"][0]
+        self.assertEqual(sub["name"], "front.sub")
+        self.assertEqual(sub["kind"], "branch")
+        self.assertEqual(sub["tool_wait"], 0.0)
+        self.assertGreater(sub["start"], 0.0)
+
+        # The front man calls its LLM once to call the tool and once more to answer.
+        self.assertGreaterEqual(front["llm_wait"], 2 * FRONT_MAN_DELAY)
+        self.assertGreaterEqual(sub["llm_wait"], SUB_AGENT_DELAY)
+
+        # Waits add up to the durations
+        self.assertAlmostEqual(front["llm_wait"] + front["tool_wait"], front["duration"], delta=TOLERANCE)
+        self.assertAlmostEqual(sub["llm_wait"], sub["duration"], delta=TOLERANCE)
+        self.assertAlmostEqual(front["tool_wait"], sub["duration"], delta=TOLERANCE)
+        self.assertGreaterEqual(front["duration"], sub["start"] + sub["duration"])
+
+    def test_spans_per_request(self):
+        """
+        Tests that each request gets its own span tree
+        """
+        self.chat()
+        spans: List[Dict[str, Any]] = self.chat()
+        self.assertEqual(len(spans), 1)
+        self.assertEqual(len(spans[0]["children"]), 1)
+
+    def test_otlp_export(self):
+        """
+        Tests that spans are appended to the file named by AGENT_SPAN_EXPORT_FILE
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            file_name: str = os.path.join(directory, "spans.jsonl")
+            with patch.dict(os.environ, {"AGENT_SPAN_EXPORT_FILE": file_name}):
+                self.chat()
+            with open(file_name, "r", encoding="utf-8") as export_file:
+                request: Dict[str, Any] = json.loads(export_file.readline())
+
+        spans: List[Dict[str, Any]] = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual([span["name"] for span in spans], ["front", "front.sub"])
+        self.assertEqual(spans[1]["parentSpanId"], spans[0]["spanId"])
@@ -0,0 +1,161 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import os
+import resource
+
+from unittest import TestCase
+
+import pytest
+
+from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.base import BaseMessage
+from langchain_core.messages.human import HumanMessage
+
+from neuro_san.internals.journals.intercepting_journal import InterceptingJournal
+from neuro_san.internals.journals.journal import Journal
+from neuro_san.internals.journals.message_retention import MessageRetention
+from neuro_san.internals.messages.agent_framework_message import AgentFrameworkMessage
+from neuro_san.internals.messages.agent_message import AgentMessage
+from neuro_san.internals.messages.origination import Origination
+
+NUM_STREAMED_MESSAGES: int = 1000000
+KEEP_LAST: int = 100
+
+# Peak RSS growth allowed while streaming NUM_STREAMED_MESSAGES with bounded retention.
+# Keeping every message would take gigabytes.
+MAX_RSS_GROWTH_MB: int = 100
+
+
+class NullJournal(Journal):
+    """
+    Journal that drops every message, standing in for the journal of the client.
+    """
+
+    async def write_message(self, message: BaseMessage, origin: List[Dict[str, Any]]):
+        return
+
+
+class TestInterceptingJournal(TestCase):
+    """
+    Tests the retention policies for the messages intercepted by an InterceptingJournal.
+    """
+
+    def setUp(self):
+        self.origin: List[Dict[str, Any]] = Origination().add_spec_name_to_origin([], "front_man")
+
+    def intercept(self, retention: MessageRetention, messages: List[BaseMessage]) -> InterceptingJournal:
+        """
+        :param retention: The MessageRetention to use
+        :param messages: The messages to write
+        :return: The InterceptingJournal the messages were written to
+        """
+        journal = InterceptingJournal(NullJournal(), self.origin, retention)
+
+        async def write_all():
+            for message in messages:
+                await journal.write_message(message, self.origin)
+            # Messages of other origins are never kept
+            await journal.write_message(AIMessage(content="other"), [])
+
+        asyncio.run(write_all())
+        return journal
+
+    @staticmethod
+    def contents(journal: InterceptingJournal) -> List[str]:
+        """
+        :return: The content of the kept messages
+        """
+        return [message.content for message in journal.iterate_messages()]
+
+    def test_keep_all(self):
+        """
+        Tests that everything is kept by default
+        """
+        messages: List[BaseMessage] = [AIMessage(content=f"message {index}") for index in range(20)]
+        journal: InterceptingJournal = self.intercept(MessageRetention(), messages)
+        self.assertEqual(self.contents(journal), [f"message {index}" for index in range(20)])
+        self.assertEqual(len(journal.get_messages()), 20)
+
+    def test_keep_last(self):
+        """
+        Tests that only the last messages are kept
+        """
+        messages: List[BaseMessage] = [AIMessage(content=f"message {index}") for index in range(20)]
+        journal: InterceptingJournal = self.intercept(MessageRetention(max_messages=5), messages)
+        self.assertEqual(self.contents(journal), [f"message {index}" for index in range(15, 20)])
+
+    def test_answers_only(self):
+        """
+        Tests that only AI and AGENT_FRAMEWORK messages are kept
+        """
+        messages: List[BaseMessage] = [
+            HumanMessage(content="question"),
+            AgentMessage(content="thinking"),
+            AIMessage(content="answer"),
+            AgentFrameworkMessage(content="final answer"),
+        ]
+        journal: InterceptingJournal = self.intercept(MessageRetention(answers_only=True), messages)
+        kept: List[BaseMessage] = list(journal.iterate_messages())
+        self.assertEqual([type(message) for message in kept], [AIMessage, AgentFrameworkMessage])
+
+    def test_spill(self):
+        """
+        Tests that messages are spilled to a file once they take too many bytes, and read back in order
+        """
+        retention = MessageRetention(spill_bytes=4096)
+        messages: List[BaseMessage] = [AIMessage(content=f"message {index}") for index in range(200)]
+        journal: InterceptingJournal = self.intercept(retention, messages)
+        self.assertTrue(retention.is_spilled())
+        self.assertEqual(retention.get_size(), 0)
+        self.assertEqual(self.contents(journal), [f"message {index}" for index in range(200)])
+
+        # Messages can still be written while iterating
+        for index, _ in enumerate(journal.iterate_messages()):
+            if index == 0:
+                journal.write_unwrapped_message(AIMessage(content="late"), self.origin)
+        self.assertEqual(self.contents(journal)[-1], "late")
+
+        file_name: str = retention.spill_file.name
+        journal.close()
+        self.assertFalse(os.path.exists(file_name))
+
+    @pytest.mark.benchmark
+    def test_bounded_memory(self):
+        """
+        Streams 1,000,000 messages from a mock agent through an InterceptingJournal
+        that keeps the last 100, checking that peak RSS stays bounded.
+        """
+        journal = InterceptingJournal(NullJournal(), self.origin, MessageRetention(max_messages=KEEP_LAST))
+
+        async def mock_agent():
+            for index in range(NUM_STREAMED_MESSAGES):
+                await journal.write_message(AIMessage(content=f"streamed token {index} " * 10), self.origin)
+
+        # ru_maxrss is in kilobytes on Linux
+        start_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        asyncio.run(mock_agent())
+        end_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        growth_mb: float = (end_rss - start_rss) / 1024
+
+        kept: List[BaseMessage] = journal.get_messages()
+        self.assertEqual(len(kept), KEEP_LAST)
+        self.assertTrue(kept[-1].content.startswith(f"streamed token {NUM_STREAMED_MESSAGES - 1} "))
+        self.assertLess(growth_mb, MAX_RSS_GROWTH_MB)
@@ -0,0 +1,176 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import threading
+import time
+
+from unittest import TestCase
+
+import pytest
+
+from langchain_core.messages.ai import AIMessage
+
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+from neuro_san.internals.journals.message_journal import MessageJournal
+from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
+from neuro_san.internals.messages.origination import Origination
+
+NUM_MESSAGES: int = 1000
+BENCHMARK_MESSAGES: int = 50000
+BATCH_SIZE: int = 32
+
+
+class LegacyMessageJournal(MessageJournal):
+    """
+    MessageJournal that writes the way it used to, for comparison:
+    a new converter per message and always the synchronous side of the queue.
+    """
+
+    async def write_message(self, message, origin):
+        """
+        Writes the message with a converter of its own on the synchronous side of the queue
+        """
+        converter = BaseMessageDictionaryConverter(origin=origin)
+        message_dict: Dict[str, Any] = converter.to_dict(message)
+        self.hopper.queue.sync_q.put(message_dict)
+
+
+class TestMessageJournal(TestCase):
+    """
+    Tests writing journal messages into an AsyncCollatingQueue with and without micro-batching.
+    """
+
+    def setUp(self):
+        origination = Origination()
+        self.origin: List[Dict[str, Any]] = origination.add_spec_name_to_origin([], "front_man")
+        self.origin = origination.add_spec_name_to_origin(self.origin, "helper")
+
+    @staticmethod
+    async def consume(queue: AsyncCollatingQueue) -> List[Dict[str, Any]]:
+        """
+        :param queue: The queue to consume
+        :return: All messages consumed before the final item
+        """
+        return [message async for message in queue]
+
+    async def produce(self, journal: MessageJournal, queue: AsyncCollatingQueue, num_messages: int):
+        """
+        Writes messages to the journal the way an agent network does, ending with the final item.
+        """
+        for index in range(num_messages):
+            await journal.write_message(AIMessage(content=f"message {index}"), self.origin)
+            if index % 100 == 0:
+                # Let other tasks run now and then, like an agent would between LLM calls
+                await asyncio.sleep(0)
+        await queue.put_final_item(synchronous=True)
+
+    async def same_loop(self, journal: MessageJournal, queue: AsyncCollatingQueue, num_messages: int) \
+            -> List[Dict[str, Any]]:
+        """
+        Runs consumer and producer in the same event loop, as for direct sessions to other networks.
+        :return: The consumed messages
+        """
+        consumer: asyncio.Task = asyncio.create_task(self.consume(queue))
+        await asyncio.sleep(0)
+        await self.produce(journal, queue, num_messages)
+        return await consumer
+
+    async def other_loop(self, journal: MessageJournal, queue: AsyncCollatingQueue, num_messages: int) \
+            -> List[Dict[str, Any]]:
+        """
+        Runs the producer in its own event loop on another thread, as for journals written by agents.
+        :return: The consumed messages
+        """
+        consumer: asyncio.Task = asyncio.create_task(self.consume(queue))
+        await asyncio.sleep(0)
+        producer = threading.Thread(target=asyncio.run, args=(self.produce(journal, queue, num_messages),))
+        producer.start()
+        messages: List[Dict[str, Any]] = await consumer
+        producer.join()
+        return messages
+
+    def check_messages(self, messages: List[Dict[str, Any]], num_messages: int):
+        """
+        Checks that all messages arrived in order
+        """
+        self.assertEqual(len(messages), num_messages)
+        for index, message in enumerate(messages):
+            self.assertEqual(message.get("text"), f"message {index}")
+            self.assertIs(message.get("origin"), self.origin)
+
+    def test_same_loop(self):
+        """
+        Tests that all messages arrive in order, whether batched or not
+        """
+        for batch_size in [1, BATCH_SIZE]:
+            queue = AsyncCollatingQueue(batch_size=batch_size)
+            messages: List[Dict[str, Any]] = asyncio.run(self.same_loop(MessageJournal(queue), queue, NUM_MESSAGES))
+            self.check_messages(messages, NUM_MESSAGES)
+
+    def test_other_loop(self):
+        """
+        Tests that all messages arrive in order when the journal is written from another event loop
+        """
+        for batch_size in [1, BATCH_SIZE]:
+            queue = AsyncCollatingQueue(batch_size=batch_size)
+            messages: List[Dict[str, Any]] = asyncio.run(self.other_loop(MessageJournal(queue), queue, NUM_MESSAGES))
+            self.check_messages(messages, NUM_MESSAGES)
+
+    def test_batch_key(self):
+        """
+        Tests that a message which looks like a batch is passed along as is, whether batched or not
+        """
+        message: Dict[str, Any] = {"batch": ["not", "a", "batch"]}
+
+        async def put_and_consume(queue: AsyncCollatingQueue) -> List[Dict[str, Any]]:
+            await queue.put(message)
+            await queue.put_final_item()
+            return await self.consume(queue)
+
+        for batch_size in [1, BATCH_SIZE]:
+            messages: List[Dict[str, Any]] = asyncio.run(put_and_consume(AsyncCollatingQueue(batch_size=batch_size)))
+            self.assertEqual(messages, [message])
+
+    def run_benchmark(self, journal_class, batch_size: int) -> float:
+        """
+        :param journal_class: The MessageJournal class to write with
+        :param batch_size: The batch size for the queue
+        :return: The journal writes per second
+        """
+        queue = AsyncCollatingQueue(batch_size=batch_size)
+        start_time: float = time.perf_counter()
+        messages: List[Dict[str, Any]] = asyncio.run(self.same_loop(journal_class(queue), queue, BENCHMARK_MESSAGES))
+        elapsed: float = time.perf_counter() - start_time
+        self.assertEqual(len(messages), BENCHMARK_MESSAGES)
+        return BENCHMARK_MESSAGES / elapsed
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Writes journal messages consumed in the same event loop, checking that writing with
+        a shared converter on the asynchronous side of the queue and micro-batched writes
+        are both faster than the previous way of writing.
+        """
+        legacy: float = self.run_benchmark(LegacyMessageJournal, 1)
+        current: float = self.run_benchmark(MessageJournal, 1)
+        batched: float = self.run_benchmark(MessageJournal, BATCH_SIZE)
+
+        self.assertGreater(current, legacy)
+        self.assertGreater(batched, legacy)
@@ -0,0 +1,185 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import copy
+import json
+import pickle
+import sys
+import time
+
+from unittest import TestCase
+
+import pytest
+
+from neuro_san.internals.messages.origin_entry import OriginEntry
+from neuro_san.internals.messages.origination import Origination
+
+CHAIN_DEPTH: int = 10
+BENCHMARK_ITERATIONS: int = 10000
+BENCHMARK_MESSAGES: int = 1000000
+# Building names is slow enough that fewer messages are timed for it
+BENCHMARK_BUILT_MESSAGES: int = 100000
+
+
+class TestOrigination(TestCase):
+    """
+    Tests the read-only origins handed to CodedTools and their remembered full names.
+    """
+
+    @staticmethod
+    def make_chain(depth: int) -> List[List[Dict[str, Any]]]:
+        """
+        :param depth: The number of tools in the chain
+        :return: The origins of every tool in a chain of tools that each call the next one
+        """
+        origination = Origination()
+        origins: List[List[Dict[str, Any]]] = []
+        origin: List[Dict[str, Any]] = []
+        for index in range(depth):
+            origin = origination.add_spec_name_to_origin(origin, f"tool_{index}")
+            origins.append(origin)
+        return origins
+
+    def test_frozen_entries(self):
+        """
+        Tests that origin entries cannot be modified, but still act like dictionaries
+        """
+        origin: List[Dict[str, Any]] = self.make_chain(2)[-1]
+        entry: Dict[str, Any] = origin[-1]
+        self.assertIsInstance(entry, OriginEntry)
+        self.assertEqual(entry, {"tool": "tool_1", "instantiation_index": 1})
+
+        with self.assertRaises(TypeError):
+            entry["tool"] = "other"
+        with self.assertRaises(TypeError):
+            entry.update({"tool": "other"})
+        with self.assertRaises(TypeError):
+            del entry["tool"]
+        self.assertEqual(entry.get("tool"), "tool_1")
+
+        self.assertIs(copy.deepcopy(entry), entry)
+        self.assertEqual(pickle.loads(pickle.dumps(entry)), entry)
+        self.assertEqual(json.loads(json.dumps(origin))[-1], {"tool": "tool_1", "instantiation_index": 1})
+        self.assertEqual(Origination.get_full_name_from_origin(origin), "tool_0.tool_1")
+
+    def test_freeze_origin(self):
+        """
+        Tests that frozen origins share frozen entries and freeze plain ones
+        """
+        origin: List[Dict[str, Any]] = self.make_chain(3)[-1]
+        frozen = Origination.freeze_origin(origin)
+        self.assertIsInstance(frozen, tuple)
+        self.assertEqual(list(frozen), origin)
+        for entry, frozen_entry in zip(origin, frozen):
+            self.assertIs(entry, frozen_entry)
+
+        # Origins restored from elsewhere can have plain dictionaries
+        plain: List[Dict[str, Any]] = [{"tool": "front_man", "instantiation_index": 1}]
+        frozen = Origination.freeze_origin(plain)
+        self.assertIsInstance(frozen[0], OriginEntry)
+        with self.assertRaises(TypeError):
+            frozen[0]["tool"] = "other"
+        self.assertEqual(plain[0].get("tool"), "front_man")
+
+        self.assertIsNone(Origination.freeze_origin(None))
+
+    @staticmethod
+    def run_benchmark(origins: List[List[Dict[str, Any]]], prepare: Callable) -> float:
+        """
+        :param origins: The origins of every tool in the chain
+        :param prepare: The way the origin is prepared for the CodedTool
+        :return: The elapsed seconds for BENCHMARK_ITERATIONS activations of the whole chain
+        """
+        start_time: float = time.perf_counter()
+        for _ in range(BENCHMARK_ITERATIONS):
+            for origin in origins:
+                prepare(origin)
+        return time.perf_counter() - start_time
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Prepares the origin argument for every CodedTool in a 10-level tool chain,
+        checking that freezing the origins takes less time than copying them.
+        """
+        origins: List[List[Dict[str, Any]]] = self.make_chain(CHAIN_DEPTH)
+
+        # Origins used to be made of plain dictionaries that were deep-copied for every CodedTool
+        plain_origins: List[List[Dict[str, Any]]] = [[dict(entry) for entry in origin] for origin in origins]
+        before_seconds: float = self.run_benchmark(plain_origins, copy.deepcopy)
+        after_seconds: float = self.run_benchmark(origins, Origination.freeze_origin)
+
+        self.assertLess(after_seconds, before_seconds)
+
+    def test_full_name(self):
+        """
+        Tests that origins remember their interned full name, but only where it applies
+        """
+        origins: List[List[Dict[str, Any]]] = self.make_chain(3)
+        origin: List[Dict[str, Any]] = origins[-1]
+        full_name: str = Origination.get_full_name_from_origin(origin)
+        self.assertEqual(full_name, "tool_0.tool_1.tool_2")
+        self.assertEqual(full_name, Origination.build_full_name(origin))
+        self.assertIs(full_name, sys.intern("tool_0.tool_1.tool_2"))
+        self.assertIs(Origination.get_full_name_from_origin(origin), full_name)
+        self.assertEqual(Origination.get_full_name_from_origin(origin[:-1]), "tool_0.tool_1")
+
+        # Origins of sub-networks get appended to the origin of the calling agent
+        sub_origin: List[Dict[str, Any]] = Origination().add_spec_name_to_origin([], "front_man")
+        sub_origin = Origination().add_spec_name_to_origin(sub_origin, "helper")
+        deeper: List[Dict[str, Any]] = copy.copy(origin)
+        deeper.extend(sub_origin)
+        self.assertEqual(Origination.get_full_name_from_origin(deeper), "tool_0.tool_1.tool_2.front_man.helper")
+
+        # Instantiation indexes and external agents
+        origination = Origination()
+        origin = origination.add_spec_name_to_origin([], "front_man")
+        first: List[Dict[str, Any]] = origination.add_spec_name_to_origin(origin, "/math_guy")
+        second: List[Dict[str, Any]] = origination.add_spec_name_to_origin(origin, "/math_guy")
+        self.assertEqual(Origination.get_full_name_from_origin(first), Origination.build_full_name(first))
+        self.assertEqual(Origination.get_full_name_from_origin(second), Origination.build_full_name(second))
+        self.assertNotEqual(Origination.get_full_name_from_origin(first),
+                            Origination.get_full_name_from_origin(second))
+
+        # Entries that come back from pickling just build the name again
+        self.assertEqual(Origination.get_full_name_from_origin(pickle.loads(pickle.dumps(first))),
+                         Origination.get_full_name_from_origin(first))
+
+    @pytest.mark.benchmark
+    def test_full_name_benchmark(self):
+        """
+        Gets the full name of the origin of messages from the deepest agent of a 10-level
+        tool chain, checking that remembering the name takes less time than building it.
+        """
+        origin: List[Dict[str, Any]] = self.make_chain(CHAIN_DEPTH)[-1]
+
+        start_time: float = time.perf_counter()
+        for _ in range(BENCHMARK_BUILT_MESSAGES):
+            Origination.build_full_name(origin)
+        before_seconds: float = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for _ in range(BENCHMARK_MESSAGES):
+            Origination.get_full_name_from_origin(origin)
+        after_seconds: float = time.perf_counter() - start_time
+
+        before_per_message: float = before_seconds / BENCHMARK_BUILT_MESSAGES
+        after_per_message: float = after_seconds / BENCHMARK_MESSAGES
+        self.assertLess(after_per_message, before_per_message)
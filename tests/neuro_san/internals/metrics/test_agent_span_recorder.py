@@ -0,0 +1,117 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+import os
+import tempfile
+
+from unittest import TestCase
+
+from neuro_san.internals.metrics.agent_span import AgentSpan
+from neuro_san.internals.metrics.agent_span_recorder import AgentSpanRecorder
+from neuro_san.internals.metrics.otlp_json_span_exporter import OtlpJsonSpanExporter
+
+
+class TestAgentSpanRecorder(TestCase):
+    """
+    Unit tests for AgentSpanRecorder and OtlpJsonSpanExporter classes.
+    """
+
+    def record_spans(self) -> AgentSpanRecorder:
+        """
+        :return: An AgentSpanRecorder with a front man calling two agents,
+                one of which is called twice.
+        """
+        recorder = AgentSpanRecorder()
+        front: List[Dict[str, Any]] = [{"tool": "front", "instantiation_index": 1}]
+        root: AgentSpan = recorder.start_span(front, "front_man")
+        for index in [1, 2]:
+            origin: List[Dict[str, Any]] = front + [{"tool": "sub", "instantiation_index": index}]
+            child: AgentSpan = recorder.start_span(origin, "branch")
+            child.add_llm_wait(0.5)
+            child.end()
+            root.add_tool_wait(0.5)
+        leaf: AgentSpan = recorder.start_span(front + [{"tool": "sub", "instantiation_index": 2},
+                                                       {"tool": "calc", "instantiation_index": 1}],
+                                              "coded_tool")
+        leaf.end()
+        root.add_llm_wait(0.25)
+        root.end()
+        return recorder
+
+    def test_span_tree(self):
+        """
+        Tests the shape of the compact span tree
+        """
+        tree: List[Dict[str, Any]] = self.record_spans().get_span_tree()
+
+        self.assertEqual(len(tree), 1)
+        root: Dict[str, Any] = tree[0]
+        self.assertEqual(root["name"], "front")
+        self.assertEqual(root["kind"], "front_man")
+        self.assertEqual(root["start"], 0.0)
+        self.assertEqual(root["llm_wait"], 0.25)
+        self.assertEqual(root["tool_wait"], 1.0)
+
+        children: List[Dict[str, Any]] = root["children"]
+        self.assertEqual([child["name"] for child in children], ["front.sub", "front.sub-02"])
+        self.assertNotIn("children", children[0])
+        self.assertEqual(children[1]["children"][0]["name"], "front.sub-02.calc")
+        self.assertEqual(children[1]["children"][0]["kind"], "coded_tool")
+
+        # Must be able to go straight into request reporting
+        json.dumps(tree)
+
+    def test_reset(self):
+        """
+        Tests that reset() starts a new trace
+        """
+        recorder: AgentSpanRecorder = self.record_spans()
+        trace_id: str = recorder.get_trace_id()
+        recorder.reset()
+        self.assertEqual(recorder.get_span_tree(), [])
+        self.assertNotEqual(recorder.get_trace_id(), trace_id)
+
+    def test_otlp_export(self):
+        """
+        Tests that exported spans are OTLP JSON lines linked by parent span ids
+        """
+        recorder: AgentSpanRecorder = self.record_spans()
+        with tempfile.TemporaryDirectory() as directory:
+            file_name: str = os.path.join(directory, "spans.jsonl")
+            exporter = OtlpJsonSpanExporter(file_name)
+            exporter.export(recorder)
+            exporter.export(recorder)
+            with open(file_name, "r", encoding="utf-8") as export_file:
+                lines: List[str] = export_file.readlines()
+
+        self.assertEqual(len(lines), 2)
+        request: Dict[str, Any] = json.loads(lines[0])
+        spans: List[Dict[str, Any]] = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual(len(spans), 4)
+
+        by_name: Dict[str, Dict[str, Any]] = {span["name"]: span for span in spans}
+        self.assertNotIn("parentSpanId", by_name["front"])
+        self.assertEqual(by_name["front.sub"]["parentSpanId"], by_name["front"]["spanId"])
+        self.assertEqual(by_name["front.sub-02.calc"]["parentSpanId"], by_name["front.sub-02"]["spanId"])
+        for span in spans:
+            self.assertEqual(span["traceId"], recorder.get_trace_id())
+            self.assertEqual(len(span["traceId"]), 32)
+            self.assertEqual(len(span["spanId"]), 16)
+            self.assertLessEqual(int(span["startTimeUnixNano"]), int(span["endTimeUnixNano"]))
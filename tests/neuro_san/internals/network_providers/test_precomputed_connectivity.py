@@ -0,0 +1,125 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import glob
+import os
+
+from unittest import TestCase
+
+from neuro_san import REGISTRIES_DIR
+from neuro_san.internals.chat.connectivity_reporter import ConnectivityReporter
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.session.direct_agent_session import DirectAgentSession
+
+
+class TestPrecomputedConnectivity(TestCase):
+    """
+    Tests that connectivity precomputed by AgentNetworkStorage
+    is the same as what is computed per request.
+    """
+
+    @staticmethod
+    def get_registry_files() -> List[str]:
+        """
+        :return: The hocon files of all bundled registries, except the manifest
+        """
+        registries_dir: str = REGISTRIES_DIR.get_file_in_basis("")
+        files: List[str] = glob.glob(os.path.join(registries_dir, "**", "*.hocon"), recursive=True)
+        return sorted(file for file in files if os.path.basename(file) != "manifest.hocon")
+
+    @staticmethod
+    def report_per_request(agent_network: AgentNetwork) -> Dict[str, Any]:
+        """
+        :param agent_network: The AgentNetwork to report on
+        :return: The ConnectivityResponse dictionary assembled the way it is for every request
+                when nothing has been precomputed
+        """
+        reporter = ConnectivityReporter(agent_network)
+        response_dict: Dict[str, Any] = {
+            "connectivity_info": reporter.report_network_connectivity(),
+        }
+        metadata: Dict[str, Any] = agent_network.get_config().get("metadata")
+        if metadata is not None:
+            response_dict["metadata"] = metadata
+        return response_dict
+
+    def test_all_registries(self):
+        """
+        Tests the precomputed connectivity of every bundled registry
+        """
+        registry_files: List[str] = self.get_registry_files()
+        self.assertGreater(len(registry_files), 20)
+
+        storage = AgentNetworkStorage()
+        restorer = AgentNetworkRestorer()
+        for registry_file in registry_files:
+            with self.subTest(registry=registry_file):
+                name: str = os.path.splitext(os.path.basename(registry_file))[0]
+                expected: Dict[str, Any] = None
+                expected_exception: Exception = None
+                try:
+                    expected = self.report_per_request(restorer.restore(file_reference=registry_file))
+                except Exception as exception:  # pylint: disable=broad-exception-caught
+                    expected_exception = exception
+
+                agent_network: AgentNetwork = restorer.restore(file_reference=registry_file)
+                storage.add_agent_network(name, agent_network)
+                stored: AgentNetwork = storage.get_agent_network_provider(name).get_agent_network()
+                session = DirectAgentSession(agent_network=stored, invocation_context=None)
+
+                if expected_exception is not None:
+                    # Networks whose connectivity cannot be reported still fail the same way per request
+                    self.assertIsNone(stored.get_connectivity())
+                    with self.assertRaises(type(expected_exception)):
+                        session.connectivity({})
+                    continue
+
+                self.assertEqual(stored.get_connectivity(), expected)
+                self.assertIsNotNone(stored.get_connectivity_etag())
+                self.assertIs(session.connectivity({}), stored.get_connectivity())
+
+    def test_not_precomputed(self):
+        """
+        Tests that networks which never went through storage still report connectivity
+        """
+        restorer = AgentNetworkRestorer()
+        agent_network: AgentNetwork = restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis("music_nerd_pro.hocon"))
+        session = DirectAgentSession(agent_network=agent_network, invocation_context=None)
+        self.assertIsNone(agent_network.get_connectivity())
+        self.assertEqual(session.connectivity({}), self.report_per_request(agent_network))
+
+    def test_modified_network(self):
+        """
+        Tests that replacing a network replaces its connectivity
+        """
+        restorer = AgentNetworkRestorer()
+        storage = AgentNetworkStorage()
+        storage.add_agent_network("network", restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis("hello_world.hocon")))
+        before: AgentNetwork = storage.get_agent_network_provider("network").get_agent_network()
+
+        storage.add_agent_network("network", restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis("music_nerd_pro.hocon")))
+        after: AgentNetwork = storage.get_agent_network_provider("network").get_agent_network()
+
+        self.assertNotEqual(before.get_connectivity(), after.get_connectivity())
+        self.assertNotEqual(before.get_connectivity_etag(), after.get_connectivity_etag())
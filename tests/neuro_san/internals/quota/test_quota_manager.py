@@ -0,0 +1,144 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import os
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from neuro_san.internals.quota.in_memory_quota_store import InMemoryQuotaStore
+from neuro_san.internals.quota.quota_exceeded_error import QuotaExceededError
+from neuro_san.internals.quota.quota_manager import QuotaManager
+from neuro_san.internals.quota.sqlite_quota_store import SqliteQuotaStore
+
+# Midnight UTC on some day
+MIDNIGHT: float = 20000 * 24 * 60 * 60.0
+
+
+class FakeClock:
+    """
+    A clock for tests to move forward at will
+    """
+
+    def __init__(self, now: float):
+        self.now: float = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestQuotaManager(TestCase):
+    """
+    Tests for the QuotaManager
+    """
+
+    def setUp(self):
+        self.clock = FakeClock(MIDNIGHT)
+
+    def test_disabled(self):
+        """
+        Tests that nothing is enforced without a metadata key or limits
+        """
+        for manager in [QuotaManager(None, tokens_per_minute=1), QuotaManager("user_id")]:
+            self.assertFalse(manager.is_enabled())
+            self.assertIsNone(manager.get_quota_key({"user_id": "alice"}))
+            manager.record("alice", 100, 1.0)
+            manager.check("alice")
+
+    def test_quota_key(self):
+        """
+        Tests how the quota key comes from request metadata
+        """
+        manager = QuotaManager("user_id", tokens_per_minute=100)
+        self.assertEqual(manager.get_quota_key({"user_id": "alice"}), "alice")
+        self.assertEqual(manager.get_quota_key({"other": "bob"}), QuotaManager.ANONYMOUS)
+        self.assertEqual(manager.get_quota_key(None), QuotaManager.ANONYMOUS)
+
+    def test_tokens_per_minute(self):
+        """
+        Tests the sliding window token limit
+        """
+        manager = QuotaManager("user_id", tokens_per_minute=100, clock=self.clock)
+        manager.record("alice", 60, 0.0)
+        manager.check("alice")
+        manager.record("alice", 40, 0.0)
+        with self.assertRaises(QuotaExceededError) as context:
+            manager.check("alice")
+        self.assertIn("100 tokens per minute", str(context.exception))
+
+        # Someone else has their own budget
+        manager.check("bob")
+
+        # Halfway into the next minute half of the last minute still counts
+        self.clock.now += 90.0
+        self.assertAlmostEqual(manager.get_usage("alice")["tokens_per_minute"], 50.0)
+        manager.check("alice")
+
+        # Two minutes on, everything has slid out of the window
+        self.clock.now += 60.0
+        self.assertAlmostEqual(manager.get_usage("alice")["tokens_per_minute"], 0.0)
+
+    def test_cost_per_day(self):
+        """
+        Tests the daily cost limit
+        """
+        manager = QuotaManager("user_id", cost_per_day=1.0, clock=self.clock)
+        manager.record("alice", 0, 0.75)
+        self.clock.now += 12 * 60 * 60.0
+        manager.check("alice")
+        manager.record("alice", 0, 0.25)
+        with self.assertRaises(QuotaExceededError) as context:
+            manager.check("alice")
+        self.assertIn("per day", str(context.exception))
+
+        # A new day brings a new budget
+        self.clock.now += 12 * 60 * 60.0
+        manager.check("alice")
+
+    def test_prune(self):
+        """
+        Tests that old windows are forgotten as usage is recorded
+        """
+        store = InMemoryQuotaStore()
+        manager = QuotaManager("user_id", tokens_per_minute=1000, store=store, clock=self.clock)
+        for _ in range(QuotaManager.PRUNE_INTERVAL):
+            manager.record("alice", 1, 0.0)
+            self.clock.now += 60.0
+        windows = store.amounts[("alice", QuotaManager.TOKENS_WINDOW)]
+        self.assertLessEqual(len(windows), 2)
+
+    def test_create_from_environment(self):
+        """
+        Tests configuration from environment variables
+        """
+        with patch.dict(os.environ, {"AGENT_QUOTA_METADATA_KEY": "user_id",
+                                     "AGENT_QUOTA_TOKENS_PER_MINUTE": "1000",
+                                     "AGENT_QUOTA_COST_PER_DAY": "bogus"}):
+            manager: QuotaManager = QuotaManager.create_from_environment()
+        self.assertTrue(manager.is_enabled())
+        self.assertEqual(manager.tokens_per_minute, 1000.0)
+        self.assertIsNone(manager.cost_per_day)
+        self.assertIsInstance(manager.store, InMemoryQuotaStore)
+
+        with patch.dict(os.environ, {"AGENT_QUOTA_METADATA_KEY": "user_id",
+                                     "AGENT_QUOTA_COST_PER_DAY": "5",
+                                     "AGENT_QUOTA_SQLITE_FILE": ":memory:"}):
+            manager = QuotaManager.create_from_environment()
+        self.assertEqual(manager.cost_per_day, 5.0)
+        self.assertIsInstance(manager.store, SqliteQuotaStore)
+
+        with patch.dict(os.environ, {}, clear=True):
+            manager = QuotaManager.create_from_environment()
+        self.assertFalse(manager.is_enabled())
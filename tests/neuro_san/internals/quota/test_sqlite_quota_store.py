@@ -0,0 +1,85 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import multiprocessing
+import os
+import tempfile
+
+from unittest import TestCase
+
+from neuro_san.internals.quota.sqlite_quota_store import SqliteQuotaStore
+
+INCREMENTS_PER_PROCESS: int = 50
+
+
+def add_usage(file_name: str):
+    """
+    Adds some usage from another process
+    :param file_name: The SQLite file shared by the processes
+    """
+    store = SqliteQuotaStore(file_name)
+    for _ in range(INCREMENTS_PER_PROCESS):
+        store.increment("alice", "tokens_minute", 10, 1)
+
+
+class TestSqliteQuotaStore(TestCase):
+    """
+    Tests for the SqliteQuotaStore
+    """
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_name: str = os.path.join(self.temp_dir.name, "quota.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_increment_and_prune(self):
+        """
+        Tests basic bookkeeping
+        """
+        store = SqliteQuotaStore(self.file_name)
+        store.increment("alice", "tokens_minute", 9, 5)
+        store.increment("alice", "tokens_minute", 10, 5)
+        store.increment("alice", "tokens_minute", 10, 2.5)
+        store.increment("alice", "cost_day", 1, 0.5)
+        store.increment("bob", "tokens_minute", 10, 1)
+
+        self.assertEqual(store.get_amounts("alice", "tokens_minute", [9, 10, 11]), {9: 5.0, 10: 7.5})
+        self.assertEqual(store.get_amounts("alice", "cost_day", [1]), {1: 0.5})
+        self.assertEqual(store.get_amounts("bob", "tokens_minute", [10]), {10: 1.0})
+        self.assertEqual(store.get_amounts("bob", "tokens_minute", []), {})
+
+        store.prune("tokens_minute", 10)
+        self.assertEqual(store.get_amounts("alice", "tokens_minute", [9, 10]), {10: 7.5})
+        self.assertEqual(store.get_amounts("alice", "cost_day", [1]), {1: 0.5})
+
+    def test_shared_across_processes(self):
+        """
+        Tests that counts from concurrent server processes add up
+        """
+        num_processes: int = 4
+        processes = [multiprocessing.Process(target=add_usage, args=(self.file_name,))
+                     for _ in range(num_processes)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            self.assertEqual(process.exitcode, 0)
+
+        store = SqliteQuotaStore(self.file_name)
+        amounts = store.get_amounts("alice", "tokens_minute", [10])
+        self.assertEqual(amounts[10], num_processes * INCREMENTS_PER_PROCESS)
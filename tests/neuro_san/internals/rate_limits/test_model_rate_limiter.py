@@ -0,0 +1,151 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Tuple
+
+import asyncio
+
+from unittest import TestCase
+
+from neuro_san.internals.rate_limits.llm_call_scheduler import LlmCallScheduler
+from neuro_san.internals.rate_limits.model_rate_limiter import ModelRateLimiter
+from neuro_san.internals.rate_limits.model_rate_limiter import POLL_SECONDS
+
+
+class FakeClock:
+    """
+    A clock for tests to move forward at will
+    """
+
+    def __init__(self, now: float):
+        self.now: float = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestModelRateLimiter(TestCase):
+    """
+    Tests for the ModelRateLimiter and LlmCallScheduler
+    """
+
+    def setUp(self):
+        self.clock = FakeClock(1000.0)
+
+    def test_requests_per_minute(self):
+        """
+        Tests that calls are paced by the requests per minute
+        """
+        # One call per second, with a burst of two
+        limiter = ModelRateLimiter(requests_per_minute=60, burst_seconds=2.0, clock=self.clock)
+        self.assertEqual(limiter.try_acquire(self.enqueue(limiter, 0), 0), 0.0)
+        self.assertEqual(limiter.try_acquire(self.enqueue(limiter, 0), 0), 0.0)
+
+        ticket = self.enqueue(limiter, 0)
+        self.assertAlmostEqual(limiter.try_acquire(ticket, 0), 1.0)
+        self.clock.now += 0.5
+        self.assertAlmostEqual(limiter.try_acquire(ticket, 0), 0.5)
+        self.clock.now += 0.5
+        self.assertEqual(limiter.try_acquire(ticket, 0), 0.0)
+        self.assertEqual(limiter.get_waiting_count(), 0)
+
+    def test_tokens_per_minute(self):
+        """
+        Tests that calls are paced by prompt tokens, including calls bigger than a burst
+        """
+        # 100 tokens a second
+        limiter = ModelRateLimiter(tokens_per_minute=6000, clock=self.clock)
+        self.assertEqual(limiter.try_acquire(self.enqueue(limiter, 0), 60), 0.0)
+
+        # A big call waits for a full bucket, then leaves it in debt
+        ticket = self.enqueue(limiter, 0)
+        self.assertAlmostEqual(limiter.try_acquire(ticket, 300), 0.6)
+        self.clock.now += 0.6
+        self.assertEqual(limiter.try_acquire(ticket, 300), 0.0)
+
+        ticket = self.enqueue(limiter, 0)
+        self.assertAlmostEqual(limiter.try_acquire(ticket, 10), 2.1)
+
+        # The provider said the big call was smaller than estimated
+        limiter.reconcile(300, 100)
+        self.assertAlmostEqual(limiter.try_acquire(ticket, 10), 0.1)
+
+    def test_priority(self):
+        """
+        Tests that lower priorities go first, then earlier arrivals
+        """
+        limiter = ModelRateLimiter(requests_per_minute=60, clock=self.clock)
+        self.assertEqual(limiter.try_acquire(self.enqueue(limiter, 0), 0), 0.0)
+
+        deep_first = self.enqueue(limiter, 3)
+        deep_second = self.enqueue(limiter, 3)
+        front_man = self.enqueue(limiter, 1)
+
+        self.clock.now += 1.0
+        self.assertEqual(limiter.try_acquire(deep_first, 0), POLL_SECONDS)
+        self.assertEqual(limiter.try_acquire(deep_second, 0), POLL_SECONDS)
+        self.assertEqual(limiter.try_acquire(front_man, 0), 0.0)
+
+        self.clock.now += 1.0
+        self.assertEqual(limiter.try_acquire(deep_second, 0), POLL_SECONDS)
+        self.assertEqual(limiter.try_acquire(deep_first, 0), 0.0)
+
+    def test_acquire_cancelled(self):
+        """
+        Tests that a cancelled caller gets out of line
+        """
+        limiter = ModelRateLimiter(requests_per_minute=60)
+
+        async def run():
+            await limiter.acquire(0)
+            waiter = asyncio.ensure_future(limiter.acquire(0))
+            await asyncio.sleep(0.05)
+            self.assertEqual(limiter.get_waiting_count(), 1)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+
+        asyncio.run(run())
+        self.assertEqual(limiter.get_waiting_count(), 0)
+
+    def test_scheduler(self):
+        """
+        Tests that limiters are shared per model and only exist when there are limits
+        """
+        scheduler = LlmCallScheduler()
+        self.assertIsNone(scheduler.get_limiter("openai", "gpt-4o", None))
+        self.assertIsNone(scheduler.get_limiter("openai", "gpt-4o", {"requests_per_minute": "lots"}))
+        self.assertIsNone(scheduler.get_limiter("openai", "gpt-4o", {"tokens_per_minute": 0}))
+
+        limits = {"requests_per_minute": 100, "tokens_per_minute": 1000}
+        limiter: ModelRateLimiter = scheduler.get_limiter("openai", "gpt-4o", limits)
+        self.assertIs(scheduler.get_limiter("openai", "gpt-4o", dict(limits)), limiter)
+        self.assertIsNot(scheduler.get_limiter("openai", "gpt-4o-mini", limits), limiter)
+
+        # Changed limits replace the limiter
+        changed: ModelRateLimiter = scheduler.get_limiter("openai", "gpt-4o", {"requests_per_minute": 50})
+        self.assertIsNot(changed, limiter)
+        self.assertIsNone(changed.token_bucket)
+
+    @staticmethod
+    def enqueue(limiter: ModelRateLimiter, priority: int) -> Tuple[int, int]:
+        """
+        Gets in line the way acquire() does
+        :return: The ticket
+        """
+        with limiter.lock:
+            ticket = (priority, next(limiter.sequence))
+            limiter.waiting.append(ticket)
+            limiter.waiting.sort()
+        return ticket
@@ -0,0 +1,159 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import time
+import tracemalloc
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from neuro_san import REGISTRIES_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.run_context.langchain.core.args_schema_cache import ArgsSchemaCache
+from neuro_san.internals.run_context.langchain.core.langchain_openai_function_tool \
+    import LangChainOpenAIFunctionTool
+
+BENCHMARK_ITERATIONS: int = 10000
+
+
+class TestArgsSchemaCache(TestCase):
+    """
+    Tests the sharing of generated args_schema classes between function tools.
+    """
+
+    def setUp(self):
+        """
+        Gets the function specs of the agents in music_nerd_pro
+        """
+        restorer = AgentNetworkRestorer()
+        agent_network: AgentNetwork = restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis("music_nerd_pro.hocon"))
+        self.function_specs: List[Tuple[str, Dict[str, Any]]] = []
+        for name in agent_network.agent_spec_map:
+            function_json: Dict[str, Any] = agent_network.get_agent_tool_spec(name).get("function")
+            if function_json is not None:
+                self.function_specs.append((name, function_json))
+
+    def build_tools(self) -> List[LangChainOpenAIFunctionTool]:
+        """
+        :return: The tools for the network, built the way BaseToolFactory does
+        """
+        tools: List[LangChainOpenAIFunctionTool] = []
+        for name, function_json in self.function_specs:
+            use_function_json: Dict[str, Any] = dict(function_json)
+            use_function_json["name"] = name
+            tools.append(LangChainOpenAIFunctionTool.from_function_json(use_function_json, None))
+        return tools
+
+    def test_shared_schema(self):
+        """
+        Tests that identical specs share a class and that the class still describes the spec
+        """
+        with patch.object(ArgsSchemaCache, "_instance", ArgsSchemaCache()):
+            first: List[LangChainOpenAIFunctionTool] = self.build_tools()
+            second: List[LangChainOpenAIFunctionTool] = self.build_tools()
+
+        num_schemas: int = 0
+        for tool, other in zip(first, second):
+            if tool.args_schema is None:
+                continue
+            num_schemas += 1
+            self.assertIs(tool.args_schema, other.args_schema)
+            self.assertEqual(tool.get_input_schema().schema().get("properties").keys(),
+                             tool.function_json.get("properties").keys())
+        self.assertGreater(num_schemas, 0)
+
+    def test_key_is_canonical(self):
+        """
+        Tests that key order does not matter, but content does
+        """
+        parameters: Dict[str, Any] = {
+            "type": "object",
+            "properties": {
+                "inquiry": {"type": "string", "description": "what to ask"},
+                "mode": {"type": "string"},
+            },
+            "required": ["inquiry"]
+        }
+        reordered: Dict[str, Any] = {
+            "required": ["inquiry"],
+            "properties": {
+                "mode": {"type": "string"},
+                "inquiry": {"description": "what to ask", "type": "string"},
+            },
+            "type": "object"
+        }
+        different: Dict[str, Any] = dict(parameters, required=["mode"])
+
+        cache = ArgsSchemaCache()
+        self.assertIs(cache.get_args_schema("parameters", parameters),
+                      cache.get_args_schema("parameters", reordered))
+        self.assertIsNot(cache.get_args_schema("parameters", parameters),
+                         cache.get_args_schema("parameters", different))
+        self.assertEqual(cache.get_size(), 2)
+
+    def test_bounded(self):
+        """
+        Tests that the least recently used class is the one evicted
+        """
+        cache = ArgsSchemaCache(max_entries=2)
+        specs: List[Dict[str, Any]] = [
+            {"type": "object", "properties": {f"field_{index}": {"type": "string"}}}
+            for index in range(3)
+        ]
+        first = cache.get_args_schema("parameters", specs[0])
+        cache.get_args_schema("parameters", specs[1])
+        self.assertIs(cache.get_args_schema("parameters", specs[0]), first)
+        cache.get_args_schema("parameters", specs[2])
+        self.assertEqual(cache.get_size(), 2)
+
+        # specs[1] was least recently used, so specs[0] is still there
+        self.assertIs(cache.get_args_schema("parameters", specs[0]), first)
+
+    def run_benchmark(self, cache: ArgsSchemaCache) -> Tuple[float, int]:
+        """
+        :param cache: The ArgsSchemaCache to build tools with
+        :return: A tuple of (elapsed seconds, peak traced bytes) for building
+                the music_nerd_pro tools BENCHMARK_ITERATIONS times
+        """
+        with patch.object(ArgsSchemaCache, "_instance", cache):
+            tracemalloc.start()
+            start_time: float = time.perf_counter()
+            for _ in range(BENCHMARK_ITERATIONS):
+                self.build_tools()
+            elapsed: float = time.perf_counter() - start_time
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return elapsed, peak
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Builds the music_nerd_pro tools many times with and without the cache,
+        checking that the cache saves both time and memory.
+        """
+        before_seconds, before_peak = self.run_benchmark(ArgsSchemaCache(max_entries=0))
+        after_seconds, after_peak = self.run_benchmark(ArgsSchemaCache())
+
+        self.assertLess(after_seconds, before_seconds)
+        self.assertLess(after_peak, before_peak)
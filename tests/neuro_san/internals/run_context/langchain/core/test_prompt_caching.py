@@ -0,0 +1,122 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import json
+
+from unittest import TestCase
+from unittest.mock import AsyncMock
+
+from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.base import BaseMessage
+from langchain_core.messages.human import HumanMessage
+from langchain_core.messages.system import SystemMessage
+from langchain_core.prompts.chat import ChatPromptTemplate
+from langchain_core.runnables.base import Runnable
+from langchain_openai.chat_models.base import ChatOpenAI
+
+from neuro_san.internals.run_context.langchain.core.langchain_run_context import LangChainRunContext
+from neuro_san.internals.run_context.langchain.llms.anthropic_llm_policy import AnthropicLlmPolicy
+from neuro_san.internals.run_context.langchain.llms.langchain_llm_resources import LangChainLlmResources
+from neuro_san.internals.run_context.langchain.llms.openai_llm_policy import OpenAILlmPolicy
+
+INSTRUCTIONS: str = "You are a very thorough assistant. " * 100
+
+
+class TestPromptCaching(TestCase):
+    """
+    Tests that the static prefix of an agent's prompts is stable and marked for provider caching.
+    """
+
+    def setUp(self):
+        self.run_context = LangChainRunContext({"prompt_caching": True}, None, None, None, None)
+        self.run_context.journal = AsyncMock()
+        self.run_context.prompt_cache_key = "test_key"
+        self.template: ChatPromptTemplate = asyncio.run(self.run_context.create_prompt_template(INSTRUCTIONS))
+
+    @staticmethod
+    def render(prompt: Runnable, chat_history: List[BaseMessage], user_input: str) -> List[BaseMessage]:
+        """
+        :param prompt: The prompt Runnable
+        :param chat_history: The chat history for the turn
+        :param user_input: The input for the turn
+        :return: The messages of the rendered prompt
+        """
+        return prompt.invoke({"chat_history": chat_history, "input": user_input}).to_messages()
+
+    def test_anthropic_markers(self):
+        """
+        Tests that the marked system prefix renders byte-identically from turn to turn
+        """
+        llm_resources = LangChainLlmResources(None, AnthropicLlmPolicy())
+        prompt: Runnable = self.run_context.mark_prompt_cache(self.template, llm_resources)
+
+        first: List[BaseMessage] = self.render(prompt, [], "hello")
+        second: List[BaseMessage] = self.render(prompt, [HumanMessage("hello"), AIMessage("hi there")],
+                                                "what now?")
+
+        # The static prefix comes first and is the same on both turns
+        self.assertIsInstance(first[0], SystemMessage)
+        self.assertEqual(json.dumps(first[0].model_dump(), sort_keys=True),
+                         json.dumps(second[0].model_dump(), sort_keys=True))
+
+        blocks: List[Dict[str, Any]] = second[0].content
+        self.assertEqual(blocks[-1].get("text"), INSTRUCTIONS)
+        self.assertEqual(blocks[-1].get("cache_control"), {"type": "ephemeral"})
+
+        # Only what follows the prefix varies
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 4)
+        self.assertEqual(second[-1].content, "what now?")
+        for message in second[1:]:
+            self.assertNotIsInstance(message.content, list)
+
+    def test_openai_cache_key(self):
+        """
+        Tests that OpenAI messages are left alone but the model sends a prompt_cache_key
+        """
+        llm_resources = LangChainLlmResources(None, OpenAILlmPolicy())
+        prompt: Runnable = self.run_context.mark_prompt_cache(self.template, llm_resources)
+        messages: List[BaseMessage] = self.render(prompt, [], "hello")
+        self.assertEqual(messages[0].content, INSTRUCTIONS)
+
+        config: Dict[str, Any] = {"openai_api_key": "not-used", "prompt_cache_key": "test_key"}
+        llm: ChatOpenAI = OpenAILlmPolicy().create_llm(config, "gpt-4o", None)
+        self.assertEqual(llm.model_kwargs.get("prompt_cache_key"), "test_key")
+
+        # OpenAI-compatible servers elsewhere do not get it
+        config["openai_api_base"] = "http://localhost:8000/v1"
+        llm = OpenAILlmPolicy().create_llm(config, "gpt-4o", None)
+        self.assertNotIn("prompt_cache_key", llm.model_kwargs)
+
+        # Nor does anything without prompt caching turned on
+        llm = OpenAILlmPolicy().create_llm({"openai_api_key": "not-used"}, "gpt-4o", None)
+        self.assertNotIn("prompt_cache_key", llm.model_kwargs)
+
+    def test_opt_in(self):
+        """
+        Tests that nothing is marked without the llm_config flag
+        """
+        self.run_context.llm_config = {}
+        llm_resources = LangChainLlmResources(None, AnthropicLlmPolicy())
+        prompt: Runnable = self.run_context.mark_prompt_cache(self.template, llm_resources)
+        self.assertIs(prompt, self.template)
+
+        messages: List[BaseMessage] = self.render(prompt, [], "hello")
+        self.assertEqual(messages[0].content, INSTRUCTIONS)
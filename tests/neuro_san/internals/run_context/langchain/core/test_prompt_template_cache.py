@@ -0,0 +1,143 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import List
+from typing import Tuple
+
+import time
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from langchain_core.prompts.chat import ChatPromptTemplate
+
+from neuro_san import REGISTRIES_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.internals.run_context.langchain.core.langchain_run_context import LangChainRunContext
+from neuro_san.internals.run_context.langchain.core.prompt_template_cache import PromptTemplateCache
+
+NETWORK_NAME: str = "esp_decision_assistant"
+BENCHMARK_ITERATIONS: int = 1000
+
+
+class TestPromptTemplateCache(TestCase):
+    """
+    Tests the sharing of compiled prompt templates between activations of the same agent.
+    """
+
+    def setUp(self):
+        """
+        Gets the instructions of the agents in esp_decision_assistant
+        """
+        restorer = AgentNetworkRestorer()
+        self.agent_network: AgentNetwork = restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis(f"{NETWORK_NAME}.hocon"))
+        self.instructions: List[Tuple[str, str]] = []
+        for name in self.agent_network.agent_spec_map:
+            instructions: str = self.agent_network.get_agent_tool_spec(name).get("instructions")
+            if instructions is not None:
+                self.instructions.append((name, instructions))
+        self.assertGreater(len(self.instructions), 0)
+
+    def activate_all(self, cache: PromptTemplateCache) -> List[ChatPromptTemplate]:
+        """
+        :param cache: The PromptTemplateCache to get templates from
+        :return: The templates for every agent in the network, as one request would get them
+        """
+        return [cache.get_prompt_template(NETWORK_NAME, name, instructions,
+                                          LangChainRunContext.compile_prompt_template)
+                for name, instructions in self.instructions]
+
+    def test_shared_template(self):
+        """
+        Tests that activations share a template that still renders the instructions
+        """
+        cache = PromptTemplateCache()
+        first: List[ChatPromptTemplate] = self.activate_all(cache)
+        second: List[ChatPromptTemplate] = self.activate_all(cache)
+        self.assertEqual(cache.get_size(), len(self.instructions))
+
+        for template, other in zip(first, second):
+            self.assertIs(template, other)
+            self.assertEqual(set(template.input_variables), {"input"})
+
+        messages = first[0].invoke({"chat_history": [], "input": "hello"}).to_messages()
+        self.assertEqual(messages[-1].content, "hello")
+
+    def test_changed_instructions(self):
+        """
+        Tests that a template is not used for instructions it was not compiled from
+        """
+        cache = PromptTemplateCache()
+        first: ChatPromptTemplate = cache.get_prompt_template(NETWORK_NAME, "agent", "Be nice",
+                                                              LangChainRunContext.compile_prompt_template)
+        second: ChatPromptTemplate = cache.get_prompt_template(NETWORK_NAME, "agent", "Be terse",
+                                                               LangChainRunContext.compile_prompt_template)
+        self.assertIsNot(first, second)
+        self.assertEqual(cache.get_size(), 1)
+
+    def test_storage_invalidation(self):
+        """
+        Tests that templates are dropped when storage reports the network as modified
+        """
+        cache = PromptTemplateCache()
+        storage = AgentNetworkStorage()
+        storage.add_listener(cache)
+        storage.add_agent_network(NETWORK_NAME, self.agent_network)
+
+        first: List[ChatPromptTemplate] = self.activate_all(cache)
+        self.assertEqual(cache.get_size(), len(self.instructions))
+
+        storage.add_agent_network(NETWORK_NAME, self.agent_network)
+        self.assertEqual(cache.get_size(), 0)
+        second: List[ChatPromptTemplate] = self.activate_all(cache)
+        self.assertIsNot(first[0], second[0])
+
+        storage.remove_agent_network(NETWORK_NAME)
+        self.assertEqual(cache.get_size(), 0)
+
+    def test_bad_cache_size(self):
+        """
+        Tests that a bad AGENT_PROMPT_TEMPLATE_CACHE_SIZE falls back to the default size
+        """
+        with patch.dict("os.environ", {"AGENT_PROMPT_TEMPLATE_CACHE_SIZE": "big"}), \
+                patch.object(PromptTemplateCache, "_instance", None):
+            cache: PromptTemplateCache = PromptTemplateCache.get_instance()
+        self.assertEqual(cache.max_entries, PromptTemplateCache.DEFAULT_MAX_ENTRIES)
+
+    def run_benchmark(self, cache: PromptTemplateCache) -> float:
+        """
+        :param cache: The PromptTemplateCache to get templates from
+        :return: The elapsed seconds for BENCHMARK_ITERATIONS activations of every agent
+        """
+        start_time: float = time.perf_counter()
+        for _ in range(BENCHMARK_ITERATIONS):
+            self.activate_all(cache)
+        return time.perf_counter() - start_time
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Activates every esp_decision_assistant agent many times with and without the cache,
+        checking that the cache saves time.
+        """
+        before_seconds: float = self.run_benchmark(PromptTemplateCache(max_entries=0))
+        after_seconds: float = self.run_benchmark(PromptTemplateCache())
+
+        self.assertLess(after_seconds, before_seconds)
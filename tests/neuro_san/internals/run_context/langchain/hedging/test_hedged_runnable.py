@@ -0,0 +1,220 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+
+from time import time
+from unittest import TestCase
+
+from langchain.agents.factory import create_agent
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.messages import AIMessage
+from langchain_core.messages import BaseMessage
+from langchain_core.messages import HumanMessage
+from langchain_core.messages import ToolMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import ChatResult
+from langchain_core.runnables.base import Runnable
+from langchain_core.runnables.base import RunnableLambda
+from langchain_core.tools import BaseTool
+from langchain_core.tools import tool
+
+from neuro_san.internals.run_context.langchain.hedging.hedge_delay_tracker import HedgeDelayTracker
+from neuro_san.internals.run_context.langchain.hedging.hedged_runnable import HedgedRunnable
+from neuro_san.internals.run_context.langchain.token_counting.get_llm_token_callback import get_llm_token_callback
+from neuro_san.internals.run_context.langchain.token_counting.llm_token_callback_handler \
+    import LlmTokenCallbackHandler
+from neuro_san.test.llms.chat_mock_llm import ChatMockLlm
+
+
+class ToolCallingMockLlm(ChatMockLlm):
+    """
+    ChatMockLlm that first asks for the "count_call" tool, then answers with what the tool returned
+    """
+
+    # pylint: disable=unused-argument
+    def bind_tools(self, tools: List[Any], **kwargs: Any) -> "ToolCallingMockLlm":
+        """
+        :return: This same model, which knows its one tool already
+        """
+        return self
+
+    # pylint: disable=unused-argument
+    def _generate(self, messages: List[BaseMessage], stop: List[str] = None,
+                  run_manager: CallbackManagerForLLMRun = None, **kwargs: Any) -> ChatResult:
+        """
+        :return: A call to the tool, or the answer once the tool has been called
+        """
+        self._simulate_latency()
+        if isinstance(messages[-1], ToolMessage):
+            message = AIMessage(content=messages[-1].content, response_metadata={"model_name": self.model_name})
+        else:
+            message = AIMessage(content="", response_metadata={"model_name": self.model_name},
+                                tool_calls=[{"name": "count_call", "args": {}, "id": self.model_name}])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class TestHedgedRunnable(TestCase):
+    """
+    Tests hedging across a primary and a fallback with scripted latencies
+    """
+
+    @staticmethod
+    def run_hedged(runnables: List[Runnable], tracker: HedgeDelayTracker) \
+            -> Tuple[AIMessage, LlmTokenCallbackHandler, float]:
+        """
+        :return: A tuple of the answer, the token accounting and the seconds it took
+        """
+        async def run() -> Tuple[AIMessage, LlmTokenCallbackHandler, float]:
+            with get_llm_token_callback({}) as callback:
+                start_time: float = time()
+                result: AIMessage = await HedgedRunnable(runnables, tracker).ainvoke("hello world")
+                return result, callback, time() - start_time
+        return asyncio.run(run())
+
+    def test_slow_primary(self):
+        """
+        Tests that a slow primary is hedged, the fallback wins and both calls are counted
+        """
+        primary = ChatMockLlm(model_name="primary", delay_seconds=1.0)
+        fallback = ChatMockLlm(model_name="fallback", delay_seconds=0.05)
+        tracker = HedgeDelayTracker(delay_seconds=0.1)
+
+        result, callback, elapsed = self.run_hedged([primary, fallback], tracker)
+
+        self.assertEqual(result.response_metadata.get("model_name"), "fallback")
+        self.assertLess(elapsed, 0.6)
+
+        models: Dict[str, Any] = callback.models_token_dict.get("ChatMockLlm")
+        self.assertEqual(models.get("fallback").get("successful_requests"), 1)
+        self.assertEqual(models.get("primary").get("successful_requests"), 0)
+        self.assertEqual(models.get("primary").get("abandoned_requests"), 1)
+        self.assertGreater(models.get("primary").get("prompt_tokens"), 0)
+        self.assertEqual(callback.successful_requests, 1)
+        self.assertEqual(callback.prompt_tokens,
+                         models.get("primary").get("prompt_tokens") + models.get("fallback").get("prompt_tokens"))
+
+        # The primary went without progress for at least the delay
+        self.assertGreaterEqual(tracker.samples[0], 0.1)
+
+    def test_fast_primary(self):
+        """
+        Tests that a primary answering within the delay is never hedged
+        """
+        primary = ChatMockLlm(model_name="primary", delay_seconds=0.05)
+        fallback = ChatMockLlm(model_name="fallback")
+        tracker = HedgeDelayTracker(delay_seconds=0.5)
+
+        result, callback, _ = self.run_hedged([primary, fallback], tracker)
+
+        self.assertEqual(result.response_metadata.get("model_name"), "primary")
+        models: Dict[str, Any] = callback.models_token_dict.get("ChatMockLlm")
+        self.assertNotIn("fallback", models)
+        self.assertEqual(len(tracker.samples), 1)
+        self.assertLess(tracker.samples[0], 0.5)
+
+    def test_slow_fallback(self):
+        """
+        Tests that a hedged primary that still finishes first wins
+        """
+        primary = ChatMockLlm(model_name="primary", delay_seconds=0.3)
+        fallback = ChatMockLlm(model_name="fallback", delay_seconds=1.0)
+        tracker = HedgeDelayTracker(delay_seconds=0.1)
+
+        result, callback, elapsed = self.run_hedged([primary, fallback], tracker)
+
+        self.assertEqual(result.response_metadata.get("model_name"), "primary")
+        self.assertLess(elapsed, 0.8)
+        models: Dict[str, Any] = callback.models_token_dict.get("ChatMockLlm")
+        self.assertEqual(models.get("fallback").get("abandoned_requests"), 1)
+
+    def test_failing_primary(self):
+        """
+        Tests that a failing primary falls back as with_fallbacks() would
+        """
+        async def fail(_: Any) -> AIMessage:
+            raise ValueError("primary is down")
+
+        fallback = ChatMockLlm(model_name="fallback")
+        tracker = HedgeDelayTracker(delay_seconds=0.5)
+
+        result, _, elapsed = self.run_hedged([RunnableLambda(fail), fallback], tracker)
+        self.assertEqual(result.response_metadata.get("model_name"), "fallback")
+        self.assertLess(elapsed, 0.5)
+
+        with self.assertRaises(ValueError):
+            self.run_hedged([RunnableLambda(fail), RunnableLambda(fail)], tracker)
+
+    @staticmethod
+    def run_tool_calling(primary_delay_seconds: float) -> Tuple[Dict[str, Any], int]:
+        """
+        Runs hedged agent chains that call a tool, with a fallback that hears back from its LLM after 0.1 seconds
+        :param primary_delay_seconds: How long the primary takes to hear back from its LLM
+        :return: A tuple of the output of the agent chain and the number of times the tool was called
+        """
+        tool_calls: List[str] = []
+
+        @tool
+        async def count_call() -> str:
+            """
+            Counts calls to this tool
+            """
+            tool_calls.append("called")
+            # Give the other agent chain plenty of time to call the tool too
+            await asyncio.sleep(0.2)
+            return f"call {len(tool_calls)}"
+
+        tools: List[BaseTool] = [count_call]
+        primary = create_agent(model=ToolCallingMockLlm(model_name="primary", delay_seconds=primary_delay_seconds),
+                               tools=tools)
+        fallback = create_agent(model=ToolCallingMockLlm(model_name="fallback", delay_seconds=0.1), tools=tools)
+        tracker = HedgeDelayTracker(delay_seconds=0.1)
+
+        async def run() -> Dict[str, Any]:
+            return await HedgedRunnable([primary, fallback], tracker).ainvoke(
+                {"messages": [HumanMessage(content="hello world")]})
+
+        return asyncio.run(run()), len(tool_calls)
+
+    def test_tools_called_once(self):
+        """
+        Tests that hedged agent chains only ever call a tool once, whether the fallback
+        hears back from its LLM first, or both do at about the same time
+        """
+        for primary_delay_seconds in [1.0, 0.2]:
+            result, num_tool_calls = self.run_tool_calling(primary_delay_seconds)
+            self.assertEqual(result.get("messages")[-1].content, "call 1")
+            self.assertEqual(num_tool_calls, 1)
+
+    def test_delay_percentile(self):
+        """
+        Tests that the delay follows the percentile of observed delays once there are enough
+        """
+        tracker = HedgeDelayTracker(percentile=90, delay_seconds=3.0, min_samples=10)
+        for index in range(9):
+            tracker.add_sample(index + 1.0)
+        self.assertEqual(tracker.get_delay_seconds(), 3.0)
+
+        tracker.add_sample(10.0)
+        self.assertEqual(tracker.get_delay_seconds(), 9.0)
+
+        same = HedgeDelayTracker.get_tracker(("agent", "openai", "gpt-4o"), {"percentile": 90})
+        self.assertIs(HedgeDelayTracker.get_tracker(("agent", "openai", "gpt-4o"), {"percentile": 90}), same)
+        self.assertIsNot(HedgeDelayTracker.get_tracker(("agent", "openai", "gpt-4o"), True), same)
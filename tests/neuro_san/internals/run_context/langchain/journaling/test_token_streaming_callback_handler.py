@@ -0,0 +1,142 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from time import time
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
+from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextTypeToolboxFactory
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
+from neuro_san.internals.run_context.factory.master_toolbox_factory import MasterToolboxFactory
+from neuro_san.session.direct_agent_session import DirectAgentSession
+from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
+from neuro_san.session.session_invocation_context import SessionInvocationContext
+
+STREAM_DELAY: float = 0.1
+
+USER_TEXT: str = "hello world"
+
+NETWORK_CONFIG: Dict[str, Any] = {
+    "llm_config": {
+        "class": "neuro_san.test.llms.chat_mock_llm.ChatMockLlm",
+        "model_name": "echo",
+        "stream_delay_seconds": STREAM_DELAY,
+    },
+    "tools": [
+        {
+            "name": "echoer",
+            "function": {
+                "description": "Echoes the input"
+            },
+            "instructions": "Echo the input"
+        }
+    ]
+}
+
+
+class TestTokenStreamingCallbackHandler(TestCase):
+    """
+    Tests that the front man's LLM output is streamed as AGENT_TOKEN_DELTA messages
+    when the ChatFilter asks for it, using a mock LLM that streams with delays.
+    """
+
+    def setUp(self):
+        """
+        Sets up a DirectAgentSession on an echoing mock network
+        """
+        agent_network = AgentNetwork(NETWORK_CONFIG, "token_streaming_test")
+
+        llm_factory: ContextTypeLlmFactory = MasterLlmFactory.create_llm_factory(NETWORK_CONFIG)
+        toolbox_factory: ContextTypeToolboxFactory = MasterToolboxFactory.create_toolbox_factory(NETWORK_CONFIG)
+        llm_factory.load()
+        toolbox_factory.load()
+
+        self.executors_pool = AsyncioExecutorPool()
+        factory = ExternalAgentSessionFactory(use_direct=True, network_storage_dict={})
+        invocation_context = SessionInvocationContext("token_streaming_test", factory, self.executors_pool,
+                                                      llm_factory, toolbox_factory, {})
+        invocation_context.start()
+        self.session = DirectAgentSession(agent_network=agent_network,
+                                          invocation_context=invocation_context,
+                                          metadata={})
+
+    def tearDown(self):
+        self.session.close()
+        self.executors_pool.shutdown()
+
+    def chat(self, chat_filter: Dict[str, Any]) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        :param chat_filter: The ChatFilter dictionary for the request
+        :return: A list of (arrival time, ChatMessage dictionary) tuples
+        """
+        request: Dict[str, Any] = {
+            "user_message": {
+                "type": "HUMAN",
+                "text": USER_TEXT
+            },
+            "chat_filter": chat_filter
+        }
+        arrivals: List[Tuple[float, Dict[str, Any]]] = []
+        for response in self.session.streaming_chat(request):
+            arrivals.append((time(), response.get("response")))
+        return arrivals
+
+    def test_stream_tokens(self):
+        """
+        Tests that deltas arrive one by one before the final answer
+        """
+        chat_filter: Dict[str, Any] = {
+            "chat_filter_type": "MINIMAL",
+            "stream_tokens": True
+        }
+        arrivals: List[Tuple[float, Dict[str, Any]]] = self.chat(chat_filter)
+        types: List[ChatMessageType] = [message.get("type") for _, message in arrivals]
+        deltas: List[Tuple[float, Dict[str, Any]]] = [
+            arrival for arrival in arrivals if arrival[1].get("type") == ChatMessageType.AGENT_TOKEN_DELTA
+        ]
+
+        # One delta per character from the mock llm, all from the front man
+        self.assertEqual("".join(message.get("text") for _, message in deltas), USER_TEXT)
+        for _, message in deltas:
+            self.assertEqual(len(message.get("origin")), 1)
+
+        # The usual final message comes last
+        self.assertEqual(types[-1], ChatMessageType.AGENT_FRAMEWORK)
+        self.assertEqual(arrivals[-1][1].get("text"), USER_TEXT)
+        self.assertEqual(types.count(ChatMessageType.AGENT_FRAMEWORK), 1)
+
+        # Deltas were streamed as generated, not all at once at the end
+        first_delta_time: float = deltas[0][0]
+        last_delta_time: float = deltas[-1][0]
+        self.assertGreaterEqual(last_delta_time - first_delta_time, (len(USER_TEXT) - 2) * STREAM_DELAY)
+
+    def test_no_stream_tokens(self):
+        """
+        Tests that there are no deltas unless they are asked for
+        """
+        for chat_filter in [None, {"chat_filter_type": "MAXIMAL"}, {"stream_tokens": False}]:
+            arrivals: List[Tuple[float, Dict[str, Any]]] = self.chat(chat_filter)
+            types: List[ChatMessageType] = [message.get("type") for _, message in arrivals]
+            self.assertNotIn(ChatMessageType.AGENT_TOKEN_DELTA, types)
+            self.assertEqual(types[-1], ChatMessageType.AGENT_FRAMEWORK)
@@ -0,0 +1,165 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
+from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextTypeToolboxFactory
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.quota.quota_manager import QuotaManager
+from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
+from neuro_san.internals.run_context.factory.master_toolbox_factory import MasterToolboxFactory
+from neuro_san.session.direct_agent_session import DirectAgentSession
+from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
+from neuro_san.session.session_invocation_context import SessionInvocationContext
+
+NETWORK_CONFIG: Dict[str, Any] = {
+    "llm_config": {
+        "class": "neuro_san.test.llms.tool_calling_mock_llm.ToolCallingMockLlm",
+        "model_name": "echo",
+    },
+    "tools": [
+        {
+            "name": "front_man",
+            "function": {
+                "description": "Passes the input to a sub-agent"
+            },
+            "instructions": "Call your tool",
+            "tools": ["sub"]
+        },
+        {
+            "name": "sub",
+            "function": {
+                "description": "Echoes the input",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "inquiry": {
+                            "type": "string",
+                            "description": "What to echo"
+                        }
+                    },
+                    "required": ["inquiry"]
+                }
+            },
+            "instructions": "Echo the input",
+            "llm_config": {
+                "class": "neuro_san.test.llms.chat_mock_llm.ChatMockLlm",
+                "model_name": "echo",
+            }
+        }
+    ]
+}
+
+
+class TestQuotaCallbackHandler(TestCase):
+    """
+    Tests that LLM calls are stopped gracefully once a quota key has used up its budget.
+    """
+
+    def setUp(self):
+        """
+        Sets up the factories and a process-wide QuotaManager just for these tests
+        """
+        self.llm_factory: ContextTypeLlmFactory = MasterLlmFactory.create_llm_factory(NETWORK_CONFIG)
+        self.toolbox_factory: ContextTypeToolboxFactory = \
+            MasterToolboxFactory.create_toolbox_factory(NETWORK_CONFIG)
+        self.llm_factory.load()
+        self.toolbox_factory.load()
+        self.executors_pool = AsyncioExecutorPool()
+
+        self.quota_manager = QuotaManager("user_id", tokens_per_minute=1000)
+        self.patcher = patch.object(QuotaManager, "_instance", self.quota_manager)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.executors_pool.shutdown()
+
+    def chat(self, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        :param metadata: The request metadata
+        :return: The list of ChatMessage dictionaries streamed back
+        """
+        factory = ExternalAgentSessionFactory(use_direct=True, network_storage_dict={})
+        invocation_context = SessionInvocationContext("quota_test", factory, self.executors_pool,
+                                                      self.llm_factory, self.toolbox_factory, metadata)
+        invocation_context.start()
+        session = DirectAgentSession(agent_network=AgentNetwork(NETWORK_CONFIG, "quota_test"),
+                                     invocation_context=invocation_context,
+                                     metadata=metadata)
+        request: Dict[str, Any] = {
+            "user_message": {
+                "type": "HUMAN",
+                "text": "hello world"
+            }
+        }
+        try:
+            return [response.get("response") for response in session.streaming_chat(request)]
+        finally:
+            session.close()
+
+    def get_answer(self, messages: List[Dict[str, Any]]) -> str:
+        """
+        :param messages: The list of ChatMessage dictionaries streamed back
+        :return: The text of the final answer
+        """
+        answers: List[Dict[str, Any]] = [message for message in messages
+                                         if message.get("type") == ChatMessageType.AGENT_FRAMEWORK]
+        self.assertEqual(len(answers), 1)
+        return answers[0].get("text")
+
+    def test_quota_exceeded(self):
+        """
+        Tests that a run over budget ends with a clear message instead of an LLM call
+        """
+        # Nothing used yet, so the first request goes through and is counted
+        answer: str = self.get_answer(self.chat({"user_id": "alice"}))
+        self.assertIn("hello world", answer)
+        self.assertNotIn("Quota exceeded", answer)
+        usage: Dict[str, float] = self.quota_manager.get_usage("alice")
+        self.assertGreater(usage["tokens_per_minute"], 0)
+
+        # Use up the rest of the budget.
+        # The next request is over budget before the front man even calls the llm
+        self.quota_manager.record("alice", 1000, 0.0)
+        usage = self.quota_manager.get_usage("alice")
+        answer = self.get_answer(self.chat({"user_id": "alice"}))
+        self.assertIn("Quota exceeded for user_id 'alice'", answer)
+        self.assertAlmostEqual(self.quota_manager.get_usage("alice")["tokens_per_minute"],
+                               usage["tokens_per_minute"], delta=1.0)
+
+        # Others are not affected
+        answer = self.get_answer(self.chat({"user_id": "bob"}))
+        self.assertIn("hello world", answer)
+        self.assertNotIn("Quota exceeded", answer)
+
+    def test_quota_exceeded_mid_run(self):
+        """
+        Tests that the budget is checked before every llm call, not just at the start of a request
+        """
+        # Not enough for the whole request to complete, but enough for it to start
+        self.quota_manager.tokens_per_minute = 5
+        answer: str = self.get_answer(self.chat({"user_id": "carol"}))
+        self.assertIn("Quota exceeded for user_id 'carol'", answer)
+        self.assertGreater(self.quota_manager.get_usage("carol")["tokens_per_minute"], 0)
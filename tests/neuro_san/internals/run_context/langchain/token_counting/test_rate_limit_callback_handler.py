@@ -0,0 +1,171 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import asyncio
+
+from time import monotonic
+from unittest import TestCase
+from unittest.mock import patch
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from pydantic import Field
+
+from neuro_san.internals.rate_limits.llm_call_scheduler import LlmCallScheduler
+from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
+from neuro_san.internals.run_context.langchain.core.langchain_run_context import LangChainRunContext
+from neuro_san.internals.run_context.langchain.llms.langchain_llm_resources import LangChainLlmResources
+from neuro_san.internals.run_context.langchain.token_counting.rate_limit_callback_handler \
+    import RateLimitCallbackHandler
+from neuro_san.internals.run_context.langchain.token_counting.token_estimator import TokenEstimator
+from neuro_san.test.llms.chat_mock_llm import ChatMockLlm
+
+NUM_CALLS: int = 30
+
+# Allowance for timer granularity
+SLACK_SECONDS: float = 0.02
+
+
+class RateCheckingMockLlm(ChatMockLlm):
+    """
+    A ChatMockLlm that checks that the calls reaching it stay within its limits
+    """
+
+    requests_per_second: float = 0.0
+    request_burst: float = 0.0
+    call_times: List[float] = Field(default_factory=list)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        now: float = monotonic()
+        self.call_times.append(now)
+
+        # However many calls there were from any earlier call up to this one,
+        # there can be no more than a burst plus what the rate allows in between.
+        count: int = len(self.call_times)
+        for index, earlier in enumerate(self.call_times):
+            allowed: float = self.request_burst + self.requests_per_second * (now - earlier + SLACK_SECONDS)
+            assert count - index <= allowed, f"{count - index} calls in {now - earlier:.3f} seconds"
+
+        return super()._generate(messages, stop, run_manager, **kwargs)
+
+
+class TestRateLimitCallbackHandler(TestCase):
+    """
+    Tests that LLM calls are held to the rate limits configured for their model
+    """
+
+    def setUp(self):
+        """
+        Sets up a process-wide LlmCallScheduler just for these tests
+        """
+        self.patcher = patch.object(LlmCallScheduler, "_instance", LlmCallScheduler())
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def schedule(self, llm: RateCheckingMockLlm, rate_limits: Dict[str, Any]):
+        """
+        Has the model's calls scheduled the way LangChainRunContext does for its agent
+        """
+        llm_resources = LangChainLlmResources(llm)
+        llm_resources.set_rate_limits("test", llm.model_name, rate_limits)
+        run_context = LangChainRunContext({}, None, None, None, None)
+        run_context.schedule_model_calls(llm_resources)
+
+    @staticmethod
+    def burst_of_calls(llm: RateCheckingMockLlm, prompt: str = "hello"):
+        """
+        Makes NUM_CALLS calls to the llm all at once
+        """
+        async def run():
+            await asyncio.gather(*[llm.ainvoke(f"{prompt} {index}") for index in range(NUM_CALLS)])
+        asyncio.run(run())
+
+    def test_requests_per_minute(self):
+        """
+        Tests that simultaneous calls never reach the model faster than its requests per minute
+        """
+        # 10 calls a second with a burst of 5
+        llm = RateCheckingMockLlm(model_name="rpm", requests_per_second=10.0, request_burst=5.0)
+        self.schedule(llm, {"requests_per_minute": 600, "burst_seconds": 0.5})
+
+        self.burst_of_calls(llm)
+
+        self.assertEqual(len(llm.call_times), NUM_CALLS)
+        elapsed: float = llm.call_times[-1] - llm.call_times[0]
+        self.assertGreaterEqual(elapsed, (NUM_CALLS - 5) / 10.0 - SLACK_SECONDS)
+
+    def test_tokens_per_minute(self):
+        """
+        Tests that simultaneous calls never send the model more prompt tokens than its tokens per minute
+        """
+        llm = RateCheckingMockLlm(model_name="tpm", requests_per_second=1000.0, request_burst=1000.0)
+        prompt: str = "the quick brown fox jumps over the lazy dog " * 10
+        tokens: int = TokenEstimator.estimate_text(f"{prompt} 0") + 4
+
+        # Enough tokens for 10 calls a second with a burst of 5
+        self.schedule(llm, {"tokens_per_minute": tokens * 600, "burst_seconds": 0.5})
+
+        self.burst_of_calls(llm, prompt)
+
+        self.assertEqual(len(llm.call_times), NUM_CALLS)
+        elapsed: float = llm.call_times[-1] - llm.call_times[0]
+        self.assertGreaterEqual(elapsed, (NUM_CALLS - 5) / 10.0 * 0.9)
+
+    def test_no_limits(self):
+        """
+        Tests that models without rate limits are left alone
+        """
+        llm = RateCheckingMockLlm(model_name="free", requests_per_second=1000.0, request_burst=1000.0)
+        self.schedule(llm, None)
+        self.assertFalse(llm.callbacks)
+
+    def test_rate_limits_from_config(self):
+        """
+        Tests that rate limits in an llm_config make it to the model's callbacks
+        without being passed to the model's constructor
+        """
+        llm_config: Dict[str, Any] = {
+            "class": "neuro_san.test.llms.chat_mock_llm.ChatMockLlm",
+            "model_name": "echo",
+            "rate_limits": {
+                "requests_per_minute": 60
+            }
+        }
+        llm_factory = MasterLlmFactory.create_llm_factory({"llm_config": llm_config})
+        llm_factory.load()
+        llm_resources: LangChainLlmResources = llm_factory.create_llm(llm_config)
+        self.assertEqual(llm_resources.get_rate_limits(), {"requests_per_minute": 60})
+        self.assertEqual(llm_resources.get_model_name(), "echo")
+
+        run_context = LangChainRunContext(llm_config, None, None, None, None)
+        run_context.schedule_model_calls(llm_resources)
+        handlers: List[Any] = llm_resources.get_model().callbacks
+        self.assertEqual(len(handlers), 1)
+        self.assertIsInstance(handlers[0], RateLimitCallbackHandler)
+        self.assertEqual(handlers[0].priority, 0)
@@ -0,0 +1,148 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import time
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from langchain_core.messages import AIMessage
+from langchain_core.messages import BaseMessage
+from langchain_core.messages import HumanMessage
+from langchain_core.messages import SystemMessage
+from tiktoken import get_encoding
+
+from neuro_san.internals.run_context.langchain.token_counting.token_estimator import TokenEstimator
+
+BENCHMARK_TURNS: int = 1000
+
+INSTRUCTIONS: str = "You are an assistant that helps people make decisions about their business. " * 50
+
+TOOLS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": f"tool_{index}",
+            "description": "Looks up something useful for the decision at hand. " * 5,
+            "parameters": {
+                "type": "object",
+                "properties": {"inquiry": {"type": "string", "description": "What to look up"}},
+                "required": ["inquiry"]
+            }
+        }
+    }
+    for index in range(10)
+]
+
+
+class TestTokenEstimator(TestCase):
+    """
+    Tests the shared encoders and the cache of token counts for large static strings.
+    """
+
+    def setUp(self):
+        TokenEstimator.clear_cache()
+
+    def tearDown(self):
+        TokenEstimator.clear_cache()
+
+    def test_encoding_names(self):
+        """
+        Tests the model name to encoding mapping
+        """
+        self.assertEqual(TokenEstimator.get_encoding_name("gpt-4o-mini"), "o200k_base")
+        self.assertEqual(TokenEstimator.get_encoding_name("gpt-4-turbo"), "cl100k_base")
+        self.assertEqual(TokenEstimator.get_encoding_name("gpt-4.1"), "o200k_base")
+        self.assertEqual(TokenEstimator.get_encoding_name("claude-3-7-sonnet"), "o200k_base")
+        self.assertEqual(TokenEstimator.get_encoding_name(None), "o200k_base")
+        self.assertIs(TokenEstimator.get_encoder_for_model("gpt-4o"), TokenEstimator.get_encoder("o200k_base"))
+
+    def test_cached_counts(self):
+        """
+        Tests that long strings are counted once and get the same count as encoding them
+        """
+        expected: int = len(get_encoding("o200k_base").encode(INSTRUCTIONS))
+        self.assertEqual(TokenEstimator.estimate_text(INSTRUCTIONS), expected)
+        self.assertEqual(TokenEstimator.get_cache_size(), 1)
+
+        with patch.object(TokenEstimator, "encode_length", side_effect=AssertionError("encoded again")):
+            self.assertEqual(TokenEstimator.estimate_text(INSTRUCTIONS), expected)
+
+        # Short strings are not worth caching. Encodings do not share counts.
+        TokenEstimator.estimate_text("hello world")
+        self.assertEqual(TokenEstimator.get_cache_size(), 1)
+        TokenEstimator.estimate_text(INSTRUCTIONS, "cl100k_base")
+        self.assertEqual(TokenEstimator.get_cache_size(), 2)
+
+    def test_bounded(self):
+        """
+        Tests that the cache of counts does not grow past its size
+        """
+        with patch.object(TokenEstimator, "max_entries", 3):
+            for index in range(10):
+                TokenEstimator.estimate_text(f"{index} {INSTRUCTIONS}")
+            self.assertEqual(TokenEstimator.get_cache_size(), 3)
+
+    def test_bad_cache_size(self):
+        """
+        Tests that a bad AGENT_TOKEN_COUNT_CACHE_SIZE falls back to the default size
+        """
+        with patch.dict("os.environ", {"AGENT_TOKEN_COUNT_CACHE_SIZE": "big"}), \
+                patch.object(TokenEstimator, "max_entries", None):
+            self.assertEqual(TokenEstimator.get_max_entries(), TokenEstimator.DEFAULT_MAX_ENTRIES)
+
+    def test_chat_call(self):
+        """
+        Tests that tool definitions count towards the estimate of a chat call
+        """
+        messages: List[List[BaseMessage]] = [[SystemMessage(INSTRUCTIONS), HumanMessage("hello")]]
+        without_tools: int = TokenEstimator.estimate_chat_call(messages, {"model_name": "gpt-4o"})
+        with_tools: int = TokenEstimator.estimate_chat_call(messages, {"model_name": "gpt-4o", "tools": TOOLS})
+        self.assertGreater(with_tools, without_tools)
+
+    @staticmethod
+    def count_turns(uncached: bool) -> float:
+        """
+        Counts the prompt tokens of BENCHMARK_TURNS turns of a growing conversation
+        with the same instructions and tools every turn.
+
+        :param uncached: True if counts should not be cached
+        :return: The elapsed seconds
+        """
+        history: List[BaseMessage] = []
+        start_time: float = time.perf_counter()
+        with patch.object(TokenEstimator, "max_entries", 0 if uncached else TokenEstimator.DEFAULT_MAX_ENTRIES):
+            for turn in range(BENCHMARK_TURNS):
+                messages: List[BaseMessage] = [SystemMessage(INSTRUCTIONS)] + history[-6:] + \
+                    [HumanMessage(f"What about option {turn}?")]
+                TokenEstimator.estimate_chat_call([messages], {"model_name": "gpt-4o", "tools": TOOLS})
+                history.extend([HumanMessage(f"What about option {turn}?"), AIMessage(f"Option {turn} is fine.")])
+        return time.perf_counter() - start_time
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Counts 1,000 turns with and without cached counts, checking that caching saves time.
+        """
+        before_seconds: float = self.count_turns(uncached=True)
+        after_seconds: float = self.count_turns(uncached=False)
+
+        self.assertLess(after_seconds, before_seconds)
@@ -0,0 +1,244 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from tornado.httpserver import HTTPServer
+from tornado.testing import bind_unused_port
+from tornado.web import Application
+from tornado.web import RequestHandler
+
+from neuro_san.internals.run_context.utils.external_function_cache import ExternalFunctionCache
+from neuro_san.internals.run_context.utils.external_tool_adapter import ExternalToolAdapter
+from neuro_san.internals.utils.etag_util import EtagUtil
+from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
+
+TTL_SECONDS: float = 60.0
+NEGATIVE_TTL_SECONDS: float = 5.0
+
+FUNCTION_RESPONSE: Dict[str, Any] = {
+    "function": {
+        "description": "I am a stub",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "inquiry": {
+                    "type": "string"
+                }
+            }
+        }
+    }
+}
+
+
+class StubFunctionHandler(RequestHandler):
+    """
+    Counts function requests and answers If-None-Match like the real FunctionHandler does.
+    Calls are counted in the "counts" dictionary of the application settings.
+    """
+
+    async def get(self, agent_name: str):
+        """
+        Answers a function request after a little while, so that concurrent requests overlap
+        """
+        counts: Dict[str, int] = self.settings.get("counts")
+        counts["calls"] += 1
+        await asyncio.sleep(0.05)
+        if agent_name != "stub_agent":
+            self.set_status(503)
+            self.write("down")
+            return
+
+        self.set_header("Etag", EtagUtil.compute_etag(FUNCTION_RESPONSE))
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        counts["bodies"] += 1
+        self.write(FUNCTION_RESPONSE)
+
+
+class FakeClock:
+    """
+    A clock for tests to move forward at will
+    """
+
+    def __init__(self):
+        self.now: float = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestExternalFunctionCache(TestCase):
+    """
+    Tests the process-wide cache of external agent function json against a local stub server
+    """
+
+    def setUp(self):
+        """
+        Starts the stub server on its own thread and event loop
+        """
+        self.counts: Dict[str, int] = {"calls": 0, "bodies": 0}
+        sock, self.port = bind_unused_port()
+        app = Application([(r"/api/v1/([^/]+)/function", StubFunctionHandler)], counts=self.counts)
+
+        self.server_loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def serve():
+            asyncio.set_event_loop(self.server_loop)
+            server = HTTPServer(app)
+            server.add_sockets([sock])
+            self.server_loop.call_soon(started.set)
+            self.server_loop.run_forever()
+            server.stop()
+
+        self.server_thread = threading.Thread(target=serve, daemon=True)
+        self.server_thread.start()
+        started.wait()
+
+        self.clock = FakeClock()
+        self.cache = ExternalFunctionCache(ttl_seconds=TTL_SECONDS, negative_ttl_seconds=NEGATIVE_TTL_SECONDS,
+                                           clock=self.clock)
+        self.patcher = patch.object(ExternalFunctionCache, "_instance", self.cache)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.server_loop.call_soon_threadsafe(self.server_loop.stop)
+        self.server_thread.join(timeout=5)
+
+    def make_invocation_context(self, user_id: str) -> Mock:
+        """
+        :param user_id: The user making the request
+        :return: A stand-in for an InvocationContext with its own request id
+        """
+        invocation_context = Mock()
+        invocation_context.get_port.return_value = None
+        invocation_context.get_metadata.return_value = {
+            "user_id": user_id,
+            "request_id": str(id(invocation_context)),
+        }
+        return invocation_context
+
+    async def lookup(self, agent_name: str, user_id: str = "alice") -> Dict[str, Any]:
+        """
+        :param agent_name: The name of the agent on the stub server
+        :param user_id: The user making the request
+        :return: The function json, as an agent activation would get it
+        """
+        adapter = ExternalToolAdapter(ExternalAgentSessionFactory(use_direct=False),
+                                      f"http://localhost:{self.port}/{agent_name}")
+        return await adapter.get_function_json(self.make_invocation_context(user_id))
+
+    def concurrent_lookups(self, num_requests: int, user_id: str = "alice") -> List[Dict[str, Any]]:
+        """
+        :param num_requests: The number of simultaneous lookups
+        :param user_id: The user making the requests
+        :return: The function json each lookup got
+        """
+        async def run() -> List[Dict[str, Any]]:
+            return await asyncio.gather(*[self.lookup("stub_agent", user_id) for _ in range(num_requests)])
+
+        return asyncio.run(asyncio.wait_for(run(), 30.0))
+
+    def test_one_call_per_ttl_window(self):
+        """
+        Tests that 100 concurrent requests make one function call per TTL window,
+        and that calls after the first window only revalidate
+        """
+        num_windows: int = 3
+        for window in range(num_windows):
+            results: List[Dict[str, Any]] = self.concurrent_lookups(100)
+            for result in results:
+                self.assertEqual(result, FUNCTION_RESPONSE.get("function"))
+            self.assertEqual(self.counts.get("calls"), window + 1)
+            self.clock.now += TTL_SECONDS + 1.0
+
+        # Only the first call had to send the function json. The rest got 304s
+        self.assertEqual(self.counts.get("bodies"), 1)
+
+    def test_concurrent_event_loops(self):
+        """
+        Tests that requests running on different threads and event loops (as on a server)
+        share a single round trip
+        """
+        num_threads: int = 10
+        with ThreadPoolExecutor(max_workers=num_threads) as pool:
+            futures = [pool.submit(self.concurrent_lookups, 10) for _ in range(num_threads)]
+            for future in futures:
+                self.assertEqual(len(future.result()), 10)
+        self.assertEqual(self.counts.get("calls"), 1)
+
+    def test_authorization_metadata(self):
+        """
+        Tests that users do not share entries
+        """
+        self.concurrent_lookups(10, user_id="alice")
+        self.concurrent_lookups(10, user_id="bob")
+        self.concurrent_lookups(10, user_id="alice")
+        self.assertEqual(self.counts.get("calls"), 2)
+
+    def test_negative_caching(self):
+        """
+        Tests that an unreachable agent is not asked again until the negative TTL passes
+        """
+        async def run():
+            for _ in range(5):
+                with self.assertRaises(ValueError):
+                    await self.lookup("down_agent")
+            self.assertEqual(self.counts.get("calls"), 1)
+
+            self.clock.now += NEGATIVE_TTL_SECONDS + 1.0
+            with self.assertRaises(ValueError):
+                await self.lookup("down_agent")
+            self.assertEqual(self.counts.get("calls"), 2)
+
+        asyncio.run(asyncio.wait_for(run(), 30.0))
+
+    def test_leader_error(self):
+        """
+        Tests that concurrent lookups all get the error of a failed round trip
+        """
+        started = asyncio.Event()
+
+        async def failing_fetcher(etag: str):
+            _ = etag
+            started.set()
+            await asyncio.sleep(0.05)
+            raise RuntimeError("connection reset")
+
+        async def follower():
+            await started.wait()
+            return await self.cache.get_function_json(("key",), failing_fetcher)
+
+        async def run():
+            return await asyncio.gather(self.cache.get_function_json(("key",), failing_fetcher), follower(),
+                                        return_exceptions=True)
+
+        results: List[Any] = asyncio.run(asyncio.wait_for(run(), 30.0))
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+            self.assertEqual(str(result), "connection reset")
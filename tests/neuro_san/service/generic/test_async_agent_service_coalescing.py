@@ -0,0 +1,163 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+
+from unittest import TestCase
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.single_agent_network_provider import SingleAgentNetworkProvider
+from neuro_san.service.generic.async_agent_service import AsyncAgentService
+from neuro_san.service.utils.server_context import ServerContext
+from neuro_san.session.async_direct_agent_session import AsyncDirectAgentSession
+
+AGENT_NAME: str = "coalescing_test"
+
+NUM_CALLERS: int = 200
+
+NETWORK_CONFIG: Dict[str, Any] = {
+    "llm_config": {
+        "class": "neuro_san.test.llms.chat_mock_llm.ChatMockLlm",
+        "model_name": "echo",
+    },
+    "tools": [
+        {
+            "name": "echoer",
+            "function": {
+                "description": "Echoes the input"
+            },
+            "instructions": "Echo the input"
+        }
+    ]
+}
+
+
+class TestAsyncAgentServiceCoalescing(TestCase):
+    """
+    Tests that bursts of identical function and connectivity requests share one computation
+    """
+
+    def setUp(self):
+        """
+        Sets up an AsyncAgentService as the server would
+        """
+        self.server_context = ServerContext()
+        self.server_context.no_queues()
+
+        agent_network = AgentNetwork(NETWORK_CONFIG, AGENT_NAME)
+        provider = SingleAgentNetworkProvider(AGENT_NAME, {AGENT_NAME: agent_network})
+        self.service = AsyncAgentService(Mock(), None, AGENT_NAME, provider, Mock(), self.server_context)
+        self.num_computations: int = 0
+
+    def tearDown(self):
+        self.server_context.get_executor_pool().shutdown()
+
+    def make_slow(self, method: str):
+        """
+        :param method: The name of the AsyncDirectAgentSession method to slow down
+        :return: A replacement for the method that counts its computations
+                and takes long enough for all the callers to pile up
+        """
+        original = getattr(AsyncDirectAgentSession, method)
+
+        async def slow(session: AsyncDirectAgentSession, request_dict: Dict[str, Any]) -> Dict[str, Any]:
+            self.num_computations += 1
+            await asyncio.sleep(0.2)
+            return await original(session, request_dict)
+
+        return slow
+
+    def run_burst(self, method: str) -> List[Dict[str, Any]]:
+        """
+        :param method: The name of the AsyncAgentService method to call
+        :return: The responses of all the simultaneous callers
+        """
+        async def run() -> List[Dict[str, Any]]:
+            calls = [getattr(self.service, method)({}, {"user_id": f"user-{index}"})
+                     for index in range(NUM_CALLERS)]
+            return await asyncio.gather(*calls)
+
+        with patch.object(AsyncDirectAgentSession, method, self.make_slow(method)):
+            return asyncio.run(run())
+
+    def test_function(self):
+        """
+        Tests that simultaneous function calls compute once
+        """
+        responses: List[Dict[str, Any]] = self.run_burst("function")
+        self.assertEqual(self.num_computations, 1)
+        self.assertEqual(len(responses), NUM_CALLERS)
+        for response in responses:
+            self.assertEqual(response.get("function").get("description"), "Echoes the input")
+        self.assertEqual(self.service.single_flight.get_in_flight_count(), 0)
+        self.assertEqual(self.service.get_request_count(), 0)
+
+        # Not a cache: a later burst computes again
+        self.run_burst("function")
+        self.assertEqual(self.num_computations, 2)
+
+    def test_connectivity(self):
+        """
+        Tests that simultaneous connectivity calls compute once
+        """
+        responses: List[Dict[str, Any]] = self.run_burst("connectivity")
+        self.assertEqual(self.num_computations, 1)
+        for response in responses:
+            self.assertEqual(response.get("connectivity_info")[0].get("origin"), "echoer")
+
+    def test_exception_shared(self):
+        """
+        Tests that all callers see a failure of the shared computation
+        """
+        async def failing(_session: AsyncDirectAgentSession, _request_dict: Dict[str, Any]) -> Dict[str, Any]:
+            self.num_computations += 1
+            await asyncio.sleep(0.1)
+            raise ValueError("no function for you")
+
+        async def run() -> List[Any]:
+            calls = [self.service.function({}, {}) for _ in range(NUM_CALLERS)]
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+        with patch.object(AsyncDirectAgentSession, "function", failing):
+            results: List[Any] = asyncio.run(run())
+
+        self.assertEqual(self.num_computations, 1)
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    def test_caller_cancellation(self):
+        """
+        Tests that the first caller going away does not take the answer away from the rest
+        """
+        async def run() -> List[Dict[str, Any]]:
+            first = asyncio.ensure_future(self.service.function({}, {}))
+            await asyncio.sleep(0.05)
+            others = [asyncio.ensure_future(self.service.function({}, {})) for _ in range(10)]
+            await asyncio.sleep(0.05)
+            first.cancel()
+            return await asyncio.gather(*others)
+
+        with patch.object(AsyncDirectAgentSession, "function", self.make_slow("function")):
+            responses: List[Dict[str, Any]] = asyncio.run(run())
+
+        self.assertEqual(self.num_computations, 1)
+        for response in responses:
+            self.assertIn("function", response)
@@ -0,0 +1,169 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.single_agent_network_provider import SingleAgentNetworkProvider
+from neuro_san.service.generic.async_agent_service import AsyncAgentService
+from neuro_san.service.utils.fair_request_queue import FairRequestQueue
+from neuro_san.service.utils.server_context import ServerContext
+
+AGENT_NAME: str = "fairness_test"
+
+NUM_NOISY: int = 6
+NUM_QUIET: int = 2
+
+NETWORK_CONFIG: Dict[str, Any] = {
+    "llm_config": {
+        "class": "neuro_san.test.llms.chat_mock_llm.ChatMockLlm",
+        "model_name": "echo",
+    },
+    "tools": [
+        {
+            "name": "echoer",
+            "function": {
+                "description": "Echoes the input"
+            },
+            "instructions": "Echo the input"
+        }
+    ]
+}
+
+
+class RecordingFairRequestQueue(FairRequestQueue):
+    """
+    FairRequestQueue with a single slot that records the order in which tenants get it
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        super().__init__("tenant", max_concurrent=1)
+        self.grants: List[str] = []
+
+    async def acquire(self, tenant: str, slot: str = None) -> str:
+        """
+        Records the tenant once it gets the slot
+        """
+        slot = await super().acquire(tenant, slot)
+        self.grants.append(tenant)
+        return slot
+
+
+class TestAsyncAgentServiceFairness(TestCase):
+    """
+    Tests a noisy tenant and a quiet tenant sharing one server process
+    """
+
+    def setUp(self):
+        """
+        Sets up an AsyncAgentService as the server would
+        """
+        self.queue = RecordingFairRequestQueue()
+        self.server_context = ServerContext()
+        self.server_context.no_queues()
+        self.server_context.fair_request_queue = self.queue
+
+        agent_network = AgentNetwork(NETWORK_CONFIG, AGENT_NAME)
+        provider = SingleAgentNetworkProvider(AGENT_NAME, {AGENT_NAME: agent_network})
+        self.service = AsyncAgentService(Mock(), None, AGENT_NAME, provider, Mock(), self.server_context)
+
+    def tearDown(self):
+        self.server_context.get_executor_pool().shutdown()
+
+    async def chat(self, tenant: str, request_id: str, slot: str = None):
+        """
+        :param tenant: The tenant making the request
+        :param request_id: The request_id of the request
+        :param slot: The fair queue slot token in the request metadata, if any
+        """
+        request: Dict[str, Any] = {
+            "user_message": {
+                "type": "HUMAN",
+                "text": f"hello from {tenant}"
+            }
+        }
+        metadata: Dict[str, Any] = {"tenant": tenant, "request_id": request_id}
+        if slot is not None:
+            metadata[FairRequestQueue.SLOT_METADATA_KEY] = slot
+        async for _ in self.service.streaming_chat(request, metadata):
+            pass
+
+    async def wait_for_waiting(self, waiting: Dict[str, int]):
+        """
+        :param waiting: The number of requests of each tenant to wait for to line up
+        """
+        while self.queue.get_stats().get("waiting") != waiting:
+            await asyncio.sleep(0)
+
+    def test_grant_order(self):
+        """
+        Tests that a quiet tenant takes turns with a noisy tenant's backlog
+        instead of waiting behind all of it
+        """
+        async def run():
+            # Hold the only slot while everyone lines up
+            holder: str = await self.queue.acquire("holder")
+            noisy = [asyncio.create_task(self.chat("noisy", f"noisy-{index}")) for index in range(NUM_NOISY)]
+            await self.wait_for_waiting({"noisy": NUM_NOISY})
+            quiet = [asyncio.create_task(self.chat("quiet", f"quiet-{index}")) for index in range(NUM_QUIET)]
+            await self.wait_for_waiting({"noisy": NUM_NOISY, "quiet": NUM_QUIET})
+            self.queue.release(holder)
+            await asyncio.gather(*noisy, *quiet)
+
+        asyncio.run(asyncio.wait_for(run(), 60.0))
+
+        # First come first served would have been the whole noisy backlog before any quiet request
+        self.assertEqual(self.queue.grants, ["holder", "noisy", "quiet", "noisy", "quiet"] + ["noisy"] * 4)
+        self.assertEqual(self.queue.get_stats(), {"running": {}, "waiting": {}})
+
+    def test_nested_request(self):
+        """
+        Tests that a call to an agent on the same server made by a request holding the only slot,
+        which carries the token of that slot, does not wait for it
+        """
+        async def run():
+            parent: str = await self.queue.acquire("noisy")
+            await self.chat("noisy", "parent", parent)
+            self.queue.release(parent)
+
+        asyncio.run(asyncio.wait_for(run(), 60.0))
+        self.assertEqual(self.queue.grants, ["noisy", "noisy"])
+        self.assertEqual(self.queue.get_stats(), {"running": {}, "waiting": {}})
+
+    def test_same_request_id(self):
+        """
+        Tests that a request with the request_id of a request holding the only slot still waits
+        """
+        async def run():
+            parent: str = await self.queue.acquire("noisy")
+            copycat = asyncio.create_task(self.chat("quiet", "parent"))
+            await self.wait_for_waiting({"quiet": 1})
+            self.assertFalse(copycat.done())
+            self.queue.release(parent)
+            await copycat
+
+        asyncio.run(asyncio.wait_for(run(), 60.0))
+        self.assertEqual(self.queue.grants, ["noisy", "quiet"])
+        self.assertEqual(self.queue.get_stats(), {"running": {}, "waiting": {}})
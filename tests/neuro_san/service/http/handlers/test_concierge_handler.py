@@ -0,0 +1,142 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+import os
+
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from tornado.testing import AsyncHTTPTestCase
+
+from neuro_san import DEPLOY_DIR
+from neuro_san import REGISTRIES_DIR
+from neuro_san import TOP_LEVEL_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.service.http.config.http_server_config import HttpServerConfig
+from neuro_san.service.http.server.http_server import HttpServer
+from neuro_san.service.utils.server_context import ServerContext
+from neuro_san.service.utils.server_status import ServerStatus
+from neuro_san.session.direct_concierge_session import DirectConciergeSession
+
+
+class TestConciergeHandler(AsyncHTTPTestCase):
+    """
+    Tests caching and ETag revalidation of the /api/v1/list endpoint.
+    """
+
+    NETWORKS: List[str] = ["chat_mock_llm_echo", "music_nerd_pro"]
+
+    def get_app(self):
+        """
+        :return: The tornado application under test
+        """
+        os.environ.setdefault("AGENT_SERVICE_LOG_JSON", DEPLOY_DIR.get_file_in_basis("logging.json"))
+
+        server_context = ServerContext()
+        server_context.set_server_status(ServerStatus("test"))
+        self.agent_server = HttpServer(server_context,
+                                       HttpServerConfig(),
+                                       TOP_LEVEL_DIR.get_file_in_basis("api/grpc/agent_service.json"),
+                                       requests_limit=-1)
+
+        self.public_storage: AgentNetworkStorage = server_context.get_network_storage_dict().get("public")
+        self.add_network(self.NETWORKS[0])
+
+        return self.agent_server.make_app(-1, self.agent_server.logger)
+
+    def tearDown(self):
+        self.agent_server.server_context.get_executor_pool().shutdown()
+        super().tearDown()
+
+    def add_network(self, name: str):
+        """
+        :param name: The name of the registry to add to public storage
+        """
+        restorer = AgentNetworkRestorer()
+        agent_network: AgentNetwork = restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis(f"{name}.hocon"))
+        self.public_storage.add_agent_network(name, agent_network)
+
+    def get_names(self, body: bytes) -> List[str]:
+        """
+        :param body: The body of a list response
+        :return: The agent names in the listing
+        """
+        result_dict: Dict[str, Any] = json.loads(body)
+        return [agent_info.get("agent_name") for agent_info in result_dict.get("agents")]
+
+    def test_etag_revalidation(self):
+        """
+        Tests that the listing is only computed once while nothing changes,
+        that clients with a current ETag get a 304, and that changes to storage show up.
+        """
+        with patch.object(DirectConciergeSession, "list", autospec=True,
+                          side_effect=DirectConciergeSession.list) as mock_list:
+            response = self.fetch("/api/v1/list")
+            self.assertEqual(response.code, 200)
+            self.assertEqual(self.get_names(response.body), self.NETWORKS[:1])
+            etag: str = response.headers.get("Etag")
+            self.assertIsNotNone(etag)
+
+            for _ in range(5):
+                response = self.fetch("/api/v1/list", headers={"If-None-Match": etag})
+                self.assertEqual(response.code, 304)
+                self.assertEqual(len(response.body), 0)
+            self.assertEqual(mock_list.call_count, 1)
+
+            self.add_network(self.NETWORKS[1])
+            response = self.fetch("/api/v1/list", headers={"If-None-Match": etag})
+            self.assertEqual(response.code, 200)
+            self.assertEqual(sorted(self.get_names(response.body)), sorted(self.NETWORKS))
+            self.assertNotEqual(response.headers.get("Etag"), etag)
+            self.assertEqual(mock_list.call_count, 2)
+
+            self.public_storage.remove_agent_network(self.NETWORKS[1])
+            response = self.fetch("/api/v1/list", headers={"If-None-Match": etag})
+            self.assertEqual(response.code, 304)
+            self.assertEqual(mock_list.call_count, 3)
+
+    def test_pared_listing(self):
+        """
+        Tests that authorization pares the listing and gets an ETag of its own
+        """
+        self.add_network(self.NETWORKS[1])
+        response = self.fetch("/api/v1/list")
+        full_etag: str = response.headers.get("Etag")
+        full_names: List[str] = self.get_names(response.body)
+
+        allowed: List[str] = [self.NETWORKS[1]]
+        with patch.object(self.agent_server.authorization_policy, "allow_agents",
+                          AsyncMock(return_value=allowed)) as mock_allow:
+            response = self.fetch("/api/v1/list")
+            self.assertEqual(response.code, 200)
+            self.assertEqual(self.get_names(response.body), [self.NETWORKS[1]])
+            self.assertEqual(sorted(mock_allow.call_args.args[0]), sorted(self.NETWORKS))
+            pared_etag: str = response.headers.get("Etag")
+            self.assertNotEqual(pared_etag, full_etag)
+
+            response = self.fetch("/api/v1/list", headers={"If-None-Match": pared_etag})
+            self.assertEqual(response.code, 304)
+
+        # The cached, unfiltered listing was not disturbed by the paring
+        response = self.fetch("/api/v1/list")
+        self.assertEqual(self.get_names(response.body), full_names)
@@ -0,0 +1,83 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import json
+import os
+
+from tornado.testing import AsyncHTTPTestCase
+
+from neuro_san import DEPLOY_DIR
+from neuro_san import REGISTRIES_DIR
+from neuro_san import TOP_LEVEL_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.service.http.config.http_server_config import HttpServerConfig
+from neuro_san.service.http.server.http_server import HttpServer
+from neuro_san.service.utils.server_context import ServerContext
+from neuro_san.service.utils.server_status import ServerStatus
+
+
+class TestConnectivityHandler(AsyncHTTPTestCase):
+    """
+    Tests ETag revalidation of the /connectivity endpoint.
+    """
+
+    NETWORK: str = "chat_mock_llm_echo"
+
+    def get_app(self):
+        """
+        :return: The tornado application under test
+        """
+        os.environ.setdefault("AGENT_SERVICE_LOG_JSON", DEPLOY_DIR.get_file_in_basis("logging.json"))
+
+        server_context = ServerContext()
+        server_context.set_server_status(ServerStatus("test"))
+        self.agent_server = HttpServer(server_context,
+                                       HttpServerConfig(),
+                                       TOP_LEVEL_DIR.get_file_in_basis("api/grpc/agent_service.json"),
+                                       requests_limit=-1)
+
+        restorer = AgentNetworkRestorer()
+        self.agent_network: AgentNetwork = restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis(f"{self.NETWORK}.hocon"))
+        server_context.get_network_storage_dict().get("public").add_agent_network(self.NETWORK, self.agent_network)
+
+        return self.agent_server.make_app(-1, self.agent_server.logger)
+
+    def tearDown(self):
+        self.agent_server.server_context.get_executor_pool().shutdown()
+        super().tearDown()
+
+    def test_etag_revalidation(self):
+        """
+        Tests that a matching If-None-Match gets a 304 without a body
+        and that a stale one gets the full connectivity
+        """
+        path: str = f"/api/v1/{self.NETWORK}/connectivity"
+        response = self.fetch(path)
+        self.assertEqual(response.code, 200)
+        etag: str = response.headers.get("Etag")
+        # Served straight from what was computed when the network was added
+        self.assertEqual(etag, self.agent_network.get_connectivity_etag())
+        self.assertIn("connectivity_info", json.loads(response.body))
+
+        response = self.fetch(path, headers={"If-None-Match": etag})
+        self.assertEqual(response.code, 304)
+        self.assertEqual(len(response.body), 0)
+
+        response = self.fetch(path, headers={"If-None-Match": '"stale"'})
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.headers.get("Etag"), etag)
+        self.assertIn("connectivity_info", json.loads(response.body))
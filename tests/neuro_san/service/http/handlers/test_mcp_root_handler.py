@@ -0,0 +1,198 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+import os
+import time
+
+import pytest
+
+from tornado.testing import AsyncHTTPTestCase
+
+from neuro_san import DEPLOY_DIR
+from neuro_san import REGISTRIES_DIR
+from neuro_san import TOP_LEVEL_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.service.http.config.http_server_config import HttpServerConfig
+from neuro_san.service.http.server.http_server import HttpServer
+from neuro_san.service.mcp.interfaces.client_session_policy import MCP_PROTOCOL_VERSION
+from neuro_san.service.mcp.util.mcp_request_util import McpRequestUtil
+from neuro_san.service.mcp.validation.tool_request_validator import ToolRequestValidator
+from neuro_san.service.utils.mcp_server_context import McpServerContext
+from neuro_san.service.utils.server_context import ServerContext
+from neuro_san.service.utils.server_status import ServerStatus
+
+# Requests made through the server. Each of these runs the agent network.
+NUM_TOOL_CALLS: int = 3
+
+# Validator set-ups and validations for the per-request comparison
+BENCHMARK_ITERATIONS: int = 10000
+
+
+class TestMcpRootHandler(AsyncHTTPTestCase):
+    """
+    Tests MCP tools/call requests: the shared tool call validator
+    and streaming of progress as server-sent events.
+    """
+
+    NETWORK: str = "chat_mock_llm_echo"
+
+    def get_app(self):
+        """
+        :return: The tornado application under test
+        """
+        os.environ.setdefault("AGENT_SERVICE_LOG_JSON", DEPLOY_DIR.get_file_in_basis("logging.json"))
+
+        self.server_context = ServerContext()
+        self.server_context.set_server_status(ServerStatus("test"))
+        self.server_context.get_mcp_server_context().set_enabled(True)
+        self.service_spec_file: str = TOP_LEVEL_DIR.get_file_in_basis("api/grpc/agent_service.json")
+        self.agent_server = HttpServer(self.server_context,
+                                       HttpServerConfig(),
+                                       self.service_spec_file,
+                                       requests_limit=-1)
+
+        restorer = AgentNetworkRestorer()
+        agent_network: AgentNetwork = restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis(f"{self.NETWORK}.hocon"))
+        agent_network.set_as_mcp_tool()
+        self.server_context.get_network_storage_dict().get("public").add_agent_network(self.NETWORK, agent_network)
+
+        return self.agent_server.make_app(-1, self.agent_server.logger)
+
+    def tearDown(self):
+        self.agent_server.server_context.get_executor_pool().shutdown()
+        super().tearDown()
+
+    def call_tool(self, request_id: int) -> Dict[str, Any]:
+        """
+        :param request_id: The MCP request id
+        :return: The MCP response dictionary for a tools/call of the network
+        """
+        request: Dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {
+                "name": self.NETWORK,
+                "arguments": {
+                    "user_message": {
+                        "type": "HUMAN",
+                        "text": f"hello {request_id}"
+                    }
+                }
+            }
+        }
+        response = self.fetch("/mcp", method="POST", body=json.dumps(request),
+                              headers={"Content-Type": "application/json",
+                                       MCP_PROTOCOL_VERSION: McpRequestUtil.get_mcp_version()})
+        self.assertEqual(response.code, 200)
+        return json.loads(response.body)
+
+    def test_shared_validator(self):
+        """
+        Tests that the validator is built once at startup and used for every request
+        """
+        mcp_context: McpServerContext = self.server_context.get_mcp_server_context()
+        validator: ToolRequestValidator = mcp_context.get_tool_request_validator(None)
+        self.assertIsNotNone(validator)
+
+        for request_id in range(NUM_TOOL_CALLS):
+            result: Dict[str, Any] = self.call_tool(request_id).get("result")
+            self.assertFalse(result.get("isError"))
+            self.assertIn(f"hello {request_id}", result.get("content")[0].get("text"))
+
+        self.assertIs(mcp_context.get_tool_request_validator(None), validator)
+
+        # Arguments that do not match the ChatRequest schema are still rejected
+        self.assertIsNotNone(validator.validate({"user_message": {"type": "HUMAN"}, "bogus": 1}))
+
+    def test_streamed_progress(self):
+        """
+        Tests that a tools/call with a progressToken that accepts an event stream
+        gets progress notifications before the tool call result
+        """
+        request: Dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {
+                "name": self.NETWORK,
+                "arguments": {
+                    "user_message": {
+                        "type": "HUMAN",
+                        "text": "hello stream"
+                    }
+                },
+                "_meta": {
+                    "progressToken": "token-1"
+                }
+            }
+        }
+        chunks: List[bytes] = []
+        response = self.fetch("/mcp", method="POST", body=json.dumps(request),
+                              headers={"Content-Type": "application/json",
+                                       "Accept": "application/json, text/event-stream",
+                                       MCP_PROTOCOL_VERSION: McpRequestUtil.get_mcp_version()},
+                              streaming_callback=chunks.append)
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.headers.get("Content-Type"), "text/event-stream")
+
+        messages: List[Dict[str, Any]] = []
+        for event in b"".join(chunks).decode("utf-8").split("\n\n"):
+            for line in event.splitlines():
+                if line.startswith("data: "):
+                    messages.append(json.loads(line[len("data: "):]))
+
+        # Progress first, result last
+        self.assertGreater(len(messages), 1)
+        progress: List[Dict[str, Any]] = messages[:-1]
+        for index, notification in enumerate(progress):
+            self.assertEqual(notification.get("method"), "notifications/progress")
+            self.assertEqual(notification.get("params").get("progressToken"), "token-1")
+            self.assertEqual(notification.get("params").get("progress"), index + 1)
+
+        result: Dict[str, Any] = messages[-1].get("result")
+        self.assertEqual(messages[-1].get("id"), "1")
+        self.assertFalse(result.get("isError"))
+        self.assertIn("hello stream", result.get("content")[0].get("text"))
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Checks that sharing the validator built at startup takes less per-request validation work
+        than building a validator for every request.
+        """
+        with open(self.service_spec_file, "r", encoding="utf-8") as spec_file:
+            service_spec: Dict[str, Any] = json.load(spec_file)
+        call_args: Dict[str, Any] = {"user_message": {"type": "HUMAN", "text": "hello"}}
+
+        start_time: float = time.perf_counter()
+        for _ in range(BENCHMARK_ITERATIONS):
+            self.assertIsNone(ToolRequestValidator(service_spec).validate(call_args))
+        before_seconds: float = time.perf_counter() - start_time
+
+        shared = ToolRequestValidator(service_spec)
+        start_time = time.perf_counter()
+        for _ in range(BENCHMARK_ITERATIONS):
+            self.assertIsNone(shared.validate(call_args))
+        after_seconds: float = time.perf_counter() - start_time
+
+        self.assertLess(after_seconds, before_seconds)
@@ -0,0 +1,130 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import json
+import os
+
+from tornado.testing import AsyncHTTPTestCase
+
+from neuro_san import DEPLOY_DIR
+from neuro_san import REGISTRIES_DIR
+from neuro_san import TOP_LEVEL_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
+from neuro_san.service.http.config.http_server_config import HttpServerConfig
+from neuro_san.service.http.server.http_server import HttpServer
+from neuro_san.service.utils.server_context import ServerContext
+from neuro_san.service.utils.server_status import ServerStatus
+
+
+class TestMetricsHandler(AsyncHTTPTestCase):
+    """
+    Tests the /metrics endpoint by scraping after a ChatMockLlm streaming_chat request.
+    """
+
+    NETWORK: str = "chat_mock_llm_echo"
+
+    def get_app(self):
+        """
+        :return: The tornado application under test
+        """
+        # Same default logging setup as ServerMainLoop
+        os.environ.setdefault("AGENT_SERVICE_LOG_JSON", DEPLOY_DIR.get_file_in_basis("logging.json"))
+        MetricsRegistry.get_instance().reset()
+
+        server_context = ServerContext()
+        server_context.set_server_status(ServerStatus("test"))
+        server_config = HttpServerConfig()
+        server_config.metrics_enabled = True
+        self.agent_server = HttpServer(server_context,
+                                       server_config,
+                                       TOP_LEVEL_DIR.get_file_in_basis("api/grpc/agent_service.json"),
+                                       requests_limit=-1)
+
+        restorer = AgentNetworkRestorer()
+        agent_network: AgentNetwork = restorer.restore(
+            file_reference=REGISTRIES_DIR.get_file_in_basis(f"{self.NETWORK}.hocon"))
+        server_context.get_network_storage_dict().get("public").add_agent_network(self.NETWORK, agent_network)
+
+        return self.agent_server.make_app(-1, self.agent_server.logger)
+
+    def tearDown(self):
+        self.agent_server.server_context.get_executor_pool().shutdown()
+        super().tearDown()
+
+    def get_scrape(self) -> str:
+        """
+        :return: The text of a /metrics scrape
+        """
+        response = self.fetch("/metrics")
+        self.assertEqual(response.code, 200)
+        self.assertTrue(response.headers.get("Content-Type").startswith("text/plain"))
+        return response.body.decode("utf-8")
+
+    def test_scrape_after_chat(self):
+        """
+        Tests that a chat with a mock llm shows up in the scraped metrics
+        """
+        request = {
+            "user_message": {
+                "type": "HUMAN",
+                "text": "hello there"
+            }
+        }
+        response = self.fetch(f"/api/v1/{self.NETWORK}/streaming_chat",
+                              method="POST", body=json.dumps(request), request_timeout=60)
+        self.assertEqual(response.code, 200)
+        self.assertIn("hello there", response.body.decode("utf-8"))
+
+        scrape: str = self.get_scrape()
+
+        network_labels: str = f'method="streaming_chat",network="{self.NETWORK}"'
+        self.assertIn(f"neuro_san_requests_in_flight{{{network_labels}}} 0", scrape)
+        self.assertIn(f'neuro_san_request_duration_seconds_count{{{network_labels}}} 1', scrape)
+        self.assertIn(f'neuro_san_time_to_first_message_seconds_count{{network="{self.NETWORK}"}} 1', scrape)
+        self.assertIn('neuro_san_llm_call_duration_seconds_count{model="echo",provider="ChatMockLlm"} 1', scrape)
+        self.assertIn('neuro_san_llm_tokens_total{model="echo",provider="ChatMockLlm",type="prompt"}', scrape)
+        self.assertIn('neuro_san_llm_cost_usd_total{model="echo",provider="ChatMockLlm"} 0', scrape)
+        self.assertIn('neuro_san_executor_pool_executors{state="available"}', scrape)
+
+    def test_scrape_format(self):
+        """
+        Tests the exposition is well-formed on an idle server
+        """
+        scrape: str = self.get_scrape()
+        self.assertIn("# TYPE neuro_san_request_duration_seconds histogram", scrape)
+        self.assertIn("# TYPE neuro_san_llm_tokens_total counter", scrape)
+        self.assertIn("# TYPE neuro_san_requests_in_flight gauge", scrape)
+        for line in scrape.splitlines():
+            if line.startswith("#"):
+                continue
+            # Every sample line is a metric name with optional labels, then a number
+            _, value = line.rsplit(" ", 1)
+            float(value)
+
+    def test_temporary_metrics_dir(self):
+        """
+        Tests that only the process which created the temporary metrics directory removes it
+        """
+        self.agent_server.server_config.http_server_instances = 2
+        self.agent_server.setup_metrics_store()
+        metrics_dir: str = self.agent_server.metrics_store.directory
+        self.assertTrue(os.path.isdir(metrics_dir))
+
+        HttpServer.remove_temp_dir(metrics_dir, os.getpid() + 1)
+        self.assertTrue(os.path.isdir(metrics_dir))
+        HttpServer.remove_temp_dir(metrics_dir, os.getpid())
+        self.assertFalse(os.path.exists(metrics_dir))
@@ -0,0 +1,138 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import copy
+import logging
+import os
+import time
+import tracemalloc
+
+from unittest import TestCase
+
+import pytest
+
+from neuro_san import DEPLOY_DIR
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.logging.log_context_filter import LogContextFilter
+
+BENCHMARK_ITERATIONS: int = 100000
+
+
+class RecordingHandler(logging.Handler):
+    """
+    Logging handler that keeps the records it is given.
+    """
+
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.addFilter(LogContextFilter())
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
+class TestHttpLogger(TestCase):
+    """
+    Tests that request metadata is only merged for log records that are emitted.
+    """
+
+    def setUp(self):
+        os.environ.setdefault("AGENT_SERVICE_LOG_JSON", DEPLOY_DIR.get_file_in_basis("logging.json"))
+        self.http_logger = HttpLogger(["user_id", "request_id"])
+
+        # Log to a logger of our own so output is not affected by the server's logging set-up
+        self.handler = RecordingHandler()
+        self.http_logger.logger = logging.getLogger("test_http_logger")
+        self.http_logger.logger.propagate = False
+        self.http_logger.logger.setLevel(logging.INFO)
+        self.http_logger.logger.addHandler(self.handler)
+
+        self.metadata: Dict[str, Any] = {"user_id": "someone", "request_id": "abc"}
+
+    def tearDown(self):
+        self.http_logger.logger.removeHandler(self.handler)
+
+    def test_merged_metadata(self):
+        """
+        Tests that emitted records get the base metadata overlaid with the request metadata
+        """
+        self.http_logger.info(self.metadata, "hello %s", "world")
+        self.http_logger.info({"user_id": "someone_else"}, "bye")
+
+        self.assertEqual(len(self.handler.records), 2)
+        first: logging.LogRecord = self.handler.records[0]
+        self.assertEqual(first.getMessage(), "hello world")
+        self.assertEqual(first.user_id, "someone")
+        self.assertEqual(first.request_id, "abc")
+        self.assertEqual(first.source, HttpLogger.HTTP_LOGGER_NAME)
+
+        second: logging.LogRecord = self.handler.records[1]
+        self.assertEqual(second.user_id, "someone_else")
+        self.assertEqual(second.request_id, "None")
+
+        # Neither the base nor the request metadata are modified
+        self.assertEqual(self.http_logger.base_metadata.get("user_id"), "None")
+        self.assertEqual(self.metadata.get("user_id"), "someone")
+
+    def test_disabled_level(self):
+        """
+        Tests that nothing is prepared for a level that is not logged
+        """
+        LogContextFilter.log_context.set(())
+        self.http_logger.debug(self.metadata, "not logged")
+        self.assertEqual(len(self.handler.records), 0)
+        self.assertEqual(LogContextFilter.log_context.get(), ())
+
+    def eager_debug(self, metadata: Dict[str, Any], msg: str):
+        """
+        Logs the way HttpLogger used to: merging metadata before knowing if anything is logged.
+        """
+        use_metadata: Dict[str, Any] = copy.copy(self.http_logger.base_metadata)
+        use_metadata.update(metadata)
+        LogContextFilter.log_context.set((use_metadata,))
+        self.http_logger.logger.debug(msg)
+
+    def run_benchmark(self, log_method) -> Tuple[float, int]:
+        """
+        :param log_method: The method to log with
+        :return: A tuple of elapsed seconds and peak traced bytes for BENCHMARK_ITERATIONS debug calls
+        """
+        tracemalloc.start()
+        start_time: float = time.perf_counter()
+        for _ in range(BENCHMARK_ITERATIONS):
+            log_method(self.metadata, "Debugging per-request detail")
+        elapsed: float = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Makes debug calls at INFO level with and without eager metadata merging,
+        checking that merging lazily saves time and peak traced memory.
+        """
+        before_seconds, before_peak = self.run_benchmark(self.eager_debug)
+        after_seconds, after_peak = self.run_benchmark(self.http_logger.debug)
+
+        self.assertEqual(len(self.handler.records), 0)
+        self.assertLess(after_seconds, before_seconds)
+        self.assertLessEqual(after_peak, before_peak)
@@ -0,0 +1,79 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import multiprocessing
+import tempfile
+
+from unittest import TestCase
+
+from neuro_san.internals.metrics.metrics_registry import MetricsRegistry
+from neuro_san.service.http.metrics.multiprocess_metrics_store import MultiprocessMetricsStore
+from neuro_san.service.http.metrics.prometheus_formatter import PrometheusFormatter
+
+
+def record_in_child(directory: str, network: str):
+    """
+    Runs in a forked process like a server instance would:
+    records a request in its own registry and shares it.
+    """
+    metrics = MetricsRegistry()
+    labels: Dict[str, str] = {"network": network, "method": "streaming_chat"}
+    metrics.inc(MetricsRegistry.REQUESTS_IN_FLIGHT, labels)
+    metrics.observe(MetricsRegistry.REQUEST_DURATION, labels, 0.2)
+    metrics.inc(MetricsRegistry.LLM_TOKENS, {"model": "echo", "provider": "mock", "type": "prompt"}, 10)
+    MultiprocessMetricsStore(directory).write(metrics.get_snapshot())
+
+
+class TestMultiprocessMetricsStore(TestCase):
+    """
+    Unit tests for MultiprocessMetricsStore class.
+    """
+
+    def test_aggregate_across_processes(self):
+        """
+        Tests that counters and histograms of exited processes are summed
+        while their gauges are dropped.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            store = MultiprocessMetricsStore(directory)
+            store.clear()
+
+            context = multiprocessing.get_context("fork")
+            for network in ["one", "two"]:
+                process = context.Process(target=record_in_child, args=(directory, network))
+                process.start()
+                process.join()
+                self.assertEqual(process.exitcode, 0)
+
+            local = MetricsRegistry()
+            local.inc(MetricsRegistry.LLM_TOKENS, {"model": "echo", "provider": "mock", "type": "prompt"}, 5)
+            local.inc(MetricsRegistry.REQUESTS_IN_FLIGHT, {"network": "local", "method": "streaming_chat"})
+
+            aggregate: Dict[str, Any] = store.aggregate(local.get_snapshot())
+            text: str = PrometheusFormatter().format(aggregate)
+
+        self.assertIn('neuro_san_llm_tokens_total{model="echo",provider="mock",type="prompt"} 25', text)
+        self.assertIn('neuro_san_request_duration_seconds_count{method="streaming_chat",network="one"} 1', text)
+        self.assertIn('neuro_san_request_duration_seconds_count{method="streaming_chat",network="two"} 1', text)
+        self.assertIn('neuro_san_request_duration_seconds_bucket{method="streaming_chat",network="two",le="0.25"} 1',
+                      text)
+        self.assertIn('neuro_san_request_duration_seconds_bucket{method="streaming_chat",network="two",le="0.1"} 0',
+                      text)
+        # Gauges only come from live processes
+        self.assertIn('neuro_san_requests_in_flight{method="streaming_chat",network="local"} 1', text)
+        self.assertNotIn('neuro_san_requests_in_flight{method="streaming_chat",network="one"}', text)
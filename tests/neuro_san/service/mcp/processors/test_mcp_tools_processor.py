@@ -0,0 +1,281 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+import json
+import time
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import pytest
+
+from neuro_san import TOP_LEVEL_DIR
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
+from neuro_san.service.interfaces.agent_authorizer import AgentAuthorizer
+from neuro_san.service.mcp.processors.mcp_tools_processor import McpToolsProcessor
+from neuro_san.service.mcp.util.mcp_tools_cache import McpToolsCache
+from neuro_san.service.mcp.validation.tool_request_validator import ToolRequestValidator
+from neuro_san.session.async_direct_agent_session import AsyncDirectAgentSession
+
+NUM_NETWORKS: int = 500
+
+SLOW_TIMEOUT_SECONDS: float = 0.2
+
+
+class FunctionService:
+    """
+    Stands in for the AsyncAgentService of an agent network, answering function requests only.
+    """
+
+    def __init__(self, agent_network: AgentNetwork):
+        self.agent_network: AgentNetwork = agent_network
+        self.function_calls: int = 0
+
+    async def function(self, request_dict: Dict[str, Any], request_metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param request_dict: a FunctionRequest dictionary
+        :param request_metadata: request metadata
+        :return: a FunctionResponse dictionary
+        """
+        self.function_calls += 1
+        session = AsyncDirectAgentSession(agent_network=self.agent_network, invocation_context=None,
+                                          metadata=request_metadata)
+        return await session.function(request_dict)
+
+    def get_service(self) -> "FunctionService":
+        """
+        Acts as its own AsyncAgentServiceProvider.
+        :return: this service
+        """
+        return self
+
+
+class SlowChatService:
+    """
+    Stands in for the AsyncAgentService of an MCP tool whose agent network
+    reports some progress and then takes longer than its request timeout.
+    """
+
+    # pylint: disable=unused-argument
+    async def streaming_chat(self, request_dict: Dict[str, Any],
+                             request_metadata: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        :param request_dict: a ChatRequest dictionary
+        :param request_metadata: request metadata
+        :return: an async iterator over ChatResponse dictionaries
+        """
+        yield {"response": {"type": "AI", "text": "thinking", "origin": [{"tool": "front_man"}]}}
+        await asyncio.sleep(10 * SLOW_TIMEOUT_SECONDS)
+        yield {"response": {"type": "AGENT_FRAMEWORK", "text": "too late", "chat_context": {}}}
+
+    def get_request_timeout_seconds(self) -> float:
+        """
+        :return: The request timeout in seconds for this service
+        """
+        return SLOW_TIMEOUT_SECONDS
+
+    def is_mcp_tool(self) -> bool:
+        """
+        :return: True, as the agent is an MCP tool
+        """
+        return True
+
+    def get_service(self) -> "SlowChatService":
+        """
+        Acts as its own AsyncAgentServiceProvider.
+        :return: this service
+        """
+        return self
+
+
+class CountingAuthorizer(AgentAuthorizer):
+    """
+    AgentAuthorizer that allows everything in storage and counts how it is consulted.
+    """
+
+    def __init__(self, storage: AgentNetworkStorage):
+        self.storage: AgentNetworkStorage = storage
+        self.services: Dict[str, Any] = {"slow_tool": SlowChatService()}
+        self.allow_calls: int = 0
+        self.allow_many_calls: int = 0
+        self.list_calls: int = 0
+
+    async def allow_agent(self, agent_name: str, metadata: Dict[str, Any]) -> Tuple[bool, AsyncAgentServiceProvider]:
+        self.allow_calls += 1
+        if agent_name == "slow_tool":
+            return True, self.services.get(agent_name)
+        agent_network: AgentNetwork = self.storage.get_agent_network_provider(agent_name).get_agent_network()
+        service: FunctionService = self.services.get(agent_name)
+        if service is None or service.agent_network is not agent_network:
+            service = FunctionService(agent_network)
+            self.services[agent_name] = service
+        return True, service
+
+    async def allow_agents(self, agent_names: List[str], metadata: Dict[str, Any]) -> List[str]:
+        self.allow_many_calls += 1
+        existing: List[str] = self.storage.get_agent_names()
+        return [agent_name for agent_name in agent_names if agent_name in existing]
+
+    async def list_agents(self, metadata: Dict[str, Any]) -> List[str]:
+        self.list_calls += 1
+        return self.storage.get_agent_names()
+
+
+class TestMcpToolsProcessor(TestCase):
+    """
+    Tests listing of MCP tools across many agent networks.
+    """
+
+    @staticmethod
+    def make_network(index: int, description: str = None) -> AgentNetwork:
+        """
+        :param index: The index of the network
+        :param description: The function description of the front man
+        :return: An AgentNetwork served as an MCP tool
+        """
+        if description is None:
+            description = f"Answers questions about topic {index}."
+        config: Dict[str, Any] = {
+            "tools": [
+                {
+                    "name": f"front_man_{index}",
+                    "function": {
+                        "description": description
+                    },
+                    "instructions": "Answer the question."
+                }
+            ]
+        }
+        agent_network = AgentNetwork(config, f"network_{index}")
+        agent_network.set_as_mcp_tool()
+        return agent_network
+
+    def setUp(self):
+        self.storage = AgentNetworkStorage()
+        for index in range(NUM_NETWORKS):
+            self.storage.add_agent_network(f"network_{index}", self.make_network(index))
+
+        # One network that is not served as an MCP tool
+        self.storage.add_agent_network("not_a_tool", AgentNetwork({"tools": [{"name": "front_man"}]}, "not_a_tool"))
+
+        self.authorizer = CountingAuthorizer(self.storage)
+        service_spec_file: str = TOP_LEVEL_DIR.get_file_in_basis("api/grpc/agent_service.json")
+        with open(service_spec_file, "r", encoding="utf-8") as spec_file:
+            self.validator = ToolRequestValidator(json.load(spec_file))
+
+    def make_processor(self, tools_cache: McpToolsCache) -> McpToolsProcessor:
+        """
+        :param tools_cache: The McpToolsCache to use. Can be None.
+        :return: A new McpToolsProcessor, as one tools/list request would get it
+        """
+        return McpToolsProcessor(None, {"public": self.storage}, self.authorizer, self.validator, tools_cache)
+
+    def list_tools(self, tools_cache: McpToolsCache) -> List[Dict[str, Any]]:
+        """
+        :param tools_cache: The McpToolsCache to use. Can be None.
+        :return: The listed tools
+        """
+        response: Dict[str, Any] = asyncio.run(self.make_processor(tools_cache).list_tools(1, {}))
+        return response.get("result").get("tools")
+
+    def test_list_tools(self):
+        """
+        Tests that all MCP networks are listed, described by their services,
+        and that a warm cache needs only the one authorization check for the listing
+        """
+        tools_cache = McpToolsCache()
+        tools: List[Dict[str, Any]] = self.list_tools(tools_cache)
+        self.assertEqual(len(tools), NUM_NETWORKS)
+        self.assertNotIn("not_a_tool", [tool.get("name") for tool in tools])
+        self.assertEqual(tools[7].get("description"), "Answers questions about topic 7.")
+        self.assertEqual(tools[7].get("inputSchema"), self.validator.get_request_schema())
+
+        self.assertEqual(self.authorizer.allow_many_calls, 1)
+        self.assertEqual(self.authorizer.list_calls, 0)
+        self.assertEqual(self.authorizer.allow_calls, NUM_NETWORKS)
+        self.assertEqual(self.authorizer.services.get("network_7").function_calls, 1)
+
+        self.assertEqual(self.list_tools(tools_cache), tools)
+        self.assertEqual(self.authorizer.allow_many_calls, 2)
+        self.assertEqual(self.authorizer.allow_calls, NUM_NETWORKS)
+        self.assertEqual(self.authorizer.services.get("network_7").function_calls, 1)
+
+    def test_storage_invalidation(self):
+        """
+        Tests that modified networks are described again and removed networks are forgotten
+        """
+        tools_cache = McpToolsCache()
+        self.storage.add_listener(tools_cache)
+        self.list_tools(tools_cache)
+        self.assertEqual(tools_cache.get_size(), NUM_NETWORKS)
+
+        self.storage.add_agent_network("network_3", self.make_network(3, "Something else entirely."))
+        self.assertEqual(tools_cache.get_size(), NUM_NETWORKS - 1)
+        tools: List[Dict[str, Any]] = self.list_tools(tools_cache)
+        self.assertEqual(tools[3].get("description"), "Something else entirely.")
+
+        self.storage.remove_agent_network("network_4")
+        self.assertEqual(tools_cache.get_size(), NUM_NETWORKS - 1)
+        self.assertEqual(len(self.list_tools(tools_cache)), NUM_NETWORKS - 1)
+
+    def test_stream_timeout(self):
+        """
+        Tests that the tool timeout still reports a timeout to the client
+        when it goes off while the caller is busy with a progress message
+        """
+        async def stream() -> List[Dict[str, Any]]:
+            processor: McpToolsProcessor = self.make_processor(None)
+            processor.logger = MagicMock()
+            messages: List[Dict[str, Any]] = []
+            async for message in processor.stream_tool(1, {}, "slow_tool", {"text": "hi"},
+                                                       None, None, None, progress_token="token-1"):
+                messages.append(message)
+                # Like the handler flushing the message to a slow client
+                await asyncio.sleep(2 * SLOW_TIMEOUT_SECONDS)
+            return messages
+
+        messages: List[Dict[str, Any]] = asyncio.run(stream())
+
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0].get("method"), "notifications/progress")
+        self.assertEqual(messages[1].get("result").get("content")[0].get("text"), "Timeout for tool slow_tool")
+        self.assertTrue(messages[1].get("result").get("isError"))
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Lists the tools of 500 networks with a cold and a warm cache,
+        checking that the warm cache lists them faster.
+        """
+        tools_cache = McpToolsCache()
+
+        start_time: float = time.perf_counter()
+        self.list_tools(tools_cache)
+        cold_seconds: float = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self.list_tools(tools_cache)
+        warm_seconds: float = time.perf_counter() - start_time
+
+        self.assertLess(warm_seconds, cold_seconds)
@@ -0,0 +1,201 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import List
+from typing import Tuple
+
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+
+from multiprocessing.connection import Connection
+from unittest import TestCase
+
+import pytest
+
+from neuro_san.service.mcp.session.in_memory_session_store import InMemorySessionStore
+from neuro_san.service.mcp.session.mcp_session_manager import McpSessionManager
+from neuro_san.service.mcp.session.sqlite_session_store import SqliteSessionStore
+
+NUM_SESSIONS: int = 100000
+MAX_SESSIONS: int = 1000
+
+# For tests that only need to go past the maximum
+SMALL_MAX_SESSIONS: int = 100
+
+
+def check_in_worker(manager: McpSessionManager, session_id: str, pipe: Connection):
+    """
+    Runs in a forked worker process, which inherits the manager as http server instances do.
+    Sends back whether the given session is active there,
+    and the id of a new session created and activated there.
+
+    :param manager: The McpSessionManager inherited from the parent process
+    :param session_id: The id of a session created by the parent process
+    :param pipe: The end of the pipe to send the results over
+    """
+    active: bool = manager.is_session_active(session_id)
+    new_session_id: str = manager.create_session().get_id()
+    activated: bool = manager.activate_session(new_session_id)
+    pipe.send((active, new_session_id, activated))
+    pipe.close()
+
+
+class TestMcpSessionManager(TestCase):
+    """
+    Tests the bounded, expiring MCP session stores.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()     # pylint: disable=consider-using-with
+        self.stores: List[SqliteSessionStore] = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        self.temp_dir.cleanup()
+
+    def sqlite_store(self, name: str, **kwargs) -> SqliteSessionStore:
+        """
+        :param name: The name of the database file in the temporary directory
+        :return: A SqliteSessionStore which is closed on tearDown()
+        """
+        store = SqliteSessionStore(os.path.join(self.temp_dir.name, name), **kwargs)
+        self.stores.append(store)
+        return store
+
+    def test_session_lifecycle(self):
+        """
+        Tests creating, activating and deleting sessions with either store
+        """
+        for store in [InMemorySessionStore(), self.sqlite_store("life.db")]:
+            manager = McpSessionManager(store)
+            session_id: str = manager.create_session().get_id()
+            self.assertFalse(manager.is_session_active(session_id))
+            self.assertTrue(manager.activate_session(session_id))
+            self.assertTrue(manager.is_session_active(session_id))
+            self.assertTrue(manager.delete_session(session_id))
+            self.assertFalse(manager.is_session_active(session_id))
+            self.assertFalse(manager.activate_session("no-such-session"))
+            self.assertFalse(manager.delete_session(None))
+
+    def test_idle_expiry(self):
+        """
+        Tests that sessions expire when idle, but not when used
+        """
+        for store in [InMemorySessionStore(idle_ttl_seconds=0.5),
+                      self.sqlite_store("idle.db", idle_ttl_seconds=0.5)]:
+            store.add_session("used")
+            store.add_session("idle")
+            self.assertTrue(store.activate_session("used"))
+            self.assertTrue(store.activate_session("idle"))
+            time.sleep(0.3)
+            self.assertTrue(store.is_session_active("used"))
+            time.sleep(0.3)
+            self.assertFalse(store.is_session_active("idle"))
+            self.assertFalse(store.activate_session("idle"))
+
+    def test_lru_eviction(self):
+        """
+        Tests that the least recently used session is evicted when there are too many
+        """
+        store = InMemorySessionStore(max_sessions=3)
+        for session_id in ["a", "b", "c"]:
+            store.add_session(session_id)
+            store.activate_session(session_id)
+        self.assertTrue(store.is_session_active("a"))
+        store.add_session("d")
+        self.assertEqual(store.get_size(), 3)
+        self.assertTrue(store.is_session_active("a"))
+        self.assertFalse(store.is_session_active("b"))
+
+    @pytest.mark.benchmark
+    def test_bounded_memory(self):
+        """
+        Tests that memory stays the same once the store holds its maximum number of sessions
+        """
+        store = InMemorySessionStore(max_sessions=MAX_SESSIONS)
+        tracemalloc.start()
+        try:
+            full_memory: int = 0
+            for index in range(NUM_SESSIONS):
+                store.add_session(f"session-{index}")
+                if index == 2 * MAX_SESSIONS:
+                    full_memory = tracemalloc.get_traced_memory()[0]
+            final_memory: int = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(store.get_size(), MAX_SESSIONS)
+        self.assertLess(final_memory, full_memory * 1.1)
+
+    def test_sqlite_bounded(self):
+        """
+        Tests that the shared store does not grow much past its maximum number of sessions
+        """
+        store = self.sqlite_store("bounded.db", max_sessions=SMALL_MAX_SESSIONS)
+        manager = McpSessionManager(store)
+        for _ in range(10 * SMALL_MAX_SESSIONS):
+            manager.create_session()
+        self.assertLessEqual(store.get_size(), SMALL_MAX_SESSIONS + store.sweep_interval)
+
+    def test_shared_between_processes(self):
+        """
+        Tests that a session created in one worker process is valid in another, and vice versa
+        """
+        manager = McpSessionManager(self.sqlite_store("shared.db"))
+        session_id: str = manager.create_session().get_id()
+        self.assertTrue(manager.activate_session(session_id))
+
+        # A worker forked by the http server, which inherits the store
+        context = multiprocessing.get_context("fork")
+        receiver, sender = context.Pipe(duplex=False)
+        worker = context.Process(target=check_in_worker, args=(manager, session_id, sender))
+        worker.start()
+        sender.close()
+        self.assertTrue(receiver.poll(30.0))
+        result: Tuple[bool, str, bool] = receiver.recv()
+        receiver.close()
+        worker.join(30.0)
+        self.assertEqual(worker.exitcode, 0)
+
+        active, new_session_id, activated = result
+        self.assertTrue(active)
+        self.assertTrue(activated)
+        self.assertTrue(manager.is_session_active(new_session_id))
+
+        # Another worker with a store of its own on the same database
+        other = McpSessionManager(self.sqlite_store("shared.db"))
+        self.assertTrue(other.is_session_active(session_id))
+        self.assertTrue(other.is_session_active(new_session_id))
+
+        # A store that only lives in memory does not share
+        local = McpSessionManager(InMemorySessionStore())
+        self.assertFalse(local.is_session_active(new_session_id))
+
+    def test_temporary_database(self):
+        """
+        Tests that a store without a database path removes its temporary database on close
+        """
+        store = SqliteSessionStore()
+        temp_dir: str = store.temp_dir
+        store.add_session("a")
+        self.assertTrue(store.activate_session("a"))
+        self.assertTrue(os.path.isdir(temp_dir))
+
+        store.close()
+        self.assertFalse(os.path.exists(temp_dir))
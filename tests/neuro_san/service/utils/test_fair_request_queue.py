@@ -0,0 +1,219 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import List
+
+import asyncio
+
+from unittest import TestCase
+
+from neuro_san.service.utils.fair_request_queue import FairRequestQueue
+
+
+class TestFairRequestQueue(TestCase):
+    """
+    Tests for the FairRequestQueue
+    """
+
+    def test_disabled(self):
+        """
+        Tests that nothing waits without a metadata key
+        """
+        queue = FairRequestQueue(max_concurrent=1)
+        self.assertFalse(queue.is_enabled())
+
+        async def run():
+            slots = [await queue.acquire("a") for _ in range(3)]
+            self.assertEqual(slots, [None] * 3)
+            for slot in slots:
+                queue.release(slot)
+
+        asyncio.run(asyncio.wait_for(run(), 5.0))
+        self.assertEqual(queue.get_stats(), {"running": {}, "waiting": {}})
+
+    def test_get_tenant(self):
+        """
+        Tests how the tenant comes from request metadata
+        """
+        queue = FairRequestQueue("tenant")
+        self.assertEqual(queue.get_tenant({"tenant": "a"}), "a")
+        self.assertEqual(queue.get_tenant({}), FairRequestQueue.ANONYMOUS)
+        self.assertEqual(queue.get_tenant(None), FairRequestQueue.ANONYMOUS)
+
+    def run_order(self, queue: FairRequestQueue, tenants: List[str]) -> List[str]:
+        """
+        :param queue: The FairRequestQueue to test
+        :param tenants: The tenants of requests arriving in order while a single slot is taken
+        :return: The order in which the tenants got the slot
+        """
+        order: List[str] = []
+
+        async def request(tenant: str):
+            slot: str = await queue.acquire(tenant)
+            order.append(tenant)
+            await asyncio.sleep(0.001)
+            queue.release(slot)
+
+        async def run():
+            # Hold the only slot while everyone lines up
+            holder: str = await queue.acquire("holder")
+            tasks = [asyncio.create_task(request(tenant)) for tenant in tenants]
+            await asyncio.sleep(0.01)
+            queue.release(holder)
+            await asyncio.gather(*tasks)
+
+        asyncio.run(asyncio.wait_for(run(), 5.0))
+        return order
+
+    def test_fair_order(self):
+        """
+        Tests that a late-coming quiet tenant does not wait behind a noisy tenant's backlog
+        """
+        queue = FairRequestQueue("tenant", max_concurrent=1)
+        order: List[str] = self.run_order(queue, ["noisy"] * 10 + ["quiet"])
+        self.assertLessEqual(order.index("quiet"), 1)
+
+    def test_weights(self):
+        """
+        Tests that slots are shared in proportion to weights
+        """
+        queue = FairRequestQueue("tenant", max_concurrent=1, tenants={"gold": {"weight": 3}})
+        order: List[str] = self.run_order(queue, ["silver"] * 8 + ["gold"] * 8)
+        self.assertEqual(order[:8].count("gold"), 6)
+
+    def test_tenant_cap(self):
+        """
+        Tests that a tenant never has more requests running than its cap
+        """
+        queue = FairRequestQueue("tenant", max_concurrent=10, tenant_max_concurrent=2,
+                                 tenants={"big": {"max_concurrent": 4}})
+        peaks = {}
+
+        async def request(tenant: str):
+            slot: str = await queue.acquire(tenant)
+            running: int = queue.get_stats()["running"].get(tenant)
+            peaks[tenant] = max(peaks.get(tenant, 0), running)
+            await asyncio.sleep(0.01)
+            queue.release(slot)
+
+        async def run():
+            await asyncio.gather(*[request(tenant) for tenant in ["small"] * 10 + ["big"] * 10])
+
+        asyncio.run(asyncio.wait_for(run(), 5.0))
+        self.assertEqual(peaks, {"small": 2, "big": 4})
+        self.assertEqual(queue.get_stats(), {"running": {}, "waiting": {}})
+
+    def test_cancel(self):
+        """
+        Tests that a request cancelled while waiting does not keep or lose a slot
+        """
+        queue = FairRequestQueue("tenant", max_concurrent=1)
+
+        async def run():
+            slot: str = await queue.acquire("a")
+            waiting = asyncio.create_task(queue.acquire("b"))
+            await asyncio.sleep(0.01)
+            self.assertEqual(queue.get_stats()["waiting"], {"b": 1})
+            waiting.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiting
+            queue.release(slot)
+            slot = await asyncio.wait_for(queue.acquire("c"), 1.0)
+            queue.release(slot)
+
+        asyncio.run(asyncio.wait_for(run(), 5.0))
+        self.assertEqual(queue.get_stats(), {"running": {}, "waiting": {}})
+
+    def test_nested_requests(self):
+        """
+        Tests that requests with the token of a slot that is held run on that slot
+        """
+        queue = FairRequestQueue("tenant", max_concurrent=1)
+
+        async def run():
+            parent: str = await queue.acquire("a")
+            self.assertIsNotNone(parent)
+            # Calls to external agents on the same server made while the parent holds the only slot
+            nested: List[str] = [await asyncio.wait_for(queue.acquire("a", parent), 1.0) for _ in range(2)]
+            self.assertEqual(nested, [parent, parent])
+            self.assertEqual(queue.get_stats()["running"], {"a": 1})
+
+            other = asyncio.create_task(queue.acquire("b"))
+            await asyncio.sleep(0.01)
+            self.assertFalse(other.done())
+
+            # The slot is only freed once every request sharing it is done
+            queue.release(parent)
+            queue.release(parent)
+            await asyncio.sleep(0.01)
+            self.assertFalse(other.done())
+            queue.release(parent)
+            queue.release(await asyncio.wait_for(other, 1.0))
+
+        asyncio.run(asyncio.wait_for(run(), 5.0))
+        self.assertEqual(queue.get_stats(), {"running": {}, "waiting": {}})
+        self.assertEqual(queue.slots, {})
+
+    def test_unknown_slot(self):
+        """
+        Tests that a slot token that is not held does not get a request out of waiting
+        """
+        queue = FairRequestQueue("tenant", max_concurrent=1)
+
+        async def run():
+            held: str = await queue.acquire("a")
+            guessed = asyncio.create_task(queue.acquire("b", "request-1"))
+            await asyncio.sleep(0.01)
+            self.assertFalse(guessed.done())
+            queue.release(held)
+            slot: str = await asyncio.wait_for(guessed, 1.0)
+            self.assertNotIn(slot, (held, "request-1"))
+            queue.release(slot)
+
+        asyncio.run(asyncio.wait_for(run(), 5.0))
+        self.assertEqual(queue.get_stats(), {"running": {}, "waiting": {}})
+
+    def test_nested_request_of_other_tenant(self):
+        """
+        Tests that the slot goes back to the tenant it was granted to
+        when a nested request of another tenant is the last one to use it
+        """
+        queue = FairRequestQueue("tenant", max_concurrent=2, tenant_max_concurrent=1)
+
+        async def run():
+            parent: str = await queue.acquire("owner")
+            # Nested request arriving without the tenant in its metadata
+            nested: str = await asyncio.wait_for(queue.acquire(FairRequestQueue.ANONYMOUS, parent), 1.0)
+            self.assertEqual(nested, parent)
+            # The parent is cancelled first
+            queue.release(parent)
+            self.assertEqual(queue.get_stats()["running"], {"owner": 1})
+            queue.release(nested)
+            self.assertEqual(queue.get_stats()["running"], {})
+            # The owner can use its one slot again
+            queue.release(await asyncio.wait_for(queue.acquire("owner"), 1.0))
+
+        asyncio.run(asyncio.wait_for(run(), 5.0))
+        self.assertEqual(queue.get_stats(), {"running": {}, "waiting": {}})
+
+    def test_idle_tenants_forgotten(self):
+        """
+        Tests that tenants with nothing waiting or running leave nothing behind
+        """
+        queue = FairRequestQueue("tenant", max_concurrent=1)
+        order: List[str] = self.run_order(queue, [f"tenant_{index}" for index in range(100)])
+        self.assertEqual(len(order), 100)
+        self.assertEqual(queue.last_tags, {})
+        self.assertEqual(queue.get_stats(), {"running": {}, "waiting": {}})